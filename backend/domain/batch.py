@@ -0,0 +1,295 @@
+"""
+Moteur de calcul vectorisé des portées
+Évalue des milliers de portées en une seule passe NumPy, avec des résultats
+identiques bit à bit à MechanicalCalculator.calculate_span
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from backend.domain.loading import ArrayLike, load_factor as apparent_load_factor
+from backend.domain.mechanical import (
+    CableProperties,
+    MechanicalCalculator,
+    SpanError,
+    SpanWarning,
+)
+
+
+@dataclass
+class CableTable:
+    """Propriétés de plusieurs câbles stockées en colonnes"""
+    names: List[str]
+    mass_lin_kg_per_m: np.ndarray  # Masse linéique (kg/m)
+    E_MPa: np.ndarray  # Module d'élasticité (MPa)
+    section_mm2: np.ndarray  # Section (mm²)
+    alpha_1e6_per_C: np.ndarray  # Coefficient de dilatation (×10⁻⁶/°C)
+    rupture_dan: np.ndarray  # Charge de rupture (daN)
+    diameter_mm: np.ndarray  # Diamètre (mm)
+
+    @classmethod
+    def from_cables(cls, cables: Sequence[CableProperties]) -> "CableTable":
+        """Construit la table à partir d'une liste de CableProperties"""
+        def column(attr: str) -> np.ndarray:
+            return np.array([getattr(c, attr) for c in cables], dtype=np.float64)
+
+        return cls(
+            names=[c.name for c in cables],
+            mass_lin_kg_per_m=column("mass_lin_kg_per_m"),
+            E_MPa=column("E_MPa"),
+            section_mm2=column("section_mm2"),
+            alpha_1e6_per_C=column("alpha_1e6_per_C"),
+            rupture_dan=column("rupture_dan"),
+            diameter_mm=column("diameter_mm"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@dataclass
+class BatchSpanResult:
+    """Résultats en colonnes pour un lot de portées"""
+    # Géométrie
+    b: np.ndarray  # Corde (m)
+    F1: np.ndarray  # Flèche médiane (m)
+    F2: np.ndarray  # Flèche au point bas (m)
+    H: np.ndarray  # Creux total (m)
+
+    # Tensions (arrondies à 1 daN)
+    T0: np.ndarray  # Tension horizontale (daN)
+    TA: np.ndarray  # Tension au support A (bas) (daN)
+    TB: np.ndarray  # Tension au support B (haut) (daN)
+
+    # Validations (masques de bits SpanWarning / SpanError)
+    warnings: np.ndarray
+    errors: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.b)
+
+
+def round_half_even(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Arrondi vectorisé identique à round(x, ndigits) de Python
+
+    np.round passe par x × 10^n, ce qui peut déplacer une valeur proche d'une
+    demi-unité de l'autre côté de la frontière. Ces rares cas sont recalculés
+    avec round() pour rester identiques au calcul scalaire.
+
+    Args:
+        values: Valeurs à arrondir
+        ndigits: Nombre de décimales
+
+    Returns:
+        Valeurs arrondies
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+
+    frac = np.abs(scaled - np.floor(scaled) - 0.5)
+    ambiguous = np.isfinite(scaled) & (frac <= 4 * np.spacing(np.abs(scaled)))
+    if np.any(ambiguous):
+        rounded[ambiguous] = [round(float(v), ndigits) for v in values[ambiguous]]
+
+    return rounded
+
+
+class BatchSpanCalculator:
+    """Calculateur vectorisé reproduisant MechanicalCalculator.calculate_span"""
+
+    G = MechanicalCalculator.G
+
+    @staticmethod
+    def calculate_sags(
+        a: np.ndarray,
+        h: np.ndarray,
+        rho: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcule corde et flèches pour des tableaux de portées (non arrondies)
+
+        Args:
+            a: Longueurs de portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette (m)
+
+        Returns:
+            (b, F1, F2, H) en mètres
+        """
+        b = np.sqrt(a**2 + h**2)
+
+        # F1 = (a × b) / (8 × ρ)
+        F1 = (a * b) / (8 * rho)
+
+        # F2 = F1 × (1 - (h / (4×F1))²), nulle si F1 = 0
+        positive = F1 > 0
+        safe_F1 = np.where(positive, F1, 1.0)
+        F2 = np.where(positive, F1 * (1 - (h / (4 * safe_F1))**2), 0.0)
+
+        H = F2 + np.abs(h)
+
+        return b, F1, F2, H
+
+    @classmethod
+    def calculate_tensions(
+        cls,
+        rho: np.ndarray,
+        F2: np.ndarray,
+        H: np.ndarray,
+        omega: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcule les tensions pour des tableaux de portées (non arrondies)
+
+        Args:
+            rho: Paramètres de la chaînette (m)
+            F2: Flèches au point bas (m)
+            H: Creux totaux (m)
+            omega: Masses linéiques (kg/m)
+
+        Returns:
+            (T0, TA, TB) en daN
+        """
+        g = cls.G / 10  # Conversion en daN/kg
+
+        T0 = rho * omega * g
+        TA = (rho + F2) * omega * g
+        TB = (rho + H) * omega * g
+
+        return T0, TA, TB
+
+    @staticmethod
+    def span_load_factor(
+        cables: CableTable,
+        cable_index: np.ndarray,
+        wind_pressure_daPa: Optional[ArrayLike] = None,
+        ice_thickness_mm: Optional[ArrayLike] = None
+    ) -> np.ndarray:
+        """
+        Coefficient de surcharge de chaque portée sous vent et givre
+
+        Args:
+            cables: Table des câbles référencés
+            cable_index: Indice du câble de chaque portée dans `cables`
+            wind_pressure_daPa: Pressions du vent (daPa), NaN ou absent = sans vent
+            ice_thickness_mm: Épaisseurs radiales de givre (mm), NaN ou absent = sans givre
+
+        Returns:
+            Coefficients de surcharge (poids apparent / poids propre)
+        """
+        wind_load = np.nan_to_num(np.asarray(
+            0.0 if wind_pressure_daPa is None else wind_pressure_daPa, dtype=np.float64
+        ))
+        ice = np.nan_to_num(np.asarray(
+            0.0 if ice_thickness_mm is None else ice_thickness_mm, dtype=np.float64
+        ))
+        if wind_load.ndim == 0 and ice.ndim == 0:
+            # Cas de charge unique : un coefficient par câble, indexé par portée
+            return apparent_load_factor(
+                cables.mass_lin_kg_per_m, cables.diameter_mm, wind_load, ice
+            )[cable_index]
+        return apparent_load_factor(
+            cables.mass_lin_kg_per_m[cable_index], cables.diameter_mm[cable_index],
+            wind_load, ice
+        )
+
+    @classmethod
+    def calculate_spans(
+        cls,
+        a: ArrayLike,
+        h: ArrayLike,
+        rho: ArrayLike,
+        cable_index: ArrayLike,
+        cables: Union[CableTable, Sequence[CableProperties]],
+        wind_pressure_daPa: Optional[ArrayLike] = None,
+        angle_grade: Optional[ArrayLike] = None,
+        load_factor: Optional[ArrayLike] = None,
+        ice_thickness_mm: Optional[ArrayLike] = None
+    ) -> BatchSpanResult:
+        """
+        Calcul complet d'un lot de portées
+
+        Les entrées scalaires sont diffusées sur la longueur du lot. Les valeurs
+        de vent ou d'angle absentes peuvent être passées en NaN.
+
+        Args:
+            a: Longueurs de portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette (m)
+            cable_index: Indice du câble de chaque portée dans `cables`
+            cables: Table des câbles référencés
+            wind_pressure_daPa: Pressions du vent (daPa), optionnel
+            angle_grade: Angles topographiques (grades), optionnel
+            load_factor: Rapport poids apparent / poids propre appliqué aux
+                tensions (ρ est alors le paramètre sous poids apparent), optionnel ;
+                par défaut, calculé à partir du vent et du givre
+            ice_thickness_mm: Épaisseurs radiales de givre (mm), optionnel
+
+        Returns:
+            BatchSpanResult en colonnes
+        """
+        if not isinstance(cables, CableTable):
+            cables = CableTable.from_cables(cables)
+
+        nan = np.nan
+        a, h, rho, cable_index, wind, angle = np.broadcast_arrays(
+            np.asarray(a, dtype=np.float64),
+            np.asarray(h, dtype=np.float64),
+            np.asarray(rho, dtype=np.float64),
+            np.asarray(cable_index, dtype=np.intp),
+            np.asarray(nan if wind_pressure_daPa is None else wind_pressure_daPa, dtype=np.float64),
+            np.asarray(nan if angle_grade is None else angle_grade, dtype=np.float64),
+        )
+
+        if np.any(rho <= 0):
+            raise ValueError("Le paramètre ρ doit être strictement positif")
+        if cable_index.size and (cable_index.min() < 0 or cable_index.max() >= len(cables)):
+            raise ValueError("Indice de câble hors de la table des câbles")
+
+        if load_factor is None:
+            load_factor = cls.span_load_factor(cables, cable_index, wind_pressure_daPa, ice_thickness_mm)
+        omega = cables.mass_lin_kg_per_m[cable_index]
+        omega = omega * np.broadcast_to(np.asarray(load_factor, dtype=np.float64), omega.shape)
+        rupture = cables.rupture_dan[cable_index]
+
+        b, F1, F2, H = cls.calculate_sags(a, h, rho)
+        T0, TA, TB = cls.calculate_tensions(rho, F2, H, omega)
+
+        # Arrondi à 1 daN comme spécifié
+        T0 = np.rint(T0)
+        TA = np.rint(TA)
+        TB = np.rint(TB)
+
+        limits = MechanicalCalculator
+        warnings = np.zeros(a.shape, dtype=np.uint8)
+        errors = np.zeros(a.shape, dtype=np.uint8)
+
+        warnings[wind > limits.WIND_LIMIT_DAPA] |= np.uint8(SpanWarning.WIND_ABOVE_LIMIT)
+        warnings[np.abs(angle) > limits.ANGLE_LIMIT_GRADE] |= np.uint8(SpanWarning.ANGLE_ABOVE_LIMIT)
+
+        max_tension = np.maximum(np.maximum(T0, TA), TB)
+        above_rupture = max_tension > rupture
+        near_rupture = ~above_rupture & (
+            max_tension > rupture * limits.RUPTURE_WARNING_RATIO
+        )
+        errors[above_rupture] |= np.uint8(SpanError.TENSION_ABOVE_RUPTURE)
+        warnings[near_rupture] |= np.uint8(SpanWarning.TENSION_NEAR_RUPTURE)
+
+        warnings[rho < limits.RHO_MIN_M] |= np.uint8(SpanWarning.RHO_LOW)
+        warnings[rho > limits.RHO_MAX_M] |= np.uint8(SpanWarning.RHO_HIGH)
+
+        return BatchSpanResult(
+            b=round_half_even(b, 2),
+            F1=round_half_even(F1, 2),
+            F2=round_half_even(F2, 2),
+            H=round_half_even(H, 2),
+            T0=T0,
+            TA=TA,
+            TB=TB,
+            warnings=warnings,
+            errors=errors
+        )
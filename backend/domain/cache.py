@@ -0,0 +1,180 @@
+"""
+Cache LRU des calculs de portée
+Mémorise les résultats de MechanicalCalculator.calculate_span pour des entrées
+strictement identiques (égalité des flottants), avec statistiques par processus
+"""
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from backend.domain.mechanical import (
+    CableProperties,
+    CompactSpanResult,
+    MechanicalCalculator,
+    SpanGeometry,
+    SpanResult,
+)
+
+
+def cable_fingerprint(cable: CableProperties) -> Tuple:
+    """Empreinte des propriétés d'un câble utilisées dans la clé du cache"""
+    return (
+        cable.name,
+        float(cable.mass_lin_kg_per_m),
+        float(cable.E_MPa),
+        float(cable.section_mm2),
+        float(cable.alpha_1e6_per_C),
+        float(cable.rupture_dan),
+        float(cable.diameter_mm),
+    )
+
+
+class SpanCache:
+    """
+    Cache LRU borné devant MechanicalCalculator.calculate_span
+
+    La clé contient toutes les entrées converties en flottants, ainsi que
+    l'ensemble des propriétés du câble : un résultat n'est jamais renvoyé pour
+    des entrées différentes. Lorsqu'un câble réapparaît avec des propriétés
+    modifiées, les entrées calculées avec ses anciennes propriétés sont purgées.
+    Une taille maximale nulle désactive le cache.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 0:
+            raise ValueError("La taille maximale du cache doit être positive ou nulle")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, CompactSpanResult]" = OrderedDict()
+        self._keys_by_cable: Dict[str, Set[Hashable]] = {}
+        self._fingerprints: Dict[str, Tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Le cache est actif si sa taille maximale est non nulle"""
+        return self.maxsize > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(value: Optional[float]) -> Optional[float]:
+        """Convertit une entrée optionnelle en flottant"""
+        return None if value is None else float(value)
+
+    def calculate_span(
+        self,
+        geometry: SpanGeometry,
+        cable: CableProperties,
+        rho: float,
+        wind_pressure_daPa: Optional[float] = None,
+        angle_grade: Optional[float] = None,
+        ice_thickness_mm: Optional[float] = None
+    ) -> SpanResult:
+        """
+        Calcul d'une portée via le cache (mêmes arguments que calculate_span)
+
+        Returns:
+            SpanResult, avec des listes de messages propres à chaque appel
+        """
+        a, h, rho = float(geometry.a), float(geometry.h), float(rho)
+        wind = self._normalize(wind_pressure_daPa)
+        angle = self._normalize(angle_grade)
+        ice = self._normalize(ice_thickness_mm)
+
+        def compute() -> CompactSpanResult:
+            return MechanicalCalculator.calculate_span_compact(
+                SpanGeometry(a=a, h=h), cable, rho, wind, angle, ice
+            )
+
+        values = (a, h, rho, wind, angle, ice)
+        if not self.enabled or any(v is not None and math.isnan(v) for v in values):
+            return compute().to_span_result()
+
+        fingerprint = cable_fingerprint(cable)
+        key = (fingerprint, *values)
+
+        with self._lock:
+            compact = self._entries.get(key)
+            if compact is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compact.to_span_result()
+            self.misses += 1
+
+        compact = compute()
+
+        with self._lock:
+            if self._fingerprints.get(cable.name, fingerprint) != fingerprint:
+                self._invalidate_locked(cable.name)
+            self._fingerprints[cable.name] = fingerprint
+
+            self._entries[key] = compact
+            self._entries.move_to_end(key)
+            self._keys_by_cable.setdefault(cable.name, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._evict_oldest_locked()
+
+        return compact.to_span_result()
+
+    def _evict_oldest_locked(self) -> None:
+        """Retire l'entrée la moins récemment utilisée"""
+        key, _ = self._entries.popitem(last=False)
+        name = key[0][0]
+        keys = self._keys_by_cable.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_cable[name]
+                self._fingerprints.pop(name, None)
+        self.evictions += 1
+
+    def _invalidate_locked(self, cable_name: str) -> int:
+        """Retire toutes les entrées d'un câble"""
+        keys = self._keys_by_cable.pop(cable_name, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        self._fingerprints.pop(cable_name, None)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def invalidate_cable(self, cable_name: str) -> int:
+        """
+        Invalide les résultats d'un câble (ex. après modification du catalogue)
+
+        Args:
+            cable_name: Nom du câble
+
+        Returns:
+            Nombre d'entrées retirées
+        """
+        with self._lock:
+            return self._invalidate_locked(cable_name)
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro"""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_cable.clear()
+            self._fingerprints.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict:
+        """Statistiques du cache pour ce processus"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,123 @@
+"""
+Calcul des cantons (sections entre deux supports d'ancrage)
+Portée équivalente de Blondel, état du canton par changement d'état, puis
+flèches et tensions de toutes les portées en une passe vectorisée
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike, BatchSpanCalculator, BatchSpanResult, CableTable
+from backend.domain.mechanical import CableProperties, blondel, canton_starts
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+
+
+def equivalent_spans(a: ArrayLike, starts: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Portée équivalente de Blondel de chaque canton (vectorisé)
+
+    a_eq = √(Σ ai³ / Σ ai) et K = Σ ai / a_eq, par la fonction blondel
+    commune au calcul unitaire
+
+    Args:
+        a: Longueurs de toutes les portées de la ligne (m)
+        starts: Indices de la première portée de chaque canton
+
+    Returns:
+        (a_eq, K) par canton
+    """
+    a = np.asarray(a, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.intp)
+
+    return blondel(np.add.reduceat(a, starts), np.add.reduceat(a**3, starts))
+
+
+@dataclass
+class CantonResult:
+    """Résultats d'une ligne découpée en cantons"""
+    # Par canton
+    ruling_span_m: np.ndarray  # Portée équivalente a_eq (m)
+    K: np.ndarray  # Coefficient de Blondel
+    tension_dan: np.ndarray  # Tension horizontale T0 non arrondie (daN)
+    rho_m: np.ndarray  # Paramètre de la chaînette (m)
+
+    # Par portée
+    canton_index: np.ndarray  # Canton de chaque portée
+    spans: BatchSpanResult  # Flèches et tensions de chaque portée
+
+
+class CantonSolver:
+    """Solveur de cantons : un changement d'état par canton, puis toutes les portées"""
+
+    @classmethod
+    def solve(
+        cls,
+        a: ArrayLike,
+        h: ArrayLike,
+        canton_sizes: ArrayLike,
+        cable: CableProperties,
+        reference: ReferenceState,
+        temperature_C: float,
+        wind_pressure_daPa: float = 0.0,
+        angle_grade: Optional[ArrayLike] = None,
+        constants: Optional[CableConstants] = None
+    ) -> CantonResult:
+        """
+        Calcule tous les cantons d'une ligne dans un état donné
+
+        Args:
+            a: Longueurs des portées, dans l'ordre de la ligne (m)
+            h: Dénivelés des portées (m)
+            canton_sizes: Nombre de portées de chaque canton
+            cable: Câble de la ligne
+            reference: État de référence (tension scalaire ou une par canton)
+            temperature_C: Température de l'état calculé (°C)
+            wind_pressure_daPa: Pression du vent de l'état calculé (daPa)
+            angle_grade: Angles topographiques par portée (grades), optionnel
+            constants: Constantes du câble déjà calculées, optionnel
+
+        Returns:
+            CantonResult
+        """
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        if a.shape != h.shape or a.ndim != 1:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+
+        sizes = np.asarray(canton_sizes, dtype=np.intp)
+        starts = canton_starts(sizes)
+        if sizes.sum() != a.size:
+            raise ValueError("La somme des tailles de cantons doit égaler le nombre de portées")
+
+        if constants is None:
+            constants = CableConstants.from_cable(cable)
+
+        a_eq, K = equivalent_spans(a, starts)
+        state = StateChangeSolver.solve(
+            constants, a_eq, reference, temperature_C, wind_pressure_daPa
+        )
+
+        canton_index = np.repeat(np.arange(sizes.size), sizes)
+        rho = state.rho_m[canton_index]
+        load_factor = state.apparent_weight_dan_per_m[canton_index] / constants.weight_dan_per_m
+
+        spans = BatchSpanCalculator.calculate_spans(
+            a=a,
+            h=h,
+            rho=rho,
+            cable_index=0,
+            cables=CableTable.from_cables([cable]),
+            wind_pressure_daPa=wind_pressure_daPa,
+            angle_grade=angle_grade,
+            load_factor=load_factor
+        )
+
+        return CantonResult(
+            ruling_span_m=a_eq,
+            K=K,
+            tension_dan=state.tension_dan,
+            rho_m=state.rho_m,
+            canton_index=canton_index,
+            spans=spans
+        )
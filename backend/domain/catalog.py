@@ -0,0 +1,34 @@
+"""
+Lecture des exports JSON du catalogue (Câble.json, Couche câble.json)
+Noms de champs XML décodés et conversion des valeurs numériques saisies
+avec une virgule décimale
+"""
+import json
+import math
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CATALOG_DIR = Path(os.getenv("CELESTEX_CATALOG_DIR", Path(__file__).resolve().parents[2]))
+CABLE_CATALOG_FILE = "Câble.json"
+LAYER_CATALOG_FILE = "Couche câble.json"
+
+
+def decode_xml_name(name: str) -> str:
+    """Décode les noms d'éléments XML exportés (_x0020_ → espace, etc.)"""
+    return re.sub(r"_x([0-9A-Fa-f]{4})_", lambda m: chr(int(m.group(1), 16)), name)
+
+
+def load_records(path: Path) -> List[Dict[str, str]]:
+    """Lit un export JSON du catalogue et décode les noms de champs"""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    (records,) = data.values()
+    return [{decode_xml_name(k): v for k, v in record.items()} for record in records]
+
+
+def parse_number(value: Optional[str]) -> float:
+    """Convertit un champ numérique du catalogue (NaN si absent ou vide)"""
+    if value is None or value.strip() == "":
+        return math.nan
+    return float(value.replace(",", "."))
@@ -0,0 +1,108 @@
+"""
+Validation en masse du domaine d'application mécanique CELESTE
+Mêmes règles que MechanicalCalculator.validate_celeste_domain, appliquées en
+colonnes à tous les cantons d'un parc, avec un histogramme des marges
+"""
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.canton import canton_starts
+
+SPAN_RATIO_LIMIT = 3.0  # a1/a2 au-delà duquel la limite stricte s'applique
+H_RATIO_LIMIT = 0.8  # h_max/a2 admissible si a1/a2 < 3
+H_RATIO_LIMIT_IRREGULAR = 0.4  # h_max/a2 admissible si a1/a2 ≥ 3
+
+# Classes de l'histogramme du taux d'utilisation (h_max/a2) / limite
+UTILISATION_EDGES = np.concatenate((np.arange(0.0, 1.5, 0.1), [np.inf]))
+
+
+@dataclass
+class DomainValidation:
+    """Résultat de validation, une valeur par canton"""
+    valid: np.ndarray  # Canton dans le domaine
+    span_ratio: np.ndarray  # a1/a2
+    h_ratio: np.ndarray  # h_max/a2
+    limit: np.ndarray  # Limite de h_max/a2 applicable (0.4 ou 0.8)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @property
+    def utilisation(self) -> np.ndarray:
+        """Taux d'utilisation (h_max/a2) / limite, > 1 hors domaine"""
+        return self.h_ratio / self.limit
+
+    def histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Répartition des cantons par taux d'utilisation
+
+        Returns:
+            (bornes des classes, effectifs), la dernière classe est ouverte
+        """
+        counts, _ = np.histogram(self.utilisation, bins=UTILISATION_EDGES)
+        return UTILISATION_EDGES, counts
+
+
+def canton_extremes(
+    a: ArrayLike,
+    h: ArrayLike,
+    canton_sizes: ArrayLike
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    a1, a2 et h_max de chaque canton à partir des portées de la ligne
+
+    Args:
+        a: Longueurs de toutes les portées (m)
+        h: Dénivelés de toutes les portées (m)
+        canton_sizes: Nombre de portées de chaque canton
+
+    Returns:
+        (a1 plus grande portée, a2 plus petite portée, h_max plus grand |dénivelé|) par canton
+    """
+    a = np.asarray(a, dtype=np.float64)
+    h = np.asarray(h, dtype=np.float64)
+    if a.ndim != 1 or a.shape != h.shape:
+        raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+    starts = canton_starts(canton_sizes)
+    if np.sum(canton_sizes) != a.size:
+        raise ValueError("La somme des tailles de cantons doit égaler le nombre de portées")
+    return (
+        np.maximum.reduceat(a, starts),
+        np.minimum.reduceat(a, starts),
+        np.maximum.reduceat(np.abs(h), starts)
+    )
+
+
+def validate_domains(a1: ArrayLike, a2: ArrayLike, h_max: ArrayLike) -> DomainValidation:
+    """
+    Valide le domaine CELESTE de tous les cantons
+
+    h_max/a2 ≤ 0.8 si a1/a2 < 3, h_max/a2 ≤ 0.4 sinon (ratios nuls si a2 ≤ 0,
+    comme la version scalaire).
+
+    Args:
+        a1: Plus grande portée de chaque canton (m)
+        a2: Plus petite portée de chaque canton (m)
+        h_max: Dénivelé maximum de chaque canton (m)
+
+    Returns:
+        DomainValidation
+    """
+    a1, a2, h_max = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (a1, a2, h_max))
+    )
+    positive = a2 > 0
+    safe_a2 = np.where(positive, a2, 1.0)
+    span_ratio = np.where(positive, a1 / safe_a2, 0.0)
+    h_ratio = np.where(positive, h_max / safe_a2, 0.0)
+
+    limit = np.where(span_ratio < SPAN_RATIO_LIMIT, H_RATIO_LIMIT, H_RATIO_LIMIT_IRREGULAR)
+    return DomainValidation(
+        valid=h_ratio <= limit,
+        span_ratio=span_ratio,
+        h_ratio=h_ratio,
+        limit=limit
+    )
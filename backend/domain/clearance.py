@@ -0,0 +1,313 @@
+"""
+Distances de sécurité aux nuages de points LiDAR (végétation, croisements)
+Les points sont rangés dans une grille le long de l'axe de la ligne ; chaque
+portée n'est comparée qu'aux points des cellules qu'elle recoupe. L'enveloppe
+du conducteur combine la flèche maximale et le balancement sous vent
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.profile import sag_at
+
+
+def load_point_cloud(path: Path, dtype: np.dtype = np.float32) -> np.ndarray:
+    """
+    Charge un nuage de points (x, y, z) exprimé dans le repère de la ligne
+
+    x : abscisse le long de l'axe depuis le premier support, y : décalage
+    latéral, z : altitude (m). Les fichiers .npy et binaires bruts sont
+    projetés en mémoire, sans lecture complète ; les CSV sont lus
+    (trois premières colonnes, ligne d'en-tête éventuelle ignorée).
+
+    Args:
+        path: Fichier .npy (n, 3), .csv, ou binaire brut de triplets
+        dtype: Type des valeurs d'un fichier binaire brut
+
+    Returns:
+        Tableau (n, 3)
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        points = np.load(path, mmap_mode="r")
+    elif suffix == ".csv":
+        with open(path, encoding="utf-8") as f:
+            first = f.readline()
+        try:
+            [float(value) for value in first.replace(";", ",").split(",")[:3]]
+            skip = 0
+        except ValueError:
+            skip = 1
+        delimiter = ";" if ";" in first else ","
+        points = np.loadtxt(path, delimiter=delimiter, skiprows=skip, usecols=(0, 1, 2), ndmin=2)
+    else:
+        points = np.memmap(path, dtype=dtype, mode="r")
+        if points.size % 3:
+            raise ValueError("Le fichier binaire doit contenir des triplets (x, y, z)")
+        points = points.reshape(-1, 3)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError("Le nuage de points doit être un tableau (n, 3)")
+    return points
+
+
+@dataclass
+class PointGridIndex:
+    """Points rangés par cellule le long de l'axe de la ligne"""
+    cell_size_m: float
+    x_min_m: float
+    cell_starts: np.ndarray  # Premier point de chaque cellule, plus le total
+    points: np.ndarray  # Points triés par cellule (n, 3)
+    point_index: np.ndarray  # Indice de chaque point trié dans le nuage d'origine
+
+    def __len__(self) -> int:
+        return len(self.point_index)
+
+    @classmethod
+    def build(
+        cls,
+        points: np.ndarray,
+        cell_size_m: float = 25.0,
+        max_lateral_m: Optional[float] = None
+    ) -> "PointGridIndex":
+        """
+        Range les points par cellule de longueur cell_size_m (tri stable par cellule)
+
+        Args:
+            points: Nuage (n, 3) dans le repère de la ligne
+            cell_size_m: Longueur d'une cellule le long de l'axe (m)
+            max_lateral_m: Points à plus de cette distance latérale de l'axe
+                écartés dès la construction, optionnel
+
+        Returns:
+            PointGridIndex
+        """
+        if cell_size_m <= 0:
+            raise ValueError("La taille de cellule doit être strictement positive")
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError("Le nuage de points doit être un tableau (n, 3)")
+
+        kept = np.arange(len(points))
+        if max_lateral_m is not None:
+            kept = np.flatnonzero(np.abs(points[:, 1]) <= max_lateral_m)
+        x = points[kept, 0].astype(np.float64)
+        x_min = float(x.min()) if x.size else 0.0
+
+        cell = ((x - x_min) // cell_size_m).astype(np.intp)
+        order = np.argsort(cell, kind="stable")
+        counts = np.bincount(cell, minlength=1)
+        starts = np.concatenate(([0], np.cumsum(counts)))
+        original = kept[order]
+
+        return cls(
+            cell_size_m=cell_size_m,
+            x_min_m=x_min,
+            cell_starts=starts,
+            points=np.ascontiguousarray(points[original]),
+            point_index=original
+        )
+
+    def query(self, x_start_m: float, x_end_m: float) -> Tuple[int, int]:
+        """
+        Plage des points triés des cellules recoupant [x_start_m, x_end_m]
+
+        Returns:
+            (début, fin) dans points et point_index
+        """
+        n_cells = self.cell_starts.size - 1
+        first = int(np.clip((x_start_m - self.x_min_m) // self.cell_size_m, 0, n_cells))
+        last = int(np.clip((x_end_m - self.x_min_m) // self.cell_size_m + 1, 0, n_cells))
+        return int(self.cell_starts[first]), int(self.cell_starts[max(first, last)])
+
+
+@dataclass
+class ConductorEnvelope:
+    """Positions extrêmes des conducteurs d'une ligne"""
+    a: np.ndarray  # Longueurs des portées (m)
+    h: np.ndarray  # Dénivelés (m)
+    start_altitude_m: float  # Altitude de l'accrochage du premier support (m)
+    rho_max_sag_m: np.ndarray  # Paramètre de l'état de flèche maximale, par portée (m)
+    rho_wind_m: np.ndarray  # Paramètre de l'état de vent, par portée (m)
+    swing_angle_rad: float = 0.0  # Balancement sous vent, de part et d'autre de la verticale (rad)
+    phase_offsets_m: Sequence[float] = (0.0,)  # Décalages latéraux des conducteurs (m)
+
+    @classmethod
+    def from_spans(
+        cls,
+        a: ArrayLike,
+        h: ArrayLike,
+        rho_max_sag_m: ArrayLike,
+        start_altitude_m: float = 0.0,
+        rho_wind_m: Optional[ArrayLike] = None,
+        swing_angle_rad: float = 0.0,
+        phase_offsets_m: Sequence[float] = (0.0,)
+    ) -> "ConductorEnvelope":
+        """Enveloppe d'une ligne, paramètres scalaires ou par portée"""
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        if a.ndim != 1 or a.shape != h.shape or a.size == 0:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+        rho_max = np.broadcast_to(np.asarray(rho_max_sag_m, dtype=np.float64), a.shape)
+        rho_wind = rho_max if rho_wind_m is None else np.broadcast_to(
+            np.asarray(rho_wind_m, dtype=np.float64), a.shape
+        )
+        if np.any(a <= 0) or np.any(rho_max <= 0) or np.any(rho_wind <= 0):
+            raise ValueError("Les portées et les paramètres ρ doivent être strictement positifs")
+        if len(phase_offsets_m) == 0:
+            raise ValueError("Au moins un conducteur est nécessaire")
+        return cls(a, h, start_altitude_m, rho_max, rho_wind, swing_angle_rad, tuple(phase_offsets_m))
+
+    @property
+    def supports_m(self) -> np.ndarray:
+        """Abscisse de chaque support (m)"""
+        return np.concatenate(([0.0], np.cumsum(self.a)))
+
+    @property
+    def attachment_altitudes_m(self) -> np.ndarray:
+        """Altitude d'accrochage de chaque support (m)"""
+        return self.start_altitude_m + np.concatenate(([0.0], np.cumsum(self.h)))
+
+    def distances(self, span: int, points: np.ndarray) -> np.ndarray:
+        """
+        Distance de chaque point à l'enveloppe des conducteurs d'une portée
+
+        Dans le plan transversal de chaque point, le conducteur occupe la
+        position de flèche maximale (sous la corde) et l'arc de rayon F_vent
+        balayé de −φ à +φ autour de la corde. La distance est le minimum sur
+        les conducteurs.
+
+        Args:
+            span: Indice de la portée
+            points: Points (n, 3) situés au droit de la portée
+
+        Returns:
+            Distances (m)
+        """
+        a, h = self.a[span], self.h[span]
+        x = np.asarray(points[:, 0], dtype=np.float64) - self.supports_m[span]
+        x = np.clip(x, 0.0, a)
+        y = np.asarray(points[:, 1], dtype=np.float64)
+        z = np.asarray(points[:, 2], dtype=np.float64)
+
+        chord = self.attachment_altitudes_m[span] + h * x / a
+        sag_max = sag_at(x, a, h, self.rho_max_sag_m[span])
+        sag_wind = sag_at(x, a, h, self.rho_wind_m[span])
+        phi = abs(self.swing_angle_rad)
+        dz = z - chord
+
+        distance = np.full(x.shape, np.inf)
+        for offset in self.phase_offsets_m:
+            dy = y - offset
+            hanging = np.hypot(dy, dz + sag_max)
+
+            # Arc du balancement : angle mesuré depuis la verticale descendante
+            theta = np.arctan2(dy, -dz)
+            on_arc = np.abs(theta) <= phi
+            radial = np.abs(np.hypot(dy, dz) - sag_wind)
+            end_y = np.sign(theta) * sag_wind * np.sin(phi)
+            end_z = -sag_wind * np.cos(phi)
+            to_end = np.hypot(dy - end_y, dz - end_z)
+            swing = np.where(on_arc, radial, to_end)
+
+            distance = np.minimum(distance, np.minimum(hanging, swing))
+        return distance
+
+
+@dataclass
+class ClearanceResult:
+    """Contrôle des distances d'une ligne"""
+    # Par portée
+    min_distance_m: np.ndarray  # Distance minimale (inf si aucun point)
+    min_point_index: np.ndarray  # Point le plus proche (indice dans le nuage, −1 si aucun)
+    points_checked: np.ndarray  # Nombre de points comparés
+    violations_count: np.ndarray  # Nombre de points sous la distance requise
+
+    # Par point en défaut
+    violation_point_index: np.ndarray
+    violation_span: np.ndarray
+    violation_distance_m: np.ndarray
+
+
+def _check_spans(
+    envelope: ConductorEnvelope,
+    spans: Sequence[int],
+    chunks: Sequence[Tuple[np.ndarray, np.ndarray]],
+    clearance_m: float
+) -> List[Tuple]:
+    """Contrôle de portées avec leurs points (exécutable dans un autre processus)"""
+    results = []
+    supports = envelope.supports_m
+    last_span = envelope.a.size - 1
+    for span, (points, index) in zip(spans, chunks):
+        x = points[:, 0]
+        inside = (x >= supports[span]) & ((x < supports[span + 1]) | ((span == last_span) & (x <= supports[-1])))
+        points, index = points[inside], index[inside]
+        if len(index) == 0:
+            results.append((np.inf, -1, 0, np.empty(0, np.intp), np.empty(0)))
+            continue
+        distance = envelope.distances(span, points)
+        best = int(np.argmin(distance))
+        bad = distance < clearance_m
+        results.append((float(distance[best]), int(index[best]), len(index), index[bad], distance[bad]))
+    return results
+
+
+class ClearanceChecker:
+    """Comparaison de l'enveloppe des conducteurs au nuage de points indexé"""
+
+    @staticmethod
+    def check(
+        index: PointGridIndex,
+        envelope: ConductorEnvelope,
+        clearance_m: float,
+        workers: Optional[int] = None
+    ) -> ClearanceResult:
+        """
+        Distances minimales par portée et points en défaut
+
+        Args:
+            index: Nuage de points indexé
+            envelope: Enveloppe des conducteurs
+            clearance_m: Distance requise (m)
+            workers: Nombre de processus (None ou 1 : dans le processus courant)
+
+        Returns:
+            ClearanceResult
+        """
+        supports = envelope.supports_m
+        n_spans = envelope.a.size
+        ranges = [index.query(supports[i], supports[i + 1]) for i in range(n_spans)]
+
+        def chunk(span: int) -> Tuple[np.ndarray, np.ndarray]:
+            start, stop = ranges[span]
+            return index.points[start:stop], index.point_index[start:stop]
+
+        spans = list(range(n_spans))
+        if workers is None or workers <= 1 or n_spans <= 1:
+            results = _check_spans(envelope, spans, [chunk(i) for i in spans], clearance_m)
+        else:
+            groups = np.array_split(np.arange(n_spans), min(workers, n_spans))
+            with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+                futures = [
+                    executor.submit(
+                        _check_spans, envelope, group.tolist(), [chunk(i) for i in group], clearance_m
+                    )
+                    for group in groups
+                ]
+                results = [item for future in futures for item in future.result()]
+
+        violations = [r[3] for r in results]
+        return ClearanceResult(
+            min_distance_m=np.array([r[0] for r in results], dtype=np.float64),
+            min_point_index=np.array([r[1] for r in results], dtype=np.intp),
+            points_checked=np.array([r[2] for r in results], dtype=np.intp),
+            violations_count=np.array([len(v) for v in violations], dtype=np.intp),
+            violation_point_index=np.concatenate(violations).astype(np.intp),
+            violation_span=np.repeat(np.arange(n_spans), [len(v) for v in violations]),
+            violation_distance_m=np.concatenate([r[4] for r in results]).astype(np.float64)
+        )
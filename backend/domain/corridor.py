@@ -0,0 +1,158 @@
+"""
+Tranchée forestière le long d'une ligne
+Combine la courbe des conducteurs, le terrain et les distances de sécurité
+pour produire l'enveloppe de la tranchée (demi-largeurs, hauteurs) et sa
+synthèse par portée
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike, BatchSpanCalculator
+from backend.domain.mechanical import CableProperties
+from backend.domain.profile import ConductorProfile
+
+
+@dataclass
+class CorridorParameters:
+    """Distances définissant la tranchée"""
+    conductor_offset_m: float  # d_câble/axe : distance horizontale conducteur extrême / axe (m)
+    safety_at_m: float  # d_sécurité_AT (m)
+    safety_dt_m: float  # d_sécurité_DT (m)
+    safety_vertical_m: float  # d_sécurité sous le conducteur (m)
+    swing_angle_rad: float = 0.0  # Inclinaison du conducteur sous vent (rad)
+
+
+@dataclass
+class CorridorProfile:
+    """Enveloppe de la tranchée aux points échantillonnés"""
+    span_index: np.ndarray
+    station_m: np.ndarray  # Abscisse cumulée (m)
+    conductor_altitude_m: np.ndarray  # Altitude du conducteur, déport compris (m)
+    ground_altitude_m: np.ndarray  # Altitude du terrain (m)
+    half_width_at_m: np.ndarray  # ½ largeur AT (m)
+    half_width_dt_m: np.ndarray  # ½ largeur DT (m)
+    trench_height_m: np.ndarray  # Hauteur de tranchée au-dessus du terrain (m)
+
+
+@dataclass
+class CorridorSpanSummary:
+    """Synthèse de la tranchée par portée"""
+    max_half_width_at_m: np.ndarray
+    max_half_width_dt_m: np.ndarray
+    min_trench_height_m: np.ndarray
+    min_trench_station_m: np.ndarray  # Abscisse cumulée du minimum (m)
+    area_at_m2: np.ndarray  # Surface de la tranchée AT (m²)
+    area_dt_m2: np.ndarray  # Surface de la tranchée DT (m²)
+
+
+def swing_angle(cable: CableProperties, wind_pressure_daPa: float) -> float:
+    """
+    Inclinaison du conducteur sous vent : tan φ = q·d / (ω·g)
+
+    Args:
+        cable: Propriétés du câble
+        wind_pressure_daPa: Pression du vent (daPa)
+
+    Returns:
+        Angle d'inclinaison (rad)
+    """
+    wind_load = wind_pressure_daPa * cable.diameter_mm / 1000
+    weight = cable.mass_lin_kg_per_m * BatchSpanCalculator.G / 10
+    return float(np.arctan2(wind_load, weight))
+
+
+class CorridorCalculator:
+    """Calcul vectorisé de la tranchée forestière"""
+
+    @staticmethod
+    def compute(
+        profile: ConductorProfile,
+        parameters: CorridorParameters,
+        ground_stations_m: ArrayLike,
+        ground_altitudes_m: ArrayLike
+    ) -> CorridorProfile:
+        """
+        Enveloppe de la tranchée en chaque point du profil
+
+        ½ Largeur = d_câble/axe + F(x)·sin φ + d_sécurité
+        Hauteur tranchée = h_câble − h_point − d_sécurité
+
+        Args:
+            profile: Profil échantillonné des conducteurs
+            parameters: Distances de la tranchée
+            ground_stations_m: Abscisses cumulées des points de terrain (croissantes)
+            ground_altitudes_m: Altitudes des points de terrain (m)
+
+        Returns:
+            CorridorProfile
+        """
+        stations = np.asarray(ground_stations_m, dtype=np.float64)
+        altitudes = np.asarray(ground_altitudes_m, dtype=np.float64)
+        if stations.ndim != 1 or stations.shape != altitudes.shape or stations.size < 2:
+            raise ValueError("Le terrain doit contenir au moins deux points (abscisse, altitude)")
+        if np.any(np.diff(stations) <= 0):
+            raise ValueError("Les abscisses du terrain doivent être strictement croissantes")
+
+        ground = np.interp(profile.station_m, stations, altitudes)
+
+        phi = parameters.swing_angle_rad
+        lateral = parameters.conductor_offset_m + profile.sag_m * np.sin(phi)
+        conductor = profile.chord_altitude_m - profile.sag_m * np.cos(phi)
+
+        return CorridorProfile(
+            span_index=profile.span_index,
+            station_m=profile.station_m,
+            conductor_altitude_m=conductor,
+            ground_altitude_m=ground,
+            half_width_at_m=lateral + parameters.safety_at_m,
+            half_width_dt_m=lateral + parameters.safety_dt_m,
+            trench_height_m=conductor - ground - parameters.safety_vertical_m
+        )
+
+    @staticmethod
+    def summarize(
+        corridor: CorridorProfile,
+        span_starts: ArrayLike,
+        n_spans: Optional[int] = None
+    ) -> CorridorSpanSummary:
+        """
+        Agrège l'enveloppe par portée
+
+        Args:
+            corridor: Enveloppe calculée par compute
+            span_starts: Indice du premier point de chaque portée
+            n_spans: Nombre de portées (déduit de span_starts par défaut)
+
+        Returns:
+            CorridorSpanSummary
+        """
+        starts = np.asarray(span_starts, dtype=np.intp)
+        n_spans = starts.size if n_spans is None else n_spans
+
+        heights = corridor.trench_height_m
+        min_height = np.minimum.reduceat(heights, starts)
+
+        # Premier point atteignant le minimum de sa portée
+        at_min = heights == min_height[corridor.span_index]
+        first_min = np.full(n_spans, heights.size, dtype=np.intp)
+        np.minimum.at(first_min, corridor.span_index[at_min], np.flatnonzero(at_min))
+
+        # Surfaces par trapèzes, sans les segments reliant deux portées
+        dx = np.diff(corridor.station_m)
+        same_span = corridor.span_index[1:] == corridor.span_index[:-1]
+        owner = corridor.span_index[:-1][same_span]
+
+        def area(half_width: np.ndarray) -> np.ndarray:
+            segments = (half_width[1:] + half_width[:-1]) * dx  # 2 × ½ largeur moyenne × dx
+            return np.bincount(owner, weights=segments[same_span], minlength=n_spans)
+
+        return CorridorSpanSummary(
+            max_half_width_at_m=np.maximum.reduceat(corridor.half_width_at_m, starts),
+            max_half_width_dt_m=np.maximum.reduceat(corridor.half_width_dt_m, starts),
+            min_trench_height_m=min_height,
+            min_trench_station_m=corridor.station_m[first_min],
+            area_at_m2=area(corridor.half_width_at_m),
+            area_dt_m2=area(corridor.half_width_dt_m)
+        )
@@ -0,0 +1,296 @@
+"""
+Charge de rupture résiduelle (CRR) à partir du catalogue des couches
+Déduit la charge de rupture de chaque brin, couche par couche, et précalcule
+au chargement la table CRR/CR de tous les scénarios « k brins cassés dans la
+couche n » pour tous les câbles du catalogue
+"""
+import logging
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+from backend.domain.catalog import (
+    CABLE_CATALOG_FILE,
+    CATALOG_DIR,
+    LAYER_CATALOG_FILE,
+    load_records,
+    parse_number
+)
+from backend.domain.mechanical import MechanicalCalculator
+
+logger = logging.getLogger(__name__)
+
+CR_RATIO = 0.95  # CR = min(CRA × 0.95, CRR)
+
+# Contrainte de rupture du câble (daN/mm²) à utiliser selon la nature de la couche.
+# Le cuivre et le bronze sont saisis dans la rubrique « Rupture de l'acier ».
+STRESS_FIELD_BY_NATURE = {
+    "Acier": "Rupture de l'acier",
+    "Cuivre": "Rupture de l'acier",
+    "Bronze": "Rupture de l'acier",
+    "Aluminium": "Rupture de l'aluminium",
+    "Aluminium recuit": "Rupture de l'aluminium",
+    "Almelec": "Rupture de l'almelec",
+}
+
+
+@dataclass
+class CRRCatalog:
+    """
+    Table CRR/CR précalculée pour tout le catalogue
+
+    Les couches sont stockées en colonnes. Pour la couche i, les valeurs des
+    scénarios k = 0..strands[i] brins cassés sont rangées à partir de
+    table_offsets[i] dans crr_table et cr_table.
+    """
+    cable_names: List[str]
+    cra_dan: np.ndarray  # Charge de rupture assignée (ou nominale) par câble (daN)
+
+    layer_cable: np.ndarray  # Câble de chaque couche
+    layer_number: np.ndarray  # N° de couche (1 = âme)
+    layer_nature: List[str]
+    strands: np.ndarray  # Nombre de brins
+    strand_diameter_mm: np.ndarray
+    strand_strength_dan: np.ndarray  # Charge de rupture d'un brin (NaN si inconnue)
+
+    table_offsets: np.ndarray
+    crr_table: np.ndarray
+    cr_table: np.ndarray
+
+    _cable_index: Dict[str, int] = field(default_factory=dict, repr=False)
+    _layer_index: Dict[Tuple[int, int], int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._cable_index = {name: i for i, name in enumerate(self.cable_names)}
+        self._layer_index = {
+            (int(c), int(n)): i for i, (c, n) in enumerate(zip(self.layer_cable, self.layer_number))
+        }
+
+    def __len__(self) -> int:
+        return len(self.cable_names)
+
+    def __contains__(self, cable_name: str) -> bool:
+        return cable_name in self._cable_index
+
+    @staticmethod
+    def strand_strength(
+        nature: str,
+        strand_diameter_mm: float,
+        cra_strand_dan: float,
+        cable_record: Mapping[str, str]
+    ) -> float:
+        """
+        Charge de rupture d'un brin
+
+        « CRA brin » du catalogue si renseignée, sinon contrainte de rupture
+        du matériau × section du brin (π·d²/4).
+
+        Args:
+            nature: Nature de la couche
+            strand_diameter_mm: Diamètre du brin (mm)
+            cra_strand_dan: Champ « CRA brin » (daN, 0 si absent)
+            cable_record: Fiche du câble (contraintes de rupture en daN/mm²)
+
+        Returns:
+            Charge de rupture (daN), NaN si elle ne peut pas être déduite
+        """
+        if cra_strand_dan > 0:
+            return cra_strand_dan
+        stress_field = STRESS_FIELD_BY_NATURE.get(nature)
+        stress = parse_number(cable_record.get(stress_field)) if stress_field else math.nan
+        if not stress > 0:
+            return math.nan
+        return stress * math.pi * strand_diameter_mm**2 / 4
+
+    @classmethod
+    def from_records(
+        cls,
+        cables: List[Mapping[str, str]],
+        layers: List[Mapping[str, str]]
+    ) -> "CRRCatalog":
+        """
+        Construit et précalcule la table à partir des fiches du catalogue
+
+        Args:
+            cables: Fiches « Câble » (noms de champs décodés)
+            layers: Fiches « Couche câble » (noms de champs décodés)
+
+        Returns:
+            CRRCatalog
+        """
+        cable_names, cra = [], []
+        records = {}
+        for record in cables:
+            rupture = parse_number(record.get("Charge de Rupture Assignée"))
+            if math.isnan(rupture):
+                rupture = parse_number(record.get("Charge de Rupture Nominale"))
+            if math.isnan(rupture):
+                continue
+            records[(record["Désignation"], record.get("Indice"))] = (len(cable_names), record)
+            cable_names.append(record["Désignation"])
+            cra.append(rupture)
+
+        rows = []
+        for layer in layers:
+            key = (layer["Désignation câble"], layer.get("Indice câble"))
+            if key not in records:
+                continue
+            cable_index, cable_record = records[key]
+            diameter = parse_number(layer["Diamètre des brins"])
+            nature = layer["Nature de la couche"]
+            rows.append((
+                cable_index,
+                int(layer["N° de la couche"]),
+                nature,
+                int(layer["Nombre de brins"]),
+                diameter,
+                cls.strand_strength(nature, diameter, parse_number(layer.get("CRA brin")), cable_record)
+            ))
+        rows.sort(key=lambda row: (row[0], row[1]))
+
+        cra_dan = np.array(cra, dtype=np.float64)
+        layer_cable = np.array([r[0] for r in rows], dtype=np.intp)
+        strands = np.array([r[3] for r in rows], dtype=np.intp)
+        strength = np.array([r[5] for r in rows], dtype=np.float64)
+
+        # Table de tous les scénarios k = 0..strands, toutes couches confondues
+        sizes = strands + 1
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.intp)
+        entry_layer = np.repeat(np.arange(len(rows)), sizes)
+        broken = np.arange(sizes.sum()) - offsets[entry_layer]
+        entry_cra = cra_dan[layer_cable[entry_layer]]
+        crr_table = entry_cra - broken * strength[entry_layer]
+        cr_table = np.minimum(entry_cra * CR_RATIO, crr_table)
+
+        return cls(
+            cable_names=cable_names,
+            cra_dan=cra_dan,
+            layer_cable=layer_cable,
+            layer_number=np.array([r[1] for r in rows], dtype=np.intp),
+            layer_nature=[r[2] for r in rows],
+            strands=strands,
+            strand_diameter_mm=np.array([r[4] for r in rows], dtype=np.float64),
+            strand_strength_dan=strength,
+            table_offsets=offsets,
+            crr_table=crr_table,
+            cr_table=cr_table
+        )
+
+    @classmethod
+    def load(cls, directory: Path = CATALOG_DIR) -> "CRRCatalog":
+        """Charge le catalogue JSON (Câble.json et Couche câble.json)"""
+        directory = Path(directory)
+        cables = load_records(directory / CABLE_CATALOG_FILE)
+        layers = load_records(directory / LAYER_CATALOG_FILE)
+        return cls.from_records(cables, layers)
+
+    def cable_cra(self, cable_name: str) -> float:
+        """Charge de rupture à neuf d'un câble (daN)"""
+        return float(self.cra_dan[self._cable(cable_name)])
+
+    def cable_layers(self, cable_name: str) -> List[Dict]:
+        """
+        Couches d'un câble et charge de rupture de leurs brins
+
+        Args:
+            cable_name: Désignation du câble
+
+        Returns:
+            Liste de couches, de l'âme vers l'extérieur
+        """
+        cable = self._cable(cable_name)
+        return [
+            {
+                "layer": int(self.layer_number[i]),
+                "nature": self.layer_nature[i],
+                "strands": int(self.strands[i]),
+                "strand_diameter_mm": float(self.strand_diameter_mm[i]),
+                "strand_strength_dan": None if math.isnan(self.strand_strength_dan[i])
+                else float(self.strand_strength_dan[i])
+            }
+            for i in np.flatnonzero(self.layer_cable == cable)
+        ]
+
+    def _cable(self, cable_name: str) -> int:
+        if cable_name not in self._cable_index:
+            raise KeyError(f"Câble inconnu du catalogue: {cable_name}")
+        return self._cable_index[cable_name]
+
+    def _layer(self, cable_name: str, layer_number: int) -> int:
+        key = (self._cable(cable_name), layer_number)
+        if key not in self._layer_index:
+            raise KeyError(f"Couche {layer_number} inconnue pour le câble {cable_name}")
+        return self._layer_index[key]
+
+    def lookup(self, cable_name: str, layer_number: int, broken: int) -> Tuple[float, float]:
+        """
+        (CRR, CR) pour k brins cassés dans une couche, lus dans la table
+
+        Args:
+            cable_name: Désignation du câble
+            layer_number: N° de la couche (1 = âme)
+            broken: Nombre de brins cassés
+
+        Returns:
+            (CRR, CR) en daN, NaN si la charge des brins est inconnue
+        """
+        layer = self._layer(cable_name, layer_number)
+        if not 0 <= broken <= self.strands[layer]:
+            raise ValueError(f"La couche {layer_number} compte {self.strands[layer]} brins")
+        entry = self.table_offsets[layer] + broken
+        return float(self.crr_table[entry]), float(self.cr_table[entry])
+
+    def evaluate(self, cable_name: str, damage: Mapping[int, int]) -> Tuple[float, float]:
+        """
+        (CRR, CR) pour des brins cassés dans plusieurs couches
+
+        Args:
+            cable_name: Désignation du câble
+            damage: Nombre de brins cassés par n° de couche
+
+        Returns:
+            (CRR, CR) en daN, NaN si une charge de brin est inconnue
+        """
+        broken_wires = []
+        for layer_number, broken in damage.items():
+            layer = self._layer(cable_name, layer_number)
+            if not 0 <= broken <= self.strands[layer]:
+                raise ValueError(f"La couche {layer_number} compte {self.strands[layer]} brins")
+            broken_wires.append((broken, float(self.strand_strength_dan[layer])))
+        return MechanicalCalculator.calculate_crr(self.cable_cra(cable_name), broken_wires)
+
+    def outer_layer_scenario(self, broken: int) -> np.ndarray:
+        """
+        CR de tous les câbles pour k brins cassés dans la couche extérieure
+
+        Args:
+            broken: Nombre de brins cassés
+
+        Returns:
+            CR par câble (daN), NaN sans données de couche ou si k dépasse le nombre de brins
+        """
+        result = np.full(len(self), np.nan)
+        if self.layer_cable.size == 0:
+            return result
+        # Dernière couche de chaque câble (couches triées par câble puis n°)
+        last = np.flatnonzero(np.r_[self.layer_cable[1:] != self.layer_cable[:-1], True])
+        valid = last[self.strands[last] >= broken]
+        result[self.layer_cable[valid]] = self.cr_table[self.table_offsets[valid] + broken]
+        return result
+
+
+def _load_default_catalog() -> CRRCatalog:
+    """Catalogue chargé à l'import ; vide si les fichiers sont absents"""
+    try:
+        catalog = CRRCatalog.load()
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Catalogue CRR indisponible ({e}), table vide")
+        return CRRCatalog.from_records([], [])
+    logger.info(f"Catalogue CRR: {len(catalog)} câbles, {catalog.cr_table.size} scénarios précalculés")
+    return catalog
+
+
+CRR_CATALOG = _load_default_catalog()
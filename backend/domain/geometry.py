@@ -0,0 +1,215 @@
+"""
+Géométrie 3D d'une ligne sous forme de tampons binaires
+Sommets des chaînettes, supports et points bas en Float32/Uint32 little-endian,
+précédés d'un en-tête JSON décrivant les décalages
+"""
+import json
+import struct
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.profile import ProfileSampler, sag_at
+
+GEOMETRY_FORMAT_VERSION = 1
+
+# Types des tampons : correspondance directe avec les tableaux typés JavaScript
+BUFFER_DTYPES = {
+    "float32": np.dtype("<f4"),
+    "uint32": np.dtype("<u4"),
+}
+
+
+@dataclass
+class LineGeometry:
+    """Tampons de géométrie d'une ligne (repère : x le long de la ligne, y latéral, z altitude)"""
+    origin: Tuple[float, float, float]  # Origine soustraite aux coordonnées (m)
+    catenary_positions: np.ndarray  # Sommets des conducteurs (n, 3) float32
+    catenary_indices: np.ndarray  # Paires d'indices de segments uint32
+    span_offsets: np.ndarray  # Premier sommet de chaque portée et conducteur, plus le total, uint32
+    low_points: np.ndarray  # Point bas de chaque portée et conducteur (n, 3) float32
+    support_positions: Optional[np.ndarray] = None  # Pied et sommet de chaque support (n, 2, 3) float32
+
+    def buffers(self) -> Dict[str, np.ndarray]:
+        """Tampons à sérialiser, dans l'ordre d'écriture"""
+        buffers = {
+            "catenary_positions": self.catenary_positions,
+            "catenary_indices": self.catenary_indices,
+            "span_offsets": self.span_offsets,
+            "low_points": self.low_points,
+        }
+        if self.support_positions is not None:
+            buffers["support_positions"] = self.support_positions
+        return buffers
+
+
+class LineGeometryBuilder:
+    """Construction vectorisée de la géométrie d'une ligne"""
+
+    @staticmethod
+    def build(
+        a: ArrayLike,
+        h: ArrayLike,
+        rho: ArrayLike,
+        start_altitude_m: float = 0.0,
+        phase_offsets_m: Sequence[float] = (0.0,),
+        support_heights_m: Optional[ArrayLike] = None,
+        resolution_m: float = 1.0
+    ) -> LineGeometry:
+        """
+        Calcule les sommets de toutes les chaînettes, supports et points bas
+
+        Les coordonnées sont exprimées par rapport au premier accrochage pour
+        conserver la précision en Float32 sur les longues lignes.
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette, scalaire ou par portée (m)
+            start_altitude_m: Altitude de l'accrochage du premier support (m)
+            phase_offsets_m: Décalages latéraux des conducteurs par rapport à l'axe (m)
+            support_heights_m: Hauteur d'accrochage de chaque support au-dessus du sol (m), optionnel
+            resolution_m: Pas d'échantillonnage des chaînettes (m)
+
+        Returns:
+            LineGeometry
+        """
+        profile = ProfileSampler.sample(a, h, rho, 0.0, resolution_m)
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        rho = np.broadcast_to(np.asarray(rho, dtype=np.float64), a.shape)
+        phases = np.asarray(phase_offsets_m, dtype=np.float64)
+        if phases.ndim != 1 or phases.size == 0:
+            raise ValueError("Au moins un conducteur est nécessaire")
+
+        n_points = len(profile)
+        n_spans = a.size
+
+        # Sommets : un bloc par conducteur
+        positions = np.empty((phases.size, n_points, 3), dtype=np.float32)
+        positions[:, :, 0] = profile.station_m
+        positions[:, :, 1] = phases[:, None]
+        positions[:, :, 2] = profile.altitude_m
+        positions = positions.reshape(-1, 3)
+
+        # Segments entre points consécutifs d'une même portée
+        same_span = np.flatnonzero(profile.span_index[1:] == profile.span_index[:-1])
+        block = (np.arange(phases.size) * n_points)[:, None]
+        first = (same_span[None, :] + block).ravel()
+        indices = np.column_stack((first, first + 1)).astype(np.uint32).ravel()
+
+        offsets = np.append(
+            (profile.span_starts[None, :] + block).ravel(), phases.size * n_points
+        ).astype(np.uint32)
+
+        # Points bas : dy/dx = 0 en x = a/2 − ρ·h/b, borné à la portée
+        b = np.sqrt(a**2 + h**2)
+        x_low = np.clip(a / 2 - rho * h / b, 0.0, a)
+        supports_x = np.concatenate(([0.0], np.cumsum(a)))
+        supports_z = np.concatenate(([0.0], np.cumsum(h)))
+        z_low = supports_z[:-1] + h * x_low / a - sag_at(x_low, a, h, rho)
+
+        low_points = np.empty((phases.size, n_spans, 3), dtype=np.float32)
+        low_points[:, :, 0] = supports_x[:-1] + x_low
+        low_points[:, :, 1] = phases[:, None]
+        low_points[:, :, 2] = z_low
+        low_points = low_points.reshape(-1, 3)
+
+        support_positions = None
+        if support_heights_m is not None:
+            heights = np.asarray(support_heights_m, dtype=np.float64)
+            if heights.shape != supports_x.shape:
+                raise ValueError("Une hauteur de support est attendue par support (portées + 1)")
+            support_positions = np.empty((supports_x.size, 2, 3), dtype=np.float32)
+            support_positions[:, :, 0] = supports_x[:, None]
+            support_positions[:, :, 1] = 0.0
+            support_positions[:, 0, 2] = supports_z - heights
+            support_positions[:, 1, 2] = supports_z
+
+        return LineGeometry(
+            origin=(0.0, 0.0, float(start_altitude_m)),
+            catenary_positions=positions,
+            catenary_indices=indices,
+            span_offsets=offsets,
+            low_points=low_points,
+            support_positions=support_positions
+        )
+
+
+def pack_buffers(buffers: Dict[str, np.ndarray], meta: Optional[Dict] = None) -> bytes:
+    """
+    Sérialise des tampons typés avec un en-tête JSON
+
+    Format : longueur de l'en-tête (uint32 LE), en-tête JSON complété par des
+    espaces jusqu'à un multiple de 4 octets, puis les tampons alignés sur
+    4 octets. Les décalages de l'en-tête sont comptés depuis le début des
+    données, pour construire directement des Float32Array/Uint32Array.
+
+    Args:
+        buffers: Tampons nommés (float32 ou uint32)
+        meta: Informations additionnelles de l'en-tête
+
+    Returns:
+        Données binaires
+    """
+    descriptors = []
+    arrays = []
+    for name, array in buffers.items():
+        kind = {("f", 4): "float32", ("u", 4): "uint32"}.get((array.dtype.kind, array.dtype.itemsize))
+        if kind is None:
+            raise ValueError(f"Type de tampon non supporté pour {name}: {array.dtype}")
+        data = np.ascontiguousarray(array, dtype=BUFFER_DTYPES[kind])
+        descriptors.append({
+            "name": name,
+            "dtype": kind,
+            "shape": list(array.shape),
+            "length": int(data.size),
+            "byte_length": int(data.nbytes)
+        })
+        arrays.append(data)
+
+    def encode(offset_base: int) -> bytes:
+        offset = offset_base
+        for descriptor in descriptors:
+            descriptor["offset"] = offset
+            offset += descriptor["byte_length"]  # 4 octets par élément : alignement conservé
+        header = {"version": GEOMETRY_FORMAT_VERSION, **(meta or {}), "buffers": descriptors}
+        raw = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        return raw + b" " * (-len(raw) % 4)
+
+    # La taille de l'en-tête dépend des décalages qu'il contient : itérer jusqu'à stabilité
+    header = encode(4)
+    while True:
+        candidate = encode(4 + len(header))
+        if len(candidate) == len(header):
+            header = candidate
+            break
+        header = candidate
+
+    return b"".join([struct.pack("<I", len(header)), header, *(a.tobytes() for a in arrays)])
+
+
+def unpack_buffers(data: bytes) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Lit des données produites par pack_buffers
+
+    Args:
+        data: Données binaires
+
+    Returns:
+        (en-tête, tampons remis en forme)
+    """
+    (header_length,) = struct.unpack_from("<I", data, 0)
+    header = json.loads(data[4:4 + header_length].decode("utf-8"))
+    buffers = {}
+    for descriptor in header["buffers"]:
+        array = np.frombuffer(
+            data,
+            dtype=BUFFER_DTYPES[descriptor["dtype"]],
+            count=descriptor["length"],
+            offset=descriptor["offset"]
+        )
+        buffers[descriptor["name"]] = array.reshape(descriptor["shape"])
+    return header, buffers
@@ -0,0 +1,257 @@
+"""
+Interventions sur câbles : abaissement ou relevage d'un accrochage, pose sur
+poulie, ancrage, haubanage. Chaque intervention est appliquée comme une
+variation de l'état de la ligne : seuls les cantons concernés sont recalculés,
+puis les efforts VHL des supports voisins
+"""
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.canton import canton_starts, equivalent_spans
+from backend.domain.mechanical import CableProperties
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+from backend.domain.vhl import LoadCase, VHLCalculator
+
+
+class InterventionKind(str, Enum):
+    """Nature d'une intervention sur un support"""
+    LOWER = "lower"  # Abaissement (delta_z_m < 0) ou relevage (> 0) de l'accrochage
+    PULLEY = "pulley"  # Pose sur poulie : le câble coulisse, le support ne sépare plus deux cantons
+    ANCHOR = "anchor"  # Ancrage : le support sépare deux cantons
+    STAY = "stay"  # Hauban : effort extérieur repris au support
+
+
+@dataclass
+class Intervention:
+    """Intervention sur un support"""
+    kind: InterventionKind
+    support: int  # Indice du support (0 = premier support de la ligne)
+    delta_z_m: float = 0.0  # Variation d'altitude de l'accrochage (m), LOWER
+    stay_force_dan: Optional[float] = None  # Composante horizontale du hauban le long de la ligne (daN),
+    # comptée comme L ; None : compense l'effort longitudinal du support
+    stay_angle_deg: float = 45.0  # Inclinaison du hauban sur l'horizontale (°)
+
+
+@dataclass
+class InterventionStep:
+    """Effet d'une intervention sur les supports recalculés"""
+    intervention: Intervention
+    cantons: List[Tuple[int, int]]  # Cantons recalculés (première portée, dernière portée + 1)
+    supports: np.ndarray  # Supports dont les efforts ont été recalculés
+    tension_before_dan: np.ndarray  # Tensions (gauche, droite) de chaque support avant (supports, 2)
+    tension_after_dan: np.ndarray  # Tensions (gauche, droite) après
+    V_before: np.ndarray
+    H_before: np.ndarray
+    L_before: np.ndarray
+    V_after: np.ndarray
+    H_after: np.ndarray
+    L_after: np.ndarray
+
+
+@dataclass
+class LineState:
+    """État courant de la ligne pendant les interventions"""
+    a: np.ndarray  # Longueurs des portées (m)
+    h: np.ndarray  # Dénivelés des portées (m)
+    angle_grade: np.ndarray  # Angle de ligne de chaque support (grades)
+    anchored: np.ndarray  # Support séparant deux cantons (extrémités toujours ancrées)
+    tension_dan: np.ndarray  # Tension horizontale de chaque portée (daN)
+    V: np.ndarray  # Efforts de chaque support (daN), haubans compris
+    H: np.ndarray
+    L: np.ndarray
+    stay_V: np.ndarray  # Efforts des haubans (daN)
+    stay_L: np.ndarray
+
+
+class InterventionSimulator:
+    """Application incrémentale d'une suite d'interventions à une ligne"""
+
+    def __init__(
+        self,
+        a: ArrayLike,
+        h: ArrayLike,
+        canton_sizes: ArrayLike,
+        angle_grade: ArrayLike,
+        cable: CableProperties,
+        reference: ReferenceState,
+        case: LoadCase
+    ):
+        """
+        Résout la ligne complète une fois, dans l'état du cas de charge
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés des portées (m)
+            canton_sizes: Nombre de portées de chaque canton
+            angle_grade: Angle de ligne de chaque support (grades), portées + 1 valeurs
+            cable: Câble de la ligne
+            reference: État de référence, appliqué à chaque canton recalculé
+            case: Conditions de l'intervention (température, vent, givre)
+        """
+        a = np.array(a, dtype=np.float64)
+        h = np.array(h, dtype=np.float64)
+        angle = np.array(angle_grade, dtype=np.float64)
+        if a.ndim != 1 or a.shape != h.shape or a.size == 0:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+        if angle.shape != (a.size + 1,):
+            raise ValueError("Un angle de ligne est attendu par support (portées + 1)")
+        if case.broken_span is not None:
+            raise ValueError("Le cas de charge d'une intervention ne comporte pas de conducteur rompu")
+        sizes = np.asarray(canton_sizes, dtype=np.intp)
+        starts = canton_starts(sizes)
+        if sizes.sum() != a.size:
+            raise ValueError("La somme des tailles de cantons doit égaler le nombre de portées")
+
+        self.constants = CableConstants.from_cable(cable)
+        self.reference = reference
+        self.reference_h = h.copy()  # Dénivelés de la ligne dans l'état de référence
+        self.case = case
+        vertical, transverse, apparent = VHLCalculator.loading(self.constants, [case])
+        self.vertical, self.transverse, self.apparent = float(vertical[0]), float(transverse[0]), float(apparent[0])
+
+        anchored = np.zeros(a.size + 1, dtype=bool)
+        anchored[starts] = True
+        anchored[-1] = True
+        n_supports = a.size + 1
+        self.state = LineState(
+            a=a, h=h, angle_grade=angle, anchored=anchored,
+            tension_dan=np.empty(a.size),
+            V=np.zeros(n_supports), H=np.zeros(n_supports), L=np.zeros(n_supports),
+            stay_V=np.zeros(n_supports), stay_L=np.zeros(n_supports)
+        )
+        self.recompute()
+
+    def recompute(self) -> None:
+        """Recalcule tous les cantons et tous les supports dans l'état courant"""
+        for first, last in self.cantons():
+            self._solve_canton(first, last)
+        self._update_supports(0, self.state.a.size)
+
+    def cantons(self) -> List[Tuple[int, int]]:
+        """Cantons courants (première portée, dernière portée + 1)"""
+        anchors = np.flatnonzero(self.state.anchored)
+        return list(zip(anchors[:-1].tolist(), anchors[1:].tolist()))
+
+    def canton_of(self, span: int) -> Tuple[int, int]:
+        """Canton contenant une portée"""
+        anchors = np.flatnonzero(self.state.anchored)
+        i = np.searchsorted(anchors, span, side="right")
+        return int(anchors[i - 1]), int(anchors[i])
+
+    def _solve_canton(self, first: int, last: int) -> None:
+        """
+        Tension du canton [first, last) par changement d'état depuis la référence
+
+        La référence est rapportée à la géométrie initiale de la ligne : un
+        accrochage déplacé allonge ou raccourcit les cordes √(a² + h²) du
+        canton, allongement que le câble reprend par sa tension.
+        """
+        a = self.state.a[first:last]
+        a_eq, _ = equivalent_spans(a, [0])
+        chords = np.hypot(a, self.state.h[first:last]).sum()
+        reference_chords = np.hypot(a, self.reference_h[first:last]).sum()
+        T = StateChangeSolver.solve(
+            self.constants, a_eq[0], self.reference, self.case.temperature_C,
+            apparent_weight_dan_per_m=self.apparent,
+            geometric_strain=(chords - reference_chords) / reference_chords
+        ).tension_dan
+        self.state.tension_dan[first:last] = T
+
+    def _update_supports(self, first: int, last: int) -> np.ndarray:
+        """
+        Recalcule les efforts des supports first..last
+
+        Les portées voisines, inchangées, sont incluses pour compléter les
+        supports extrêmes.
+
+        Returns:
+            Indices des supports recalculés
+        """
+        s = self.state
+        lo, hi = max(first - 1, 0), min(last + 1, s.a.size)
+        tension = s.tension_dan[None, lo:hi]
+        V, H, L = VHLCalculator.support_loads(
+            s.a[lo:hi], s.h[lo:hi], s.angle_grade[lo:hi + 1], tension,
+            np.full_like(tension, self.vertical), np.full_like(tension, self.transverse)
+        )
+        supports = np.arange(first, last + 1)
+        rows = supports - lo
+        s.V[supports] = V[0, rows] + s.stay_V[supports]
+        s.H[supports] = H[0, rows]
+        s.L[supports] = L[0, rows] + s.stay_L[supports]
+        return supports
+
+    def support_tensions(self, supports: np.ndarray) -> np.ndarray:
+        """Tensions des portées (gauche, droite) de chaque support, 0 en bout de ligne"""
+        padded = np.concatenate(([0.0], self.state.tension_dan, [0.0]))
+        return np.column_stack((padded[supports], padded[supports + 1]))
+
+    def apply(self, intervention: Intervention) -> InterventionStep:
+        """
+        Applique une intervention et recalcule ce qu'elle modifie
+
+        Args:
+            intervention: Intervention
+
+        Returns:
+            InterventionStep, efforts avant et après sur les supports recalculés
+        """
+        s = self.state
+        i = intervention.support
+        if not 0 <= i < s.anchored.size:
+            raise ValueError(f"Support hors de la ligne: {i}")
+        n_spans = s.a.size
+        adjacent = [k for k in (i - 1, i) if 0 <= k < n_spans]
+        kind = InterventionKind(intervention.kind)
+
+        # Supports dont les efforts changent : ceux des cantons touchés, ou le seul support haubané
+        if kind is InterventionKind.STAY:
+            first = last = i
+        else:
+            first = min(self.canton_of(k)[0] for k in adjacent)
+            last = max(self.canton_of(k)[1] for k in adjacent)
+        supports = np.arange(first, last + 1)
+
+        tension_before = self.support_tensions(supports)
+        before = (s.V[supports].copy(), s.H[supports].copy(), s.L[supports].copy())
+        cantons: List[Tuple[int, int]] = []
+
+        if kind is InterventionKind.LOWER:
+            if i > 0:
+                s.h[i - 1] += intervention.delta_z_m
+            if i < n_spans:
+                s.h[i] -= intervention.delta_z_m
+            cantons = sorted({self.canton_of(k) for k in adjacent})
+        elif kind in (InterventionKind.PULLEY, InterventionKind.ANCHOR):
+            if i in (0, n_spans):
+                raise ValueError("Les supports d'extrémité de ligne restent ancrés")
+            s.anchored[i] = kind is InterventionKind.ANCHOR
+            cantons = sorted({self.canton_of(k) for k in adjacent})
+        else:
+            # Le hauban remplace l'effort précédent de ce support
+            L_cable = s.L[i] - s.stay_L[i]
+            force = -L_cable if intervention.stay_force_dan is None else intervention.stay_force_dan
+            s.stay_L[i] = force
+            s.stay_V[i] = abs(force) * np.tan(np.radians(intervention.stay_angle_deg))
+
+        for canton in cantons:
+            self._solve_canton(*canton)
+        self._update_supports(first, last)
+
+        return InterventionStep(
+            intervention=intervention,
+            cantons=cantons,
+            supports=supports,
+            tension_before_dan=tension_before,
+            tension_after_dan=self.support_tensions(supports),
+            V_before=before[0], H_before=before[1], L_before=before[2],
+            V_after=s.V[supports].copy(), H_after=s.H[supports].copy(), L_after=s.L[supports].copy()
+        )
+
+    def run(self, interventions: Sequence[Intervention]) -> List[InterventionStep]:
+        """Applique une suite d'interventions, dans l'ordre"""
+        return [self.apply(intervention) for intervention in interventions]
@@ -0,0 +1,297 @@
+"""
+Solveur inverse du paramètre de la chaînette
+Recherche ρ donnant une tension, une flèche ou une garde cible, pour des
+tableaux entiers de portées (Newton sécurisé par bissection)
+
+Le solveur s'appuie sur la table des câbles du moteur en lot ; batch.py
+important mechanical.py, il est placé ici plutôt que dans mechanical.py pour
+éviter une importation circulaire.
+"""
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike, BatchSpanCalculator, CableTable
+from backend.domain.mechanical import CableProperties
+
+
+class RhoTarget(str, Enum):
+    """Grandeur cible du solveur inverse"""
+    T0 = "T0"  # Tension horizontale (daN)
+    TA = "TA"  # Tension au support bas (daN)
+    TB = "TB"  # Tension au support haut (daN)
+    F1 = "F1"  # Flèche médiane (m)
+    F2 = "F2"  # Flèche au point bas (m)
+    H = "H"  # Creux total (m)
+    CLEARANCE = "clearance"  # Hauteur du point bas (m)
+
+
+class SolveStatus(IntEnum):
+    """Statut de convergence par portée"""
+    CONVERGED = 0
+    NOT_BRACKETED = 1  # Cible inatteignable dans [rho_min, rho_max]
+    MAX_ITERATIONS = 2
+
+
+@dataclass
+class RhoSolution:
+    """Résultats du solveur inverse, en colonnes"""
+    rho: np.ndarray  # Paramètre de la chaînette (m), NaN si non encadré
+    status: np.ndarray  # SolveStatus par portée
+    iterations: np.ndarray  # Nombre d'itérations par portée
+    residual: np.ndarray  # Écart final à la cible (unité de la cible)
+
+    def __len__(self) -> int:
+        return len(self.rho)
+
+
+class RhoSolver:
+    """Solveur vectorisé de ρ à partir d'une grandeur cible"""
+
+    G = BatchSpanCalculator.G
+
+    RHO_MIN_M = 10.0  # Borne basse par défaut de l'encadrement (m)
+    RHO_MAX_M = 100000.0  # Borne haute par défaut de l'encadrement (m)
+    TOLERANCE = 1e-10  # Tolérance relative sur la cible
+    MAX_ITERATIONS = 100
+
+    @classmethod
+    def evaluate(
+        cls,
+        target: RhoTarget,
+        a: np.ndarray,
+        h: np.ndarray,
+        rho: np.ndarray,
+        omega: np.ndarray,
+        low_attachment_m: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Évalue la grandeur cible et sa dérivée par rapport à ρ (non arrondies)
+
+        Args:
+            target: Grandeur cible
+            a: Longueurs de portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette (m)
+            omega: Masses linéiques (kg/m)
+            low_attachment_m: Hauteur de l'accrochage bas au-dessus du sol (m),
+                requise pour la cible CLEARANCE
+
+        Returns:
+            (valeur, dérivée)
+        """
+        target = RhoTarget(target)
+        weight = omega * (cls.G / 10)  # daN/m
+
+        # F1 = k / ρ avec k = a·b/8, et F2 = F1 - h²/(16·F1) = k/ρ - h²·ρ/(16·k)
+        k = a * np.sqrt(a**2 + h**2) / 8
+        F1 = k / rho
+        dF1 = -k / rho**2
+        F2 = F1 - h**2 * rho / (16 * k)
+        dF2 = dF1 - h**2 / (16 * k)
+
+        if target is RhoTarget.T0:
+            return rho * weight, weight
+        if target is RhoTarget.TA:
+            return (rho + F2) * weight, (1 + dF2) * weight
+        if target is RhoTarget.TB:
+            return (rho + F2 + np.abs(h)) * weight, (1 + dF2) * weight
+        if target is RhoTarget.F1:
+            return F1, dF1
+        if target is RhoTarget.F2:
+            return F2, dF2
+        if target is RhoTarget.H:
+            return F2 + np.abs(h), dF2
+
+        if low_attachment_m is None:
+            raise ValueError("La cible 'clearance' nécessite la hauteur de l'accrochage bas")
+        return low_attachment_m - F2, -dF2
+
+    @classmethod
+    def _initial_guess(
+        cls,
+        target: RhoTarget,
+        values: np.ndarray,
+        a: np.ndarray,
+        h: np.ndarray,
+        omega: np.ndarray,
+        low_attachment_m: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Estimation initiale de ρ par les formules de la portée de niveau"""
+        weight = omega * (cls.G / 10)
+        k = a * np.sqrt(a**2 + h**2) / 8
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if target in (RhoTarget.T0, RhoTarget.TA, RhoTarget.TB):
+                return values / weight
+            if target is RhoTarget.CLEARANCE:
+                return k / (low_attachment_m - values)
+            if target is RhoTarget.H:
+                return k / (values - np.abs(h))
+            return k / values
+
+    @classmethod
+    def solve(
+        cls,
+        target: Union[RhoTarget, str],
+        values: ArrayLike,
+        a: ArrayLike,
+        h: ArrayLike,
+        cable_index: ArrayLike,
+        cables: Union[CableTable, Sequence[CableProperties]],
+        low_attachment_m: Optional[ArrayLike] = None,
+        wind_pressure_daPa: Optional[ArrayLike] = None,
+        ice_thickness_mm: Optional[ArrayLike] = None,
+        load_factor: Optional[ArrayLike] = None,
+        rho_min: float = RHO_MIN_M,
+        rho_max: float = RHO_MAX_M,
+        tolerance: float = TOLERANCE,
+        max_iterations: int = MAX_ITERATIONS
+    ) -> RhoSolution:
+        """
+        Recherche ρ pour que chaque portée atteigne sa valeur cible
+
+        Les tensions TA et TB présentent un minimum en ρ : seule la branche
+        tendue (ρ au-delà du minimum) est recherchée. Sous vent ou givre, ρ est
+        le paramètre sous poids apparent, comme pour
+        BatchSpanCalculator.calculate_spans.
+
+        Args:
+            target: Grandeur cible (T0, TA, TB, F1, F2, H ou clearance)
+            values: Valeurs cibles (daN ou m selon la cible)
+            a: Longueurs de portées (m)
+            h: Dénivelés (m)
+            cable_index: Indice du câble de chaque portée dans `cables`
+            cables: Table des câbles référencés
+            low_attachment_m: Hauteur de l'accrochage bas au-dessus du sol (m),
+                requise pour la cible clearance
+            wind_pressure_daPa: Pressions du vent (daPa), optionnel
+            ice_thickness_mm: Épaisseurs radiales de givre (mm), optionnel
+            load_factor: Rapport poids apparent / poids propre, optionnel ;
+                par défaut, calculé à partir du vent et du givre
+            rho_min: Borne basse de l'encadrement (m)
+            rho_max: Borne haute de l'encadrement (m)
+            tolerance: Tolérance relative sur la cible
+            max_iterations: Nombre maximal d'itérations
+
+        Returns:
+            RhoSolution avec ρ, statut et nombre d'itérations par portée
+        """
+        target = RhoTarget(target)
+        if not isinstance(cables, CableTable):
+            cables = CableTable.from_cables(cables)
+        if not 0 < rho_min < rho_max:
+            raise ValueError("L'encadrement doit vérifier 0 < rho_min < rho_max")
+
+        values, a, h, cable_index, low = np.broadcast_arrays(
+            np.asarray(values, dtype=np.float64),
+            np.asarray(a, dtype=np.float64),
+            np.asarray(h, dtype=np.float64),
+            np.asarray(cable_index, dtype=np.intp),
+            np.asarray(np.nan if low_attachment_m is None else low_attachment_m, dtype=np.float64),
+        )
+        if target is RhoTarget.CLEARANCE and low_attachment_m is None:
+            raise ValueError("La cible 'clearance' nécessite la hauteur de l'accrochage bas")
+        if np.any(a <= 0):
+            raise ValueError("Les longueurs de portées doivent être strictement positives")
+        if cable_index.size and (cable_index.min() < 0 or cable_index.max() >= len(cables)):
+            raise ValueError("Indice de câble hors de la table des câbles")
+
+        if load_factor is None:
+            load_factor = BatchSpanCalculator.span_load_factor(
+                cables, cable_index, wind_pressure_daPa, ice_thickness_mm
+            )
+        load_factor = np.broadcast_to(np.asarray(load_factor, dtype=np.float64), values.shape)
+
+        values, a, h, low, load_factor = (
+            np.atleast_1d(x).ravel() for x in (values, a, h, low, load_factor)
+        )
+        omega = cables.mass_lin_kg_per_m[np.atleast_1d(cable_index).ravel()] * load_factor
+        n = values.size
+
+        def residual(rho: np.ndarray, idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            f, df = cls.evaluate(target, a[idx], h[idx], rho, omega[idx], low[idx])
+            return f - values[idx], df
+
+        lo = np.full(n, float(rho_min))
+        hi = np.full(n, float(rho_max))
+
+        # Branche tendue pour TA/TB : au-delà du minimum ρ* où d(ρ + F2)/dρ = 0
+        if target in (RhoTarget.TA, RhoTarget.TB):
+            k = a * np.sqrt(a**2 + h**2) / 8
+            slope = 1 - h**2 / (16 * k)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rho_star = np.where(slope > 0, np.sqrt(k / slope), rho_min)
+            lo = np.clip(rho_star, rho_min, rho_max)
+
+        all_idx = np.arange(n)
+        f_lo, _ = residual(lo, all_idx)
+        f_hi, _ = residual(hi, all_idx)
+
+        rho = np.full(n, np.nan)
+        status = np.full(n, SolveStatus.MAX_ITERATIONS, dtype=np.int8)
+        iterations = np.zeros(n, dtype=np.int32)
+        final_residual = np.full(n, np.nan)
+        scale = tolerance * np.maximum(np.abs(values), 1.0)
+
+        # Bornes déjà solutions
+        at_lo = np.abs(f_lo) <= scale
+        at_hi = ~at_lo & (np.abs(f_hi) <= scale)
+        rho[at_lo], rho[at_hi] = lo[at_lo], hi[at_hi]
+        final_residual[at_lo], final_residual[at_hi] = f_lo[at_lo], f_hi[at_hi]
+        status[at_lo | at_hi] = SolveStatus.CONVERGED
+
+        bracketed = np.sign(f_lo) != np.sign(f_hi)
+        status[~bracketed & ~(at_lo | at_hi)] = SolveStatus.NOT_BRACKETED
+
+        active = np.flatnonzero(bracketed & ~(at_lo | at_hi))
+        lo_sign = np.sign(f_lo[active])
+        lo_a, hi_a = lo[active], hi[active]
+        guess = cls._initial_guess(
+            target, values[active], a[active], h[active], omega[active], low[active]
+        )
+        inside = (guess > lo_a) & (guess < hi_a)
+        x = np.where(inside, guess, 0.5 * (lo_a + hi_a))
+
+        for iteration in range(1, max_iterations + 1):
+            if active.size == 0:
+                break
+
+            f, df = residual(x, active)
+            iterations[active] = iteration
+
+            converged = (np.abs(f) <= scale[active]) | (hi_a - lo_a <= 1e-14 * x)
+            if np.any(converged):
+                done = active[converged]
+                rho[done] = x[converged]
+                final_residual[done] = f[converged]
+                status[done] = SolveStatus.CONVERGED
+
+                keep = ~converged
+                active, x, f, df = active[keep], x[keep], f[keep], df[keep]
+                lo_a, hi_a, lo_sign = lo_a[keep], hi_a[keep], lo_sign[keep]
+
+            # Mise à jour de l'encadrement
+            same_side = np.sign(f) == lo_sign
+            lo_a = np.where(same_side, x, lo_a)
+            hi_a = np.where(same_side, hi_a, x)
+
+            # Pas de Newton, remplacé par une bissection s'il sort de l'encadrement
+            with np.errstate(divide="ignore", invalid="ignore"):
+                newton = x - f / df
+            inside = np.isfinite(newton) & (newton > lo_a) & (newton < hi_a)
+            x = np.where(inside, newton, 0.5 * (lo_a + hi_a))
+
+        if active.size:
+            f, _ = residual(x, active)
+            rho[active] = x
+            final_residual[active] = f
+
+        return RhoSolution(
+            rho=rho,
+            status=status,
+            iterations=iterations,
+            residual=final_residual
+        )
@@ -0,0 +1,127 @@
+"""
+Charges linéiques apparentes des câbles
+Poids propre, vent sur le diamètre projeté et givre radial, combinés en un
+poids apparent et un coefficient de surcharge m = p / (ω·g), vectorisés sur
+des tableaux de câbles et de cas de charge
+"""
+from dataclasses import dataclass
+from typing import Sequence, Union
+
+import numpy as np
+
+# Scalaire ou tableau accepté par les calculs vectorisés (réexporté par batch)
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+GRAVITY = 9.81  # Gravité (m/s²)
+ICE_DENSITY_KG_M3 = 900  # Masse volumique du givre (kg/m³)
+
+
+@dataclass
+class ApparentLoad:
+    """Charges linéiques d'un câble dans un cas de charge (daN/m)"""
+    vertical_dan_per_m: np.ndarray  # Poids propre + givre
+    transverse_dan_per_m: np.ndarray  # Effort du vent
+    apparent_dan_per_m: np.ndarray  # Poids apparent p = √(vertical² + transverse²)
+    load_factor: np.ndarray  # Coefficient de surcharge m = p / (ω·g)
+
+    @property
+    def swing_angle_rad(self) -> np.ndarray:
+        """Inclinaison du plan du câble sous vent (rad)"""
+        return np.arctan2(self.transverse_dan_per_m, self.vertical_dan_per_m)
+
+
+def apparent_load(
+    weight_dan_per_m: ArrayLike,
+    diameter_m: ArrayLike,
+    wind_pressure_daPa: ArrayLike = 0.0,
+    ice_thickness_mm: ArrayLike = 0.0
+) -> ApparentLoad:
+    """
+    Poids apparent d'un câble sous vent et givre (entrées diffusables)
+
+    Le givre d'épaisseur radiale e alourdit le câble de
+    ρ_givre·π·((d + 2e)² − d²)/4 et le vent s'applique au diamètre givré
+    d + 2e. Sans vent ni givre, m vaut exactement 1.
+
+    Args:
+        weight_dan_per_m: Poids linéiques propres (daN/m)
+        diameter_m: Diamètres (m)
+        wind_pressure_daPa: Pressions du vent (daPa = daN/m²)
+        ice_thickness_mm: Épaisseurs radiales de givre (mm)
+
+    Returns:
+        ApparentLoad de forme diffusée
+    """
+    weight = np.asarray(weight_dan_per_m, dtype=np.float64)
+    d = np.asarray(diameter_m, dtype=np.float64)
+    ice = np.asarray(ice_thickness_mm, dtype=np.float64) / 1000
+    wind = np.asarray(wind_pressure_daPa, dtype=np.float64)
+
+    ice_area = np.pi * ((d + 2 * ice)**2 - d**2) / 4
+    vertical = weight + ICE_DENSITY_KG_M3 * ice_area * GRAVITY / 10
+    transverse = wind * (d + 2 * ice)
+    apparent = np.hypot(vertical, transverse)
+
+    return ApparentLoad(
+        vertical_dan_per_m=vertical,
+        transverse_dan_per_m=transverse,
+        apparent_dan_per_m=apparent,
+        load_factor=apparent / weight
+    )
+
+
+def load_factor(
+    mass_lin_kg_per_m: ArrayLike,
+    diameter_mm: ArrayLike,
+    wind_pressure_daPa: ArrayLike = 0.0,
+    ice_thickness_mm: ArrayLike = 0.0
+) -> np.ndarray:
+    """
+    Coefficient de surcharge m à partir des propriétés catalogue du câble
+
+    Le même calcul sert au calcul unitaire et au calcul en lot, qui restent
+    ainsi identiques au bit près.
+
+    Args:
+        mass_lin_kg_per_m: Masses linéiques (kg/m)
+        diameter_mm: Diamètres (mm)
+        wind_pressure_daPa: Pressions du vent (daPa)
+        ice_thickness_mm: Épaisseurs radiales de givre (mm)
+
+    Returns:
+        Coefficients de surcharge, forme diffusée
+    """
+    weight = np.asarray(mass_lin_kg_per_m, dtype=np.float64) * GRAVITY / 10
+    diameter_m = np.asarray(diameter_mm, dtype=np.float64) / 1000
+    return apparent_load(weight, diameter_m, wind_pressure_daPa, ice_thickness_mm).load_factor
+
+
+def load_factor_table(
+    mass_lin_kg_per_m: ArrayLike,
+    diameter_mm: ArrayLike,
+    wind_pressure_daPa: ArrayLike,
+    ice_thickness_mm: ArrayLike = 0.0
+) -> np.ndarray:
+    """
+    Coefficients de surcharge de chaque câble dans chaque cas de charge
+
+    Calculés une fois par câble et par cas, puis indexés pour chaque portée
+    (table[cable_index, cas]) : une étude de cas de charge ne recalcule pas
+    les charges portée par portée.
+
+    Args:
+        mass_lin_kg_per_m: Masse linéique de chaque câble (kg/m)
+        diameter_mm: Diamètre de chaque câble (mm)
+        wind_pressure_daPa: Pression du vent de chaque cas (daPa)
+        ice_thickness_mm: Épaisseur de givre de chaque cas (mm)
+
+    Returns:
+        Tableau (câbles, cas)
+    """
+    mass = np.atleast_1d(np.asarray(mass_lin_kg_per_m, dtype=np.float64))[:, None]
+    diameter = np.atleast_1d(np.asarray(diameter_mm, dtype=np.float64))[:, None]
+    wind, ice = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(wind_pressure_daPa, dtype=np.float64)),
+        np.atleast_1d(np.asarray(ice_thickness_mm, dtype=np.float64))
+    )
+    return load_factor(mass, diameter, wind[None, :], ice[None, :])
@@ -3,9 +3,14 @@ Module de calculs mécaniques pour lignes électriques aériennes
 Basé sur les techniques standards de calcul de lignes électriques
 """
 import math
-from typing import Optional, Dict, List, Tuple
+from enum import IntFlag
+from typing import Optional, Dict, Iterable, List, Sequence, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+from backend.domain.loading import ArrayLike, GRAVITY, load_factor as apparent_load_factor
+
 
 @dataclass
 class CableProperties:
@@ -50,10 +55,368 @@ class SpanResult:
     errors: List[str]
 
 
+class SpanWarning(IntFlag):
+    """Codes d'avertissement d'une portée (combinables en masque de bits)"""
+    WIND_ABOVE_LIMIT = 1  # Vent > 36 daPa
+    ANGLE_ABOVE_LIMIT = 2  # Angle > 15 grades
+    TENSION_NEAR_RUPTURE = 4  # Tension > 90 % de la charge de rupture
+    RHO_LOW = 8  # ρ < 100 m
+    RHO_HIGH = 16  # ρ > 10000 m
+
+
+class SpanError(IntFlag):
+    """Codes d'erreur d'une portée (combinables en masque de bits)"""
+    TENSION_ABOVE_RUPTURE = 1  # Tension > charge de rupture
+
+
+class CompactSpanResult:
+    """
+    Résultat compact d'une portée
+
+    Stocke uniquement des nombres : les avertissements et erreurs sont des
+    masques de bits (SpanWarning / SpanError) et les messages ne sont rédigés
+    qu'à la demande, au moment de la réponse API.
+    """
+    __slots__ = (
+        "b", "F1", "F2", "H", "T0", "TA", "TB",
+        "warning_codes", "error_codes",
+        "rho", "rupture_dan", "wind_pressure_daPa", "angle_grade"
+    )
+
+    def __init__(
+        self,
+        b: float,
+        F1: float,
+        F2: float,
+        H: float,
+        T0: float,
+        TA: float,
+        TB: float,
+        warning_codes: int,
+        error_codes: int,
+        rho: float,
+        rupture_dan: float,
+        wind_pressure_daPa: Optional[float] = None,
+        angle_grade: Optional[float] = None
+    ):
+        self.b = b
+        self.F1 = F1
+        self.F2 = F2
+        self.H = H
+        self.T0 = T0
+        self.TA = TA
+        self.TB = TB
+        self.warning_codes = int(warning_codes)
+        self.error_codes = int(error_codes)
+        # Entrées nécessaires à la rédaction des messages
+        self.rho = rho
+        self.rupture_dan = rupture_dan
+        self.wind_pressure_daPa = wind_pressure_daPa
+        self.angle_grade = angle_grade
+
+    def messages(self) -> Tuple[List[str], List[str]]:
+        """Rédige les messages (warnings, errors) correspondant aux codes"""
+        return render_span_messages(
+            self.warning_codes,
+            self.error_codes,
+            rho=self.rho,
+            max_tension=max(self.T0, self.TA, self.TB),
+            rupture_dan=self.rupture_dan,
+            wind_pressure_daPa=self.wind_pressure_daPa,
+            angle_grade=self.angle_grade
+        )
+
+    def to_span_result(self) -> SpanResult:
+        """Convertit en SpanResult avec les messages rédigés"""
+        warnings, errors = self.messages()
+        return SpanResult(
+            b=self.b,
+            F1=self.F1,
+            F2=self.F2,
+            H=self.H,
+            T0=self.T0,
+            TA=self.TA,
+            TB=self.TB,
+            warnings=warnings,
+            errors=errors
+        )
+
+
+def canton_starts(canton_sizes: ArrayLike) -> np.ndarray:
+    """
+    Indices de la première portée de chaque canton
+
+    Args:
+        canton_sizes: Nombre de portées de chaque canton, dans l'ordre de la ligne
+
+    Returns:
+        Indices de début de canton
+    """
+    sizes = np.asarray(canton_sizes, dtype=np.intp)
+    if sizes.ndim != 1 or sizes.size == 0 or np.any(sizes <= 0):
+        raise ValueError("Chaque canton doit contenir au moins une portée")
+    return np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+
+def blondel(sum_a: ArrayLike, sum_a3: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Portée équivalente de Blondel à partir des sommes Σai et Σai³ (vectorisé)
+
+    a_eq = √(Σ ai³ / Σ ai) et K = Σ ai / a_eq, (0, 0) pour un ensemble vide
+
+    Args:
+        sum_a: Sommes des longueurs de portées (m)
+        sum_a3: Sommes des cubes des longueurs (m³)
+
+    Returns:
+        (a_eq, K), forme diffusée
+    """
+    sum_a = np.asarray(sum_a, dtype=np.float64)
+    sum_a3 = np.asarray(sum_a3, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a_eq = np.where(sum_a > 0, np.sqrt(sum_a3 / sum_a), 0.0)
+        K = np.where(a_eq > 0, sum_a / a_eq, 0.0)
+    return a_eq, K
+
+
+class _FenwickTree:
+    """Arbre de Fenwick : mise à jour, somme préfixe et ajout en fin en O(log n)"""
+
+    def __init__(self, values: Iterable[float] = ()):
+        self._tree = [0.0] + list(values)
+        n = len(self._tree) - 1
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                self._tree[parent] += self._tree[i]
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def append(self, value: float) -> None:
+        """Ajoute une valeur en fin"""
+        i = len(self._tree)
+        total = value
+        child = i - 1
+        while child > i - (i & -i):
+            total += self._tree[child]
+            child -= child & -child
+        self._tree.append(total)
+
+    def add(self, index: int, delta: float) -> None:
+        """Ajoute delta à la valeur d'indice index"""
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, stop: int) -> float:
+        """Somme des valeurs [0, stop)"""
+        total = 0.0
+        while stop > 0:
+            total += self._tree[stop]
+            stop -= stop & -stop
+        return total
+
+    def search(self, target: float) -> int:
+        """Plus petit indice i tel que la somme [0, i] dépasse target (valeurs positives)"""
+        position = 0
+        step = 1 << len(self).bit_length()
+        while step:
+            following = position + step
+            if following < len(self._tree) and self._tree[following] <= target:
+                position = following
+                target -= self._tree[following]
+            step >>= 1
+        return position
+
+
+class EquivalentSpanAccumulator:
+    """
+    Accumulateur de portée équivalente (Blondel) par sommes courantes Σa et Σa³
+
+    Consomme les portées depuis n'importe quel itérable. Les sommes totales
+    sont tenues à jour en O(1). Les portées sont conservées dans des arbres de
+    Fenwick (a, a³ et nombre de portées) : ajouter, retirer ou remplacer une
+    portée et obtenir a_eq et K d'une sous-plage coûtent O(log n). Une portée
+    retirée laisse un emplacement vide, compacté en O(n) quand les emplacements
+    vides deviennent majoritaires (O(1) amorti par retrait).
+    Avec keep_spans=False, seules les sommes sont conservées (flux).
+    """
+
+    def __init__(self, spans: Iterable[float] = (), keep_spans: bool = True):
+        self.keep_spans = keep_spans
+        self.count = 0
+        self.sum_a = 0.0
+        self.sum_a3 = 0.0
+        self._slots: List[Optional[float]] = []
+        if keep_spans:
+            self._slots = [float(a) for a in spans]
+            self.count = len(self._slots)
+            self._rebuild()
+            self.sum_a = self._tree_a.prefix(self.count)
+            self.sum_a3 = self._tree_a3.prefix(self.count)
+        else:
+            self.extend(spans)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _rebuild(self) -> None:
+        """Compacte les emplacements et reconstruit les arbres en O(n)"""
+        self._slots = [a for a in self._slots if a is not None]
+        self._tree_a = _FenwickTree(self._slots)
+        self._tree_a3 = _FenwickTree(a**3 for a in self._slots)
+        self._tree_count = _FenwickTree([1] * len(self._slots))
+
+    @property
+    def spans(self) -> Sequence[float]:
+        """Portées conservées, dans l'ordre (copie en O(n))"""
+        self._require_spans()
+        return [a for a in self._slots if a is not None]
+
+    def _require_spans(self) -> None:
+        if not self.keep_spans:
+            raise ValueError("Opération impossible : les portées ne sont pas conservées (keep_spans=False)")
+
+    def _slot(self, index: int) -> int:
+        """Emplacement de la portée de rang index (indices négatifs acceptés)"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"Indice de portée {index} hors de [0, {self.count})")
+        return self._tree_count.search(index)
+
+    def _boundary(self, index: int) -> int:
+        """Emplacement de début de la portée de rang index, fin des emplacements si index = count"""
+        return len(self._slots) if index == self.count else self._tree_count.search(index)
+
+    def add(self, a: float) -> None:
+        """Ajoute une portée en fin de ligne"""
+        self.count += 1
+        self.sum_a += a
+        self.sum_a3 += a**3
+        if self.keep_spans:
+            self._slots.append(a)
+            self._tree_a.append(a)
+            self._tree_a3.append(a**3)
+            self._tree_count.append(1)
+
+    def extend(self, spans: Iterable[float]) -> None:
+        """Ajoute les portées d'un itérable ou d'un générateur"""
+        for a in spans:
+            self.add(a)
+
+    def replace(self, index: int, a: float) -> float:
+        """
+        Remplace une portée
+
+        Args:
+            index: Position de la portée
+            a: Nouvelle longueur (m)
+
+        Returns:
+            Ancienne longueur (m)
+        """
+        self._require_spans()
+        slot = self._slot(index)
+        old = self._slots[slot]
+        self._slots[slot] = a
+        self._tree_a.add(slot, a - old)
+        self._tree_a3.add(slot, a**3 - old**3)
+        self.sum_a += a - old
+        self.sum_a3 += a**3 - old**3
+        return old
+
+    def remove(self, index: int) -> float:
+        """
+        Retire une portée (les suivantes sont décalées d'un rang)
+
+        Args:
+            index: Position de la portée
+
+        Returns:
+            Longueur retirée (m)
+        """
+        self._require_spans()
+        slot = self._slot(index)
+        old = self._slots[slot]
+        self._slots[slot] = None
+        self._tree_a.add(slot, -old)
+        self._tree_a3.add(slot, -old**3)
+        self._tree_count.add(slot, -1)
+        self.count -= 1
+        self.sum_a -= old
+        self.sum_a3 -= old**3
+        if 2 * self.count < len(self._slots):
+            self._rebuild()
+        return old
+
+    def refresh(self) -> None:
+        """Recalcule les sommes depuis les portées (élimine la dérive d'arrondi)"""
+        self._require_spans()
+        self._rebuild()
+        self.sum_a = sum(self._slots)
+        self.sum_a3 = sum(a**3 for a in self._slots)
+
+    def result(self) -> Tuple[float, float]:
+        """(a_eq, K) de l'ensemble des portées"""
+        if self.count == 0:
+            return 0.0, 0.0
+        a_eq, K = blondel(self.sum_a, self.sum_a3)
+        return float(a_eq), float(K)
+
+    def range(self, start: int, stop: int) -> Tuple[float, float]:
+        """
+        (a_eq, K) des portées [start, stop)
+
+        Args:
+            start: Indice de la première portée
+            stop: Indice de fin (exclu)
+
+        Returns:
+            (a_eq, K), (0, 0) pour une plage vide
+        """
+        self._require_spans()
+        if not 0 <= start <= stop <= self.count:
+            raise ValueError(f"Plage invalide [{start}, {stop}) pour {self.count} portées")
+        if start == stop:
+            return 0.0, 0.0
+        first, end = self._boundary(start), self._boundary(stop)
+        a_eq, K = blondel(
+            self._tree_a.prefix(end) - self._tree_a.prefix(first),
+            self._tree_a3.prefix(end) - self._tree_a3.prefix(first)
+        )
+        return float(a_eq), float(K)
+
+    def segments(self, canton_sizes: Iterable[int]) -> List[Tuple[float, float]]:
+        """
+        (a_eq, K) de chaque canton d'un découpage de la ligne
+
+        Args:
+            canton_sizes: Nombre de portées de chaque canton, dans l'ordre
+
+        Returns:
+            Liste de (a_eq, K) par canton
+        """
+        sizes = np.asarray(list(canton_sizes), dtype=np.intp)
+        starts = canton_starts(sizes)
+        if sizes.sum() != self.count:
+            raise ValueError("La somme des tailles de cantons doit égaler le nombre de portées")
+        return [self.range(int(start), int(start + size)) for start, size in zip(starts, sizes)]
+
+
 class MechanicalCalculator:
     """Calculateur mécanique pour lignes électriques"""
     
-    G = 9.81  # Gravité (m/s²)
+    G = GRAVITY  # Gravité (m/s²)
+
+    # Limites des conditions CELESTE et seuils de validation métier
+    WIND_LIMIT_DAPA = 36  # Pression de vent maximale (daPa)
+    ANGLE_LIMIT_GRADE = 15  # Angle topographique maximal (grades)
+    RUPTURE_WARNING_RATIO = 0.9  # Part de la charge de rupture déclenchant un avertissement
+    RHO_MIN_M = 100  # ρ en dessous duquel la valeur est suspecte (m)
+    RHO_MAX_M = 10000  # ρ au-dessus duquel la valeur est suspecte (m)
     
     @staticmethod
     def validate_celeste_domain(a1: float, a2: float, h_max: float) -> List[str]:
@@ -125,7 +488,8 @@ class MechanicalCalculator:
     def calculate_tensions(
         geometry: SpanGeometry,
         cable: CableProperties,
-        rho: float
+        rho: float,
+        load_factor: float = 1.0
     ) -> Tuple[float, float, float]:
         """
         Calcule les tensions dans le câble
@@ -134,6 +498,8 @@ class MechanicalCalculator:
             geometry: Géométrie de la portée
             cable: Propriétés du câble
             rho: Paramètre de la chaînette (m)
+            load_factor: Coefficient de surcharge m = poids apparent / poids
+                propre (vent, givre) ; ρ est alors le paramètre sous poids apparent
         
         Returns:
             (T0, TA, TB) où:
@@ -141,10 +507,10 @@ class MechanicalCalculator:
                 TA = tension au support bas (daN)
                 TB = tension au support haut (daN)
         """
-        omega = cable.mass_lin_kg_per_m
+        omega = cable.mass_lin_kg_per_m * load_factor
         g = MechanicalCalculator.G / 10  # Conversion en daN/kg
         
-        # T0 = ρ × (ω × g)
+        # T0 = ρ × (m × ω × g)
         T0 = rho * omega * g
         
         # Calcul des flèches
@@ -159,31 +525,19 @@ class MechanicalCalculator:
         return T0, TA, TB
     
     @staticmethod
-    def calculate_equivalent_span(spans: List[float]) -> Tuple[float, float]:
+    def calculate_equivalent_span(spans: Iterable[float]) -> Tuple[float, float]:
         """
         Calcule la portée équivalente selon la méthode de Blondel
         
         Args:
-            spans: Liste des longueurs de portées (m)
+            spans: Longueurs de portées (m), liste ou générateur
         
         Returns:
             (a_eq, K) où:
                 a_eq = portée équivalente (m)
                 K = coefficient
         """
-        if not spans:
-            return 0.0, 0.0
-        
-        sum_a = sum(spans)
-        sum_a3 = sum(a**3 for a in spans)
-        
-        # a_eq = √(Σ ai³ / Σ ai)
-        a_eq = math.sqrt(sum_a3 / sum_a) if sum_a > 0 else 0
-        
-        # K = Σ ai / a_eq
-        K = sum_a / a_eq if a_eq > 0 else 0
-        
-        return a_eq, K
+        return EquivalentSpanAccumulator(spans, keep_spans=False).result()
     
     @staticmethod
     def calculate_crr(
@@ -250,37 +604,59 @@ class MechanicalCalculator:
         cable: CableProperties,
         rho: float,
         wind_pressure_daPa: Optional[float] = None,
-        angle_grade: Optional[float] = None
+        angle_grade: Optional[float] = None,
+        ice_thickness_mm: Optional[float] = None
     ) -> SpanResult:
         """
         Calcul complet d'une portée
 
+        Les tensions sont calculées sous le poids apparent (vent sur le
+        diamètre, givre) : ρ est le paramètre dans le plan de charge.
+
         Args:
             geometry: Géométrie de la portée
             cable: Propriétés du câble
             rho: Paramètre de la chaînette (m)
             wind_pressure_daPa: Pression du vent (daPa), optionnel
             angle_grade: Angle topographique (grades), optionnel
+            ice_thickness_mm: Épaisseur radiale de givre (mm), optionnel
 
         Returns:
             SpanResult avec tous les résultats et validations
         """
-        warnings = []
-        errors = []
+        return cls.calculate_span_compact(
+            geometry, cable, rho, wind_pressure_daPa, angle_grade, ice_thickness_mm
+        ).to_span_result()
+
+    @classmethod
+    def calculate_span_compact(
+        cls,
+        geometry: SpanGeometry,
+        cable: CableProperties,
+        rho: float,
+        wind_pressure_daPa: Optional[float] = None,
+        angle_grade: Optional[float] = None,
+        ice_thickness_mm: Optional[float] = None
+    ) -> CompactSpanResult:
+        """
+        Calcul complet d'une portée, sans rédaction des messages
+
+        Mêmes arguments que calculate_span. Destiné aux calculs en nombre :
+        les messages sont rédigés plus tard via CompactSpanResult.messages().
+
+        Returns:
+            CompactSpanResult
+        """
+        warning_codes = 0
+        error_codes = 0
 
         # Validation du vent
-        if wind_pressure_daPa and wind_pressure_daPa > 36:
-            warnings.append(
-                f"⚠️ Vent de {wind_pressure_daPa} daPa > 36 daPa "
-                "(au-delà des conditions CELESTE)"
-            )
+        if wind_pressure_daPa and wind_pressure_daPa > cls.WIND_LIMIT_DAPA:
+            warning_codes |= SpanWarning.WIND_ABOVE_LIMIT
 
         # Validation de l'angle
-        if angle_grade and abs(angle_grade) > 15:
-            warnings.append(
-                f"⚠️ Angle de {angle_grade} grades > 15 grades "
-                "(au-delà des conditions CELESTE)"
-            )
+        if angle_grade and abs(angle_grade) > cls.ANGLE_LIMIT_GRADE:
+            warning_codes |= SpanWarning.ANGLE_ABOVE_LIMIT
 
         # Calcul de la corde
         b = geometry.b
@@ -288,8 +664,13 @@ class MechanicalCalculator:
         # Calcul des flèches
         F1, F2, H = cls.calculate_sag(geometry, rho)
 
-        # Calcul des tensions
-        T0, TA, TB = cls.calculate_tensions(geometry, cable, rho)
+        # Calcul des tensions sous poids apparent (vent, givre)
+        wind = 0.0 if wind_pressure_daPa is None or math.isnan(wind_pressure_daPa) else wind_pressure_daPa
+        ice = 0.0 if ice_thickness_mm is None or math.isnan(ice_thickness_mm) else ice_thickness_mm
+        load_factor = 1.0
+        if wind or ice:
+            load_factor = float(apparent_load_factor(cable.mass_lin_kg_per_m, cable.diameter_mm, wind, ice))
+        T0, TA, TB = cls.calculate_tensions(geometry, cable, rho, load_factor)
 
         # Arrondi à 1 daN comme spécifié
         T0 = round(T0)
@@ -299,28 +680,18 @@ class MechanicalCalculator:
         # Validation métier : vérifier que les tensions ne dépassent pas la charge de rupture
         max_tension = max(T0, TA, TB)
         if max_tension > cable.rupture_dan:
-            errors.append(
-                f"❌ Tension maximale ({max_tension} daN) dépasse la charge de rupture "
-                f"du câble ({cable.rupture_dan} daN). Calcul non valide !"
-            )
-        elif max_tension > cable.rupture_dan * 0.9:
+            error_codes |= SpanError.TENSION_ABOVE_RUPTURE
+        elif max_tension > cable.rupture_dan * cls.RUPTURE_WARNING_RATIO:
             # Warning si on est à plus de 90% de la charge de rupture
-            warnings.append(
-                f"⚠️ Tension maximale ({max_tension} daN) proche de la charge de rupture "
-                f"({cable.rupture_dan} daN). Marge de sécurité faible."
-            )
+            warning_codes |= SpanWarning.TENSION_NEAR_RUPTURE
 
         # Validation métier : vérifier que rho est dans une plage réaliste
-        if rho < 100:
-            warnings.append(
-                f"⚠️ Paramètre ρ très faible ({rho} m). Vérifiez la valeur."
-            )
-        elif rho > 10000:
-            warnings.append(
-                f"⚠️ Paramètre ρ très élevé ({rho} m). Vérifiez la valeur."
-            )
+        if rho < cls.RHO_MIN_M:
+            warning_codes |= SpanWarning.RHO_LOW
+        elif rho > cls.RHO_MAX_M:
+            warning_codes |= SpanWarning.RHO_HIGH
 
-        return SpanResult(
+        return CompactSpanResult(
             b=round(b, 2),
             F1=round(F1, 2),
             F2=round(F2, 2),
@@ -328,10 +699,227 @@ class MechanicalCalculator:
             T0=T0,
             TA=TA,
             TB=TB,
-            warnings=warnings,
-            errors=errors
+            warning_codes=warning_codes,
+            error_codes=error_codes,
+            rho=rho,
+            rupture_dan=cable.rupture_dan,
+            wind_pressure_daPa=wind_pressure_daPa,
+            angle_grade=angle_grade
+        )
+
+
+@dataclass
+class ConductorLengths:
+    """Longueurs de conducteur par portée et par canton (m)"""
+    # Par portée
+    chord_m: np.ndarray  # Corde b
+    arc_length_m: np.ndarray  # Longueur de la chaînette dans l'état calculé
+    slack_m: np.ndarray  # Mou : longueur − corde
+    elastic_m: np.ndarray  # Allongement élastique ∫ T ds / (E·S)
+    thermal_m: np.ndarray  # Dilatation depuis la température de la longueur à vide
+    unstressed_length_m: np.ndarray  # Longueur à vide, à la température de coupe
+
+    # Par canton
+    canton_length_m: np.ndarray  # Somme des longueurs dans l'état calculé
+    canton_unstressed_m: np.ndarray  # Somme des longueurs à vide (commande et déroulage)
+
+    def drums(self, drum_length_m: float, allowance_m: float = 0.0) -> np.ndarray:
+        """
+        Nombre de tourets nécessaires par canton
+
+        Args:
+            drum_length_m: Longueur de conducteur d'un touret (m)
+            allowance_m: Surlongueur par canton (raccordements, chutes) (m)
+
+        Returns:
+            Nombre de tourets de chaque canton
+        """
+        if drum_length_m <= 0:
+            raise ValueError("La longueur d'un touret doit être strictement positive")
+        return np.ceil((self.canton_unstressed_m + allowance_m) / drum_length_m).astype(np.intp)
+
+
+class ConductorLengthCalculator:
+    """Longueurs exactes de la chaînette pour des tableaux de portées inclinées"""
+
+    @staticmethod
+    def low_point_offset(a: np.ndarray, h: np.ndarray, rho: np.ndarray) -> np.ndarray:
+        """
+        Abscisse du milieu de portée par rapport au point bas de la chaînette
+
+        h = ρ·(cosh(xB/ρ) − cosh(xA/ρ)) = 2·ρ·sinh(xm/ρ)·sinh(a/(2ρ)), avec
+        xA = xm − a/2 et xB = xm + a/2.
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette (m)
+
+        Returns:
+            xm (m), positif si le point bas est du côté du support A
+        """
+        return rho * np.arcsinh(h / (2 * rho * np.sinh(a / (2 * rho))))
+
+    @staticmethod
+    def arc_lengths(a: ArrayLike, h: ArrayLike, rho: ArrayLike) -> np.ndarray:
+        """
+        Longueur de la chaînette d'une portée inclinée : L = √(h² + (2·ρ·sinh(a/(2ρ)))²)
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette (m)
+
+        Returns:
+            Longueurs (m)
+        """
+        a = np.asarray(a, dtype=np.float64)
+        rho = np.asarray(rho, dtype=np.float64)
+        return np.hypot(h, 2 * rho * np.sinh(a / (2 * rho)))
+
+    @classmethod
+    def compute(
+        cls,
+        a: ArrayLike,
+        h: ArrayLike,
+        rho: ArrayLike,
+        cable: CableProperties,
+        canton_sizes: Optional[ArrayLike] = None,
+        temperature_C: float = 15.0,
+        unstressed_temperature_C: Optional[float] = None,
+        load_factor: ArrayLike = 1.0
+    ) -> ConductorLengths:
+        """
+        Longueurs de toutes les portées et totaux par canton, en une passe
+
+        La tension le long de la chaînette vaut T0·cosh(x/ρ) ; son intégrale
+        donne l'allongement élastique
+        ∫ T ds / (E·S) = T0/(2·E·S) · (a + ρ/2·(sinh(2xB/ρ) − sinh(2xA/ρ))).
+        La longueur à vide retire cet allongement et la dilatation
+        α·(θ − θ_coupe)·L, au premier ordre comme l'équation de changement d'état.
+
+        Args:
+            a: Longueurs des portées, dans l'ordre de la ligne (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette (m), scalaire ou par portée
+            cable: Propriétés du câble
+            canton_sizes: Nombre de portées de chaque canton (ligne entière si absent)
+            temperature_C: Température de l'état calculé (°C)
+            unstressed_temperature_C: Température de la longueur à vide (°C),
+                température de l'état calculé si absente
+            load_factor: Coefficient de surcharge (T0 = ρ·m·ω·g), scalaire ou par portée
+
+        Returns:
+            ConductorLengths
+        """
+        a, h, rho, m = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(a, dtype=np.float64)),
+            np.asarray(h, dtype=np.float64),
+            np.asarray(rho, dtype=np.float64),
+            np.asarray(load_factor, dtype=np.float64)
+        )
+        if a.ndim != 1:
+            raise ValueError("Les portées doivent être un tableau à une dimension")
+        if np.any(a <= 0):
+            raise ValueError("Les portées doivent être strictement positives")
+        if np.any(rho <= 0):
+            raise ValueError("Le paramètre ρ doit être strictement positif")
+
+        sizes = np.asarray([a.size] if canton_sizes is None else canton_sizes, dtype=np.intp)
+        starts = canton_starts(sizes)
+        if sizes.sum() != a.size:
+            raise ValueError("La somme des tailles de cantons doit égaler le nombre de portées")
+
+        length = cls.arc_lengths(a, h, rho)
+        chord = np.hypot(a, h)
+
+        xm = cls.low_point_offset(a, h, rho)
+        xA, xB = xm - a / 2, xm + a / 2
+        T0 = rho * m * cable.mass_lin_kg_per_m * MechanicalCalculator.G / 10
+        ES = cable.E_MPa * cable.section_mm2 / 10  # N → daN
+        elastic = T0 / (2 * ES) * (a + rho / 2 * (np.sinh(2 * xB / rho) - np.sinh(2 * xA / rho)))
+
+        if unstressed_temperature_C is None:
+            unstressed_temperature_C = temperature_C
+        thermal = cable.alpha_1e6_per_C * 1e-6 * (temperature_C - unstressed_temperature_C) * length
+        unstressed = length - elastic - thermal
+
+        return ConductorLengths(
+            chord_m=chord,
+            arc_length_m=length,
+            slack_m=length - chord,
+            elastic_m=elastic,
+            thermal_m=thermal,
+            unstressed_length_m=unstressed,
+            canton_length_m=np.add.reduceat(length, starts),
+            canton_unstressed_m=np.add.reduceat(unstressed, starts)
+        )
+
+
+def render_span_messages(
+    warning_codes: int,
+    error_codes: int,
+    rho: float,
+    max_tension: float,
+    rupture_dan: float,
+    wind_pressure_daPa: Optional[float] = None,
+    angle_grade: Optional[float] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Rédige les messages correspondant aux codes d'avertissement et d'erreur
+
+    Args:
+        warning_codes: Masque de bits SpanWarning
+        error_codes: Masque de bits SpanError
+        rho: Paramètre de la chaînette (m)
+        max_tension: Tension maximale arrondie (daN)
+        rupture_dan: Charge de rupture du câble (daN)
+        wind_pressure_daPa: Pression du vent (daPa), optionnel
+        angle_grade: Angle topographique (grades), optionnel
+
+    Returns:
+        (warnings, errors) sous forme de listes de messages
+    """
+    warning_codes = SpanWarning(int(warning_codes))
+    error_codes = SpanError(int(error_codes))
+    warnings = []
+    errors = []
+
+    if SpanWarning.WIND_ABOVE_LIMIT in warning_codes:
+        warnings.append(
+            f"⚠️ Vent de {wind_pressure_daPa} daPa > 36 daPa "
+            "(au-delà des conditions CELESTE)"
         )
 
+    if SpanWarning.ANGLE_ABOVE_LIMIT in warning_codes:
+        warnings.append(
+            f"⚠️ Angle de {angle_grade} grades > 15 grades "
+            "(au-delà des conditions CELESTE)"
+        )
+
+    if SpanError.TENSION_ABOVE_RUPTURE in error_codes:
+        errors.append(
+            f"❌ Tension maximale ({max_tension} daN) dépasse la charge de rupture "
+            f"du câble ({rupture_dan} daN). Calcul non valide !"
+        )
+
+    if SpanWarning.TENSION_NEAR_RUPTURE in warning_codes:
+        warnings.append(
+            f"⚠️ Tension maximale ({max_tension} daN) proche de la charge de rupture "
+            f"({rupture_dan} daN). Marge de sécurité faible."
+        )
+
+    if SpanWarning.RHO_LOW in warning_codes:
+        warnings.append(
+            f"⚠️ Paramètre ρ très faible ({rho} m). Vérifiez la valeur."
+        )
+    elif SpanWarning.RHO_HIGH in warning_codes:
+        warnings.append(
+            f"⚠️ Paramètre ρ très élevé ({rho} m). Vérifiez la valeur."
+        )
+
+    return warnings, errors
+
 
 # Fonction utilitaire pour convertir les résultats en dict
 def span_result_to_dict(result: SpanResult) -> Dict:
@@ -351,3 +939,23 @@ def span_result_to_dict(result: SpanResult) -> Dict:
         "warnings": result.warnings,
         "errors": result.errors
     }
+
+
+def compact_result_to_dict(result: CompactSpanResult) -> Dict:
+    """Convertit un CompactSpanResult en dictionnaire pour l'API (messages rédigés ici)"""
+    warnings, errors = result.messages()
+    return {
+        "geometry": {
+            "b_m": result.b,
+            "F1_m": result.F1,
+            "F2_m": result.F2,
+            "H_m": result.H
+        },
+        "tensions": {
+            "T0_dan": result.T0,
+            "TA_dan": result.TA,
+            "TB_dan": result.TB
+        },
+        "warnings": warnings,
+        "errors": errors
+    }
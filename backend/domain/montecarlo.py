@@ -0,0 +1,300 @@
+"""
+Propagation d'incertitudes par Monte Carlo
+Tire des échantillons des relevés terrain (portées, dénivelés) et des valeurs
+catalogue (masse, E, α), évalue le canton de façon vectorisée et agrège les
+résultats en histogrammes, sans conserver les échantillons
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.domain.batch import BatchSpanCalculator
+from backend.domain.mechanical import CableProperties, blondel
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+
+# Grandeurs agrégées : T0 par canton, les autres par portée
+MONTE_CARLO_QUANTITIES = ("T0_dan", "TA_dan", "TB_dan", "F1_m", "F2_m")
+
+
+@dataclass
+class InputTolerances:
+    """Écarts-types des entrées (lois normales centrées sur la valeur nominale)"""
+    span_m: float = 0.0  # Longueur de portée (m)
+    delta_h_m: float = 0.0  # Dénivelé (m)
+    mass_rel: float = 0.0  # Masse linéique (relatif)
+    E_rel: float = 0.0  # Module d'élasticité (relatif)
+    alpha_rel: float = 0.0  # Coefficient de dilatation (relatif)
+
+
+@dataclass
+class MonteCarloJob:
+    """Définition d'un tirage Monte Carlo sur un canton"""
+    cable: CableProperties
+    spans_m: Sequence[float]  # Portées nominales du canton (m)
+    delta_h_m: Sequence[float]  # Dénivelés nominaux (m)
+    reference: ReferenceState  # État de référence (tension mesurée)
+    temperature_C: float  # Température de l'état évalué (°C)
+    wind_pressure_daPa: float = 0.0  # Pression du vent de l'état évalué (daPa)
+    tolerances: InputTolerances = field(default_factory=InputTolerances)
+    n_samples: int = 10_000
+    seed: int = 0
+
+
+@dataclass
+class Distribution:
+    """Distribution d'une grandeur, une ligne par portée (histogramme à pas fixe)"""
+    low: np.ndarray  # Borne basse de l'histogramme
+    high: np.ndarray  # Borne haute de l'histogramme
+    counts: np.ndarray  # Effectifs (n, bins), valeurs hors bornes dans les classes extrêmes
+    total: int  # Nombre d'échantillons
+    mean: np.ndarray
+    m2: np.ndarray  # Somme des carrés des écarts à la moyenne
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+    @property
+    def std(self) -> np.ndarray:
+        """Écart-type (échantillon)"""
+        if self.total < 2:
+            return np.zeros_like(self.mean)
+        return np.sqrt(self.m2 / (self.total - 1))
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Bornes des classes (n, bins + 1)"""
+        steps = np.linspace(0.0, 1.0, self.counts.shape[1] + 1)
+        return self.low[:, None] + (self.high - self.low)[:, None] * steps
+
+    def percentile(self, q: float) -> np.ndarray:
+        """
+        Percentile estimé par interpolation linéaire dans l'histogramme
+
+        Args:
+            q: Percentile (0 à 100)
+
+        Returns:
+            Valeur par ligne, bornée par les extrêmes observés
+        """
+        bins = self.counts.shape[1]
+        width = (self.high - self.low) / bins
+        target = q / 100 * self.total
+
+        cumulative = np.cumsum(self.counts, axis=1)
+        index = np.argmax(cumulative >= target, axis=1)
+        rows = np.arange(self.counts.shape[0])
+        count = self.counts[rows, index]
+        before = cumulative[rows, index] - count
+        fraction = np.where(count > 0, (target - before) / np.maximum(count, 1), 0.0)
+
+        value = self.low + width * (index + fraction)
+        return np.clip(value, self.minimum, self.maximum)
+
+    def merge(self, other: "Distribution") -> "Distribution":
+        """Fusionne deux distributions de mêmes bornes (moments de Chan)"""
+        total = self.total + other.total
+        delta = other.mean - self.mean
+        return Distribution(
+            low=self.low,
+            high=self.high,
+            counts=self.counts + other.counts,
+            total=total,
+            mean=self.mean + delta * other.total / total,
+            m2=self.m2 + other.m2 + delta**2 * self.total * other.total / total,
+            minimum=np.minimum(self.minimum, other.minimum),
+            maximum=np.maximum(self.maximum, other.maximum)
+        )
+
+
+@dataclass
+class MonteCarloResult:
+    """Distributions de chaque grandeur"""
+    n_samples: int
+    distributions: Dict[str, Distribution]
+
+    def percentiles(self, quantity: str, qs: Sequence[float]) -> Dict[float, np.ndarray]:
+        """Percentiles d'une grandeur, une valeur par portée (ou par canton pour T0)"""
+        distribution = self.distributions[quantity]
+        return {q: distribution.percentile(q) for q in qs}
+
+
+class MonteCarloSimulator:
+    """Simulation Monte Carlo d'un canton, éventuellement répartie sur plusieurs processus"""
+
+    BINS = 256
+    PILOT_SAMPLES = 2_000  # Échantillons servant à fixer les bornes des histogrammes
+    RANGE_MARGIN = 0.25  # Élargissement relatif des bornes du pilote
+    TASK_SAMPLES = 20_000  # Échantillons par tâche (indépendant du nombre de processus)
+    CHUNK_SAMPLES = 5_000  # Échantillons évalués en une passe vectorisée
+
+    @classmethod
+    def evaluate(
+        cls,
+        job: MonteCarloJob,
+        rng: np.random.Generator,
+        n: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Tire et évalue n échantillons
+
+        Args:
+            job: Définition du tirage
+            rng: Générateur aléatoire
+            n: Nombre d'échantillons
+
+        Returns:
+            Grandeurs de forme (n, 1) pour T0 et (n, portées) pour les autres
+        """
+        tol = job.tolerances
+        nominal_a = np.asarray(job.spans_m, dtype=np.float64)
+        nominal_h = np.asarray(job.delta_h_m, dtype=np.float64)
+        m = nominal_a.size
+
+        a = nominal_a + tol.span_m * rng.standard_normal((n, m))
+        h = nominal_h + tol.delta_h_m * rng.standard_normal((n, m))
+        mass = job.cable.mass_lin_kg_per_m * (1 + tol.mass_rel * rng.standard_normal(n))
+        E = job.cable.E_MPa * (1 + tol.E_rel * rng.standard_normal(n))
+        alpha = job.cable.alpha_1e6_per_C * (1 + tol.alpha_rel * rng.standard_normal(n))
+
+        constants = CableConstants(
+            ES_dan=E * job.cable.section_mm2 / 10,
+            alpha_per_C=alpha * 1e-6,
+            weight_dan_per_m=mass * BatchSpanCalculator.G / 10,
+            diameter_m=job.cable.diameter_mm / 1000
+        )
+
+        a_eq, _ = blondel(np.sum(a, axis=1), np.sum(a**3, axis=1))
+        state = StateChangeSolver.solve(
+            constants, a_eq, job.reference, job.temperature_C, job.wind_pressure_daPa
+        )
+
+        rho = state.rho_m[:, None]
+        _, F1, F2, H = BatchSpanCalculator.calculate_sags(a, h, rho)
+        apparent_mass = state.apparent_weight_dan_per_m[:, None] / (BatchSpanCalculator.G / 10)
+        _, TA, TB = BatchSpanCalculator.calculate_tensions(rho, F2, H, apparent_mass)
+
+        return {
+            "T0_dan": state.tension_dan[:, None],
+            "TA_dan": TA,
+            "TB_dan": TB,
+            "F1_m": F1,
+            "F2_m": F2
+        }
+
+    @classmethod
+    def _accumulate(
+        cls,
+        values: np.ndarray,
+        low: np.ndarray,
+        high: np.ndarray
+    ) -> Distribution:
+        """Histogramme et moments de valeurs (n, lignes), par ligne"""
+        rows = values.shape[1]
+        bins = cls.BINS
+        index = np.floor((values - low) / (high - low) * bins).astype(np.int64)
+        np.clip(index, 0, bins - 1, out=index)
+        flat = index + np.arange(rows) * bins
+        counts = np.bincount(flat.ravel(), minlength=rows * bins).reshape(rows, bins)
+
+        mean = values.mean(axis=0)
+        return Distribution(
+            low=low,
+            high=high,
+            counts=counts,
+            total=values.shape[0],
+            mean=mean,
+            m2=((values - mean) ** 2).sum(axis=0),
+            minimum=values.min(axis=0),
+            maximum=values.max(axis=0)
+        )
+
+    @classmethod
+    def run_task(
+        cls,
+        job: MonteCarloJob,
+        seed: np.random.SeedSequence,
+        n: int,
+        bounds: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    ) -> Dict[str, Distribution]:
+        """
+        Évalue une tâche par blocs et renvoie ses distributions partielles
+
+        Args:
+            job: Définition du tirage
+            seed: Graine propre à la tâche
+            n: Nombre d'échantillons de la tâche
+            bounds: Bornes (basse, haute) des histogrammes par grandeur
+
+        Returns:
+            Distributions partielles par grandeur
+        """
+        rng = np.random.default_rng(seed)
+        merged: Dict[str, Distribution] = {}
+        for start in range(0, n, cls.CHUNK_SAMPLES):
+            chunk = cls.evaluate(job, rng, min(cls.CHUNK_SAMPLES, n - start))
+            for name, values in chunk.items():
+                partial = cls._accumulate(values, *bounds[name])
+                merged[name] = merged[name].merge(partial) if name in merged else partial
+        return merged
+
+    @classmethod
+    def histogram_bounds(
+        cls,
+        job: MonteCarloJob,
+        seed: np.random.SeedSequence
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Bornes des histogrammes déduites d'un tirage pilote élargi"""
+        pilot = cls.evaluate(job, np.random.default_rng(seed), cls.PILOT_SAMPLES)
+        bounds = {}
+        for name, values in pilot.items():
+            low, high = values.min(axis=0), values.max(axis=0)
+            pad = np.maximum(cls.RANGE_MARGIN * (high - low), 1e-6 * np.abs(high) + 1e-9)
+            bounds[name] = (low - pad, high + pad)
+        return bounds
+
+    @classmethod
+    def run(cls, job: MonteCarloJob, workers: Optional[int] = None) -> MonteCarloResult:
+        """
+        Exécute le tirage complet
+
+        Les échantillons sont découpés en tâches de taille fixe, chacune avec sa
+        propre graine issue de SeedSequence(seed).spawn : le résultat ne dépend
+        donc pas du nombre de processus.
+
+        Args:
+            job: Définition du tirage
+            workers: Nombre de processus (None ou 1 : dans le processus courant)
+
+        Returns:
+            MonteCarloResult
+        """
+        if job.n_samples < 2:
+            raise ValueError("Au moins deux échantillons sont nécessaires")
+        if len(job.spans_m) == 0 or len(job.spans_m) != len(job.delta_h_m):
+            raise ValueError("spans_m et delta_h_m doivent être non vides et de même longueur")
+
+        n_tasks = math.ceil(job.n_samples / cls.TASK_SAMPLES)
+        pilot_seed, *task_seeds = np.random.SeedSequence(job.seed).spawn(n_tasks + 1)
+        bounds = cls.histogram_bounds(job, pilot_seed)
+        sizes = [min(cls.TASK_SAMPLES, job.n_samples - i * cls.TASK_SAMPLES) for i in range(n_tasks)]
+
+        if workers is None or workers <= 1 or n_tasks == 1:
+            partials: List[Dict[str, Distribution]] = [
+                cls.run_task(job, seed, n, bounds) for seed, n in zip(task_seeds, sizes)
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, n_tasks)) as executor:
+                partials = list(executor.map(
+                    cls.run_task,
+                    [job] * n_tasks, task_seeds, sizes, [bounds] * n_tasks
+                ))
+
+        distributions = partials[0]
+        for partial in partials[1:]:
+            distributions = {
+                name: distributions[name].merge(partial[name]) for name in distributions
+            }
+
+        return MonteCarloResult(n_samples=job.n_samples, distributions=distributions)
@@ -0,0 +1,148 @@
+"""
+Situation particulière : surcharges ponctuelles sur une portée
+(arbre tombé sur la ligne, obstacle). Nouvelle tension par l'équation de
+changement d'état, flèche maximale et abaissement du câble au droit des
+charges, vectorisés sur de nombreuses positions et intensités
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+
+
+@dataclass
+class PointLoadResult:
+    """Résultats par scénario (forme des scénarios) et par charge (dernier axe)"""
+    tension_dan: np.ndarray  # Tension horizontale sous surcharge (daN)
+    max_sag_m: np.ndarray  # Flèche maximale sous la corde (m)
+    max_sag_x_m: np.ndarray  # Abscisse de la flèche maximale depuis le support A (m)
+    sag_at_load_m: np.ndarray  # Flèche au droit de chaque charge (m)
+    drop_m: np.ndarray  # Abaissement au droit de chaque charge par rapport à la portée sans surcharge (m)
+    unloaded_tension_dan: np.ndarray  # Tension sans surcharge à la même température (daN)
+
+
+def _influence(x: np.ndarray, xi: np.ndarray, a: float) -> np.ndarray:
+    """Moment en x d'une charge unitaire en ξ sur une poutre de portée a : min·(a − max)/a"""
+    return np.minimum(x, xi) * (a - np.maximum(x, xi)) / a
+
+
+class PointLoadSolver:
+    """Portée isolée (ancrée aux deux extrémités) sous poids propre et charges ponctuelles"""
+
+    @staticmethod
+    def equivalent_weight(
+        a: float,
+        weight_dan_per_m: float,
+        positions_m: np.ndarray,
+        loads_dan: np.ndarray
+    ) -> np.ndarray:
+        """
+        Poids linéique uniforme donnant le même allongement du câble
+
+        La longueur du câble vaut a + D/(2·T²), D = ∫ V(x)² dx où V est
+        l'effort tranchant de la poutre équivalente. Pour le poids propre
+        seul, D = w²·a³/12 : le poids p tel que p²·a³/12 = D se substitue
+        donc directement dans l'équation de changement d'état.
+        D = w²·a³/12 + w·Σ Pk·ξk·(a − ξk) + Σj Σk Pj·Pk·min(ξj, ξk)·(a − max(ξj, ξk))/a
+
+        Args:
+            a: Longueur de la portée (m)
+            weight_dan_per_m: Poids linéique du câble (daN/m)
+            positions_m: Positions des charges depuis le support A (m), charges sur le dernier axe
+            loads_dan: Intensités des charges (daN), même forme
+
+        Returns:
+            Poids équivalent (daN/m), forme des scénarios
+        """
+        w = weight_dan_per_m
+        uniform = w**2 * a**3 / 12
+        cross = w * np.sum(loads_dan * positions_m * (a - positions_m), axis=-1)
+        pairs = _influence(positions_m[..., :, None], positions_m[..., None, :], a)
+        quadratic = np.einsum("...j,...jk,...k->...", loads_dan, pairs, loads_dan)
+        return np.sqrt(12 * (uniform + cross + quadratic) / a**3)
+
+    @classmethod
+    def solve(
+        cls,
+        a: float,
+        h: float,
+        constants: CableConstants,
+        reference: ReferenceState,
+        temperature_C: float,
+        positions_m: ArrayLike,
+        loads_dan: ArrayLike
+    ) -> PointLoadResult:
+        """
+        Nouvelle tension et flèches sous surcharges ponctuelles
+
+        La flèche sous la corde vaut M(x)/T · b/a, M moment de la poutre
+        équivalente (poids propre et charges) : avec le poids propre seul,
+        c'est la flèche parabolique F(x) = x·(a − x)·b/(2·ρ·a).
+        Les charges d'un même scénario sont sur le dernier axe ; les axes
+        précédents sont diffusés (ex. intensités × positions pour une courbe
+        de danger).
+
+        Args:
+            a: Longueur de la portée (m)
+            h: Dénivelé (m)
+            constants: Constantes du câble
+            reference: État de référence de la portée
+            temperature_C: Température de l'état calculé (°C)
+            positions_m: Positions des charges depuis le support A (m)
+            loads_dan: Intensités des charges (daN)
+
+        Returns:
+            PointLoadResult
+        """
+        positions, loads = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(positions_m, dtype=np.float64)),
+            np.atleast_1d(np.asarray(loads_dan, dtype=np.float64))
+        )
+        if a <= 0:
+            raise ValueError("La portée doit être strictement positive")
+        if np.any(positions < 0) or np.any(positions > a):
+            raise ValueError("Les charges doivent être situées dans la portée")
+        if np.any(loads < 0):
+            raise ValueError("Les charges doivent être positives ou nulles")
+
+        w = constants.weight_dan_per_m
+        incline = np.sqrt(a**2 + h**2) / a
+
+        unloaded = StateChangeSolver.solve(constants, a, reference, temperature_C, 0.0)
+        p = cls.equivalent_weight(a, w, positions, loads)
+        T = StateChangeSolver.solve(
+            constants, a, reference, temperature_C, apparent_weight_dan_per_m=p
+        ).tension_dan
+
+        def moment(x: np.ndarray) -> np.ndarray:
+            """Moment de la poutre équivalente aux abscisses x (dernier axe)"""
+            point = np.sum(loads[..., None, :] * _influence(x[..., :, None], positions[..., None, :], a), axis=-1)
+            return w * x * (a - x) / 2 + point
+
+        # Flèche maximale : aux charges, ou là où l'effort tranchant s'annule entre deux charges
+        order = np.argsort(positions, axis=-1)
+        xi = np.take_along_axis(positions, order, axis=-1)
+        P = np.take_along_axis(loads, order, axis=-1)
+        reaction = w * a / 2 + np.sum(P * (a - xi), axis=-1, keepdims=True) / a
+        carried = np.concatenate((np.zeros_like(reaction), np.cumsum(P, axis=-1)), axis=-1)
+        bounds_low = np.concatenate((np.zeros_like(reaction), xi), axis=-1)
+        bounds_high = np.concatenate((xi, np.full_like(reaction, a)), axis=-1)
+        if w > 0:
+            stationary = np.clip((reaction - carried) / w, bounds_low, bounds_high)
+        else:
+            stationary = bounds_low
+        candidates = np.concatenate((xi, stationary), axis=-1)
+        candidate_moment = moment(candidates)
+        best = np.argmax(candidate_moment, axis=-1)[..., None]
+
+        T_scen = T[..., None]
+        return PointLoadResult(
+            tension_dan=T,
+            max_sag_m=np.take_along_axis(candidate_moment, best, axis=-1)[..., 0] / T * incline,
+            max_sag_x_m=np.take_along_axis(candidates, best, axis=-1)[..., 0],
+            sag_at_load_m=moment(positions) / T_scen * incline,
+            drop_m=(moment(positions) / T_scen - w * positions * (a - positions) / (2 * unloaded.tension_dan)) * incline,
+            unloaded_tension_dan=unloaded.tension_dan
+        )
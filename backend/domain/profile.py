@@ -0,0 +1,239 @@
+"""
+Échantillonnage de la courbe des conducteurs le long d'une ligne
+Calcule y(x) et la flèche F(x) = y_corde(x) − y(x) de toutes les portées
+en une passe vectorisée, à une résolution donnée
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+
+
+@dataclass
+class ConductorProfile:
+    """Points échantillonnés de la courbe du conducteur, toutes portées confondues"""
+    span_index: np.ndarray  # Portée de chaque point
+    span_starts: np.ndarray  # Indice du premier point de chaque portée
+    x_m: np.ndarray  # Abscisse locale depuis le support A de la portée (m)
+    station_m: np.ndarray  # Abscisse cumulée depuis le début de la ligne (m)
+    chord_altitude_m: np.ndarray  # Altitude de la corde y_corde(x) (m)
+    sag_m: np.ndarray  # Flèche F(x) sous la corde (m)
+    altitude_m: np.ndarray  # Altitude du conducteur y(x) (m)
+
+    def __len__(self) -> int:
+        return len(self.x_m)
+
+
+def sag_at(x: ArrayLike, a: ArrayLike, h: ArrayLike, rho: ArrayLike) -> np.ndarray:
+    """
+    Flèche en un point, approximation parabolique cohérente avec F1
+
+    F(x) = x·(a − x)·b / (2·ρ·a), qui vaut F1 = a·b / (8·ρ) en x = a/2
+
+    Args:
+        x: Abscisses locales depuis le support A (m)
+        a: Longueurs de portée (m)
+        h: Dénivelés (m)
+        rho: Paramètres de la chaînette (m)
+
+    Returns:
+        Flèches sous la corde (m)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    a = np.asarray(a, dtype=np.float64)
+    b = np.sqrt(a**2 + np.asarray(h, dtype=np.float64)**2)
+    return x * (a - x) * b / (2 * np.asarray(rho, dtype=np.float64) * a)
+
+
+@dataclass
+class DecimatedProfile:
+    """Profil réduit pour l'affichage : extrêmes de chaque colonne de pixels"""
+    station_m: np.ndarray  # Abscisse cumulée (m)
+    altitude_m: np.ndarray  # Altitude du conducteur y(x) (m)
+    sag_m: np.ndarray  # Flèche F(x) sous la corde (m)
+    span_index: np.ndarray  # Portée de chaque point
+
+    def __len__(self) -> int:
+        return len(self.station_m)
+
+
+def decimate_min_max(
+    profile: ConductorProfile,
+    window_start_m: float,
+    window_end_m: float,
+    buckets: int
+) -> DecimatedProfile:
+    """
+    Réduit un profil aux points extrêmes de chaque colonne de pixels
+
+    Chaque colonne conserve son point le plus bas et son point le plus haut,
+    dans l'ordre des abscisses : le tracé reste fidèle avec au plus
+    2 × buckets points.
+
+    Args:
+        profile: Profil échantillonné (abscisses croissantes)
+        window_start_m: Début de la fenêtre affichée (m)
+        window_end_m: Fin de la fenêtre affichée (m)
+        buckets: Nombre de colonnes de pixels
+
+    Returns:
+        DecimatedProfile
+    """
+    if window_end_m <= window_start_m or buckets < 1:
+        raise ValueError("La fenêtre doit être non vide et contenir au moins une colonne")
+
+    lo = np.searchsorted(profile.station_m, window_start_m, side="left")
+    hi = np.searchsorted(profile.station_m, window_end_m, side="right")
+    station = profile.station_m[lo:hi]
+    altitude = profile.altitude_m[lo:hi]
+
+    if station.size == 0:
+        empty = np.empty(0)
+        return DecimatedProfile(empty, empty, empty, np.empty(0, dtype=np.intp))
+
+    scale = buckets / (window_end_m - window_start_m)
+    bucket = np.minimum(((station - window_start_m) * scale).astype(np.intp), buckets - 1)
+
+    # Tri par colonne puis altitude : premier = minimum, dernier = maximum
+    order = np.lexsort((altitude, bucket))
+    sorted_bucket = bucket[order]
+    first = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+    last = np.r_[first[1:] - 1, order.size - 1]
+
+    keep = np.unique(np.concatenate((order[first], order[last]))) + lo
+    return DecimatedProfile(
+        station_m=profile.station_m[keep],
+        altitude_m=profile.altitude_m[keep],
+        sag_m=profile.sag_m[keep],
+        span_index=profile.span_index[keep]
+    )
+
+
+class ProfileSampler:
+    """Échantillonnage vectorisé des portées successives d'une ligne"""
+
+    OVERSAMPLING = 4  # Points échantillonnés par colonne de pixels
+    MIN_RESOLUTION_M = 0.01  # Pas le plus fin en zoom avant (m)
+
+    @staticmethod
+    def sample(
+        a: ArrayLike,
+        h: ArrayLike,
+        rho: ArrayLike,
+        start_altitude_m: float = 0.0,
+        resolution_m: float = 1.0,
+        start_station_m: float = 0.0
+    ) -> ConductorProfile:
+        """
+        Échantillonne toutes les portées, supports compris
+
+        Les portées se suivent : le support B d'une portée est le support A de
+        la suivante, l'altitude des accrochages est donc cumulée à partir de
+        start_altitude_m. Chaque portée reçoit ceil(a / résolution) + 1 points
+        régulièrement espacés.
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette, scalaire ou par portée (m)
+            start_altitude_m: Altitude de l'accrochage du premier support (m)
+            resolution_m: Pas d'échantillonnage maximal (m)
+            start_station_m: Abscisse cumulée du premier support (m)
+
+        Returns:
+            ConductorProfile
+        """
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        rho = np.broadcast_to(np.asarray(rho, dtype=np.float64), a.shape)
+        if a.ndim != 1 or a.shape != h.shape or a.size == 0:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+        if np.any(a <= 0) or np.any(rho <= 0):
+            raise ValueError("Les portées et les paramètres ρ doivent être strictement positifs")
+        if resolution_m <= 0:
+            raise ValueError("La résolution doit être strictement positive")
+
+        counts = np.ceil(a / resolution_m).astype(np.intp) + 1
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        span_index = np.repeat(np.arange(a.size), counts)
+        k = np.arange(counts.sum()) - starts[span_index]
+
+        a_i, h_i = a[span_index], h[span_index]
+        x = k * (a_i / (counts - 1)[span_index])
+
+        attachment_altitude = start_altitude_m + np.concatenate(([0.0], np.cumsum(h)[:-1]))
+        span_offset = start_station_m + np.concatenate(([0.0], np.cumsum(a)[:-1]))
+
+        chord = attachment_altitude[span_index] + h_i * x / a_i
+        sag = sag_at(x, a_i, h_i, rho[span_index])
+
+        return ConductorProfile(
+            span_index=span_index,
+            span_starts=starts,
+            x_m=x,
+            station_m=span_offset[span_index] + x,
+            chord_altitude_m=chord,
+            sag_m=sag,
+            altitude_m=chord - sag
+        )
+
+    @classmethod
+    def sample_window(
+        cls,
+        a: ArrayLike,
+        h: ArrayLike,
+        rho: ArrayLike,
+        start_altitude_m: float,
+        pixel_width: int,
+        window_start_m: Optional[float] = None,
+        window_end_m: Optional[float] = None
+    ) -> DecimatedProfile:
+        """
+        Profil adapté à une largeur d'affichage, sur toute la ligne ou une fenêtre
+
+        Seules les portées qui recoupent la fenêtre sont échantillonnées, avec
+        un pas proportionnel à la largeur de la fenêtre par pixel : le nombre
+        de points calculés dépend de l'affichage, pas de la longueur de ligne.
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette, scalaire ou par portée (m)
+            start_altitude_m: Altitude de l'accrochage du premier support (m)
+            pixel_width: Largeur d'affichage (pixels)
+            window_start_m: Début de la fenêtre (m), début de ligne par défaut
+            window_end_m: Fin de la fenêtre (m), fin de ligne par défaut
+
+        Returns:
+            DecimatedProfile, span_index relatif à la ligne complète
+        """
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        rho = np.broadcast_to(np.asarray(rho, dtype=np.float64), a.shape)
+        if a.ndim != 1 or a.shape != h.shape or a.size == 0:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+
+        supports = np.concatenate(([0.0], np.cumsum(a)))
+        start = 0.0 if window_start_m is None else max(window_start_m, 0.0)
+        end = supports[-1] if window_end_m is None else min(window_end_m, supports[-1])
+        if end <= start:
+            raise ValueError("La fenêtre ne recoupe pas la ligne")
+
+        first = max(np.searchsorted(supports, start, side="right") - 1, 0)
+        last = min(np.searchsorted(supports, end, side="left"), a.size)
+        altitudes = start_altitude_m + np.concatenate(([0.0], np.cumsum(h)))
+
+        resolution = max((end - start) / (pixel_width * cls.OVERSAMPLING), cls.MIN_RESOLUTION_M)
+        profile = cls.sample(
+            a[first:last],
+            h[first:last],
+            rho[first:last],
+            start_altitude_m=altitudes[first],
+            resolution_m=resolution,
+            start_station_m=supports[first]
+        )
+        profile.span_index = profile.span_index + first
+
+        return decimate_min_max(profile, start, end, pixel_width)
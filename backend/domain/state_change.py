@@ -0,0 +1,198 @@
+"""
+Équation de changement d'état des câbles
+Reporte la tension horizontale d'un état de référence vers d'autres états
+(température, vent) pour une portée équivalente donnée
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.loading import apparent_load
+from backend.domain.mechanical import CableProperties, MechanicalCalculator
+
+
+@dataclass(frozen=True)
+class CableConstants:
+    """Constantes d'un câble précalculées pour l'équation de changement d'état"""
+    ES_dan: float  # Raideur E·S (daN)
+    alpha_per_C: float  # Coefficient de dilatation (1/°C)
+    weight_dan_per_m: float  # Poids propre ω·g (daN/m)
+    diameter_m: float  # Diamètre (m)
+
+    @classmethod
+    def from_cable(cls, cable: CableProperties) -> "CableConstants":
+        """Calcule les constantes une seule fois pour un câble"""
+        return cls(
+            ES_dan=cable.E_MPa * cable.section_mm2 / 10,  # N → daN
+            alpha_per_C=cable.alpha_1e6_per_C * 1e-6,
+            weight_dan_per_m=cable.mass_lin_kg_per_m * MechanicalCalculator.G / 10,
+            diameter_m=cable.diameter_mm / 1000
+        )
+
+    def apparent_weight(self, wind_pressure_daPa: ArrayLike) -> np.ndarray:
+        """
+        Poids apparent sous vent : p = √((ω·g)² + (q·d)²)
+
+        Args:
+            wind_pressure_daPa: Pressions du vent (daPa = daN/m²)
+
+        Returns:
+            Poids apparent (daN/m)
+        """
+        return apparent_load(self.weight_dan_per_m, self.diameter_m, wind_pressure_daPa).apparent_dan_per_m
+
+
+@dataclass
+class ReferenceState:
+    """État de référence d'un canton"""
+    temperature_C: float  # Température (°C)
+    tension_dan: ArrayLike  # Tension horizontale T0 (daN), scalaire ou une par canton
+    wind_pressure_daPa: float = 0.0  # Pression du vent (daPa)
+
+
+@dataclass
+class StateChangeResult:
+    """Tensions et paramètres obtenus par changement d'état"""
+    tension_dan: np.ndarray  # Tension horizontale T0 (daN)
+    rho_m: np.ndarray  # Paramètre de la chaînette sous poids apparent (m)
+    apparent_weight_dan_per_m: np.ndarray  # Poids apparent (daN/m)
+    iterations: int  # Nombre d'itérations de Newton
+
+
+class StateChangeSolver:
+    """Solveur vectorisé de l'équation de changement d'état"""
+
+    TOLERANCE = 1e-13  # Tolérance relative sur la tension
+    MAX_ITERATIONS = 60
+
+    @classmethod
+    def solve_cubic(cls, A: np.ndarray, B: np.ndarray) -> Tuple[np.ndarray, int]:
+        """
+        Racine positive de T³ + A·T² - B = 0 (B > 0)
+
+        La racine positive est unique. Newton démarre d'un majorant
+        T = max(-A, 0) + ∛B et converge de façon monotone (f convexe au-delà).
+
+        Args:
+            A: Coefficient A
+            B: Coefficient B (strictement positif)
+
+        Returns:
+            (racine, nombre d'itérations)
+        """
+        A, B = np.broadcast_arrays(np.asarray(A, dtype=np.float64), np.asarray(B, dtype=np.float64))
+        T = np.maximum(-A, 0) + np.cbrt(B)
+
+        for iteration in range(1, cls.MAX_ITERATIONS + 1):
+            f = T**2 * (T + A) - B
+            df = T * (3 * T + 2 * A)
+            step = f / df
+            T = T - step
+            if np.all(np.abs(step) <= cls.TOLERANCE * T):
+                return T, iteration
+
+        return T, cls.MAX_ITERATIONS
+
+    @classmethod
+    def solve(
+        cls,
+        constants: CableConstants,
+        ruling_span_m: ArrayLike,
+        reference: ReferenceState,
+        temperature_C: ArrayLike,
+        wind_pressure_daPa: ArrayLike = 0.0,
+        apparent_weight_dan_per_m: Optional[ArrayLike] = None,
+        geometric_strain: ArrayLike = 0.0
+    ) -> StateChangeResult:
+        """
+        Tension horizontale dans les états demandés (entrées diffusables)
+
+        (T2 - T1)/ES + α·(θ2 - θ1) - ε_g = a²/24 · (p2²/T2² - p1²/T1²)
+
+        ε_g est l'allongement relatif des cordes √(a² + h²) du canton depuis
+        l'état de référence (accrochage déplacé) : le câble, de longueur
+        inchangée, doit le reprendre par sa tension.
+
+        Args:
+            constants: Constantes du câble
+            ruling_span_m: Portée(s) équivalente(s) (m)
+            reference: État de référence
+            temperature_C: Températures des états recherchés (°C)
+            wind_pressure_daPa: Pressions de vent des états recherchés (daPa)
+            apparent_weight_dan_per_m: Poids apparents p2 imposés (ex. avec givre),
+                remplace le calcul à partir du vent, optionnel
+            geometric_strain: Allongement relatif des cordes ε_g depuis la référence
+
+        Returns:
+            StateChangeResult de forme diffusée
+        """
+        a = np.asarray(ruling_span_m, dtype=np.float64)
+        T1 = np.asarray(reference.tension_dan, dtype=np.float64)
+        if np.any(a <= 0) or np.any(T1 <= 0):
+            raise ValueError("La portée équivalente et la tension de référence doivent être positives")
+
+        ES = constants.ES_dan
+        p1 = constants.apparent_weight(reference.wind_pressure_daPa)
+        if apparent_weight_dan_per_m is None:
+            p2 = constants.apparent_weight(wind_pressure_daPa)
+        else:
+            p2 = np.asarray(apparent_weight_dan_per_m, dtype=np.float64)
+        delta_theta = np.asarray(temperature_C, dtype=np.float64) - reference.temperature_C
+
+        k = ES * a**2 / 24
+        strain = np.asarray(geometric_strain, dtype=np.float64)
+        A = -T1 + ES * constants.alpha_per_C * delta_theta + k * p1**2 / T1**2 - ES * strain
+        B = k * p2**2
+
+        T2, iterations = cls.solve_cubic(A, B)
+        p2 = np.broadcast_to(p2, T2.shape)
+
+        return StateChangeResult(
+            tension_dan=T2,
+            rho_m=T2 / p2,
+            apparent_weight_dan_per_m=p2,
+            iterations=iterations
+        )
+
+    @classmethod
+    def solve_grid(
+        cls,
+        constants: CableConstants,
+        ruling_span_m: float,
+        reference: ReferenceState,
+        temperatures_C: ArrayLike,
+        wind_pressures_daPa: ArrayLike
+    ) -> StateChangeResult:
+        """
+        Évalue un canton sur la grille températures × pressions de vent
+
+        Args:
+            constants: Constantes du câble
+            ruling_span_m: Portée équivalente du canton (m)
+            reference: État de référence
+            temperatures_C: Axe des températures (°C)
+            wind_pressures_daPa: Axe des pressions de vent (daPa)
+
+        Returns:
+            StateChangeResult de forme (n_températures, n_vents)
+        """
+        temperatures = np.asarray(temperatures_C, dtype=np.float64).reshape(-1, 1)
+        winds = np.asarray(wind_pressures_daPa, dtype=np.float64).reshape(1, -1)
+        return cls.solve(constants, ruling_span_m, reference, temperatures, winds)
+
+
+def reference_from_rho(
+    constants: CableConstants,
+    rho_m: float,
+    temperature_C: float,
+    wind_pressure_daPa: float = 0.0
+) -> ReferenceState:
+    """Construit un état de référence à partir de ρ (T0 = ρ × p)"""
+    p = float(constants.apparent_weight(wind_pressure_daPa))
+    return ReferenceState(
+        temperature_C=temperature_C,
+        tension_dan=rho_m * p,
+        wind_pressure_daPa=wind_pressure_daPa
+    )
@@ -0,0 +1,358 @@
+"""
+Tables de pose : tension et flèches en fonction de la température pour tous
+les cantons d'une ligne, calculées en une passe vectorisée et mises en cache
+sur disque (clé : empreinte du contenu des entrées)
+"""
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike, BatchSpanCalculator
+from backend.domain.canton import canton_starts, equivalent_spans
+from backend.domain.mechanical import CableProperties
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+
+logger = logging.getLogger(__name__)
+
+# Version du format des tables : la changer invalide les tables en cache
+TABLE_FORMAT_VERSION = 1
+
+CSV_COLUMNS = ("canton", "span", "a_m", "h_m", "temperature_C", "T0_dan", "rho_m", "F1_m")
+
+
+@dataclass
+class StringingTable:
+    """Tables de pose d'une ligne : cantons × températures et portées × températures"""
+    key: str  # Empreinte des entrées
+    cable: str  # Nom du câble
+    temperatures_C: np.ndarray  # Températures des lignes de la table (°C)
+    canton_sizes: np.ndarray  # Nombre de portées de chaque canton
+    a_m: np.ndarray  # Longueurs des portées (m)
+    h_m: np.ndarray  # Dénivelés (m)
+    ruling_span_m: np.ndarray  # Portée équivalente de chaque canton (m)
+    tension_dan: np.ndarray  # Tension horizontale T0 (cantons, températures) (daN)
+    rho_m: np.ndarray  # Paramètre de la chaînette (cantons, températures) (m)
+    sag_m: np.ndarray  # Flèche médiane F1 de chaque portée (portées, températures) (m)
+
+    @property
+    def canton_index(self) -> np.ndarray:
+        """Canton de chaque portée"""
+        return np.repeat(np.arange(self.canton_sizes.size), self.canton_sizes)
+
+    def to_dict(self) -> Dict:
+        """Tables par canton, pour l'API ou l'export JSON"""
+        cantons = []
+        starts = canton_starts(self.canton_sizes)
+        for i, (start, size) in enumerate(zip(starts.tolist(), self.canton_sizes.tolist())):
+            stop = start + size
+            cantons.append({
+                "ruling_span_m": round(float(self.ruling_span_m[i]), 2),
+                "T0_dan": np.rint(self.tension_dan[i]).astype(int).tolist(),
+                "rho_m": np.round(self.rho_m[i], 1).tolist(),
+                "spans": [
+                    {"a_m": float(a), "h_m": float(h), "F1_m": np.round(sag, 2).tolist()}
+                    for a, h, sag in zip(self.a_m[start:stop], self.h_m[start:stop], self.sag_m[start:stop])
+                ]
+            })
+        return {
+            "key": self.key,
+            "cable": self.cable,
+            "temperatures_C": self.temperatures_C.tolist(),
+            "cantons": cantons
+        }
+
+    def to_json(self) -> str:
+        """Export JSON"""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def to_csv(self) -> str:
+        """Export CSV, une ligne par portée et par température"""
+        n_spans, n_temps = self.sag_m.shape
+        span = np.repeat(np.arange(n_spans), n_temps)
+        canton = self.canton_index[span]
+        temperature = np.tile(self.temperatures_C, n_spans)
+        columns = (
+            canton,
+            span,
+            self.a_m[span],
+            self.h_m[span],
+            temperature,
+            np.rint(self.tension_dan[canton, np.tile(np.arange(n_temps), n_spans)]).astype(int),
+            np.round(self.rho_m[canton, np.tile(np.arange(n_temps), n_spans)], 1),
+            np.round(self.sag_m.ravel(), 2)
+        )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(zip(*(column.tolist() for column in columns)))
+        return buffer.getvalue()
+
+
+class StringingTableGenerator:
+    """Génération vectorisée des tables de pose de tous les cantons"""
+
+    @staticmethod
+    def content_key(
+        a: np.ndarray,
+        h: np.ndarray,
+        canton_sizes: np.ndarray,
+        cable: CableProperties,
+        reference: ReferenceState,
+        temperatures_C: np.ndarray
+    ) -> str:
+        """
+        Empreinte SHA-256 des entrées (valeurs exactes des flottants)
+
+        Returns:
+            Empreinte hexadécimale
+        """
+        digest = hashlib.sha256()
+        header = {
+            "version": TABLE_FORMAT_VERSION,
+            "cable": asdict(cable),
+            "reference_temperature_C": float(reference.temperature_C),
+            "reference_wind_pressure_daPa": float(reference.wind_pressure_daPa)
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+        for array, dtype in (
+            (a, np.float64), (h, np.float64), (canton_sizes, np.int64),
+            (reference.tension_dan, np.float64), (temperatures_C, np.float64)
+        ):
+            values = np.ascontiguousarray(np.atleast_1d(np.asarray(array, dtype=dtype)))
+            digest.update(np.int64(values.size).tobytes())
+            digest.update(values.tobytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def generate(
+        cls,
+        a: ArrayLike,
+        h: ArrayLike,
+        canton_sizes: ArrayLike,
+        cable: CableProperties,
+        reference: ReferenceState,
+        temperatures_C: ArrayLike
+    ) -> StringingTable:
+        """
+        Tables de pose de tous les cantons (sans vent)
+
+        Un seul changement d'état sur la grille cantons × températures, puis
+        les flèches de toutes les portées × températures en une passe.
+
+        Args:
+            a: Longueurs des portées, dans l'ordre de la ligne (m)
+            h: Dénivelés des portées (m)
+            canton_sizes: Nombre de portées de chaque canton
+            cable: Câble de la ligne
+            reference: État de référence (tension scalaire ou une par canton)
+            temperatures_C: Températures des lignes de la table (°C)
+
+        Returns:
+            StringingTable
+        """
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        temperatures = np.atleast_1d(np.asarray(temperatures_C, dtype=np.float64))
+        if a.ndim != 1 or a.shape != h.shape or a.size == 0:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+        if temperatures.ndim != 1 or temperatures.size == 0:
+            raise ValueError("Au moins une température est nécessaire")
+        sizes = np.asarray(canton_sizes, dtype=np.intp)
+        starts = canton_starts(sizes)
+        if sizes.sum() != a.size:
+            raise ValueError("La somme des tailles de cantons doit égaler le nombre de portées")
+
+        constants = CableConstants.from_cable(cable)
+        a_eq, _ = equivalent_spans(a, starts)
+        tension = np.asarray(reference.tension_dan, dtype=np.float64)
+        if tension.ndim == 1:
+            tension = tension[:, None]
+        state = StateChangeSolver.solve(
+            constants, a_eq[:, None],
+            ReferenceState(reference.temperature_C, tension, reference.wind_pressure_daPa),
+            temperatures[None, :]
+        )
+
+        canton_index = np.repeat(np.arange(sizes.size), sizes)
+        _, F1, _, _ = BatchSpanCalculator.calculate_sags(a[:, None], h[:, None], state.rho_m[canton_index])
+
+        return StringingTable(
+            key=cls.content_key(a, h, sizes, cable, reference, temperatures),
+            cable=cable.name,
+            temperatures_C=temperatures,
+            canton_sizes=sizes,
+            a_m=a,
+            h_m=h,
+            ruling_span_m=a_eq,
+            tension_dan=state.tension_dan,
+            rho_m=state.rho_m,
+            sag_m=F1
+        )
+
+
+class StringingTableCache:
+    """
+    Cache disque des tables de pose, un fichier .npz par empreinte
+
+    Rouvrir un chantier relit ses tables sans recalcul. Quand la taille
+    totale dépasse max_bytes, les tables les moins récemment utilisées
+    (date de modification, mise à jour à chaque lecture) sont supprimées.
+    """
+
+    SUFFIX = ".npz"
+
+    def __init__(self, directory: Path, max_bytes: int = 256 * 1024**2):
+        if max_bytes < 0:
+            raise ValueError("La taille maximale du cache doit être positive ou nulle")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.write_errors = 0
+
+    def _path(self, key: str) -> Path:
+        if not key or any(c not in "0123456789abcdef" for c in key):
+            raise ValueError(f"Empreinte invalide: {key}")
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[StringingTable]:
+        """
+        Relit une table en cache
+
+        Args:
+            key: Empreinte de la table
+
+        Returns:
+            StringingTable, None si absente
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return StringingTable(
+            key=key,
+            cable=str(arrays.pop("cable")),
+            **arrays
+        )
+
+    def put(self, table: StringingTable) -> None:
+        """Écrit une table (écriture atomique), puis applique la limite de taille"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(table.key)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp{self.SUFFIX}")
+        arrays = {name: value for name, value in vars(table).items() if name != "key"}
+        try:
+            np.savez(tmp, **arrays)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def get_or_generate(
+        self,
+        a: ArrayLike,
+        h: ArrayLike,
+        canton_sizes: ArrayLike,
+        cable: CableProperties,
+        reference: ReferenceState,
+        temperatures_C: ArrayLike
+    ) -> StringingTable:
+        """
+        Table en cache si les entrées sont identiques, sinon générée et écrite
+
+        Mêmes arguments que StringingTableGenerator.generate. Si l'écriture
+        échoue (disque plein, droits), la table est renvoyée sans être mise
+        en cache.
+        """
+        key = StringingTableGenerator.content_key(
+            np.asarray(a, dtype=np.float64), np.asarray(h, dtype=np.float64),
+            np.asarray(canton_sizes, dtype=np.intp), cable, reference,
+            np.atleast_1d(np.asarray(temperatures_C, dtype=np.float64))
+        )
+        table = self.get(key)
+        with self._lock:
+            if table is not None:
+                self.hits += 1
+                return table
+            self.misses += 1
+
+        table = StringingTableGenerator.generate(a, h, canton_sizes, cable, reference, temperatures_C)
+        if self.max_bytes > 0:
+            try:
+                self.put(table)
+            except OSError as e:
+                with self._lock:
+                    self.write_errors += 1
+                logger.warning(f"Table de pose {key[:12]} non mise en cache: {e}")
+        return table
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        """Fichiers du cache avec leurs métadonnées"""
+        if not self.directory.exists():
+            return []
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            if ".tmp" in path.name:
+                continue
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def size_bytes(self) -> int:
+        """Taille totale des tables en cache"""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self) -> int:
+        """
+        Supprime les tables les moins récemment utilisées au-delà de max_bytes
+
+        Returns:
+            Nombre de tables supprimées
+        """
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+            total = sum(stat.st_size for _, stat in entries)
+            removed = 0
+            for path, stat in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+                removed += 1
+            self.evictions += removed
+            return removed
+
+    def stats(self) -> Dict:
+        """Statistiques du cache"""
+        entries = self._entries()
+        return {
+            "directory": str(self.directory),
+            "tables": len(entries),
+            "size_bytes": sum(stat.st_size for _, stat in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "write_errors": self.write_errors
+        }
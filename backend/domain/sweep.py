@@ -0,0 +1,225 @@
+"""
+Balayages paramétriques ρ × température × vent
+Évalue la grille cartésienne complète par blocs de taille bornée et écrit les
+résultats en colonnes (.npy projetés en mémoire) sur disque
+"""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backend.domain.batch import BatchSpanCalculator
+from backend.domain.canton import equivalent_spans
+from backend.domain.mechanical import CableProperties
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+
+# Colonnes écrites pour chaque point de la grille
+SWEEP_COLUMNS = ("rho_m", "T0_dan", "TA_dan", "TB_dan", "F1_m", "F2_m", "H_m")
+
+MANIFEST_FILE = "manifest.json"
+
+
+@dataclass
+class SweepAxis:
+    """Axe d'un balayage : liste explicite ou plage régulière"""
+    values: List[float]
+
+    @classmethod
+    def linspace(cls, start: float, stop: float, num: int) -> "SweepAxis":
+        """Axe régulier de `num` valeurs entre start et stop inclus"""
+        if num < 1:
+            raise ValueError("Un axe doit contenir au moins une valeur")
+        return cls(values=np.linspace(start, stop, num).tolist())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class SweepJob:
+    """Définition d'un balayage sur un jeu de portées"""
+    cable: CableProperties
+    spans_m: Sequence[float]  # Portées du canton étudié (m)
+    delta_h_m: Sequence[float]  # Dénivelés correspondants (m)
+    rho_m: SweepAxis  # Paramètres ρ à la température de référence (m)
+    temperature_C: SweepAxis  # Températures (°C)
+    wind_pressure_daPa: SweepAxis  # Pressions de vent (daPa)
+    reference_temperature_C: float = 15.0  # Température à laquelle ρ est défini (°C)
+    columns: Sequence[str] = field(default=SWEEP_COLUMNS)
+
+    @property
+    def shape(self) -> tuple:
+        """Forme de la grille (ρ, température, vent, portée)"""
+        return (len(self.rho_m), len(self.temperature_C), len(self.wind_pressure_daPa), len(self.spans_m))
+
+    @property
+    def size(self) -> int:
+        """Nombre total de points de la grille"""
+        return int(np.prod(self.shape))
+
+
+class SweepRunner:
+    """Exécution par blocs d'un balayage vers des colonnes sur disque"""
+
+    DEFAULT_CHUNK_SIZE = 65536
+    DTYPE = np.float32  # Stockage compact des colonnes
+
+    @classmethod
+    def evaluate_chunk(
+        cls,
+        job: SweepJob,
+        constants: CableConstants,
+        ruling_span_m: float,
+        start: int,
+        stop: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Évalue les points [start, stop) de la grille aplatie (ordre C)
+
+        Args:
+            job: Définition du balayage
+            constants: Constantes du câble
+            ruling_span_m: Portée équivalente du jeu de portées (m)
+            start: Premier indice aplati
+            stop: Indice aplati de fin (exclu)
+
+        Returns:
+            Colonnes calculées pour le bloc
+        """
+        # La portée est l'axe le plus rapide : le bloc couvre des états
+        # (ρ, température, vent) consécutifs, résolus une seule fois chacun
+        n_spans = len(job.spans_m)
+        i_state, i_span = np.divmod(np.arange(start, stop), n_spans)
+        first_state = start // n_spans
+        states = np.arange(first_state, (stop - 1) // n_spans + 1)
+        i_rho, i_temp, i_wind = np.unravel_index(states, job.shape[:3])
+
+        rho_ref = np.asarray(job.rho_m.values, dtype=np.float64)[i_rho]
+        temperature = np.asarray(job.temperature_C.values, dtype=np.float64)[i_temp]
+        wind = np.asarray(job.wind_pressure_daPa.values, dtype=np.float64)[i_wind]
+        a = np.asarray(job.spans_m, dtype=np.float64)[i_span]
+        h = np.asarray(job.delta_h_m, dtype=np.float64)[i_span]
+
+        reference = ReferenceState(
+            temperature_C=job.reference_temperature_C,
+            tension_dan=rho_ref * constants.weight_dan_per_m
+        )
+        state = StateChangeSolver.solve(constants, ruling_span_m, reference, temperature, wind)
+
+        of_point = i_state - first_state
+        rho = state.rho_m[of_point]
+        _, F1, F2, H = BatchSpanCalculator.calculate_sags(a, h, rho)
+        apparent_mass = state.apparent_weight_dan_per_m[of_point] / (BatchSpanCalculator.G / 10)
+        T0, TA, TB = BatchSpanCalculator.calculate_tensions(rho, F2, H, apparent_mass)
+
+        computed = {
+            "rho_m": rho,
+            "T0_dan": T0,
+            "TA_dan": TA,
+            "TB_dan": TB,
+            "F1_m": F1,
+            "F2_m": F2,
+            "H_m": H
+        }
+        return {name: computed[name] for name in job.columns}
+
+    @classmethod
+    def run(
+        cls,
+        job: SweepJob,
+        output_dir: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict:
+        """
+        Exécute le balayage et écrit une colonne .npy par grandeur
+
+        La mémoire utilisée dépend de chunk_size, pas de la taille de la grille :
+        chaque bloc est écrit dans des fichiers projetés en mémoire.
+
+        Args:
+            job: Définition du balayage
+            output_dir: Répertoire de sortie (créé si besoin)
+            chunk_size: Nombre de points par bloc
+            progress: Rappel (points traités, total) après chaque bloc, optionnel
+
+        Returns:
+            Manifeste décrivant les axes et les colonnes écrites
+        """
+        unknown = set(job.columns) - set(SWEEP_COLUMNS)
+        if unknown:
+            raise ValueError(f"Colonnes inconnues: {sorted(unknown)}")
+        if len(job.spans_m) == 0 or len(job.spans_m) != len(job.delta_h_m):
+            raise ValueError("spans_m et delta_h_m doivent être non vides et de même longueur")
+        if job.size == 0:
+            raise ValueError("Chaque axe du balayage doit contenir au moins une valeur")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size doit être strictement positif")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        constants = CableConstants.from_cable(job.cable)
+        a_eq, _ = equivalent_spans(job.spans_m, [0])
+        ruling_span = float(a_eq[0])
+
+        total = job.size
+        outputs = {
+            name: np.lib.format.open_memmap(
+                output_dir / f"{name}.npy", mode="w+", dtype=cls.DTYPE, shape=(total,)
+            )
+            for name in job.columns
+        }
+
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            chunk = cls.evaluate_chunk(job, constants, ruling_span, start, stop)
+            for name, values in chunk.items():
+                outputs[name][start:stop] = values
+            if progress is not None:
+                progress(stop, total)
+
+        for column in outputs.values():
+            column.flush()
+        del outputs
+
+        manifest = {
+            "cable": job.cable.name,
+            "shape": list(job.shape),
+            "order": ["rho_m", "temperature_C", "wind_pressure_daPa", "span"],
+            "axes": {
+                "rho_m": list(job.rho_m.values),
+                "temperature_C": list(job.temperature_C.values),
+                "wind_pressure_daPa": list(job.wind_pressure_daPa.values),
+                "spans_m": [float(x) for x in job.spans_m],
+                "delta_h_m": [float(x) for x in job.delta_h_m]
+            },
+            "reference_temperature_C": job.reference_temperature_C,
+            "ruling_span_m": ruling_span,
+            "dtype": np.dtype(cls.DTYPE).name,
+            "columns": {name: f"{name}.npy" for name in job.columns}
+        }
+        (output_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+        return manifest
+
+
+def load_sweep_column(output_dir: Path, name: str) -> np.ndarray:
+    """
+    Ouvre une colonne d'un balayage, projetée en mémoire et remise en forme
+
+    Args:
+        output_dir: Répertoire du balayage
+        name: Nom de la colonne
+
+    Returns:
+        Tableau (ρ, température, vent, portée) en lecture seule
+    """
+    output_dir = Path(output_dir)
+    manifest = json.loads((output_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+    if name not in manifest["columns"]:
+        raise KeyError(name)
+    column = np.load(output_dir / manifest["columns"][name], mmap_mode="r")
+    return column.reshape(manifest["shape"])
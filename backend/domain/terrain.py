@@ -0,0 +1,278 @@
+"""
+Profils de terrain (abscisse, altitude du sol) projetés en mémoire
+Un relevé CSV est converti une fois en colonnes float64 (.npy), puis la
+garde au sol de chaque portée est calculée par blocs de portées, sans
+charger le profil complet
+"""
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.profile import sag_at
+
+TERRAIN_COLUMNS = ("chainage_m", "elevation_m")
+
+READ_BLOCK_BYTES = 16 * 1024**2  # Taille des blocs lus pour compter les lignes
+
+
+def _count_lines(path: Path) -> int:
+    """
+    Nombre de lignes de données d'un fichier texte, lu par blocs
+
+    Les lignes vides ou ne contenant qu'un commentaire « # » sont ignorées,
+    comme à la lecture des blocs.
+    """
+    count = 0
+    pending = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(READ_BLOCK_BYTES)
+            if not block:
+                break
+            lines = (pending + block).split(b"\n")
+            pending = lines.pop()
+            count += sum(1 for line in lines if line.split(b"#", 1)[0].strip())
+    return count + bool(pending.split(b"#", 1)[0].strip())
+
+
+def convert_profile_csv(
+    csv_path: Path,
+    npy_path: Path,
+    chunk_rows: int = 1_000_000
+) -> Path:
+    """
+    Convertit un profil CSV (abscisse, altitude) en colonnes float64 .npy
+
+    Le fichier est lu par blocs de chunk_rows lignes et écrit directement
+    dans un tableau (2, n) projeté en mémoire : la mémoire utilisée dépend
+    de chunk_rows, pas de la taille du relevé. Une ligne d'en-tête, les
+    lignes vides et les commentaires « # » sont ignorés, les séparateurs
+    « , » et « ; » sont acceptés.
+
+    Args:
+        csv_path: Profil CSV, abscisses strictement croissantes
+        npy_path: Fichier .npy à écrire
+        chunk_rows: Nombre de lignes lues par bloc
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    csv_path, npy_path = Path(csv_path), Path(npy_path)
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows doit être strictement positif")
+
+    with open(csv_path, encoding="utf-8") as f:
+        first = f.readline()
+    delimiter = ";" if ";" in first else ","
+    try:
+        [float(value) for value in first.split(delimiter)[:2]]
+        header = 0
+    except ValueError:
+        header = 1
+
+    n = _count_lines(csv_path) - header
+    if n < 2:
+        raise ValueError("Le profil doit contenir au moins deux points")
+
+    npy_path.parent.mkdir(parents=True, exist_ok=True)
+    columns = np.lib.format.open_memmap(npy_path, mode="w+", dtype=np.float64, shape=(2, n))
+    written = 0
+    previous = -np.inf
+    try:
+        with open(csv_path, encoding="utf-8") as f:
+            for _ in range(header):
+                next(f)
+            while True:
+                lines = list(islice(f, chunk_rows))
+                if not lines:
+                    break
+                lines = [line for line in lines if line.split("#", 1)[0].strip()]
+                if not lines:
+                    continue
+                block = np.loadtxt(lines, delimiter=delimiter, usecols=(0, 1), ndmin=2)
+                chainage = block[:, 0]
+                if chainage[0] <= previous or np.any(np.diff(chainage) <= 0):
+                    raise ValueError("Les abscisses du profil doivent être strictement croissantes")
+                columns[:, written:written + len(block)] = block.T
+                written += len(block)
+                previous = chainage[-1]
+        if written != n:
+            raise ValueError(f"Lignes lues ({written}) différentes des lignes comptées ({n})")
+        columns.flush()
+    except Exception:
+        del columns
+        npy_path.unlink(missing_ok=True)
+        raise
+    del columns
+    return npy_path
+
+
+@dataclass
+class GroundClearance:
+    """Garde au sol minimale de chaque portée (NaN si le profil ne couvre pas la portée)"""
+    min_clearance_m: np.ndarray  # Distance verticale conducteur − sol minimale (m)
+    station_m: np.ndarray  # Abscisse du minimum (m)
+    conductor_altitude_m: np.ndarray  # Altitude du conducteur au minimum (m)
+    ground_elevation_m: np.ndarray  # Altitude du sol au minimum (m)
+
+
+@dataclass
+class TerrainProfile:
+    """Profil de terrain, colonnes projetées en mémoire"""
+    chainage_m: np.ndarray  # Abscisses croissantes (m)
+    elevation_m: np.ndarray  # Altitudes du sol (m)
+
+    def __len__(self) -> int:
+        return len(self.chainage_m)
+
+    @classmethod
+    def open(cls, path: Path) -> "TerrainProfile":
+        """Ouvre un profil converti par convert_profile_csv, sans le lire"""
+        columns = np.load(Path(path), mmap_mode="r")
+        if columns.ndim != 2 or columns.shape[0] != 2 or columns.shape[1] < 2:
+            raise ValueError("Le profil doit être un tableau (2, n) d'au moins deux points")
+        return cls(chainage_m=columns[0], elevation_m=columns[1])
+
+    @classmethod
+    def from_csv(cls, csv_path: Path, npy_path: Optional[Path] = None) -> "TerrainProfile":
+        """
+        Ouvre un profil CSV, converti au premier appel
+
+        La version binaire (par défaut à côté du CSV) est réutilisée tant
+        qu'elle est plus récente que le CSV.
+        """
+        csv_path = Path(csv_path)
+        npy_path = csv_path.with_suffix(".npy") if npy_path is None else Path(npy_path)
+        if not npy_path.exists() or npy_path.stat().st_mtime_ns < csv_path.stat().st_mtime_ns:
+            convert_profile_csv(csv_path, npy_path)
+        return cls.open(npy_path)
+
+    def _span_groups(self, supports: np.ndarray, chunk_points: int) -> Iterator[Tuple[int, int]]:
+        """Groupes de portées consécutives dont les points de profil tiennent dans un bloc"""
+        # Recherche dichotomique : seules quelques pages du profil sont lues
+        bounds = np.searchsorted(self.chainage_m, supports)
+        first = 0
+        n_spans = supports.size - 1
+        while first < n_spans:
+            last = first + 1
+            while last < n_spans and bounds[last + 1] - bounds[first] <= chunk_points:
+                last += 1
+            yield first, last
+            first = last
+
+    def clearance(
+        self,
+        a: ArrayLike,
+        h: ArrayLike,
+        rho: ArrayLike,
+        start_altitude_m: float,
+        start_station_m: float = 0.0,
+        chunk_points: int = 1_000_000
+    ) -> GroundClearance:
+        """
+        Garde au sol minimale de chaque portée
+
+        Le sol est linéaire entre deux points du profil et le conducteur
+        parabolique (y = y_corde − F(x)) : sur chaque segment élémentaire
+        (entre points du profil et supports), la garde est un polynôme du
+        second degré convexe. Son minimum exact est aux extrémités du segment
+        ou au point où sa dérivée s'annule, évalués pour tous les segments
+        d'un bloc de portées à la fois.
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés (m)
+            rho: Paramètres de la chaînette (état de flèche maximale), scalaire ou par portée (m)
+            start_altitude_m: Altitude de l'accrochage du premier support (m)
+            start_station_m: Abscisse du premier support dans le profil (m)
+            chunk_points: Nombre indicatif de points de profil par bloc
+
+        Returns:
+            GroundClearance
+        """
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        rho = np.broadcast_to(np.asarray(rho, dtype=np.float64), a.shape)
+        if a.ndim != 1 or a.shape != h.shape or a.size == 0:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+        if np.any(a <= 0) or np.any(rho <= 0):
+            raise ValueError("Les portées et les paramètres ρ doivent être strictement positifs")
+        if chunk_points <= 0:
+            raise ValueError("chunk_points doit être strictement positif")
+
+        n_spans = a.size
+        supports = start_station_m + np.concatenate(([0.0], np.cumsum(a)))
+        attachments = start_altitude_m + np.concatenate(([0.0], np.cumsum(h)))
+        b = np.sqrt(a**2 + h**2)
+
+        best = np.full(n_spans, np.inf)
+        station = np.full(n_spans, np.nan)
+        conductor_at = np.full(n_spans, np.nan)
+        ground_at = np.full(n_spans, np.nan)
+        x_first, x_last = float(self.chainage_m[0]), float(self.chainage_m[-1])
+
+        for first, last in self._span_groups(supports, chunk_points):
+            # Points du profil du bloc, plus un point de part et d'autre pour l'interpolation
+            lo = max(int(np.searchsorted(self.chainage_m, supports[first], side="right")) - 1, 0)
+            hi = min(int(np.searchsorted(self.chainage_m, supports[last], side="left")) + 1, len(self))
+            X = np.asarray(self.chainage_m[lo:hi])
+            G = np.asarray(self.elevation_m[lo:hi])
+
+            # Segments élémentaires : points du profil et supports, dans la zone couverte
+            group_supports = supports[first:last + 1]
+            u = np.union1d(X, group_supports)
+            u = u[(u >= max(group_supports[0], x_first)) & (u <= min(group_supports[-1], x_last))]
+            if u.size == 0:
+                continue
+            g = np.interp(u, X, G)
+
+            def conductor(x: np.ndarray, span: np.ndarray) -> np.ndarray:
+                local = np.clip(x - supports[span], 0.0, a[span])
+                return attachments[span] + h[span] * local / a[span] - sag_at(local, a[span], h[span], rho[span])
+
+            # Extrémités : un support compte pour les deux portées qu'il sépare
+            span_of_point = np.clip(np.searchsorted(supports, u, side="right") - 1, first, last - 1)
+            at_support = np.isin(u, group_supports[1:-1])
+            candidates_x = [u, u[at_support]]
+            candidates_g = [g, g[at_support]]
+            candidates_span = [span_of_point, span_of_point[at_support] - 1]
+
+            # Minimum intérieur de chaque segment : y'(x) = pente du sol
+            if u.size > 1:
+                u0, u1, g0, g1 = u[:-1], u[1:], g[:-1], g[1:]
+                span = np.clip(np.searchsorted(supports, (u0 + u1) / 2, side="right") - 1, first, last - 1)
+                slope = (g1 - g0) / (u1 - u0)
+                x_star = supports[span] + (slope - h[span] / a[span] + b[span] / (2 * rho[span])) * rho[span] * a[span] / b[span]
+                inside = (x_star > u0) & (x_star < u1)
+                candidates_x.append(x_star[inside])
+                candidates_g.append(g0[inside] + slope[inside] * (x_star[inside] - u0[inside]))
+                candidates_span.append(span[inside])
+
+            x = np.concatenate(candidates_x)
+            ground = np.concatenate(candidates_g)
+            span = np.concatenate(candidates_span)
+            y = conductor(x, span)
+            gap = y - ground
+
+            # Minimum par portée : tri par (portée, garde), premier de chaque portée
+            order = np.lexsort((gap, span))
+            spans_sorted = span[order]
+            head = order[np.flatnonzero(np.diff(spans_sorted, prepend=-1) != 0)]
+            better = gap[head] < best[span[head]]
+            target = span[head][better]
+            best[target] = gap[head][better]
+            station[target] = x[head][better]
+            conductor_at[target] = y[head][better]
+            ground_at[target] = ground[head][better]
+
+        best[np.isinf(best)] = np.nan
+        return GroundClearance(
+            min_clearance_m=best,
+            station_m=station,
+            conductor_altitude_m=conductor_at,
+            ground_elevation_m=ground_at
+        )
@@ -0,0 +1,343 @@
+"""
+Bilan thermique CIGRE d'un conducteur en régime permanent
+Échauffement Joule et solaire, refroidissement par convection et rayonnement,
+vectorisé sur des séries météo (par exemple une année de données horaires)
+"""
+import dataclasses
+import logging
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.catalog import CABLE_CATALOG_FILE, CATALOG_DIR, load_records, parse_number
+from backend.domain.mechanical import MechanicalCalculator
+
+logger = logging.getLogger(__name__)
+
+STEFAN_BOLTZMANN = 5.6697e-8  # W/(m²·K⁴)
+KELVIN = 273.15
+MIN_WIND_SPEED_M_S = 0.5  # Vitesse de vent minimale retenue par la méthode (m/s)
+
+# Chaleur massique (J/(kg·°C)) selon la nature du câble
+SPECIFIC_HEAT_COPPER = 385.0
+SPECIFIC_HEAT_ALUMINIUM = 897.0
+SPECIFIC_HEAT_ALUMINIUM_STEEL = 800.0  # Valeur moyenne des câbles alu-acier
+
+
+@dataclass
+class ThermalConductor:
+    """Caractéristiques thermiques et électriques d'un conducteur"""
+    name: str
+    diameter_m: float  # Diamètre extérieur (m)
+    resistance_20C_ohm_per_m: float  # Résistance en continu à 20 °C (Ω/m)
+    temperature_coefficient_per_C: float  # Coefficient de température de la résistance (1/°C)
+    emissivity: float = 0.5  # Émissivité ε
+    absorptivity: float = 0.5  # Coefficient d'absorption solaire α_s
+    roughness: float = 0.05  # Rugosité Rf = d / (2·(D − d)), d diamètre d'un brin extérieur
+    skin_factor: float = 1.0  # Effet de peau en courant alternatif (R_ac / R_dc)
+    heat_capacity_J_per_m_C: float = math.nan  # Capacité thermique linéique m·c (J/(m·°C))
+
+    def resistance(self, temperature_C: ArrayLike) -> np.ndarray:
+        """Résistance linéique à la température du conducteur (Ω/m)"""
+        temperature = np.asarray(temperature_C, dtype=np.float64)
+        return self.skin_factor * self.resistance_20C_ohm_per_m * (
+            1 + self.temperature_coefficient_per_C * (temperature - 20)
+        )
+
+    @classmethod
+    def stack(cls, conductors: Sequence["ThermalConductor"]) -> "ThermalConductor":
+        """Regroupe plusieurs conducteurs, champs numériques en tableaux (un par conducteur)"""
+        fields = [f.name for f in dataclasses.fields(cls) if f.name != "name"]
+        return cls(
+            name=", ".join(c.name for c in conductors),
+            **{name: np.array([getattr(c, name) for c in conductors], dtype=np.float64) for name in fields}
+        )
+
+    @classmethod
+    def from_record(
+        cls,
+        record: Mapping[str, str],
+        age_years: float = 10.0
+    ) -> Optional["ThermalConductor"]:
+        """
+        Conducteur à partir d'une fiche du catalogue « Câble »
+
+        L'émissivité découle de l'âge du câble (équation CIGRE) ; le
+        coefficient d'absorption solaire lui est pris égal. La capacité
+        thermique est la masse linéique × la chaleur massique de la nature
+        du câble (cuivre, aluminium ou alu-acier).
+
+        Args:
+            record: Fiche du câble (noms de champs décodés)
+            age_years: Âge du câble (années)
+
+        Returns:
+            ThermalConductor, None si la résistance ou le diamètre manque
+        """
+        resistance_km = parse_number(record.get("Résistance en continu à 20°C"))
+        coefficient = parse_number(record.get("Coefficient de température de résistance électrique"))
+        diameter_mm = parse_number(record.get("Diamètre extérieur du câble"))
+        if not (resistance_km > 0 and diameter_mm > 0):
+            return None
+        epsilon = MechanicalCalculator.calculate_cable_temperature_cigre(age_years)
+        if record.get("Nature (BGT)") == "CU":
+            specific_heat = SPECIFIC_HEAT_COPPER
+        elif record.get("Alu-acier") == "1":
+            specific_heat = SPECIFIC_HEAT_ALUMINIUM_STEEL
+        else:
+            specific_heat = SPECIFIC_HEAT_ALUMINIUM
+        return cls(
+            name=record["Désignation"],
+            diameter_m=diameter_mm / 1000,
+            resistance_20C_ohm_per_m=resistance_km / 1000,  # Ω/km → Ω/m
+            temperature_coefficient_per_C=0.0 if math.isnan(coefficient) else coefficient,
+            emissivity=epsilon,
+            absorptivity=epsilon,
+            heat_capacity_J_per_m_C=parse_number(record.get("Masse linéïque non graissée")) * specific_heat
+        )
+
+
+@dataclass
+class HeatBalance:
+    """Termes du bilan thermique par échantillon (W/m)"""
+    joule: np.ndarray
+    solar: np.ndarray
+    convective: np.ndarray
+    radiative: np.ndarray
+
+
+class CIGREThermalSolver:
+    """Résolution vectorisée du bilan P_J + P_S = P_c + P_r"""
+
+    BISECTION_TOLERANCE_C = 1e-3
+    MAX_TEMPERATURE_RISE_C = 400.0  # Borne haute de recherche au-dessus de l'ambiante
+
+    @staticmethod
+    def solar_heating(conductor: ThermalConductor, irradiance_W_m2: ArrayLike) -> np.ndarray:
+        """P_S = α_s · S · D (W/m)"""
+        return conductor.absorptivity * np.asarray(irradiance_W_m2, dtype=np.float64) * conductor.diameter_m
+
+    @staticmethod
+    def radiative_cooling(
+        conductor: ThermalConductor,
+        conductor_C: ArrayLike,
+        ambient_C: ArrayLike
+    ) -> np.ndarray:
+        """P_r = π·D·σ·ε·((T_s + 273)⁴ − (T_a + 273)⁴) (W/m)"""
+        ts = np.asarray(conductor_C, dtype=np.float64) + KELVIN
+        ta = np.asarray(ambient_C, dtype=np.float64) + KELVIN
+        return np.pi * conductor.diameter_m * STEFAN_BOLTZMANN * conductor.emissivity * (ts**4 - ta**4)
+
+    @staticmethod
+    def convective_cooling(
+        conductor: ThermalConductor,
+        conductor_C: ArrayLike,
+        ambient_C: ArrayLike,
+        wind_speed_m_s: ArrayLike,
+        wind_angle_deg: ArrayLike = 90.0,
+        altitude_m: float = 0.0
+    ) -> np.ndarray:
+        """
+        P_c = π·λ_f·(T_s − T_a)·Nu (W/m)
+
+        Nu est le plus grand des nombres de Nusselt en convection forcée
+        (corrigé de l'angle d'incidence du vent) et en convection naturelle.
+        La vitesse du vent est bornée inférieurement à MIN_WIND_SPEED_M_S.
+
+        Args:
+            conductor: Conducteur
+            conductor_C: Température du conducteur (°C)
+            ambient_C: Température ambiante (°C)
+            wind_speed_m_s: Vitesse du vent (m/s)
+            wind_angle_deg: Angle entre le vent et l'axe du conducteur (°)
+            altitude_m: Altitude du site (m)
+
+        Returns:
+            Puissance évacuée par convection (W/m)
+        """
+        ts = np.asarray(conductor_C, dtype=np.float64)
+        ta = np.asarray(ambient_C, dtype=np.float64)
+        v = np.maximum(np.asarray(wind_speed_m_s, dtype=np.float64), MIN_WIND_SPEED_M_S)
+        delta = np.radians(np.asarray(wind_angle_deg, dtype=np.float64))
+        D = conductor.diameter_m
+
+        # Propriétés de l'air au film (T_f = (T_s + T_a)/2)
+        tf = (ts + ta) / 2
+        conductivity = 2.42e-2 + 7.2e-5 * tf
+        viscosity = 1.32e-5 + 9.5e-8 * tf
+        relative_density = math.exp(-1.16e-4 * altitude_m)
+
+        # Convection forcée, vent perpendiculaire
+        reynolds = relative_density * v * D / viscosity
+        laminar = reynolds < 2650
+        smooth = np.asarray(conductor.roughness) <= 0.05
+        B = np.where(laminar, 0.641, np.where(smooth, 0.178, 0.048))
+        n = np.where(laminar, 0.471, np.where(smooth, 0.633, 0.800))
+        nusselt_90 = B * reynolds**n
+
+        # Correction d'incidence
+        sin_delta = np.abs(np.sin(delta))
+        nusselt_forced = nusselt_90 * np.where(
+            delta <= np.radians(24),
+            0.42 + 0.68 * sin_delta**1.08,
+            0.42 + 0.58 * sin_delta**0.90
+        )
+
+        # Convection naturelle
+        rise = np.maximum(ts - ta, 0.0)
+        grashof = D**3 * rise * MechanicalCalculator.G / ((tf + KELVIN) * viscosity**2)
+        prandtl = 0.715 - 2.5e-4 * tf
+        gp = grashof * prandtl
+        nusselt_natural = np.where(gp < 1e4, 0.850 * gp**0.188, 0.480 * gp**0.250)
+
+        nusselt = np.maximum(nusselt_forced, nusselt_natural)
+        return np.pi * conductivity * (ts - ta) * nusselt
+
+    @classmethod
+    def heat_balance(
+        cls,
+        conductor: ThermalConductor,
+        current_A: ArrayLike,
+        conductor_C: ArrayLike,
+        ambient_C: ArrayLike,
+        wind_speed_m_s: ArrayLike,
+        irradiance_W_m2: ArrayLike,
+        wind_angle_deg: ArrayLike = 90.0,
+        altitude_m: float = 0.0
+    ) -> HeatBalance:
+        """Termes du bilan pour une température de conducteur donnée"""
+        current = np.asarray(current_A, dtype=np.float64)
+        return HeatBalance(
+            joule=current**2 * conductor.resistance(conductor_C),
+            solar=cls.solar_heating(conductor, irradiance_W_m2),
+            convective=cls.convective_cooling(
+                conductor, conductor_C, ambient_C, wind_speed_m_s, wind_angle_deg, altitude_m
+            ),
+            radiative=cls.radiative_cooling(conductor, conductor_C, ambient_C)
+        )
+
+    @classmethod
+    def temperature(
+        cls,
+        conductor: ThermalConductor,
+        current_A: ArrayLike,
+        ambient_C: ArrayLike,
+        wind_speed_m_s: ArrayLike,
+        irradiance_W_m2: ArrayLike,
+        wind_angle_deg: ArrayLike = 90.0,
+        altitude_m: float = 0.0
+    ) -> np.ndarray:
+        """
+        Température du conducteur en régime permanent pour chaque échantillon
+
+        Le bilan P_J + P_S − P_c − P_r décroît avec la température du
+        conducteur : racine encadrée par dichotomie, tous échantillons
+        résolus simultanément.
+
+        Args:
+            conductor: Conducteur
+            current_A: Intensité (A)
+            ambient_C: Température ambiante (°C)
+            wind_speed_m_s: Vitesse du vent (m/s)
+            irradiance_W_m2: Rayonnement solaire global (W/m²)
+            wind_angle_deg: Angle entre le vent et l'axe du conducteur (°)
+            altitude_m: Altitude du site (m)
+
+        Returns:
+            Température du conducteur (°C), forme diffusée des entrées
+        """
+        current, ambient, wind, irradiance, angle = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64)
+              for x in (current_A, ambient_C, wind_speed_m_s, irradiance_W_m2, wind_angle_deg))
+        )
+        solar = cls.solar_heating(conductor, irradiance)
+
+        def imbalance(ts: np.ndarray) -> np.ndarray:
+            return (
+                current**2 * conductor.resistance(ts) + solar
+                - cls.convective_cooling(conductor, ts, ambient, wind, angle, altitude_m)
+                - cls.radiative_cooling(conductor, ts, ambient)
+            )
+
+        # À T_s = T_a, seuls les apports subsistent : la racine est au-dessus
+        low = ambient.copy()
+        high = ambient + cls.MAX_TEMPERATURE_RISE_C
+        iterations = int(np.ceil(np.log2(cls.MAX_TEMPERATURE_RISE_C / cls.BISECTION_TOLERANCE_C)))
+        for _ in range(iterations):
+            mid = (low + high) / 2
+            heating = imbalance(mid) > 0
+            low = np.where(heating, mid, low)
+            high = np.where(heating, high, mid)
+        return (low + high) / 2
+
+    @classmethod
+    def ampacity(
+        cls,
+        conductor: ThermalConductor,
+        max_temperature_C: float,
+        ambient_C: ArrayLike,
+        wind_speed_m_s: ArrayLike,
+        irradiance_W_m2: ArrayLike,
+        wind_angle_deg: ArrayLike = 90.0,
+        altitude_m: float = 0.0
+    ) -> np.ndarray:
+        """
+        Intensité admissible pour une température maximale du conducteur
+
+        I = √((P_c + P_r − P_S) / R(T_max)), nulle si l'ensoleillement suffit
+        à atteindre T_max.
+
+        Args:
+            conductor: Conducteur
+            max_temperature_C: Température maximale admissible du conducteur (°C)
+            ambient_C: Température ambiante (°C)
+            wind_speed_m_s: Vitesse du vent (m/s)
+            irradiance_W_m2: Rayonnement solaire global (W/m²)
+            wind_angle_deg: Angle entre le vent et l'axe du conducteur (°)
+            altitude_m: Altitude du site (m)
+
+        Returns:
+            Intensité admissible (A), forme diffusée des entrées
+        """
+        balance = cls.heat_balance(
+            conductor, 0.0, max_temperature_C, ambient_C,
+            wind_speed_m_s, irradiance_W_m2, wind_angle_deg, altitude_m
+        )
+        cooling = balance.convective + balance.radiative - balance.solar
+        return np.sqrt(np.maximum(cooling, 0.0) / conductor.resistance(max_temperature_C))
+
+
+def load_thermal_conductors(directory: Path = CATALOG_DIR) -> Dict[str, ThermalConductor]:
+    """
+    Conducteurs du catalogue disposant d'une résistance linéique
+
+    Args:
+        directory: Répertoire du catalogue JSON
+
+    Returns:
+        Conducteurs par désignation
+    """
+    conductors = {}
+    for record in load_records(Path(directory) / CABLE_CATALOG_FILE):
+        conductor = ThermalConductor.from_record(record)
+        if conductor is not None:
+            conductors[conductor.name] = conductor
+    return conductors
+
+
+def _load_default_conductors() -> Dict[str, ThermalConductor]:
+    """Conducteurs chargés à l'import ; aucun si le catalogue est absent"""
+    try:
+        conductors = load_thermal_conductors()
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Catalogue thermique indisponible ({e})")
+        return {}
+    logger.info(f"Catalogue thermique: {len(conductors)} conducteurs")
+    return conductors
+
+
+THERMAL_CONDUCTORS = _load_default_conductors()
@@ -0,0 +1,243 @@
+"""
+Régime transitoire de la température des conducteurs
+Intègre m·c·dT/dt = P_J + P_S − P_c − P_r, avec les termes du bilan CIGRE,
+pour plusieurs conducteurs à la fois et par tranches de pas de temps
+"""
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.thermal import CIGREThermalSolver, ThermalConductor
+
+
+@dataclass
+class TransientScenario:
+    """Scénario indépendant : un conducteur soumis à une série de charges et de météo"""
+    name: str
+    conductor: ThermalConductor
+    step_s: float  # Pas de temps des séries (s)
+    current_A: ArrayLike  # Intensité à chaque pas (A)
+    ambient_C: ArrayLike  # Température ambiante, scalaire ou par pas (°C)
+    wind_speed_m_s: ArrayLike  # Vitesse du vent, scalaire ou par pas (m/s)
+    irradiance_W_m2: ArrayLike  # Rayonnement solaire, scalaire ou par pas (W/m²)
+    initial_C: Optional[float] = None  # Température initiale, régime permanent du premier pas par défaut
+    wind_angle_deg: float = 90.0
+    altitude_m: float = 0.0
+
+
+class TransientThermalModel:
+    """Intégration pas à pas, vectorisée sur les conducteurs, par tranches de pas"""
+
+    CHUNK_STEPS = 4096  # Pas de temps traités par tranche
+    DERIVATIVE_STEP_C = 0.01  # Écart de température pour la pente du bilan (°C)
+
+    @staticmethod
+    def _series(values: ArrayLike, n_conductors: int, n_steps: int) -> np.ndarray:
+        """Série (conducteurs, pas) à partir d'un scalaire, d'une série commune ou par conducteur"""
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim == 1 and array.shape[0] == n_steps:
+            array = array[None, :]
+        try:
+            return np.broadcast_to(array, (n_conductors, n_steps))
+        except ValueError:
+            raise ValueError(f"Série de forme {array.shape} incompatible avec ({n_conductors}, {n_steps})")
+
+    @staticmethod
+    def _column(values: ArrayLike) -> ArrayLike:
+        """Valeur par conducteur mise en colonne, pour la diffuser sur les pas d'une tranche"""
+        array = np.asarray(values)
+        return array[:, None] if array.ndim == 1 else values
+
+    @staticmethod
+    def _balance(
+        conductor: ThermalConductor,
+        temperature: np.ndarray,
+        current: np.ndarray,
+        solar: np.ndarray,
+        ambient: np.ndarray,
+        wind: np.ndarray,
+        wind_angle_deg: ArrayLike,
+        altitude_m: float
+    ) -> np.ndarray:
+        """Bilan P_J + P_S − P_c − P_r (W/m)"""
+        return (
+            current**2 * conductor.resistance(temperature) + solar
+            - CIGREThermalSolver.convective_cooling(conductor, temperature, ambient, wind, wind_angle_deg, altitude_m)
+            - CIGREThermalSolver.radiative_cooling(conductor, temperature, ambient)
+        )
+
+    @classmethod
+    def iter_chunks(
+        cls,
+        conductor: ThermalConductor,
+        initial_C: ArrayLike,
+        step_s: float,
+        current_A: ArrayLike,
+        ambient_C: ArrayLike,
+        wind_speed_m_s: ArrayLike,
+        irradiance_W_m2: ArrayLike,
+        wind_angle_deg: ArrayLike = 90.0,
+        altitude_m: float = 0.0,
+        chunk_steps: Optional[int] = None
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Intègre la série tranche par tranche
+
+        Les conditions étant constantes sur un pas, m·c·dT/dt = f(T) y est
+        autonome et T tend vers la température de régime permanent T_e du
+        pas (f(T_e) = 0). Avec g = T_e − T, le bilan est approché par
+        f ≈ g·(k_e + c·g), de pente k_e = −f'(T_e) en T_e et passant par
+        f(T) en début de pas ; l'équation obtenue s'intègre exactement :
+
+            g(Δt) = g0 · k_e·e / (k_e·e + k_s·(1 − e)),  e = exp(−k_e·Δt / m·c)
+
+        avec k_s = f(T0) / g0. Chaque pas est donc franchi en une seule
+        évaluation, sans sous-pas, quelle que soit sa durée ; T_e et k_e
+        sont calculés pour toute la tranche à la fois. Seule la température
+        en fin de tranche est reportée d'une tranche à la suivante : la
+        mémoire de travail est bornée par la taille des tranches, quelle
+        que soit la longueur des séries. Les champs du conducteur peuvent
+        être des tableaux (un conducteur par ligne).
+
+        Args:
+            conductor: Conducteur(s), voir ThermalConductor.stack
+            initial_C: Température initiale de chaque conducteur (°C)
+            step_s: Pas de temps des séries (s)
+            current_A: Intensité (A), série (pas,) ou (conducteurs, pas)
+            ambient_C: Température ambiante (°C), scalaire ou série
+            wind_speed_m_s: Vitesse du vent (m/s), scalaire ou série
+            irradiance_W_m2: Rayonnement solaire (W/m²), scalaire ou série
+            wind_angle_deg: Angle entre le vent et l'axe du conducteur (°)
+            altitude_m: Altitude du site (m)
+            chunk_steps: Pas par tranche (CHUNK_STEPS par défaut)
+
+        Yields:
+            (indice du premier pas, températures en fin de pas (conducteurs, pas de la tranche))
+        """
+        if step_s <= 0:
+            raise ValueError("Le pas de temps doit être strictement positif")
+        capacity = np.asarray(conductor.heat_capacity_J_per_m_C, dtype=np.float64)
+        if not np.all(capacity > 0):
+            raise ValueError("La capacité thermique du conducteur est nécessaire au régime transitoire")
+
+        temperature = np.atleast_1d(np.asarray(initial_C, dtype=np.float64)).copy()
+        n_conductors = temperature.size
+        n_steps = np.shape(current_A)[-1]
+        chunk_steps = chunk_steps or cls.CHUNK_STEPS
+        inputs = [
+            cls._series(x, n_conductors, n_steps)
+            for x in (current_A, ambient_C, wind_speed_m_s, irradiance_W_m2)
+        ]
+
+        # Conducteur et angle en colonnes pour les calculs sur toute une tranche
+        columns = dataclasses.replace(conductor, **{
+            f.name: cls._column(getattr(conductor, f.name))
+            for f in dataclasses.fields(conductor) if f.name != "name"
+        })
+        angle_columns = cls._column(wind_angle_deg)
+        delta = cls.DERIVATIVE_STEP_C
+
+        for start in range(0, n_steps, chunk_steps):
+            stop = min(start + chunk_steps, n_steps)
+            current, ambient, wind, irradiance = (
+                np.ascontiguousarray(x[:, start:stop]) for x in inputs
+            )
+            solar = CIGREThermalSolver.solar_heating(columns, irradiance)
+            conditions = (current, solar, ambient, wind, angle_columns, altitude_m)
+
+            # Régime permanent de chaque pas et pente du bilan en ce point
+            equilibrium = CIGREThermalSolver.temperature(
+                columns, current, ambient, wind, irradiance, angle_columns, altitude_m
+            )
+            slope = (
+                cls._balance(columns, equilibrium - delta, *conditions)
+                - cls._balance(columns, equilibrium + delta, *conditions)
+            ) / (2 * delta)
+            decay = np.exp(-slope * step_s / cls._column(capacity))
+
+            out = np.empty((n_conductors, stop - start))
+            for j in range(stop - start):
+                gap = equilibrium[:, j] - temperature
+                balance = cls._balance(
+                    conductor, temperature, current[:, j], solar[:, j], ambient[:, j], wind[:, j],
+                    wind_angle_deg, altitude_m
+                )
+                # Pente sécante ; celle du régime permanent si T0 y est déjà
+                secant = np.divide(balance, gap, out=slope[:, j].copy(), where=gap != 0)
+                secant = np.where(secant > 0, secant, slope[:, j])
+                k_decay = slope[:, j] * decay[:, j]
+                temperature = equilibrium[:, j] - gap * k_decay / (k_decay + secant * (1 - decay[:, j]))
+                out[:, j] = temperature
+            yield start, out
+
+    @classmethod
+    def integrate(cls, *args, **kwargs) -> np.ndarray:
+        """
+        Trajectoire complète, mêmes arguments que iter_chunks
+
+        Returns:
+            Températures en fin de chaque pas (conducteurs, pas)
+        """
+        chunks = list(cls.iter_chunks(*args, **kwargs))
+        return np.concatenate([out for _, out in chunks], axis=1)
+
+    @classmethod
+    def run_scenario(cls, scenario: TransientScenario) -> np.ndarray:
+        """
+        Trajectoire d'un scénario
+
+        Args:
+            scenario: Scénario
+
+        Returns:
+            Températures du conducteur en fin de chaque pas (°C)
+        """
+        current = np.asarray(scenario.current_A, dtype=np.float64)
+        if current.ndim != 1 or current.size == 0:
+            raise ValueError(f"Scénario {scenario.name}: série d'intensité vide ou mal formée")
+
+        initial = scenario.initial_C
+        if initial is None:
+            first = [np.asarray(x, dtype=np.float64).reshape(-1)[0] for x in (
+                scenario.ambient_C, scenario.wind_speed_m_s, scenario.irradiance_W_m2
+            )]
+            initial = float(CIGREThermalSolver.temperature(
+                scenario.conductor, current[0], *first, scenario.wind_angle_deg, scenario.altitude_m
+            ))
+
+        return cls.integrate(
+            scenario.conductor,
+            initial,
+            scenario.step_s,
+            current,
+            scenario.ambient_C,
+            scenario.wind_speed_m_s,
+            scenario.irradiance_W_m2,
+            scenario.wind_angle_deg,
+            scenario.altitude_m
+        )[0]
+
+    @classmethod
+    def run_scenarios(
+        cls,
+        scenarios: Sequence[TransientScenario],
+        workers: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Exécute des scénarios indépendants, en parallèle sur plusieurs processus
+
+        Args:
+            scenarios: Scénarios
+            workers: Nombre de processus (None ou 1 : dans le processus courant)
+
+        Returns:
+            Trajectoire de chaque scénario, dans l'ordre
+        """
+        if workers is None or workers <= 1 or len(scenarios) <= 1:
+            return [cls.run_scenario(scenario) for scenario in scenarios]
+        with ProcessPoolExecutor(max_workers=min(workers, len(scenarios))) as executor:
+            return list(executor.map(cls.run_scenario, scenarios))
@@ -0,0 +1,196 @@
+"""
+Efforts VHL sur tous les supports d'une ligne, pour tous les cas de charge
+Tensions des portées par changement d'état (un calcul par canton et par cas),
+puis efforts vertical V, transversal H et longitudinal L de chaque support
+en une passe vectorisée
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.domain.batch import ArrayLike
+from backend.domain.canton import canton_starts, equivalent_spans
+from backend.domain.loading import apparent_load
+from backend.domain.mechanical import CableProperties
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+
+
+@dataclass
+class LoadCase:
+    """Cas de charge"""
+    name: str
+    temperature_C: float  # Température (°C)
+    wind_pressure_daPa: float = 0.0  # Pression du vent, perpendiculaire à la ligne (daPa)
+    ice_thickness_mm: float = 0.0  # Épaisseur radiale de givre (mm)
+    broken_span: Optional[int] = None  # Portée dont le conducteur est rompu
+
+
+@dataclass
+class VHLMatrix:
+    """Efforts par support (lignes) et par cas de charge (colonnes), en daN"""
+    case_names: List[str]
+    V: np.ndarray  # Effort vertical
+    H: np.ndarray  # Effort transversal
+    L: np.ndarray  # Effort longitudinal
+    R: np.ndarray  # Résultante horizontale √(H² + L²)
+    governing_case: np.ndarray  # Cas donnant la plus grande résultante, par support
+    span_tension_dan: np.ndarray  # Tension horizontale par portée et par cas
+
+
+class VHLCalculator:
+    """Matrice supports × cas de charge des efforts VHL"""
+
+    @staticmethod
+    def loading(
+        constants: CableConstants,
+        cases: Sequence[LoadCase]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Charges linéiques de chaque cas
+
+        Le givre alourdit le câble (ρ_givre·π·((d + 2e)² − d²)/4) et élargit
+        la surface exposée au vent (d + 2e).
+
+        Args:
+            constants: Constantes du câble
+            cases: Cas de charge
+
+        Returns:
+            (poids vertical, effort du vent, poids apparent) en daN/m, par cas
+        """
+        load = apparent_load(
+            constants.weight_dan_per_m,
+            constants.diameter_m,
+            [case.wind_pressure_daPa for case in cases],
+            [case.ice_thickness_mm for case in cases]
+        )
+        return load.vertical_dan_per_m, load.transverse_dan_per_m, load.apparent_dan_per_m
+
+    @staticmethod
+    def support_loads(
+        a: np.ndarray,
+        h: np.ndarray,
+        angle_grade: np.ndarray,
+        tension: np.ndarray,
+        vertical: np.ndarray,
+        transverse: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Assemble V, H et L des supports d'une suite de portées consécutives
+
+        Les supports extrêmes ne reçoivent que la portée de la suite : pour
+        un tronçon de ligne, seuls les supports intérieurs sont complets.
+
+        Args:
+            a: Longueurs des portées (m), (portées,)
+            h: Dénivelés des portées (m), (portées,)
+            angle_grade: Angle de ligne de chaque support (grades), (portées + 1,)
+            tension: Tension horizontale par cas et par portée (daN), (cas, portées)
+            vertical: Poids linéique par cas et par portée (daN/m)
+            transverse: Effort du vent linéique par cas et par portée (daN/m)
+
+        Returns:
+            (V, H, L) de forme (cas, supports)
+        """
+        # Contributions de chaque portée à son support gauche (A) et droit (B)
+        slope = tension * h / a
+        V_A, V_B = vertical * a / 2 - slope, vertical * a / 2 + slope
+        wind_half = transverse * a / 2
+
+        zeros = np.zeros((tension.shape[0], 1))
+        T_left = np.hstack((zeros, tension))  # Portée à gauche de chaque support
+        T_right = np.hstack((tension, zeros))  # Portée à droite de chaque support
+
+        half_angle = np.radians(angle_grade * 0.9) / 2  # grades → degrés → radians
+        V = np.hstack((zeros, V_B)) + np.hstack((V_A, zeros))
+        H = (T_left + T_right) * np.sin(half_angle) + np.hstack((zeros, wind_half)) + np.hstack((wind_half, zeros))
+        L = (T_right - T_left) * np.cos(half_angle)
+        return V, H, L
+
+    @classmethod
+    def compute(
+        cls,
+        a: ArrayLike,
+        h: ArrayLike,
+        canton_sizes: ArrayLike,
+        angle_grade: ArrayLike,
+        cable: CableProperties,
+        reference: ReferenceState,
+        cases: Sequence[LoadCase]
+    ) -> VHLMatrix:
+        """
+        Calcule V, H et L sur chaque support pour chaque cas
+
+        Pour une portée de tension horizontale T, de poids vertical w, de
+        longueur a et de dénivelé h (support B − support A) :
+            V_A = w·a/2 − T·h/a et V_B = w·a/2 + T·h/a
+        Sur un support d'angle de ligne θ entre les portées gauche et droite :
+            H = (T_g + T_d)·sin(θ/2) + effort du vent sur la demi-portée de chaque côté
+            L = (T_d − T_g)·cos(θ/2)
+        Un conducteur rompu n'exerce plus ni tension ni poids sur ses deux supports.
+
+        Args:
+            a: Longueurs des portées (m)
+            h: Dénivelés des portées (m)
+            canton_sizes: Nombre de portées de chaque canton
+            angle_grade: Angle de ligne de chaque support (grades), portées + 1 valeurs
+            cable: Câble de la ligne
+            reference: État de référence commun aux cantons
+            cases: Cas de charge
+
+        Returns:
+            VHLMatrix de forme (supports, cas)
+        """
+        a = np.asarray(a, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        angle = np.asarray(angle_grade, dtype=np.float64)
+        if a.ndim != 1 or a.shape != h.shape or a.size == 0:
+            raise ValueError("Les portées et les dénivelés doivent être des tableaux de même longueur")
+        if angle.shape != (a.size + 1,):
+            raise ValueError("Un angle de ligne est attendu par support (portées + 1)")
+        if len(cases) == 0:
+            raise ValueError("Au moins un cas de charge est nécessaire")
+
+        sizes = np.asarray(canton_sizes, dtype=np.intp)
+        starts = canton_starts(sizes)
+        if sizes.sum() != a.size:
+            raise ValueError("La somme des tailles de cantons doit égaler le nombre de portées")
+
+        broken = np.zeros((len(cases), a.size), dtype=bool)
+        for i, case in enumerate(cases):
+            if case.broken_span is not None:
+                if not 0 <= case.broken_span < a.size:
+                    raise ValueError(f"Portée rompue hors de la ligne: {case.broken_span}")
+                broken[i, case.broken_span] = True
+
+        constants = CableConstants.from_cable(cable)
+        vertical, transverse, apparent = cls.loading(constants, cases)
+
+        # Tensions : (cas, cantons) puis (cas, portées)
+        a_eq, _ = equivalent_spans(a, starts)
+        temperature = np.array([case.temperature_C for case in cases], dtype=np.float64)[:, None]
+        state = StateChangeSolver.solve(
+            constants,
+            a_eq[None, :],
+            reference,
+            temperature,
+            apparent_weight_dan_per_m=apparent[:, None]
+        )
+        canton_index = np.repeat(np.arange(sizes.size), sizes)
+        tension = np.where(broken, 0.0, state.tension_dan[:, canton_index])
+
+        w = np.where(broken, 0.0, vertical[:, None])
+        q = np.where(broken, 0.0, transverse[:, None])
+        V, H, L = cls.support_loads(a, h, angle, tension, w, q)
+        R = np.hypot(H, L)
+
+        return VHLMatrix(
+            case_names=[case.name for case in cases],
+            V=V.T,
+            H=H.T,
+            L=L.T,
+            R=R.T,
+            governing_case=np.argmax(R, axis=0),
+            span_tension_dan=tension.T
+        )
@@ -1,15 +1,55 @@
+import json
 import logging
+import os
+import shutil
+import uuid
+from dataclasses import replace
 from pathlib import Path
-from fastapi import FastAPI, APIRouter, Request, HTTPException, Query, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, APIRouter, BackgroundTasks, Request, HTTPException, Query, status
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, ValidationError as PydanticValidationError
-from typing import Optional
-
+from typing import AsyncIterator, Iterator, Optional
+
+import numpy as np
+
+from backend.domain.batch import BatchSpanCalculator, CableTable
+from backend.domain.cache import SpanCache
+from backend.domain.canton import CantonSolver
+from backend.domain.celeste_domain import canton_extremes, validate_domains
+from backend.domain.montecarlo import (
+    MONTE_CARLO_QUANTITIES,
+    InputTolerances,
+    MonteCarloJob,
+    MonteCarloSimulator
+)
+from backend.domain.crr import CRR_CATALOG
+from backend.domain.vhl import LoadCase, VHLCalculator
+from backend.domain.thermal import THERMAL_CONDUCTORS, CIGREThermalSolver
+from backend.domain.transient import TransientScenario, TransientThermalModel
+from backend.domain.point_load import PointLoadSolver
+from backend.domain.stringing import StringingTableCache
+from backend.domain.intervention import Intervention, InterventionKind, InterventionSimulator
+from backend.domain.corridor import CorridorCalculator, CorridorParameters, swing_angle
+from backend.domain.geometry import LineGeometryBuilder, pack_buffers
+from backend.domain.profile import ProfileSampler
+from backend.domain.inverse import RhoSolver, RhoTarget, SolveStatus
+from backend.domain.sweep import SWEEP_COLUMNS, SweepAxis, SweepJob, SweepRunner
+from backend.domain.state_change import (
+    CableConstants,
+    ReferenceState,
+    StateChangeSolver,
+    reference_from_rho
+)
 from backend.domain.mechanical import (
+    ConductorLengthCalculator,
+    EquivalentSpanAccumulator,
     MechanicalCalculator,
     CableProperties,
+    CompactSpanResult,
     SpanGeometry,
+    compact_result_to_dict,
     span_result_to_dict
 )
 from backend.exceptions import (
@@ -33,6 +73,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Répertoire des résultats de balayages paramétriques
+SWEEP_DIR = Path(os.getenv("CELESTEX_SWEEP_DIR", "./data/sweeps"))
+MAX_SWEEP_POINTS = 20_000_000
+
+# Nombre maximal de balayages conservés : les plus anciens terminés sont supprimés
+MAX_SWEEP_JOBS = 50
+
+# Nombre maximal de points échantillonnés sur les profils de conducteurs
+MAX_PROFILE_POINTS = 5_000_000
+
+# Limites des tirages Monte Carlo
+MAX_MONTE_CARLO_SAMPLES = 5_000_000
+MAX_MONTE_CARLO_WORKERS = os.cpu_count() or 1
+
+# Nombre maximal d'échantillons météo par calcul thermique
+MAX_THERMAL_SAMPLES = 1_000_000
+MAX_THERMAL_WORKERS = os.cpu_count() or 1
+
+# Pas de temps maximal du régime transitoire (s)
+MAX_TRANSIENT_STEP_S = 86_400.0
+
+# Taille maximale de la grille intensités × positions des courbes de danger
+MAX_DANGER_CURVE_POINTS = 1_000_000
+
+# Nombre maximal de charges ponctuelles simultanées (matrice d'influence n × n)
+MAX_POINT_LOADS = 1_000
+
+# Taille maximale des tables de pose (portées × températures)
+MAX_STRINGING_CELLS = 5_000_000
+
+# Nombre maximal de cantons par validation en masse du domaine CELESTE
+MAX_DOMAIN_CANTONS = 1_000_000
+
+# Calcul des portées en lot : le corps JSON est validé en entier avant le calcul,
+# sa taille est donc bornée ; le format NDJSON est lu et calculé bloc par bloc
+MAX_BATCH_SPANS = 50_000
+MAX_STREAMED_BATCH_SPANS = 10_000_000
+
+# Suivi des balayages lancés par ce processus
+sweep_jobs: dict[str, dict] = {}
+
+# Cache des calculs de portée (désactivé si la taille vaut 0)
+span_cache = SpanCache(maxsize=int(os.getenv("CELESTEX_SPAN_CACHE_SIZE", "0")))
+
+# Cache disque des tables de pose (désactivé si la taille vaut 0)
+STRINGING_DIR = Path(os.getenv("CELESTEX_STRINGING_DIR", "./data/stringing"))
+stringing_cache = StringingTableCache(
+    STRINGING_DIR, max_bytes=int(os.getenv("CELESTEX_STRINGING_CACHE_BYTES", str(256 * 1024**2)))
+)
+
 app = FastAPI(
     title="CELESTE X",
     description="Application de calcul mécanique pour lignes électriques aériennes",
@@ -125,11 +215,189 @@ class SpanCalcInput(BaseModel):
     # Optionnel
     wind_pressure_daPa: Optional[float] = Field(None, ge=0, description="Pression vent (daPa)")
     angle_topo_grade: Optional[float] = Field(None, description="Angle topographique (grades)")
+    ice_thickness_mm: Optional[float] = Field(None, ge=0, description="Épaisseur radiale de givre (mm)")
+
+
+class BatchSpanItem(BaseModel):
+    """Portée d'une ligne calculée en lot"""
+    span_length_m: float = Field(..., gt=0, description="Longueur portée (m)")
+    delta_h_m: float = Field(..., description="Dénivelé entre supports (m)")
+    cable_id: str = Field(..., description="Identifiant du câble dans `cables`")
+    rho_m: float = Field(..., gt=0, description="Paramètre chaînette (m)")
+    wind_pressure_daPa: Optional[float] = Field(None, ge=0, description="Pression vent (daPa)")
+    angle_topo_grade: Optional[float] = Field(None, description="Angle topographique (grades)")
+    ice_thickness_mm: Optional[float] = Field(None, ge=0, description="Épaisseur radiale de givre (mm)")
+
+
+class SpanBatchHeader(BaseModel):
+    """Câbles et taille des blocs d'un calcul en lot (première ligne du format NDJSON)"""
+    cables: dict[str, CableInput] = Field(..., min_items=1, description="Câbles par identifiant")
+    chunk_size: int = Field(256, gt=0, le=10000, description="Nombre de portées par bloc calculé")
+
+
+class SpanBatchInput(SpanBatchHeader):
+    """Entrées pour le calcul en lot des portées d'une ligne (corps JSON lu en entier)"""
+    spans: list[BatchSpanItem] = Field(
+        ..., min_items=1, max_items=MAX_BATCH_SPANS, description="Portées de la ligne"
+    )
+
+
+class RhoSolveInput(BaseModel):
+    """Entrées pour la recherche de ρ à partir d'une grandeur cible (en colonnes)"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    target: RhoTarget = Field(..., description="Grandeur cible (T0, TA, TB, F1, F2, H, clearance)")
+    target_values: list[float] = Field(..., min_items=1, description="Valeurs cibles (daN ou m)")
+    spans_m: list[float] = Field(..., min_items=1, description="Longueurs des portées (m)")
+    delta_h_m: list[float] = Field(..., min_items=1, description="Dénivelés (m)")
+    low_attachment_m: Optional[list[float]] = Field(
+        None, description="Hauteur de l'accrochage bas au-dessus du sol (m), cible clearance"
+    )
+    wind_pressure_daPa: float = Field(0.0, ge=0, description="Pression vent (daPa)")
+    ice_thickness_mm: float = Field(0.0, ge=0, description="Épaisseur radiale de givre (mm)")
+    rho_min_m: float = Field(RhoSolver.RHO_MIN_M, gt=0, description="Borne basse de ρ (m)")
+    rho_max_m: float = Field(RhoSolver.RHO_MAX_M, gt=0, description="Borne haute de ρ (m)")
+
+
+class ReferenceStateInput(BaseModel):
+    """État de référence d'un canton (tension T0 ou paramètre ρ)"""
+    temperature_C: float = Field(15.0, description="Température de référence (°C)")
+    tension_dan: Optional[float] = Field(None, gt=0, description="Tension horizontale T0 (daN)")
+    rho_m: Optional[float] = Field(None, gt=0, description="Paramètre chaînette (m)")
+    wind_pressure_daPa: float = Field(0.0, ge=0, description="Pression vent (daPa)")
+
+
+class StateChangeInput(BaseModel):
+    """Entrées pour l'équation de changement d'état sur une grille"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    ruling_span_m: float = Field(..., gt=0, description="Portée équivalente (m)")
+    reference: ReferenceStateInput = Field(..., description="État de référence")
+    temperatures_C: list[float] = Field(..., min_items=1, description="Températures (°C)")
+    wind_pressures_daPa: list[float] = Field([0.0], min_items=1, description="Pressions vent (daPa)")
+
+
+class CantonSpansInput(BaseModel):
+    """Portées d'un canton entre deux supports d'ancrage"""
+    spans_m: list[float] = Field(..., min_items=1, description="Longueurs des portées (m)")
+    delta_h_m: list[float] = Field(..., min_items=1, description="Dénivelés (m)")
+
+
+class CantonLineInput(BaseModel):
+    """Entrées pour le calcul de tous les cantons d'une ligne"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    cantons: list[CantonSpansInput] = Field(..., min_items=1, description="Cantons dans l'ordre de la ligne")
+    reference: ReferenceStateInput = Field(..., description="État de référence commun aux cantons")
+    temperature_C: float = Field(..., description="Température de l'état calculé (°C)")
+    wind_pressure_daPa: float = Field(0.0, ge=0, description="Pression vent de l'état calculé (daPa)")
+
+
+class ConductorLengthInput(CantonLineInput):
+    """Entrées pour les longueurs de conducteur de tous les cantons d'une ligne"""
+    unstressed_temperature_C: Optional[float] = Field(
+        None, description="Température de la longueur à vide (°C), celle de l'état calculé si absente"
+    )
+    drum_length_m: Optional[float] = Field(None, gt=0, description="Longueur de conducteur par touret (m)")
+    allowance_m: float = Field(0.0, ge=0, description="Surlongueur par canton (m)")
+
+
+class StringingTableInput(BaseModel):
+    """Entrées pour les tables de pose de tous les cantons d'une ligne"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    cantons: list[CantonSpansInput] = Field(..., min_items=1, description="Cantons dans l'ordre de la ligne")
+    reference: ReferenceStateInput = Field(..., description="État de référence commun aux cantons")
+    temperatures_C: list[float] = Field(..., min_items=1, description="Températures des lignes de la table (°C)")
+    format: str = Field("json", description="Format de la réponse: json ou csv")
+
+
+class SweepAxisInput(BaseModel):
+    """Axe de balayage : valeurs explicites ou plage start/stop/num"""
+    values: Optional[list[float]] = Field(None, min_items=1, description="Valeurs explicites")
+    start: Optional[float] = Field(None, description="Première valeur de la plage")
+    stop: Optional[float] = Field(None, description="Dernière valeur de la plage")
+    num: Optional[int] = Field(None, gt=0, le=MAX_SWEEP_POINTS, description="Nombre de valeurs de la plage")
+
+
+class SweepInput(BaseModel):
+    """Entrées d'un balayage ρ × température × vent"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    spans_m: list[float] = Field(..., min_items=1, description="Portées du canton (m)")
+    delta_h_m: list[float] = Field(..., min_items=1, description="Dénivelés (m)")
+    rho_m: SweepAxisInput = Field(..., description="Axe ρ à la température de référence (m)")
+    temperature_C: SweepAxisInput = Field(..., description="Axe des températures (°C)")
+    wind_pressure_daPa: SweepAxisInput = Field(..., description="Axe des pressions de vent (daPa)")
+    reference_temperature_C: float = Field(15.0, description="Température de référence de ρ (°C)")
+    columns: list[str] = Field(list(SWEEP_COLUMNS), min_items=1, description="Colonnes à écrire")
+    chunk_size: int = Field(SweepRunner.DEFAULT_CHUNK_SIZE, gt=0, le=1_000_000, description="Points par bloc")
+
+
+class ToleranceInput(BaseModel):
+    """Écarts-types des entrées incertaines"""
+    span_m: float = Field(0.0, ge=0, description="Écart-type des longueurs de portée (m)")
+    delta_h_m: float = Field(0.0, ge=0, description="Écart-type des dénivelés (m)")
+    mass_rel: float = Field(0.0, ge=0, lt=1, description="Écart-type relatif de la masse linéique")
+    E_rel: float = Field(0.0, ge=0, lt=1, description="Écart-type relatif du module E")
+    alpha_rel: float = Field(0.0, ge=0, lt=1, description="Écart-type relatif du coefficient α")
+
+
+class MonteCarloInput(BaseModel):
+    """Entrées d'une propagation d'incertitudes sur un canton"""
+    cable: CableInput = Field(..., description="Propriétés nominales du câble")
+    spans_m: list[float] = Field(..., min_items=1, description="Portées nominales du canton (m)")
+    delta_h_m: list[float] = Field(..., min_items=1, description="Dénivelés nominaux (m)")
+    reference: ReferenceStateInput = Field(..., description="État de référence")
+    temperature_C: float = Field(..., description="Température de l'état évalué (°C)")
+    wind_pressure_daPa: float = Field(0.0, ge=0, description="Pression vent de l'état évalué (daPa)")
+    tolerances: ToleranceInput = Field(..., description="Écarts-types des entrées")
+    n_samples: int = Field(10_000, ge=2, le=MAX_MONTE_CARLO_SAMPLES, description="Nombre d'échantillons")
+    seed: int = Field(0, ge=0, description="Graine du tirage")
+    percentiles: list[float] = Field([5.0, 50.0, 95.0], min_items=1, description="Percentiles demandés")
+    include_histograms: bool = Field(False, description="Inclure les histogrammes")
+    workers: int = Field(1, ge=1, le=MAX_MONTE_CARLO_WORKERS, description="Nombre de processus")
+
+
+class ProfileInput(BaseModel):
+    """Entrées du profil en long des conducteurs"""
+    spans_m: list[float] = Field(..., min_items=1, description="Longueurs des portées, dans l'ordre de la ligne (m)")
+    delta_h_m: list[float] = Field(..., min_items=1, description="Dénivelés des portées (m)")
+    rho_m: list[float] = Field(..., min_items=1, description="ρ par portée, ou une valeur unique (m)")
+    start_altitude_m: float = Field(0.0, description="Altitude de l'accrochage du premier support (m)")
+    pixel_width: int = Field(..., ge=1, le=10_000, description="Largeur d'affichage (pixels)")
+    window_start_m: Optional[float] = Field(None, description="Début de la fenêtre affichée (m)")
+    window_end_m: Optional[float] = Field(None, description="Fin de la fenêtre affichée (m)")
+
+
+class GeometryInput(BaseModel):
+    """Entrées de la géométrie 3D d'une ligne"""
+    spans_m: list[float] = Field(..., min_items=1, description="Longueurs des portées, dans l'ordre de la ligne (m)")
+    delta_h_m: list[float] = Field(..., min_items=1, description="Dénivelés des portées (m)")
+    rho_m: list[float] = Field(..., min_items=1, description="ρ par portée, ou une valeur unique (m)")
+    start_altitude_m: float = Field(0.0, description="Altitude de l'accrochage du premier support (m)")
+    phase_offsets_m: list[float] = Field([0.0], min_items=1, description="Décalages latéraux des conducteurs (m)")
+    support_heights_m: Optional[list[float]] = Field(None, description="Hauteurs d'accrochage des supports (m)")
+    resolution_m: float = Field(1.0, gt=0, description="Pas d'échantillonnage des chaînettes (m)")
+
+
+class CorridorInput(BaseModel):
+    """Entrées du calcul de tranchée forestière"""
+    spans_m: list[float] = Field(..., min_items=1, description="Longueurs des portées, dans l'ordre de la ligne (m)")
+    delta_h_m: list[float] = Field(..., min_items=1, description="Dénivelés des portées (m)")
+    rho_m: list[float] = Field(..., min_items=1, description="ρ par portée, ou une valeur unique (m)")
+    start_altitude_m: float = Field(..., description="Altitude de l'accrochage du premier support (m)")
+    ground_stations_m: list[float] = Field(..., min_items=2, description="Abscisses cumulées du terrain (m)")
+    ground_altitudes_m: list[float] = Field(..., min_items=2, description="Altitudes du terrain (m)")
+    conductor_offset_m: float = Field(..., ge=0, description="Distance conducteur extrême / axe (m)")
+    safety_at_m: float = Field(..., ge=0, description="Distance de sécurité AT (m)")
+    safety_dt_m: float = Field(..., ge=0, description="Distance de sécurité DT (m)")
+    safety_vertical_m: float = Field(..., ge=0, description="Distance de sécurité verticale (m)")
+    resolution_m: float = Field(1.0, gt=0, description="Pas d'échantillonnage (m)")
+    cable: Optional[CableInput] = Field(None, description="Câble, requis pour le déport au vent")
+    wind_pressure_daPa: float = Field(0.0, ge=0, description="Pression vent pour le déport (daPa)")
+    include_profile: bool = Field(False, description="Inclure l'enveloppe point par point")
 
 
 class EquivalentSpanInput(BaseModel):
     """Entrées pour le calcul de portée équivalente"""
     spans_m: list[float] = Field(..., min_items=1, description="Liste des portées (m)")
+    canton_sizes: Optional[list[int]] = Field(None, description="Découpage en cantons (portées par canton), optionnel")
 
 
 class CRRInput(BaseModel):
@@ -141,12 +409,236 @@ class CRRInput(BaseModel):
     )
 
 
+class LoadCaseInput(BaseModel):
+    """Cas de charge pour la matrice VHL"""
+    name: str = Field(..., description="Nom du cas")
+    temperature_C: float = Field(..., description="Température (°C)")
+    wind_pressure_daPa: float = Field(0.0, ge=0, description="Pression vent (daPa)")
+    ice_thickness_mm: float = Field(0.0, ge=0, description="Épaisseur radiale de givre (mm)")
+    broken_span: Optional[int] = Field(None, ge=0, description="Indice de la portée au conducteur rompu")
+
+
+class VHLMatrixInput(BaseModel):
+    """Entrées de la matrice VHL supports × cas de charge"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    cantons: list[CantonSpansInput] = Field(..., min_items=1, description="Cantons dans l'ordre de la ligne")
+    angles_grade: list[float] = Field(..., min_items=2, description="Angle de ligne de chaque support (grades)")
+    reference: ReferenceStateInput = Field(..., description="État de référence commun aux cantons")
+    cases: list[LoadCaseInput] = Field(..., min_items=1, description="Cas de charge")
+
+
+class InterventionInput(BaseModel):
+    """Intervention sur un support"""
+    kind: InterventionKind = Field(..., description="lower, pulley, anchor ou stay")
+    support: int = Field(..., ge=0, description="Indice du support (0 = premier support)")
+    delta_z_m: float = Field(0.0, description="Variation d'altitude de l'accrochage (m), négative pour un abaissement")
+    stay_force_dan: Optional[float] = Field(None, description="Composante horizontale du hauban (daN), compense L si absente")
+    stay_angle_deg: float = Field(45.0, ge=0, lt=90, description="Inclinaison du hauban (°)")
+
+
+class InterventionLineInput(BaseModel):
+    """Entrées de la simulation d'interventions sur câbles"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    cantons: list[CantonSpansInput] = Field(..., min_items=1, description="Cantons dans l'ordre de la ligne")
+    angles_grade: list[float] = Field(..., min_items=2, description="Angle de ligne de chaque support (grades)")
+    reference: ReferenceStateInput = Field(..., description="État de référence commun aux cantons")
+    case: LoadCaseInput = Field(..., description="Conditions de l'intervention")
+    interventions: list[InterventionInput] = Field(..., min_items=1, description="Interventions, dans l'ordre")
+
+
+class LayerDamageInput(BaseModel):
+    """Brins cassés dans une couche"""
+    layer: int = Field(..., ge=1, description="N° de la couche (1 = âme)")
+    broken: int = Field(..., ge=0, description="Nombre de brins cassés")
+
+
+class CatalogCRRInput(BaseModel):
+    """Entrées du calcul de CRR à partir du catalogue des couches"""
+    cable_name: str = Field(..., description="Désignation du câble dans le catalogue")
+    damage: list[LayerDamageInput] = Field(..., min_items=1, description="Brins cassés par couche")
+
+
+class ThermalInput(BaseModel):
+    """Entrées du bilan thermique CIGRE sur une série météo"""
+    cable_name: str = Field(..., description="Désignation du câble dans le catalogue")
+    ambient_C: list[float] = Field(..., min_items=1, description="Températures ambiantes (°C)")
+    wind_speed_m_s: list[float] = Field(..., min_items=1, description="Vitesses du vent (m/s)")
+    irradiance_W_m2: list[float] = Field(..., min_items=1, description="Rayonnement solaire global (W/m²)")
+    wind_angle_deg: float = Field(90.0, ge=0, le=90, description="Angle vent / axe du conducteur (°)")
+    altitude_m: float = Field(0.0, ge=0, description="Altitude du site (m)")
+    age_years: float = Field(10.0, ge=0, description="Âge du câble (années), pour l'émissivité")
+    current_A: Optional[float] = Field(None, ge=0, description="Intensité : calcule la température du conducteur")
+    max_temperature_C: Optional[float] = Field(None, description="Température maximale : calcule l'intensité admissible")
+
+
+class TransientScenarioInput(BaseModel):
+    """Scénario de régime transitoire"""
+    name: str = Field(..., description="Nom du scénario")
+    cable_name: str = Field(..., description="Désignation du câble dans le catalogue")
+    current_A: list[float] = Field(..., min_items=1, description="Intensité à chaque pas (A)")
+    ambient_C: list[float] = Field(..., min_items=1, description="Température ambiante, une valeur ou une par pas (°C)")
+    wind_speed_m_s: list[float] = Field(..., min_items=1, description="Vitesse du vent, une valeur ou une par pas (m/s)")
+    irradiance_W_m2: list[float] = Field(..., min_items=1, description="Rayonnement solaire, une valeur ou une par pas (W/m²)")
+    initial_C: Optional[float] = Field(None, description="Température initiale (°C), régime permanent du premier pas par défaut")
+
+
+class TransientInput(BaseModel):
+    """Entrées de la simulation thermique en régime transitoire"""
+    step_s: float = Field(..., gt=0, le=MAX_TRANSIENT_STEP_S, description="Pas de temps des séries (s)")
+    scenarios: list[TransientScenarioInput] = Field(..., min_items=1, description="Scénarios indépendants")
+    wind_angle_deg: float = Field(90.0, ge=0, le=90, description="Angle vent / axe du conducteur (°)")
+    altitude_m: float = Field(0.0, ge=0, description="Altitude du site (m)")
+    age_years: float = Field(10.0, ge=0, description="Âge des câbles (années), pour l'émissivité")
+    workers: int = Field(1, ge=1, le=MAX_THERMAL_WORKERS, description="Nombre de processus")
+
+
+class BulkDomainInput(BaseModel):
+    """
+    Validation du domaine CELESTE en masse, en colonnes
+
+    Fournir soit a1_m/a2_m/h_max_m (une valeur par canton), soit
+    spans_m/delta_h_m/canton_sizes (portées de la ligne découpées en cantons).
+    """
+    a1_m: Optional[list[float]] = Field(None, description="Plus grande portée de chaque canton (m), ≥ a2_m")
+    a2_m: Optional[list[float]] = Field(None, description="Plus petite portée de chaque canton (m), > 0")
+    h_max_m: Optional[list[float]] = Field(None, description="Dénivelé max de chaque canton (m), ≥ 0")
+    spans_m: Optional[list[float]] = Field(None, description="Longueurs de toutes les portées (m), > 0")
+    delta_h_m: Optional[list[float]] = Field(None, description="Dénivelés de toutes les portées (m)")
+    canton_sizes: Optional[list[int]] = Field(None, description="Nombre de portées de chaque canton")
+
+
+class PointLoadInput(BaseModel):
+    """Charge ponctuelle sur la portée"""
+    position_m: float = Field(..., ge=0, description="Position depuis le support A (m)")
+    load_dan: float = Field(..., ge=0, description="Intensité (daN)")
+
+
+class DangerCurveInput(BaseModel):
+    """Grille intensités × positions d'une charge ponctuelle unique"""
+    loads_dan: list[float] = Field(..., min_items=1, description="Intensités de la charge (daN)")
+    n_positions: int = Field(101, ge=2, description="Nombre de positions régulièrement espacées dans la portée")
+
+
+class PointLoadSpanInput(BaseModel):
+    """Entrées de la situation particulière (surcharges ponctuelles sur une portée)"""
+    cable: CableInput = Field(..., description="Propriétés du câble")
+    a_m: float = Field(..., gt=0, description="Longueur de la portée (m)")
+    h_m: float = Field(0.0, description="Dénivelé (m)")
+    reference: ReferenceStateInput = Field(..., description="État de référence de la portée")
+    temperature_C: float = Field(..., description="Température de l'état calculé (°C)")
+    loads: Optional[list[PointLoadInput]] = Field(
+        None, min_items=1, max_items=MAX_POINT_LOADS, description="Charges simultanées"
+    )
+    danger_curve: Optional[DangerCurveInput] = Field(None, description="Courbe de danger d'une charge unique")
+
+
 class VHLInput(BaseModel):
     """Entrées pour le calcul d'effort VHL"""
     H_dan: float = Field(..., description="Composante horizontale (daN)")
     L_dan: float = Field(..., description="Composante longitudinale (daN)")
 
 
+def _cable_properties(cable: CableInput) -> CableProperties:
+    """Convertit un CableInput en CableProperties"""
+    return CableProperties(
+        name=cable.name,
+        mass_lin_kg_per_m=cable.mass_lin_kg_per_m,
+        E_MPa=cable.E_MPa,
+        section_mm2=cable.section_mm2,
+        alpha_1e6_per_C=cable.alpha_1e6_per_C,
+        rupture_dan=cable.rupture_dan,
+        diameter_mm=cable.diameter_mm
+    )
+
+
+def _reference_state(reference: ReferenceStateInput, constants: CableConstants) -> ReferenceState:
+    """Construit l'état de référence à partir de T0 ou de ρ"""
+    if (reference.tension_dan is None) == (reference.rho_m is None):
+        raise ValidationError(
+            "L'état de référence doit définir soit tension_dan, soit rho_m",
+            {"tension_dan": reference.tension_dan, "rho_m": reference.rho_m}
+        )
+    if reference.rho_m is not None:
+        return reference_from_rho(
+            constants,
+            reference.rho_m,
+            reference.temperature_C,
+            reference.wind_pressure_daPa
+        )
+    return ReferenceState(
+        temperature_C=reference.temperature_C,
+        tension_dan=reference.tension_dan,
+        wind_pressure_daPa=reference.wind_pressure_daPa
+    )
+
+
+def _sweep_axis(name: str, axis: SweepAxisInput) -> SweepAxis:
+    """Construit un axe de balayage à partir de valeurs ou d'une plage"""
+    if axis.values is not None:
+        return SweepAxis(values=axis.values)
+    if axis.start is None or axis.stop is None or axis.num is None:
+        raise ValidationError(
+            "Un axe doit définir soit values, soit start/stop/num",
+            {"axis": name}
+        )
+    return SweepAxis.linspace(axis.start, axis.stop, axis.num)
+
+
+def _run_sweep_job(job_id: str, job: SweepJob, chunk_size: int) -> None:
+    """Exécute un balayage en tâche de fond et met à jour son suivi"""
+    state = sweep_jobs[job_id]
+    state["status"] = "running"
+
+    def progress(done: int, total: int) -> None:
+        state["progress"] = done / total
+
+    try:
+        state["manifest"] = SweepRunner.run(job, SWEEP_DIR / job_id, chunk_size, progress)
+        state["status"] = "done"
+        logger.info(f"Balayage {job_id} terminé: {job.size} points")
+    except Exception as e:
+        logger.exception(f"Échec du balayage {job_id}")
+        state["status"] = "failed"
+        state["error"] = str(e)
+
+
+def _delete_sweep(job_id: str) -> None:
+    """Supprime les colonnes et le suivi d'un balayage"""
+    shutil.rmtree(SWEEP_DIR / job_id, ignore_errors=True)
+    sweep_jobs.pop(job_id, None)
+
+
+def _prune_sweeps(max_jobs: int) -> None:
+    """
+    Supprime les balayages terminés les plus anciens pour en laisser place à un nouveau
+
+    Les balayages en cours ne sont jamais supprimés.
+
+    Args:
+        max_jobs: Nombre de balayages conservés, nouveau balayage compris
+    """
+    finished: dict[str, float] = {}
+    if SWEEP_DIR.exists():
+        for path in SWEEP_DIR.iterdir():
+            if path.is_dir() and path.name.isalnum():
+                finished[path.name] = path.stat().st_mtime
+    for job_id in sweep_jobs:
+        finished.setdefault(job_id, 0.0)
+    active = [job_id for job_id, state in sweep_jobs.items() if state["status"] in ("pending", "running")]
+    for job_id in active:
+        finished.pop(job_id)
+
+    if len(active) >= max_jobs:
+        raise ValidationError(
+            "Trop de balayages en cours",
+            {"running": len(active), "max_jobs": max_jobs}
+        )
+    excess = len(finished) + len(active) - (max_jobs - 1)
+    for job_id in sorted(finished, key=finished.get)[:max(excess, 0)]:
+        _delete_sweep(job_id)
+        logger.info(f"Balayage {job_id} supprimé (rétention)")
+
+
 # ===== ENDPOINTS =====
 
 @api.get("/health")
@@ -233,23 +725,17 @@ def calc_span(payload: SpanCalcInput):
             h=payload.delta_h_m
         )
 
-        cable = CableProperties(
-            name=payload.cable.name,
-            mass_lin_kg_per_m=payload.cable.mass_lin_kg_per_m,
-            E_MPa=payload.cable.E_MPa,
-            section_mm2=payload.cable.section_mm2,
-            alpha_1e6_per_C=payload.cable.alpha_1e6_per_C,
-            rupture_dan=payload.cable.rupture_dan,
-            diameter_mm=payload.cable.diameter_mm
-        )
+        cable = _cable_properties(payload.cable)
 
-        # Calcul
-        result = MechanicalCalculator.calculate_span(
+        # Calcul (via le cache s'il est activé)
+        calculate = span_cache.calculate_span if span_cache.enabled else MechanicalCalculator.calculate_span
+        result = calculate(
             geometry=geometry,
             cable=cable,
             rho=payload.rho_m,
             wind_pressure_daPa=payload.wind_pressure_daPa,
-            angle_grade=payload.angle_topo_grade
+            angle_grade=payload.angle_topo_grade,
+            ice_thickness_mm=payload.ice_thickness_mm
         )
 
         logger.info(f"Calcul réussi: T0={result.T0} daN, warnings={len(result.warnings)}")
@@ -269,144 +755,1527 @@ def calc_span(payload: SpanCalcInput):
         raise CalculationError("Division par zéro dans le calcul", {"cable": payload.cable.name})
 
 
-@api.post("/calc/equivalent-span")
-def calc_equivalent_span(payload: EquivalentSpanInput):
+def _span_batch_chunk(
+    chunk: list[BatchSpanItem],
+    start: int,
+    cable_positions: dict[str, int],
+    cables: CableTable
+) -> bytes:
+    """Calcule un bloc de portées et renvoie une ligne NDJSON par portée"""
+    nan = float("nan")
+    rho = np.array([s.rho_m for s in chunk])
+    wind = np.array([nan if s.wind_pressure_daPa is None else s.wind_pressure_daPa for s in chunk])
+    angle = np.array([nan if s.angle_topo_grade is None else s.angle_topo_grade for s in chunk])
+    ice = np.array([nan if s.ice_thickness_mm is None else s.ice_thickness_mm for s in chunk])
+    cable_index = np.array([cable_positions[s.cable_id] for s in chunk])
+
+    result = BatchSpanCalculator.calculate_spans(
+        a=np.array([s.span_length_m for s in chunk]),
+        h=np.array([s.delta_h_m for s in chunk]),
+        rho=rho,
+        cable_index=cable_index,
+        cables=cables,
+        wind_pressure_daPa=wind,
+        angle_grade=angle,
+        ice_thickness_mm=ice
+    )
+
+    lines = []
+    for i, span in enumerate(chunk):
+        compact = CompactSpanResult(
+            b=float(result.b[i]),
+            F1=float(result.F1[i]),
+            F2=float(result.F2[i]),
+            H=float(result.H[i]),
+            T0=int(result.T0[i]),
+            TA=int(result.TA[i]),
+            TB=int(result.TB[i]),
+            warning_codes=result.warnings[i],
+            error_codes=result.errors[i],
+            rho=span.rho_m,
+            rupture_dan=float(cables.rupture_dan[cable_index[i]]),
+            wind_pressure_daPa=span.wind_pressure_daPa,
+            angle_grade=span.angle_topo_grade
+        )
+        lines.append(json.dumps({
+            "index": start + i,
+            "cable_id": span.cable_id,
+            "result": compact_result_to_dict(compact)
+        }, ensure_ascii=False))
+
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _stream_span_batch(payload: SpanBatchInput, cables: CableTable) -> Iterator[bytes]:
+    """Calcule les portées bloc par bloc et produit une ligne NDJSON par portée"""
+    cable_positions = {cable_id: i for i, cable_id in enumerate(payload.cables)}
+    spans = payload.spans
+    for start in range(0, len(spans), payload.chunk_size):
+        yield _span_batch_chunk(spans[start:start + payload.chunk_size], start, cable_positions, cables)
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[tuple[int, bytes]]:
+    """Lignes non vides du corps de la requête, lues au fil de la réception"""
+    pending = b""
+    number = 0
+    async for data in request.stream():
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            number += 1
+            if line.strip():
+                yield number, line
+    if pending.strip():
+        yield number + 1, pending
+
+
+@api.post("/calc/spans/batch")
+def calc_spans_batch(payload: SpanBatchInput):
     """
-    Calcule la portée équivalente selon Blondel
-    
+    Calcul en lot des portées d'une ligne
+
+    Les câbles sont définis une seule fois et référencés par identifiant.
+    Les résultats sont calculés par blocs et diffusés au fil de l'eau, mais
+    le corps JSON est validé en entier avant le premier bloc : la mémoire
+    croît avec le nombre de portées, limité à MAX_BATCH_SPANS. Pour des
+    lignes plus longues, utiliser /calc/spans/batch/ndjson.
+
     Retourne:
-        - a_eq: portée équivalente (m)
-        - K: coefficient
+        Flux NDJSON, une ligne par portée (index, cable_id, result)
     """
-    try:
-        a_eq, K = MechanicalCalculator.calculate_equivalent_span(payload.spans_m)
-        
-        return {
-            "success": True,
-            "input": {"spans_m": payload.spans_m},
-            "result": {
-                "a_eq_m": round(a_eq, 2),
-                "K": round(K, 3)
-            }
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    logger.info(f"Calcul en lot: {len(payload.spans)} portées, {len(payload.cables)} câbles")
 
+    unknown = sorted({s.cable_id for s in payload.spans} - set(payload.cables))
+    if unknown:
+        raise ValidationError(
+            "Câble(s) référencé(s) mais non défini(s)",
+            {"cable_ids": unknown}
+        )
 
-@api.post("/calc/crr")
-def calc_crr(payload: CRRInput):
+    cables = CableTable.from_cables(
+        [_cable_properties(cable) for cable in payload.cables.values()]
+    )
+
+    return StreamingResponse(
+        _stream_span_batch(payload, cables),
+        media_type="application/x-ndjson"
+    )
+
+
+class RequestDrivenStreamingResponse(StreamingResponse):
     """
-    Calcule la Charge de Rupture Résiduelle
-    
+    Réponse diffusée pendant la lecture du corps de la requête
+
+    StreamingResponse lit aussi `receive` pour détecter la déconnexion du
+    client, ce qui consommerait le corps de la requête : ici seul le
+    générateur lit la requête, une déconnexion interrompt sa lecture.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _ndjson_error(message: str, details: dict) -> bytes:
+    """Ligne d'erreur terminant un flux NDJSON déjà commencé"""
+    return (json.dumps(
+        {"error": "Validation error", "message": message, "details": details}, ensure_ascii=False
+    ) + "\n").encode("utf-8")
+
+
+async def _stream_ndjson_batch(
+    lines: AsyncIterator[tuple[int, bytes]],
+    header: SpanBatchHeader,
+    cables: CableTable
+) -> AsyncIterator[bytes]:
+    """Valide et calcule les portées bloc par bloc, au fil de la lecture du corps"""
+    cable_positions = {cable_id: i for i, cable_id in enumerate(header.cables)}
+    chunk: list[BatchSpanItem] = []
+    count = 0
+
+    async for line_number, line in lines:
+        try:
+            span = BatchSpanItem.model_validate_json(line)
+        except PydanticValidationError as e:
+            yield _ndjson_error(
+                f"Ligne {line_number} invalide",
+                {"line": line_number, "errors": [{"loc": list(err["loc"]), "msg": err["msg"]} for err in e.errors()]}
+            )
+            return
+        if span.cable_id not in cable_positions:
+            yield _ndjson_error(
+                "Câble référencé mais non défini",
+                {"line": line_number, "cable_id": span.cable_id}
+            )
+            return
+        if count + len(chunk) >= MAX_STREAMED_BATCH_SPANS:
+            yield _ndjson_error("Trop de portées dans le lot", {"max_spans": MAX_STREAMED_BATCH_SPANS})
+            return
+
+        chunk.append(span)
+        if len(chunk) == header.chunk_size:
+            yield await run_in_threadpool(_span_batch_chunk, chunk, count, cable_positions, cables)
+            count += len(chunk)
+            chunk = []
+
+    if chunk:
+        yield await run_in_threadpool(_span_batch_chunk, chunk, count, cable_positions, cables)
+        count += len(chunk)
+    if count == 0:
+        yield _ndjson_error("Le lot doit contenir les câbles puis au moins une portée", {})
+        return
+    logger.info(f"Calcul en lot NDJSON: {count} portées, {len(header.cables)} câbles")
+
+
+@api.post("/calc/spans/batch/ndjson")
+async def calc_spans_batch_ndjson(request: Request):
+    """
+    Calcul en lot des portées d'une ligne, corps NDJSON lu au fil de l'eau
+
+    La première ligne décrit les câbles et la taille des blocs
+    ({"cables": {...}, "chunk_size": 256}), chaque ligne suivante une portée
+    (mêmes champs que `spans` de /calc/spans/batch). Les portées sont lues,
+    validées et calculées bloc par bloc : chaque bloc est envoyé dès qu'il
+    est calculé, avant la lecture de la suite du corps, et seul un bloc est
+    en mémoire. Le client doit donc lire la réponse pendant l'envoi.
+
+    Une première ligne invalide renvoie une erreur 422. Une portée invalide,
+    les résultats ayant déjà commencé, termine le flux par une ligne
+    {"error", "message", "details"}.
+
     Retourne:
-        - CRR: charge de rupture résiduelle (daN)
-        - CR: charge admissible (daN)
+        Flux NDJSON, une ligne par portée (index, cable_id, result)
     """
+    lines = _ndjson_lines(request)
     try:
-        CRR, CR = MechanicalCalculator.calculate_crr(
-            payload.cra_dan,
-            payload.broken_wires
+        line_number, line = await lines.__anext__()
+    except StopAsyncIteration:
+        raise ValidationError("Le lot doit contenir les câbles puis au moins une portée")
+    try:
+        header = SpanBatchHeader.model_validate_json(line)
+    except PydanticValidationError as e:
+        raise ValidationError(
+            f"Ligne {line_number} invalide",
+            {"line": line_number, "errors": [{"loc": list(err["loc"]), "msg": err["msg"]} for err in e.errors()]}
         )
-        
-        return {
-            "success": True,
-            "input": payload.dict(),
-            "result": {
-                "CRR_dan": round(CRR),
-                "CR_dan": round(CR)
-            }
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    cables = CableTable.from_cables([_cable_properties(cable) for cable in header.cables.values()])
 
+    return RequestDrivenStreamingResponse(
+        _stream_ndjson_batch(lines, header, cables),
+        media_type="application/x-ndjson"
+    )
 
-@api.post("/calc/vhl")
-def calc_vhl(payload: VHLInput):
+
+@api.post("/calc/solve-rho")
+def calc_solve_rho(payload: RhoSolveInput):
     """
-    Calcule l'effort résultant sur un support (VHL)
-    
+    Recherche ρ pour atteindre une tension, une flèche ou une garde cible
+
+    Sous vent ou givre, les tensions sont calculées sous poids apparent.
+
     Retourne:
-        - R: effort résultant (daN)
+        - rho_m: paramètre par portée (null si non convergé)
+        - status / iterations: convergence par portée
     """
+    n = len(payload.spans_m)
+    columns = {"target_values": payload.target_values, "delta_h_m": payload.delta_h_m}
+    if payload.low_attachment_m is not None:
+        columns["low_attachment_m"] = payload.low_attachment_m
+    mismatched = {name: len(col) for name, col in columns.items() if len(col) != n}
+    if mismatched:
+        raise ValidationError(
+            "Les colonnes doivent avoir la même longueur que spans_m",
+            {"spans_m": n, **mismatched}
+        )
+
+    logger.info(f"Recherche de ρ ({payload.target.value}) sur {n} portées")
+
     try:
-        R = MechanicalCalculator.calculate_vhl_effort(
-            payload.H_dan,
-            payload.L_dan
+        solution = RhoSolver.solve(
+            target=payload.target,
+            values=payload.target_values,
+            a=payload.spans_m,
+            h=payload.delta_h_m,
+            cable_index=0,
+            cables=[_cable_properties(payload.cable)],
+            low_attachment_m=payload.low_attachment_m,
+            wind_pressure_daPa=payload.wind_pressure_daPa,
+            ice_thickness_mm=payload.ice_thickness_mm,
+            rho_min=payload.rho_min_m,
+            rho_max=payload.rho_max_m
         )
-        
-        return {
-            "success": True,
-            "input": payload.dict(),
-            "result": {
-                "R_dan": round(R)
-            }
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    converged = solution.status == SolveStatus.CONVERGED
+
+    return {
+        "success": True,
+        "result": {
+            "rho_m": [round(float(r), 3) if ok else None for r, ok in zip(solution.rho, converged)],
+            "status": solution.status.tolist(),
+            "iterations": solution.iterations.tolist(),
+            "status_codes": {s.name: s.value for s in SolveStatus},
+            "converged_count": int(converged.sum())
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    }
 
 
-@api.get("/calc/cigre-emissivity")
-def calc_cigre_emissivity(age_years: float = 10.0):
+@api.post("/calc/state-change")
+def calc_state_change(payload: StateChangeInput):
     """
-    Calcule l'émissivité selon CIGRE
-    
-    Paramètres:
-        - age_years: âge du câble (années)
-    
+    Équation de changement d'état sur la grille températures × vents
+
     Retourne:
-        - epsilon: émissivité
+        - tension_dan[i][j]: T0 (daN) pour temperatures_C[i] et wind_pressures_daPa[j]
+        - rho_m[i][j]: paramètre sous poids apparent (m)
     """
+    constants = CableConstants.from_cable(_cable_properties(payload.cable))
+    reference = _reference_state(payload.reference, constants)
+
     try:
-        epsilon = MechanicalCalculator.calculate_cable_temperature_cigre(age_years)
-        
-        return {
-            "success": True,
-            "input": {"age_years": age_years},
-            "result": {
-                "epsilon": round(epsilon, 3)
-            }
+        result = StateChangeSolver.solve_grid(
+            constants,
+            payload.ruling_span_m,
+            reference,
+            payload.temperatures_C,
+            payload.wind_pressures_daPa
+        )
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    return {
+        "success": True,
+        "input": payload.dict(),
+        "result": {
+            "temperatures_C": payload.temperatures_C,
+            "wind_pressures_daPa": payload.wind_pressures_daPa,
+            "tension_dan": np.rint(result.tension_dan).astype(int).tolist(),
+            "rho_m": np.round(result.rho_m, 1).tolist()
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    }
 
 
-@api.post("/calc/validate-domain")
-def validate_domain(
-    a1_m: float = Query(..., gt=0, description="Plus grande portée (m)"),
-    a2_m: float = Query(..., gt=0, description="Plus petite portée (m)"),
-    h_max_m: float = Query(..., ge=0, description="Dénivelé max canton (m)")
-):
+@api.post("/calc/cantons")
+def calc_cantons(payload: CantonLineInput):
     """
-    Valide le domaine d'application mécanique CELESTE
-    
-    Retourne:
-        - valid: booléen
-        - errors: liste des erreurs
+    Calcul de tous les cantons d'une ligne
+
+    Retourne par canton:
+        - a_eq_m, K: portée équivalente
+        - T0_dan, rho_m: état du canton
+        - spans: flèches et tensions de chaque portée, en colonnes
     """
+    for i, canton in enumerate(payload.cantons):
+        if len(canton.spans_m) != len(canton.delta_h_m):
+            raise ValidationError(
+                "spans_m et delta_h_m doivent avoir la même longueur",
+                {"canton": i}
+            )
+
+    logger.info(f"Calcul de {len(payload.cantons)} cantons")
+
+    cable = _cable_properties(payload.cable)
+    constants = CableConstants.from_cable(cable)
+    reference = _reference_state(payload.reference, constants)
+
     try:
-        errors = MechanicalCalculator.validate_celeste_domain(a1_m, a2_m, h_max_m)
-        
-        return {
-            "success": True,
-            "input": {
-                "a1_m": a1_m,
-                "a2_m": a2_m,
-                "h_max_m": h_max_m
-            },
-            "result": {
-                "valid": len(errors) == 0,
-                "errors": errors
-            }
-        }
-        
-    except Exception as e:
+        result = CantonSolver.solve(
+            a=[a for canton in payload.cantons for a in canton.spans_m],
+            h=[h for canton in payload.cantons for h in canton.delta_h_m],
+            canton_sizes=[len(canton.spans_m) for canton in payload.cantons],
+            cable=cable,
+            reference=reference,
+            temperature_C=payload.temperature_C,
+            wind_pressure_daPa=payload.wind_pressure_daPa,
+            constants=constants
+        )
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    spans = result.spans
+    cantons = []
+    start = 0
+    for i, canton in enumerate(payload.cantons):
+        stop = start + len(canton.spans_m)
+        cantons.append({
+            "a_eq_m": round(float(result.ruling_span_m[i]), 2),
+            "K": round(float(result.K[i]), 3),
+            "T0_dan": round(float(result.tension_dan[i])),
+            "rho_m": round(float(result.rho_m[i]), 1),
+            "spans": {
+                "b_m": spans.b[start:stop].tolist(),
+                "F1_m": spans.F1[start:stop].tolist(),
+                "F2_m": spans.F2[start:stop].tolist(),
+                "H_m": spans.H[start:stop].tolist(),
+                "T0_dan": spans.T0[start:stop].astype(int).tolist(),
+                "TA_dan": spans.TA[start:stop].astype(int).tolist(),
+                "TB_dan": spans.TB[start:stop].astype(int).tolist(),
+                "warning_codes": spans.warnings[start:stop].tolist(),
+                "error_codes": spans.errors[start:stop].tolist()
+            }
+        })
+        start = stop
+
+    return {
+        "success": True,
+        "result": {"cantons": cantons}
+    }
+
+
+@api.post("/calc/lengths")
+def calc_conductor_lengths(payload: ConductorLengthInput):
+    """
+    Longueurs de conducteur de toutes les portées, totaux par canton
+
+    Retourne par canton:
+        - length_m, unstressed_length_m: longueurs dans l'état calculé et à vide
+        - drums: nombre de tourets (si drum_length_m est fourni)
+        - spans: longueur, mou, allongements élastique et thermique par portée
+    """
+    for i, canton in enumerate(payload.cantons):
+        if len(canton.spans_m) != len(canton.delta_h_m):
+            raise ValidationError(
+                "spans_m et delta_h_m doivent avoir la même longueur",
+                {"canton": i}
+            )
+
+    cable = _cable_properties(payload.cable)
+    constants = CableConstants.from_cable(cable)
+    reference = _reference_state(payload.reference, constants)
+    a = [a for canton in payload.cantons for a in canton.spans_m]
+    h = [h for canton in payload.cantons for h in canton.delta_h_m]
+    sizes = [len(canton.spans_m) for canton in payload.cantons]
+
+    try:
+        cantons = CantonSolver.solve(
+            a=a, h=h, canton_sizes=sizes, cable=cable, reference=reference,
+            temperature_C=payload.temperature_C,
+            wind_pressure_daPa=payload.wind_pressure_daPa,
+            constants=constants
+        )
+        # Poids apparent du canton : T0 = ρ·p
+        load_factor = cantons.tension_dan / (cantons.rho_m * constants.weight_dan_per_m)
+        lengths = ConductorLengthCalculator.compute(
+            a, h,
+            rho=cantons.rho_m[cantons.canton_index],
+            cable=cable,
+            canton_sizes=sizes,
+            temperature_C=payload.temperature_C,
+            unstressed_temperature_C=payload.unstressed_temperature_C,
+            load_factor=load_factor[cantons.canton_index]
+        )
+        drums = None if payload.drum_length_m is None else lengths.drums(payload.drum_length_m, payload.allowance_m)
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    logger.info(
+        f"Longueurs de conducteur: {len(a)} portées, {len(sizes)} cantons, "
+        f"{float(lengths.canton_unstressed_m.sum()):.1f} m à vide"
+    )
+
+    result = []
+    start = 0
+    for i, size in enumerate(sizes):
+        stop = start + size
+        result.append({
+            "length_m": round(float(lengths.canton_length_m[i]), 3),
+            "unstressed_length_m": round(float(lengths.canton_unstressed_m[i]), 3),
+            "drums": None if drums is None else int(drums[i]),
+            "spans": {
+                "length_m": np.round(lengths.arc_length_m[start:stop], 3).tolist(),
+                "slack_m": np.round(lengths.slack_m[start:stop], 3).tolist(),
+                "elastic_m": np.round(lengths.elastic_m[start:stop], 4).tolist(),
+                "thermal_m": np.round(lengths.thermal_m[start:stop], 4).tolist(),
+                "unstressed_length_m": np.round(lengths.unstressed_length_m[start:stop], 3).tolist()
+            }
+        })
+        start = stop
+
+    return {
+        "success": True,
+        "result": {
+            "cantons": result,
+            "total_length_m": round(float(lengths.canton_length_m.sum()), 3),
+            "total_unstressed_length_m": round(float(lengths.canton_unstressed_m.sum()), 3)
+        }
+    }
+
+
+def _stringing_response(table, format: str):
+    """Réponse JSON ou CSV d'une table de pose"""
+    if format == "csv":
+        return Response(
+            content=table.to_csv(),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="tables_de_pose_{table.key[:12]}.csv"'}
+        )
+    if format != "json":
+        raise ValidationError("Format inconnu (json ou csv)", {"format": format})
+    return {"success": True, "result": table.to_dict()}
+
+
+@api.post("/calc/stringing-tables")
+def calc_stringing_tables(payload: StringingTableInput):
+    """
+    Tables de pose (tension et flèches selon la température) de tous les cantons
+
+    Les tables sont mises en cache sur disque, clé = empreinte des entrées :
+    une requête identique relit la table sans recalcul. Si l'écriture du
+    cache échoue, la table est renvoyée sans être mise en cache.
+
+    Retourne (JSON):
+        - key: empreinte, réutilisable sur /calc/stringing-tables/{key}
+        - cantons: T0_dan et rho_m par température, F1_m de chaque portée
+    """
+    if payload.format not in ("json", "csv"):
+        raise ValidationError("Format inconnu (json ou csv)", {"format": payload.format})
+    for i, canton in enumerate(payload.cantons):
+        if len(canton.spans_m) != len(canton.delta_h_m):
+            raise ValidationError(
+                "spans_m et delta_h_m doivent avoir la même longueur",
+                {"canton": i}
+            )
+    cells = sum(len(canton.spans_m) for canton in payload.cantons) * len(payload.temperatures_C)
+    if cells > MAX_STRINGING_CELLS:
+        raise ValidationError(
+            f"Table de pose trop grande ({cells} > {MAX_STRINGING_CELLS} portées × températures)",
+            {"cells": cells, "max_cells": MAX_STRINGING_CELLS}
+        )
+
+    cable = _cable_properties(payload.cable)
+    constants = CableConstants.from_cable(cable)
+    reference = _reference_state(payload.reference, constants)
+
+    try:
+        table = stringing_cache.get_or_generate(
+            a=[a for canton in payload.cantons for a in canton.spans_m],
+            h=[h for canton in payload.cantons for h in canton.delta_h_m],
+            canton_sizes=[len(canton.spans_m) for canton in payload.cantons],
+            cable=cable,
+            reference=reference,
+            temperatures_C=payload.temperatures_C
+        )
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    logger.info(
+        f"Tables de pose: {len(payload.cantons)} cantons × {len(payload.temperatures_C)} températures, "
+        f"clé={table.key[:12]}"
+    )
+    return _stringing_response(table, payload.format)
+
+
+@api.get("/calc/stringing-tables/cache/stats")
+def get_stringing_cache_stats():
+    """Statistiques du cache disque des tables de pose"""
+    return {"success": True, "cache": stringing_cache.stats()}
+
+
+@api.get("/calc/stringing-tables/{key}")
+def get_stringing_table(key: str, format: str = Query("json", description="Format: json ou csv")):
+    """Export d'une table de pose en cache, sans recalcul"""
+    try:
+        table = stringing_cache.get(key)
+    except ValueError:
+        table = None
+    if table is None:
+        raise HTTPException(status_code=404, detail=f"Table de pose introuvable: {key}")
+    return _stringing_response(table, format)
+
+
+@api.post("/calc/monte-carlo")
+def calc_monte_carlo(payload: MonteCarloInput):
+    """
+    Propagation Monte Carlo des incertitudes de relevé et de catalogue
+
+    Retourne par grandeur (T0 pour le canton, TA/TB/F1/F2 par portée):
+        - mean, std, min, max
+        - percentiles demandés
+        - histogrammes (bornes et effectifs) si demandés
+    """
+    if len(payload.spans_m) != len(payload.delta_h_m):
+        raise ValidationError(
+            "spans_m et delta_h_m doivent avoir la même longueur",
+            {"spans_m": len(payload.spans_m), "delta_h_m": len(payload.delta_h_m)}
+        )
+    if any(q < 0 or q > 100 for q in payload.percentiles):
+        raise ValidationError("Les percentiles doivent être compris entre 0 et 100", {"percentiles": payload.percentiles})
+
+    cable = _cable_properties(payload.cable)
+    constants = CableConstants.from_cable(cable)
+
+    job = MonteCarloJob(
+        cable=cable,
+        spans_m=payload.spans_m,
+        delta_h_m=payload.delta_h_m,
+        reference=_reference_state(payload.reference, constants),
+        temperature_C=payload.temperature_C,
+        wind_pressure_daPa=payload.wind_pressure_daPa,
+        tolerances=InputTolerances(**payload.tolerances.dict()),
+        n_samples=payload.n_samples,
+        seed=payload.seed
+    )
+
+    logger.info(f"Monte Carlo: {job.n_samples} échantillons, {len(job.spans_m)} portées, {payload.workers} processus")
+
+    try:
+        result = MonteCarloSimulator.run(job, workers=payload.workers)
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    quantities = {}
+    for name in MONTE_CARLO_QUANTITIES:
+        distribution = result.distributions[name]
+        summary = {
+            "mean": distribution.mean.tolist(),
+            "std": distribution.std.tolist(),
+            "min": distribution.minimum.tolist(),
+            "max": distribution.maximum.tolist(),
+            "percentiles": {
+                str(q): values.tolist() for q, values in result.percentiles(name, payload.percentiles).items()
+            }
+        }
+        if payload.include_histograms:
+            summary["histogram"] = {
+                "low": distribution.low.tolist(),
+                "high": distribution.high.tolist(),
+                "counts": distribution.counts.tolist()
+            }
+        quantities[name] = summary
+
+    return {
+        "success": True,
+        "result": {
+            "n_samples": result.n_samples,
+            "seed": payload.seed,
+            "quantities": quantities
+        }
+    }
+
+
+@api.post("/calc/profile")
+def calc_profile(payload: ProfileInput):
+    """
+    Profil en long des conducteurs, réduit à la largeur d'affichage
+
+    Retourne au plus 2 points (min/max) par pixel sur la fenêtre demandée:
+        - station_m, altitude_m: y(x) le long de la ligne
+        - sag_m: F(x) = y_corde(x) − y(x)
+        - span_index: portée de chaque point
+    """
+    n_spans = len(payload.spans_m)
+    if len(payload.delta_h_m) != n_spans or len(payload.rho_m) not in (1, n_spans):
+        raise ValidationError(
+            "delta_h_m doit avoir la longueur de spans_m, et rho_m une valeur ou une par portée",
+            {"spans_m": n_spans, "delta_h_m": len(payload.delta_h_m), "rho_m": len(payload.rho_m)}
+        )
+
+    try:
+        rho = payload.rho_m if len(payload.rho_m) == n_spans else payload.rho_m[0]
+        profile = ProfileSampler.sample_window(
+            payload.spans_m,
+            payload.delta_h_m,
+            rho,
+            payload.start_altitude_m,
+            payload.pixel_width,
+            payload.window_start_m,
+            payload.window_end_m
+        )
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    return {
+        "success": True,
+        "result": {
+            "points": len(profile),
+            "station_m": np.round(profile.station_m, 3).tolist(),
+            "altitude_m": np.round(profile.altitude_m, 3).tolist(),
+            "sag_m": np.round(profile.sag_m, 3).tolist(),
+            "span_index": profile.span_index.tolist()
+        }
+    }
+
+
+@api.post("/calc/geometry")
+def calc_geometry(payload: GeometryInput):
+    """
+    Géométrie 3D de la ligne en tampons binaires (application/octet-stream)
+
+    Format: longueur de l'en-tête (uint32 LE), en-tête JSON (origine, décalages
+    et types des tampons), puis tampons Float32/Uint32 alignés sur 4 octets:
+        - catenary_positions, catenary_indices, span_offsets: conducteurs
+        - low_points: points bas
+        - support_positions: supports, si les hauteurs sont fournies
+    """
+    n_spans = len(payload.spans_m)
+    if len(payload.delta_h_m) != n_spans or len(payload.rho_m) not in (1, n_spans):
+        raise ValidationError(
+            "delta_h_m doit avoir la longueur de spans_m, et rho_m une valeur ou une par portée",
+            {"spans_m": n_spans, "delta_h_m": len(payload.delta_h_m), "rho_m": len(payload.rho_m)}
+        )
+    points = sum(payload.spans_m) / payload.resolution_m * len(payload.phase_offsets_m)
+    if points > MAX_PROFILE_POINTS:
+        raise ValidationError("Géométrie trop détaillée pour la longueur de la ligne", {"points": int(points)})
+
+    try:
+        rho = payload.rho_m if len(payload.rho_m) == n_spans else payload.rho_m[0]
+        geometry = LineGeometryBuilder.build(
+            payload.spans_m,
+            payload.delta_h_m,
+            rho,
+            start_altitude_m=payload.start_altitude_m,
+            phase_offsets_m=payload.phase_offsets_m,
+            support_heights_m=payload.support_heights_m,
+            resolution_m=payload.resolution_m
+        )
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    data = pack_buffers(geometry.buffers(), {
+        "origin": list(geometry.origin),
+        "spans": n_spans,
+        "phases": len(payload.phase_offsets_m)
+    })
+    logger.info(f"Géométrie 3D: {n_spans} portées, {len(data)} octets")
+
+    return Response(content=data, media_type="application/octet-stream")
+
+
+@api.post("/calc/corridor")
+def calc_corridor(payload: CorridorInput):
+    """
+    Tranchée forestière le long de la ligne
+
+    Retourne:
+        - spans: ½ largeurs AT/DT maximales, hauteur de tranchée minimale et surfaces par portée
+        - profile: enveloppe point par point si demandée
+    """
+    n_spans = len(payload.spans_m)
+    if len(payload.delta_h_m) != n_spans or len(payload.rho_m) not in (1, n_spans):
+        raise ValidationError(
+            "delta_h_m doit avoir la longueur de spans_m, et rho_m une valeur ou une par portée",
+            {"spans_m": n_spans, "delta_h_m": len(payload.delta_h_m), "rho_m": len(payload.rho_m)}
+        )
+    if payload.wind_pressure_daPa > 0 and payload.cable is None:
+        raise ValidationError("Le câble est requis pour calculer le déport au vent")
+    if sum(payload.spans_m) / payload.resolution_m > MAX_PROFILE_POINTS:
+        raise ValidationError("Résolution trop fine pour la longueur de la ligne", {"resolution_m": payload.resolution_m})
+
+    logger.info(f"Tranchée forestière: {n_spans} portées, résolution {payload.resolution_m}m")
+
+    phi = 0.0
+    if payload.cable is not None:
+        phi = swing_angle(_cable_properties(payload.cable), payload.wind_pressure_daPa)
+
+    parameters = CorridorParameters(
+        conductor_offset_m=payload.conductor_offset_m,
+        safety_at_m=payload.safety_at_m,
+        safety_dt_m=payload.safety_dt_m,
+        safety_vertical_m=payload.safety_vertical_m,
+        swing_angle_rad=phi
+    )
+
+    try:
+        rho = payload.rho_m if len(payload.rho_m) == n_spans else payload.rho_m[0]
+        profile = ProfileSampler.sample(
+            payload.spans_m, payload.delta_h_m, rho, payload.start_altitude_m, payload.resolution_m
+        )
+        corridor = CorridorCalculator.compute(
+            profile, parameters, payload.ground_stations_m, payload.ground_altitudes_m
+        )
+        summary = CorridorCalculator.summarize(corridor, profile.span_starts, n_spans)
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    result = {
+        "swing_angle_grade": round(phi * 200 / np.pi, 2),
+        "spans": {
+            "max_half_width_at_m": np.round(summary.max_half_width_at_m, 2).tolist(),
+            "max_half_width_dt_m": np.round(summary.max_half_width_dt_m, 2).tolist(),
+            "min_trench_height_m": np.round(summary.min_trench_height_m, 2).tolist(),
+            "min_trench_station_m": np.round(summary.min_trench_station_m, 2).tolist(),
+            "area_at_m2": np.round(summary.area_at_m2, 1).tolist(),
+            "area_dt_m2": np.round(summary.area_dt_m2, 1).tolist()
+        }
+    }
+    if payload.include_profile:
+        result["profile"] = {
+            "station_m": np.round(corridor.station_m, 2).tolist(),
+            "conductor_altitude_m": np.round(corridor.conductor_altitude_m, 2).tolist(),
+            "ground_altitude_m": np.round(corridor.ground_altitude_m, 2).tolist(),
+            "half_width_at_m": np.round(corridor.half_width_at_m, 2).tolist(),
+            "half_width_dt_m": np.round(corridor.half_width_dt_m, 2).tolist(),
+            "trench_height_m": np.round(corridor.trench_height_m, 2).tolist()
+        }
+
+    return {"success": True, "result": result}
+
+
+@api.post("/calc/sweeps", status_code=status.HTTP_202_ACCEPTED)
+def create_sweep(payload: SweepInput, background_tasks: BackgroundTasks):
+    """
+    Lance un balayage ρ × température × vent sur un jeu de portées
+
+    Au plus MAX_SWEEP_JOBS balayages sont conservés : les plus anciens
+    terminés sont supprimés pour faire place au nouveau.
+
+    Retourne:
+        - job_id: identifiant à interroger sur /calc/sweeps/{job_id}
+        - points: taille de la grille
+    """
+    if len(payload.spans_m) != len(payload.delta_h_m):
+        raise ValidationError("spans_m et delta_h_m doivent avoir la même longueur")
+    unknown = sorted(set(payload.columns) - set(SWEEP_COLUMNS))
+    if unknown:
+        raise ValidationError("Colonnes inconnues", {"columns": unknown})
+
+    job = SweepJob(
+        cable=_cable_properties(payload.cable),
+        spans_m=payload.spans_m,
+        delta_h_m=payload.delta_h_m,
+        rho_m=_sweep_axis("rho_m", payload.rho_m),
+        temperature_C=_sweep_axis("temperature_C", payload.temperature_C),
+        wind_pressure_daPa=_sweep_axis("wind_pressure_daPa", payload.wind_pressure_daPa),
+        reference_temperature_C=payload.reference_temperature_C,
+        columns=payload.columns
+    )
+    if job.size > MAX_SWEEP_POINTS:
+        raise ValidationError(
+            "Grille de balayage trop grande",
+            {"points": job.size, "max_points": MAX_SWEEP_POINTS}
+        )
+
+    _prune_sweeps(MAX_SWEEP_JOBS)
+    job_id = uuid.uuid4().hex
+    sweep_jobs[job_id] = {"status": "pending", "progress": 0.0, "points": job.size}
+    background_tasks.add_task(_run_sweep_job, job_id, job, payload.chunk_size)
+    logger.info(f"Balayage {job_id} lancé: {job.size} points")
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "points": job.size,
+        "shape": list(job.shape)
+    }
+
+
+@api.get("/calc/sweeps/{job_id}")
+def get_sweep(job_id: str):
+    """
+    État d'un balayage
+
+    Retourne:
+        - status: pending, running, done ou failed
+        - manifest: axes et colonnes disponibles une fois terminé
+    """
+    state = sweep_jobs.get(job_id)
+    if state is None:
+        manifest_path = SWEEP_DIR / job_id / "manifest.json"
+        if not job_id.isalnum() or not manifest_path.exists():
+            raise HTTPException(status_code=404, detail="Balayage introuvable")
+        state = {
+            "status": "done",
+            "progress": 1.0,
+            "manifest": json.loads(manifest_path.read_text(encoding="utf-8"))
+        }
+
+    return {"success": True, "job_id": job_id, **state}
+
+
+@api.get("/calc/sweeps/{job_id}/columns/{column}")
+def get_sweep_column(job_id: str, column: str):
+    """
+    Télécharge une colonne d'un balayage terminé (fichier .npy float32)
+
+    La colonne est à plat, dans l'ordre (ρ, température, vent, portée).
+    """
+    if not job_id.isalnum() or column not in SWEEP_COLUMNS:
+        raise HTTPException(status_code=404, detail="Colonne introuvable")
+    path = SWEEP_DIR / job_id / f"{column}.npy"
+    if not (SWEEP_DIR / job_id / "manifest.json").exists() or not path.exists():
+        raise HTTPException(status_code=404, detail="Colonne introuvable")
+
+    return FileResponse(str(path), media_type="application/octet-stream", filename=f"{column}.npy")
+
+
+@api.delete("/calc/sweeps/{job_id}")
+def delete_sweep(job_id: str):
+    """Supprime un balayage terminé et ses colonnes"""
+    state = sweep_jobs.get(job_id)
+    if state is None and (not job_id.isalnum() or not (SWEEP_DIR / job_id).is_dir()):
+        raise HTTPException(status_code=404, detail="Balayage introuvable")
+    if state is not None and state["status"] in ("pending", "running"):
+        raise HTTPException(status_code=409, detail="Balayage en cours")
+
+    _delete_sweep(job_id)
+    logger.info(f"Balayage {job_id} supprimé")
+    return {"success": True, "job_id": job_id}
+
+
+@api.get("/calc/cache/stats")
+def get_span_cache_stats():
+    """
+    Statistiques du cache des calculs de portée (propres à ce processus)
+
+    Retourne:
+        - size / maxsize: nombre d'entrées et capacité
+        - hits, misses, evictions, invalidations, hit_rate
+    """
+    return {"success": True, "cache": span_cache.stats()}
+
+
+@api.delete("/calc/cache")
+def clear_span_cache(cable_name: Optional[str] = Query(None, description="Câble à invalider (tout le cache si absent)")):
+    """Vide le cache des calculs de portée, ou seulement les entrées d'un câble"""
+    if cable_name is None:
+        span_cache.clear()
+        removed = None
+    else:
+        removed = span_cache.invalidate_cable(cable_name)
+    logger.info(f"Cache des portées invalidé: câble={cable_name}, entrées retirées={removed}")
+    return {"success": True, "removed": removed, "cache": span_cache.stats()}
+
+
+@api.post("/calc/equivalent-span")
+def calc_equivalent_span(payload: EquivalentSpanInput):
+    """
+    Calcule la portée équivalente selon Blondel
+    
+    Retourne:
+        - a_eq: portée équivalente (m)
+        - K: coefficient
+        - cantons: a_eq et K de chaque canton si un découpage est fourni
+    """
+    try:
+        accumulator = EquivalentSpanAccumulator(payload.spans_m)
+        a_eq, K = accumulator.result()
+
+        result = {
+            "a_eq_m": round(a_eq, 2),
+            "K": round(K, 3)
+        }
+        if payload.canton_sizes is not None:
+            result["cantons"] = [
+                {"a_eq_m": round(canton_a_eq, 2), "K": round(canton_K, 3)}
+                for canton_a_eq, canton_K in accumulator.segments(payload.canton_sizes)
+            ]
+
+        return {
+            "success": True,
+            "input": {"spans_m": payload.spans_m},
+            "result": result
+        }
+        
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+    except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@api.post("/calc/crr")
+def calc_crr(payload: CRRInput):
+    """
+    Calcule la Charge de Rupture Résiduelle
+    
+    Retourne:
+        - CRR: charge de rupture résiduelle (daN)
+        - CR: charge admissible (daN)
+    """
+    try:
+        CRR, CR = MechanicalCalculator.calculate_crr(
+            payload.cra_dan,
+            payload.broken_wires
+        )
+        
+        return {
+            "success": True,
+            "input": payload.dict(),
+            "result": {
+                "CRR_dan": round(CRR),
+                "CR_dan": round(CR)
+            }
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _finite_or_none(value: float) -> Optional[float]:
+    """Arrondit une charge, None si elle est inconnue (NaN)"""
+    return None if np.isnan(value) else round(float(value))
+
+
+@api.get("/calc/crr/catalog")
+def get_catalog_crr(cable_name: str = Query(..., description="Désignation du câble")):
+    """
+    Table CRR précalculée d'un câble du catalogue
+
+    Retourne par couche:
+        - strands, strand_strength_dan: brins et charge de rupture d'un brin
+        - CR_dan: CR pour 0, 1, 2... brins cassés dans la couche
+    """
+    if cable_name not in CRR_CATALOG:
+        raise HTTPException(status_code=404, detail="Câble inconnu du catalogue")
+
+    layers = CRR_CATALOG.cable_layers(cable_name)
+    for layer in layers:
+        layer["CR_dan"] = [
+            _finite_or_none(CRR_CATALOG.lookup(cable_name, layer["layer"], k)[1])
+            for k in range(layer["strands"] + 1)
+        ]
+
+    return {
+        "success": True,
+        "cable_name": cable_name,
+        "result": {"CRA_dan": round(CRR_CATALOG.cable_cra(cable_name)), "layers": layers}
+    }
+
+
+@api.get("/calc/crr/catalog/outer-layer")
+def get_catalog_outer_layer_crr(broken: int = Query(..., ge=0, description="Brins cassés dans la couche extérieure")):
+    """CR de tous les câbles du catalogue pour k brins cassés dans la couche extérieure"""
+    cr = CRR_CATALOG.outer_layer_scenario(broken)
+    return {
+        "success": True,
+        "broken": broken,
+        "result": {name: _finite_or_none(value) for name, value in zip(CRR_CATALOG.cable_names, cr)}
+    }
+
+
+@api.post("/calc/crr/catalog")
+def calc_catalog_crr(payload: CatalogCRRInput):
+    """
+    CRR d'un câble du catalogue à partir des brins cassés par couche
+
+    Retourne:
+        - CRR: charge de rupture résiduelle (daN)
+        - CR: charge admissible (daN)
+    """
+    damage = {}
+    for item in payload.damage:
+        damage[item.layer] = damage.get(item.layer, 0) + item.broken
+
+    try:
+        CRR, CR = CRR_CATALOG.evaluate(payload.cable_name, damage)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}", {"cable_name": payload.cable_name})
+
+    if np.isnan(CRR):
+        raise ValidationError(
+            "Charge de rupture des brins inconnue pour une des couches",
+            {"cable_name": payload.cable_name, "layers": sorted(damage)}
+        )
+
+    return {
+        "success": True,
+        "input": payload.dict(),
+        "result": {
+            "CRR_dan": round(CRR),
+            "CR_dan": round(CR)
+        }
+    }
+
+
+@api.post("/calc/vhl/matrix")
+def calc_vhl_matrix(payload: VHLMatrixInput):
+    """
+    Efforts V, H, L de tous les supports pour tous les cas de charge
+
+    Retourne, par support (lignes) et par cas (colonnes):
+        - V_dan, H_dan, L_dan, R_dan
+        - governing_case: cas donnant la plus grande résultante R par support
+    """
+    for i, canton in enumerate(payload.cantons):
+        if len(canton.spans_m) != len(canton.delta_h_m):
+            raise ValidationError(
+                "spans_m et delta_h_m doivent avoir la même longueur",
+                {"canton": i}
+            )
+
+    cable = _cable_properties(payload.cable)
+    reference = _reference_state(payload.reference, CableConstants.from_cable(cable))
+    cases = [
+        LoadCase(
+            name=case.name,
+            temperature_C=case.temperature_C,
+            wind_pressure_daPa=case.wind_pressure_daPa,
+            ice_thickness_mm=case.ice_thickness_mm,
+            broken_span=case.broken_span
+        )
+        for case in payload.cases
+    ]
+
+    n_supports = sum(len(canton.spans_m) for canton in payload.cantons) + 1
+    logger.info(f"Matrice VHL: {n_supports} supports × {len(cases)} cas")
+
+    try:
+        matrix = VHLCalculator.compute(
+            a=[a for canton in payload.cantons for a in canton.spans_m],
+            h=[h for canton in payload.cantons for h in canton.delta_h_m],
+            canton_sizes=[len(canton.spans_m) for canton in payload.cantons],
+            angle_grade=payload.angles_grade,
+            cable=cable,
+            reference=reference,
+            cases=cases
+        )
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    return {
+        "success": True,
+        "result": {
+            "cases": matrix.case_names,
+            "V_dan": np.rint(matrix.V).astype(int).tolist(),
+            "H_dan": np.rint(matrix.H).astype(int).tolist(),
+            "L_dan": np.rint(matrix.L).astype(int).tolist(),
+            "R_dan": np.rint(matrix.R).astype(int).tolist(),
+            "governing_case": [matrix.case_names[i] for i in matrix.governing_case]
+        }
+    }
+
+
+@api.post("/calc/interventions")
+def calc_interventions(payload: InterventionLineInput):
+    """
+    Simule une suite d'interventions sur câbles
+
+    Chaque intervention ne recalcule que les cantons concernés et les
+    supports voisins. L'état de référence est rapporté à la géométrie
+    initiale : abaisser ou relever un accrochage modifie la tension du
+    canton à longueur de câble constante.
+
+    Retourne par intervention:
+        - cantons: cantons recalculés (première portée, dernière portée + 1)
+        - supports: efforts V, H, L et tensions (gauche, droite) avant/après
+    """
+    for i, canton in enumerate(payload.cantons):
+        if len(canton.spans_m) != len(canton.delta_h_m):
+            raise ValidationError(
+                "spans_m et delta_h_m doivent avoir la même longueur",
+                {"canton": i}
+            )
+
+    cable = _cable_properties(payload.cable)
+    reference = _reference_state(payload.reference, CableConstants.from_cable(cable))
+    case = payload.case
+    try:
+        simulator = InterventionSimulator(
+            a=[a for canton in payload.cantons for a in canton.spans_m],
+            h=[h for canton in payload.cantons for h in canton.delta_h_m],
+            canton_sizes=[len(canton.spans_m) for canton in payload.cantons],
+            angle_grade=payload.angles_grade,
+            cable=cable,
+            reference=reference,
+            case=LoadCase(
+                name=case.name,
+                temperature_C=case.temperature_C,
+                wind_pressure_daPa=case.wind_pressure_daPa,
+                ice_thickness_mm=case.ice_thickness_mm,
+                broken_span=case.broken_span
+            )
+        )
+        steps = simulator.run([
+            Intervention(
+                kind=item.kind,
+                support=item.support,
+                delta_z_m=item.delta_z_m,
+                stay_force_dan=item.stay_force_dan,
+                stay_angle_deg=item.stay_angle_deg
+            )
+            for item in payload.interventions
+        ])
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    logger.info(f"Interventions: {len(steps)} étapes sur {len(payload.angles_grade)} supports")
+
+    def rounded(values: np.ndarray) -> list:
+        return np.rint(values).astype(int).tolist()
+
+    return {
+        "success": True,
+        "result": [
+            {
+                "kind": step.intervention.kind.value,
+                "support": step.intervention.support,
+                "cantons": [list(canton) for canton in step.cantons],
+                "supports": step.supports.tolist(),
+                "T_before_dan": rounded(step.tension_before_dan),
+                "T_after_dan": rounded(step.tension_after_dan),
+                "V_before_dan": rounded(step.V_before),
+                "H_before_dan": rounded(step.H_before),
+                "L_before_dan": rounded(step.L_before),
+                "V_after_dan": rounded(step.V_after),
+                "H_after_dan": rounded(step.H_after),
+                "L_after_dan": rounded(step.L_after)
+            }
+            for step in steps
+        ]
+    }
+
+
+@api.post("/calc/vhl")
+def calc_vhl(payload: VHLInput):
+    """
+    Calcule l'effort résultant sur un support (VHL)
+    
+    Retourne:
+        - R: effort résultant (daN)
+    """
+    try:
+        R = MechanicalCalculator.calculate_vhl_effort(
+            payload.H_dan,
+            payload.L_dan
+        )
+        
+        return {
+            "success": True,
+            "input": payload.dict(),
+            "result": {
+                "R_dan": round(R)
+            }
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.get("/calc/cigre-emissivity")
+def calc_cigre_emissivity(age_years: float = 10.0):
+    """
+    Calcule l'émissivité selon CIGRE
+    
+    Paramètres:
+        - age_years: âge du câble (années)
+    
+    Retourne:
+        - epsilon: émissivité
+    """
+    try:
+        epsilon = MechanicalCalculator.calculate_cable_temperature_cigre(age_years)
+        
+        return {
+            "success": True,
+            "input": {"age_years": age_years},
+            "result": {
+                "epsilon": round(epsilon, 3)
+            }
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.post("/calc/thermal")
+def calc_thermal(payload: ThermalInput):
+    """
+    Bilan thermique CIGRE en régime permanent sur une série météo
+
+    Fournir soit current_A (température du conducteur), soit
+    max_temperature_C (intensité admissible).
+
+    Retourne:
+        - temperature_C ou ampacity_A par échantillon, et leurs extrêmes
+    """
+    if (payload.current_A is None) == (payload.max_temperature_C is None):
+        raise ValidationError("Fournir soit current_A, soit max_temperature_C")
+    n = len(payload.ambient_C)
+    if len(payload.wind_speed_m_s) != n or len(payload.irradiance_W_m2) != n:
+        raise ValidationError(
+            "Les séries météo doivent avoir la même longueur",
+            {"ambient_C": n, "wind_speed_m_s": len(payload.wind_speed_m_s),
+             "irradiance_W_m2": len(payload.irradiance_W_m2)}
+        )
+    if n > MAX_THERMAL_SAMPLES:
+        raise ValidationError(
+            f"Trop d'échantillons ({n} > {MAX_THERMAL_SAMPLES})",
+            {"samples": n, "max_samples": MAX_THERMAL_SAMPLES}
+        )
+    if payload.cable_name not in THERMAL_CONDUCTORS:
+        raise HTTPException(status_code=404, detail="Câble inconnu du catalogue ou sans résistance linéique")
+
+    epsilon = MechanicalCalculator.calculate_cable_temperature_cigre(payload.age_years)
+    conductor = replace(THERMAL_CONDUCTORS[payload.cable_name], emissivity=epsilon, absorptivity=epsilon)
+    weather = dict(
+        ambient_C=np.asarray(payload.ambient_C),
+        wind_speed_m_s=np.asarray(payload.wind_speed_m_s),
+        irradiance_W_m2=np.asarray(payload.irradiance_W_m2),
+        wind_angle_deg=payload.wind_angle_deg,
+        altitude_m=payload.altitude_m
+    )
+    logger.info(f"Bilan thermique CIGRE: {payload.cable_name}, {n} échantillons")
+
+    if payload.current_A is not None:
+        values = CIGREThermalSolver.temperature(conductor, payload.current_A, **weather)
+        key, digits = "temperature_C", 2
+    else:
+        values = CIGREThermalSolver.ampacity(conductor, payload.max_temperature_C, **weather)
+        key, digits = "ampacity_A", 1
+
+    return {
+        "success": True,
+        "cable_name": payload.cable_name,
+        "result": {
+            key: np.round(values, digits).tolist(),
+            "min": round(float(values.min()), digits),
+            "max": round(float(values.max()), digits),
+            "emissivity": round(epsilon, 3)
+        }
+    }
+
+
+@api.post("/calc/thermal/transient")
+def calc_thermal_transient(payload: TransientInput):
+    """
+    Trajectoire de température des conducteurs après des variations de charge
+
+    Chaque scénario est intégré par tranches de pas de temps, en une
+    évaluation du bilan par pas quelle que soit sa durée ; le coût est
+    proportionnel au nombre total de pas, borné par MAX_THERMAL_SAMPLES.
+    Les scénarios sont répartis sur plusieurs processus si workers > 1.
+
+    Retourne par scénario:
+        - temperature_C: température en fin de chaque pas
+        - max_C: température maximale atteinte
+    """
+    total_steps = sum(len(scenario.current_A) for scenario in payload.scenarios)
+    if total_steps > MAX_THERMAL_SAMPLES:
+        raise ValidationError(
+            f"Trop de pas de temps ({total_steps} > {MAX_THERMAL_SAMPLES})",
+            {"steps": total_steps, "max_steps": MAX_THERMAL_SAMPLES}
+        )
+
+    epsilon = MechanicalCalculator.calculate_cable_temperature_cigre(payload.age_years)
+    scenarios = []
+    for scenario in payload.scenarios:
+        if scenario.cable_name not in THERMAL_CONDUCTORS:
+            raise HTTPException(status_code=404, detail=f"Câble inconnu du catalogue: {scenario.cable_name}")
+        n_steps = len(scenario.current_A)
+        for name in ("ambient_C", "wind_speed_m_s", "irradiance_W_m2"):
+            if len(getattr(scenario, name)) not in (1, n_steps):
+                raise ValidationError(
+                    f"{name} doit contenir une valeur ou une par pas",
+                    {"scenario": scenario.name, name: len(getattr(scenario, name)), "steps": n_steps}
+                )
+        scenarios.append(TransientScenario(
+            name=scenario.name,
+            conductor=replace(THERMAL_CONDUCTORS[scenario.cable_name], emissivity=epsilon, absorptivity=epsilon),
+            step_s=payload.step_s,
+            current_A=scenario.current_A,
+            ambient_C=scenario.ambient_C,
+            wind_speed_m_s=scenario.wind_speed_m_s,
+            irradiance_W_m2=scenario.irradiance_W_m2,
+            initial_C=scenario.initial_C,
+            wind_angle_deg=payload.wind_angle_deg,
+            altitude_m=payload.altitude_m
+        ))
+
+    logger.info(
+        f"Régime transitoire: {len(scenarios)} scénarios, {total_steps} pas, {payload.workers} processus"
+    )
+    try:
+        trajectories = TransientThermalModel.run_scenarios(scenarios, payload.workers)
+    except ValueError as e:
+        raise ValidationError(f"Valeur invalide: {str(e)}")
+
+    return {
+        "success": True,
+        "result": [
+            {
+                "name": scenario.name,
+                "temperature_C": np.round(trajectory, 2).tolist(),
+                "max_C": round(float(trajectory.max()), 2)
+            }
+            for scenario, trajectory in zip(scenarios, trajectories)
+        ]
+    }
+
+
+@api.post("/calc/point-load")
+def calc_point_load(payload: PointLoadSpanInput):
+    """
+    Situation particulière : surcharges ponctuelles sur une portée
+
+    Retourne:
+        - scenario (si loads): tension, flèche maximale, flèche et abaissement au droit des charges
+        - danger_curve (si danger_curve): tension, flèche maximale et abaissement
+          au droit de la charge, par intensité (lignes) et par position (colonnes)
+    """
+    if payload.loads is None and payload.danger_curve is None:
+        raise ValidationError("Fournir loads et/ou danger_curve")
+    for load in payload.loads or []:
+        if load.position_m > payload.a_m:
+            raise ValidationError(
+                "Les charges doivent être situées dans la portée",
+                {"position_m": load.position_m, "a_m": payload.a_m}
+            )
+
+    cable = _cable_properties(payload.cable)
+    constants = CableConstants.from_cable(cable)
+    reference = _reference_state(payload.reference, constants)
+    span = dict(a=payload.a_m, h=payload.h_m, constants=constants, reference=reference,
+                temperature_C=payload.temperature_C)
+    response = {"success": True}
+
+    if payload.loads is not None:
+        result = PointLoadSolver.solve(
+            **span,
+            positions_m=[load.position_m for load in payload.loads],
+            loads_dan=[load.load_dan for load in payload.loads]
+        )
+        response["scenario"] = {
+            "T_dan": round(float(result.tension_dan)),
+            "T_unloaded_dan": round(float(result.unloaded_tension_dan)),
+            "max_sag_m": round(float(result.max_sag_m), 2),
+            "max_sag_x_m": round(float(result.max_sag_x_m), 2),
+            "sag_at_load_m": np.round(result.sag_at_load_m, 2).tolist(),
+            "drop_m": np.round(result.drop_m, 2).tolist()
+        }
+
+    if payload.danger_curve is not None:
+        curve = payload.danger_curve
+        n_points = len(curve.loads_dan) * curve.n_positions
+        if n_points > MAX_DANGER_CURVE_POINTS:
+            raise ValidationError(
+                f"Courbe de danger trop fine ({n_points} > {MAX_DANGER_CURVE_POINTS})",
+                {"points": n_points, "max_points": MAX_DANGER_CURVE_POINTS}
+            )
+        positions = np.linspace(0.0, payload.a_m, curve.n_positions)
+        try:
+            result = PointLoadSolver.solve(
+                **span,
+                positions_m=positions[:, None],
+                loads_dan=np.asarray(curve.loads_dan, dtype=np.float64)[:, None, None]
+            )
+        except ValueError as e:
+            raise ValidationError(f"Valeur invalide: {str(e)}")
+        logger.info(f"Courbe de danger: {len(curve.loads_dan)} intensités × {curve.n_positions} positions")
+        response["danger_curve"] = {
+            "positions_m": np.round(positions, 2).tolist(),
+            "loads_dan": curve.loads_dan,
+            "T_dan": np.rint(result.tension_dan).astype(int).tolist(),
+            "max_sag_m": np.round(result.max_sag_m, 2).tolist(),
+            "drop_m": np.round(result.drop_m[..., 0], 2).tolist()
+        }
+
+    return response
+
+
+@api.post("/calc/validate-domain")
+def validate_domain(
+    a1_m: float = Query(..., gt=0, description="Plus grande portée (m)"),
+    a2_m: float = Query(..., gt=0, description="Plus petite portée (m)"),
+    h_max_m: float = Query(..., ge=0, description="Dénivelé max canton (m)")
+):
+    """
+    Valide le domaine d'application mécanique CELESTE
+    
+    Retourne:
+        - valid: booléen
+        - errors: liste des erreurs
+    """
+    try:
+        errors = MechanicalCalculator.validate_celeste_domain(a1_m, a2_m, h_max_m)
+        
+        return {
+            "success": True,
+            "input": {
+                "a1_m": a1_m,
+                "a2_m": a2_m,
+                "h_max_m": h_max_m
+            },
+            "result": {
+                "valid": len(errors) == 0,
+                "errors": errors
+            }
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.post("/calc/validate-domain/bulk")
+def validate_domain_bulk(payload: BulkDomainInput):
+    """
+    Valide le domaine CELESTE de tous les cantons en une requête
+
+    Retourne, en colonnes:
+        - valid: 1 si le canton est dans le domaine, 0 sinon
+        - span_ratio, h_ratio, limit: a1/a2, h_max/a2 et limite applicable
+        - summary: nombre de cantons hors domaine et histogramme du taux
+          d'utilisation (h_max/a2) / limite (borne inférieure de chaque
+          classe, la dernière classe est ouverte)
+
+    Valeurs non finies, a2 ≤ 0, h_max < 0 ou a1 < a2 : erreur 422.
+    """
+    columns = (payload.a1_m, payload.a2_m, payload.h_max_m)
+    spans = (payload.spans_m, payload.delta_h_m, payload.canton_sizes)
+    if all(c is not None for c in columns) and all(c is None for c in spans):
+        if not len(payload.a1_m) == len(payload.a2_m) == len(payload.h_max_m):
+            raise ValidationError(
+                "a1_m, a2_m et h_max_m doivent avoir la même longueur",
+                {"a1_m": len(payload.a1_m), "a2_m": len(payload.a2_m), "h_max_m": len(payload.h_max_m)}
+            )
+        a1, a2, h_max = (np.asarray(c, dtype=np.float64) for c in columns)
+    elif all(c is not None for c in spans) and all(c is None for c in columns):
+        try:
+            a1, a2, h_max = canton_extremes(payload.spans_m, payload.delta_h_m, payload.canton_sizes)
+        except ValueError as e:
+            raise ValidationError(f"Valeur invalide: {str(e)}")
+    else:
+        raise ValidationError("Fournir soit a1_m/a2_m/h_max_m, soit spans_m/delta_h_m/canton_sizes")
+
+    if a1.size == 0:
+        raise ValidationError("Au moins un canton est nécessaire")
+    if a1.size > MAX_DOMAIN_CANTONS:
+        raise ValidationError(
+            f"Trop de cantons ({a1.size} > {MAX_DOMAIN_CANTONS})",
+            {"cantons": int(a1.size), "max_cantons": MAX_DOMAIN_CANTONS}
+        )
+
+    checks = (
+        (~(np.isfinite(a1) & np.isfinite(a2) & np.isfinite(h_max)), "Valeurs non finies"),
+        (a2 <= 0, "a2_m doit être strictement positive"),
+        (h_max < 0, "h_max_m doit être positif ou nul"),
+        (a1 < a2, "a1_m doit être supérieure ou égale à a2_m"),
+    )
+    for invalid, message in checks:
+        if invalid.any():
+            cantons = np.flatnonzero(invalid)
+            raise ValidationError(
+                message,
+                {"cantons": cantons[:20].tolist(), "count": int(cantons.size)}
+            )
+
+    validation = validate_domains(a1, a2, h_max)
+    edges, counts = validation.histogram()
+    n_invalid = int(np.count_nonzero(~validation.valid))
+    logger.info(f"Validation du domaine CELESTE: {len(validation)} cantons, {n_invalid} hors domaine")
+
+    return {
+        "success": True,
+        "result": {
+            "valid": validation.valid.astype(np.uint8).tolist(),
+            "span_ratio": np.round(validation.span_ratio, 3).tolist(),
+            "h_ratio": np.round(validation.h_ratio, 3).tolist(),
+            "limit": validation.limit.tolist()
+        },
+        "summary": {
+            "cantons": len(validation),
+            "invalid": n_invalid,
+            "max_utilisation": round(float(validation.utilisation.max()), 3),
+            "histogram": {
+                "lower_bounds": [round(float(e), 2) for e in edges[:-1]],
+                "counts": counts.tolist()
+            }
+        }
+    }
+
+
 @api.post("/auth/login", response_model=TokenResponse)
 def login(credentials: LoginRequest):
     """
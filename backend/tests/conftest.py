@@ -0,0 +1,33 @@
+"""
+Fixtures partagées par les tests unitaires
+"""
+import pytest
+from backend.domain.mechanical import CableProperties
+
+
+@pytest.fixture
+def cable_aster570():
+    """Câble Aster 570 pour les tests"""
+    return CableProperties(
+        name="Aster 570",
+        mass_lin_kg_per_m=1.631,
+        E_MPa=78000,
+        section_mm2=564.6,
+        alpha_1e6_per_C=19.1,
+        rupture_dan=17200,
+        diameter_mm=31.5
+    )
+
+
+@pytest.fixture
+def cable_phlox228():
+    """Câble Phlox 228 pour les tests"""
+    return CableProperties(
+        name="Phlox 228",
+        mass_lin_kg_per_m=0.776,
+        E_MPa=74000,
+        section_mm2=228.0,
+        alpha_1e6_per_C=18.0,
+        rupture_dan=7200,
+        diameter_mm=19.6
+    )
@@ -0,0 +1,548 @@
+"""
+Tests des routes de calcul de l'API
+"""
+import asyncio
+import atexit
+import io
+import json
+import os
+import shutil
+import tempfile
+
+# Base, balayages et tables de pose hors du dépôt, fixés avant l'import de l'application
+_DATA_DIR = tempfile.mkdtemp(prefix="celestex-tests-")
+atexit.register(shutil.rmtree, _DATA_DIR, ignore_errors=True)
+os.environ.setdefault("CELESTEX_DB_PATH", os.path.join(_DATA_DIR, "celestex.db"))
+os.environ.setdefault("CELESTEX_SWEEP_DIR", os.path.join(_DATA_DIR, "sweeps"))
+os.environ.setdefault("CELESTEX_STRINGING_DIR", os.path.join(_DATA_DIR, "stringing"))
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+
+ASTER = {
+    "name": "Aster 570",
+    "mass_lin_kg_per_m": 1.631,
+    "E_MPa": 78000,
+    "section_mm2": 564.6,
+    "alpha_1e6_per_C": 19.1,
+    "rupture_dan": 17200,
+    "diameter_mm": 31.5
+}
+
+
+@pytest.fixture
+def client():
+    """Client HTTP de l'application"""
+    return TestClient(main.app)
+
+
+def _span(span_length_m=400.0, cable_id="aster"):
+    return {"span_length_m": span_length_m, "delta_h_m": 10.0, "cable_id": cable_id, "rho_m": 1500.0}
+
+
+def _ndjson(*objects) -> bytes:
+    return "".join(json.dumps(obj) + "\n" for obj in objects).encode("utf-8")
+
+
+def test_spans_batch_ndjson(client):
+    """Une ligne de résultat par portée, dans l'ordre"""
+    body = _ndjson({"cables": {"aster": ASTER}, "chunk_size": 2}, *[_span(300.0 + 10 * i) for i in range(5)])
+    response = client.post("/api/calc/spans/batch/ndjson", content=body)
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == list(range(5))
+    assert all(line["cable_id"] == "aster" for line in lines)
+
+
+def test_spans_batch_ndjson_invalid_header(client):
+    """Première ligne invalide : 422 avant tout résultat"""
+    body = _ndjson({"cables": {}}, _span())
+    response = client.post("/api/calc/spans/batch/ndjson", content=body)
+
+    assert response.status_code == 422
+    assert response.json()["message"] == "Ligne 1 invalide"
+
+
+def test_spans_batch_ndjson_invalid_span_ends_stream(client):
+    """Portée invalide après des résultats : le flux se termine par une ligne d'erreur"""
+    body = _ndjson({"cables": {"aster": ASTER}, "chunk_size": 1}, _span(), _span(cable_id="absent"), _span())
+    response = client.post("/api/calc/spans/batch/ndjson", content=body)
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["index"] == 0
+    assert lines[-1]["message"] == "Câble référencé mais non défini"
+    assert lines[-1]["details"] == {"line": 3, "cable_id": "absent"}
+    assert len(lines) == 2
+
+
+def test_spans_batch_ndjson_results_precede_end_of_body():
+    """Le premier bloc est envoyé avant que le client ait fini d'envoyer le corps"""
+    head = _ndjson({"cables": {"aster": ASTER}, "chunk_size": 2}, _span(), _span())
+    tail = _ndjson(_span(), _span())
+
+    async def exchange():
+        first_result = asyncio.Event()
+        messages = [
+            {"type": "http.request", "body": head, "more_body": True},
+            {"type": "http.request", "body": tail, "more_body": False},
+        ]
+        sent = []
+
+        async def receive():
+            if len(messages) == 1:
+                await asyncio.wait_for(first_result.wait(), timeout=10)
+            return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body" and message.get("body"):
+                first_result.set()
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+            "scheme": "http", "path": "/api/calc/spans/batch/ndjson", "raw_path": b"/api/calc/spans/batch/ndjson",
+            "root_path": "", "query_string": b"", "headers": [(b"content-type", b"application/x-ndjson")],
+            "client": ("test", 1), "server": ("test", 80)
+        }
+        await main.app(scope, receive, send)
+        return sent
+
+    sent = asyncio.run(exchange())
+    body = b"".join(message.get("body", b"") for message in sent if message["type"] == "http.response.body")
+    assert sent[0]["status"] == 200
+    assert [json.loads(line)["index"] for line in body.splitlines()] == [0, 1, 2, 3]
+
+
+def test_validate_domain_bulk(client):
+    """Verdict par canton et histogramme du taux d'utilisation"""
+    response = client.post(
+        "/api/calc/validate-domain/bulk",
+        json={"a1_m": [200, 400, 300], "a2_m": [100, 100, 100], "h_max_m": [40, 30, 90]}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["result"]["valid"] == [1, 1, 0]
+    histogram = body["summary"]["histogram"]
+    assert len(histogram["lower_bounds"]) == len(histogram["counts"])
+    assert sum(histogram["counts"]) == 3
+
+
+@pytest.mark.parametrize("columns", [
+    {"a1_m": [-100], "a2_m": [-50], "h_max_m": [-500]},
+    {"a1_m": [200], "a2_m": [0], "h_max_m": [10]},
+    {"a1_m": [200], "a2_m": [100], "h_max_m": [-1]},
+    {"a1_m": [100], "a2_m": [200], "h_max_m": [10]},
+])
+def test_validate_domain_bulk_rejects_invalid_cantons(client, columns):
+    """a2 ≤ 0, h_max < 0 ou a1 < a2 : 422 et non un verdict"""
+    response = client.post("/api/calc/validate-domain/bulk", json=columns)
+    assert response.status_code == 422
+    assert response.json()["details"]["cantons"] == [0]
+
+
+def test_stringing_tables_too_large(client, monkeypatch):
+    """Portées × températures au-delà de la limite : 422 sans calcul"""
+    monkeypatch.setattr(main, "MAX_STRINGING_CELLS", 10)
+    response = client.post("/api/calc/stringing-tables", json={
+        "cable": ASTER,
+        "cantons": [{"spans_m": [300, 350, 400], "delta_h_m": [0, 5, -5]}],
+        "reference": {"temperature_C": 15, "tension_dan": 2500},
+        "temperatures_C": [-10, 0, 10, 20]
+    })
+    assert response.status_code == 422
+    assert response.json()["details"] == {"cells": 12, "max_cells": 10}
+
+
+@pytest.fixture
+def sweeps(monkeypatch, tmp_path):
+    """Balayages écrits dans un répertoire temporaire"""
+    monkeypatch.setattr(main, "SWEEP_DIR", tmp_path / "sweeps")
+    monkeypatch.setattr(main, "sweep_jobs", {})
+    return tmp_path / "sweeps"
+
+
+SWEEP = {
+    "cable": ASTER,
+    "spans_m": [300, 400],
+    "delta_h_m": [0, 10],
+    "rho_m": {"start": 1000, "stop": 2000, "num": 3},
+    "temperature_C": {"values": [-5, 15, 40]},
+    "wind_pressure_daPa": {"values": [0]},
+    "columns": ["T0_dan", "F1_m"]
+}
+
+
+def test_sweep_lifecycle(client, sweeps):
+    """Balayage lancé, terminé, colonne téléchargée puis supprimée"""
+    response = client.post("/api/calc/sweeps", json=SWEEP)
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    state = client.get(f"/api/calc/sweeps/{job_id}").json()
+    assert state["status"] == "done"
+    column = client.get(f"/api/calc/sweeps/{job_id}/columns/F1_m")
+    assert column.status_code == 200
+    assert np.load(io.BytesIO(column.content)).shape == (3 * 3 * 2,)
+
+    assert client.delete(f"/api/calc/sweeps/{job_id}").status_code == 200
+    assert not (sweeps / job_id).exists()
+    assert client.get(f"/api/calc/sweeps/{job_id}").status_code == 404
+    assert client.delete(f"/api/calc/sweeps/{job_id}").status_code == 404
+
+
+def test_sweep_retention(client, sweeps, monkeypatch):
+    """Au-delà de MAX_SWEEP_JOBS, le balayage terminé le plus ancien est supprimé"""
+    monkeypatch.setattr(main, "MAX_SWEEP_JOBS", 2)
+    jobs = []
+    for _ in range(3):
+        jobs.append(client.post("/api/calc/sweeps", json=SWEEP).json()["job_id"])
+        os.utime(sweeps / jobs[-1], (len(jobs), len(jobs)))
+
+    assert sorted(path.name for path in sweeps.iterdir()) == sorted(jobs[1:])
+    assert set(main.sweep_jobs) == set(jobs[1:])
+    assert client.get(f"/api/calc/sweeps/{jobs[0]}").status_code == 404
+
+
+def test_sweep_invalid_inputs(client, sweeps):
+    """Colonne inconnue ou axe incomplet : 422"""
+    assert client.post("/api/calc/sweeps", json={**SWEEP, "columns": ["X"]}).status_code == 422
+    assert client.post("/api/calc/sweeps", json={**SWEEP, "rho_m": {"start": 1000}}).status_code == 422
+    assert client.get("/api/calc/sweeps/inconnu").status_code == 404
+    assert client.get("/api/calc/sweeps/inconnu/columns/X").status_code == 404
+
+
+LINE = {
+    "cable": ASTER,
+    "cantons": [{"spans_m": [300, 400, 350], "delta_h_m": [0, 10, -5]}, {"spans_m": [450, 380], "delta_h_m": [5, 0]}],
+    "reference": {"temperature_C": 15, "tension_dan": 2500},
+}
+
+
+def test_spans_batch(client):
+    """Corps JSON : une ligne NDJSON par portée"""
+    response = client.post("/api/calc/spans/batch", json={"cables": {"aster": ASTER}, "spans": [_span(), _span(300.0)]})
+    assert response.status_code == 200
+    assert [json.loads(line)["index"] for line in response.text.splitlines()] == [0, 1]
+
+
+def test_spans_batch_unknown_cable(client):
+    """Portée référençant un câble non défini : 422"""
+    response = client.post("/api/calc/spans/batch", json={"cables": {"aster": ASTER}, "spans": [_span(cable_id="x")]})
+    assert response.status_code == 422
+
+
+def test_solve_rho(client):
+    """ρ retrouvé à partir de T0 = ρ·p"""
+    response = client.post("/api/calc/solve-rho", json={
+        "cable": ASTER, "target": "T0", "target_values": [2000.0], "spans_m": [400], "delta_h_m": [0]
+    })
+    assert response.status_code == 200
+    assert response.json()["result"]["rho_m"][0] == pytest.approx(2000 / (1.631 * 0.981), abs=1e-3)
+
+
+def test_solve_rho_mismatched_columns(client):
+    """Colonnes de longueurs différentes : 422"""
+    response = client.post("/api/calc/solve-rho", json={
+        "cable": ASTER, "target": "T0", "target_values": [2000.0, 2100.0], "spans_m": [400], "delta_h_m": [0]
+    })
+    assert response.status_code == 422
+
+
+def test_state_change(client):
+    """Grille températures × vents, tension de référence retrouvée à l'état de référence"""
+    response = client.post("/api/calc/state-change", json={
+        "cable": ASTER, "ruling_span_m": 400, "reference": LINE["reference"],
+        "temperatures_C": [15, 40], "wind_pressures_daPa": [0, 36]
+    })
+    assert response.status_code == 200
+    tension = response.json()["result"]["tension_dan"]
+    assert tension[0][0] == pytest.approx(2500, abs=1)
+    assert tension[1][0] < tension[0][0] < tension[0][1]
+
+
+def test_state_change_ambiguous_reference(client):
+    """État de référence avec T0 et ρ : 422"""
+    response = client.post("/api/calc/state-change", json={
+        "cable": ASTER, "ruling_span_m": 400, "reference": {"tension_dan": 2500, "rho_m": 1500},
+        "temperatures_C": [15]
+    })
+    assert response.status_code == 422
+
+
+def test_cantons(client):
+    """Un résultat par canton"""
+    response = client.post("/api/calc/cantons", json={**LINE, "temperature_C": 40})
+    assert response.status_code == 200
+    assert len(response.json()["result"]["cantons"]) == 2
+
+
+def test_cantons_mismatched_spans(client):
+    """Portées et dénivelés de longueurs différentes : 422"""
+    line = {**LINE, "cantons": [{"spans_m": [300, 400], "delta_h_m": [0]}]}
+    assert client.post("/api/calc/cantons", json={**line, "temperature_C": 40}).status_code == 422
+
+
+def test_lengths(client):
+    """Longueurs par canton et nombre de tourets"""
+    response = client.post("/api/calc/lengths", json={**LINE, "temperature_C": 15, "drum_length_m": 1000})
+    assert response.status_code == 200
+    cantons = response.json()["result"]["cantons"]
+    assert len(cantons) == 2
+    assert cantons[0]["length_m"] > 1050
+
+
+def test_lengths_invalid_drum(client):
+    """Longueur de touret nulle : 422"""
+    response = client.post("/api/calc/lengths", json={**LINE, "temperature_C": 15, "drum_length_m": 0})
+    assert response.status_code == 422
+
+
+@pytest.fixture
+def stringing(monkeypatch, tmp_path):
+    """Cache des tables de pose dans un répertoire temporaire"""
+    cache = main.StringingTableCache(tmp_path / "stringing")
+    monkeypatch.setattr(main, "stringing_cache", cache)
+    return cache
+
+
+def test_stringing_tables_cached_and_exported(client, stringing):
+    """Table calculée, relue par son empreinte, statistiques du cache"""
+    response = client.post("/api/calc/stringing-tables", json={**LINE, "temperatures_C": [-10, 15, 40]})
+    assert response.status_code == 200
+    key = response.json()["result"]["key"]
+
+    csv = client.get(f"/api/calc/stringing-tables/{key}", params={"format": "csv"})
+    assert csv.status_code == 200
+    assert len(csv.text.strip().splitlines()) == 1 + 5 * 3
+
+    stats = client.get("/api/calc/stringing-tables/cache/stats").json()["cache"]
+    assert stats["tables"] == 1 and stats["misses"] == 1
+
+
+def test_stringing_tables_invalid(client, stringing):
+    """Format inconnu : 422 ; empreinte inconnue : 404"""
+    response = client.post("/api/calc/stringing-tables", json={**LINE, "temperatures_C": [15], "format": "xml"})
+    assert response.status_code == 422
+    assert client.get("/api/calc/stringing-tables/abc123").status_code == 404
+    assert client.get("/api/calc/stringing-tables/invalide!").status_code == 404
+
+
+MONTE_CARLO = {
+    "cable": ASTER,
+    "spans_m": [300, 400],
+    "delta_h_m": [0, 10],
+    "reference": {"temperature_C": 15, "tension_dan": 2500},
+    "temperature_C": 40,
+    "tolerances": {"span_m": 0.5, "mass_rel": 0.01},
+    "n_samples": 500,
+}
+
+
+def test_monte_carlo(client):
+    """Statistiques de T0, dispersion non nulle"""
+    response = client.post("/api/calc/monte-carlo", json=MONTE_CARLO)
+    assert response.status_code == 200
+    assert response.json()["result"]["quantities"]["T0_dan"]["std"][0] > 0
+
+
+def test_monte_carlo_invalid(client):
+    """Colonnes de longueurs différentes, nombre de tirages trop faible : 422"""
+    assert client.post("/api/calc/monte-carlo", json={**MONTE_CARLO, "delta_h_m": [0]}).status_code == 422
+    assert client.post("/api/calc/monte-carlo", json={**MONTE_CARLO, "n_samples": 1}).status_code == 422
+
+
+PROFILE = {"spans_m": [300, 400], "delta_h_m": [0, 10], "rho_m": [1500], "start_altitude_m": 30}
+
+
+def test_profile(client):
+    """Profil échantillonné selon la largeur d'affichage"""
+    response = client.post("/api/calc/profile", json={**PROFILE, "pixel_width": 200})
+    assert response.status_code == 200
+    result = response.json()["result"]
+    assert 0 < result["points"] == len(result["station_m"])
+
+
+def test_profile_invalid(client):
+    """ρ ni unique ni par portée : 422"""
+    response = client.post("/api/calc/profile", json={**PROFILE, "rho_m": [1500, 1600, 1700], "pixel_width": 200})
+    assert response.status_code == 422
+
+
+def test_geometry(client):
+    """Tampons binaires précédés de la longueur de l'en-tête JSON"""
+    response = client.post("/api/calc/geometry", json={**PROFILE, "phase_offsets_m": [-3, 0, 3]})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+    header_length = int.from_bytes(response.content[:4], "little")
+    assert json.loads(response.content[4:4 + header_length])
+
+
+def test_geometry_too_detailed(client, monkeypatch):
+    """Nombre de points au-delà de la limite : 422"""
+    monkeypatch.setattr(main, "MAX_PROFILE_POINTS", 100)
+    assert client.post("/api/calc/geometry", json=PROFILE).status_code == 422
+
+
+CORRIDOR = {
+    **PROFILE,
+    "ground_stations_m": [0, 700],
+    "ground_altitudes_m": [0, 0],
+    "conductor_offset_m": 3,
+    "safety_at_m": 5,
+    "safety_dt_m": 2,
+    "safety_vertical_m": 4,
+}
+
+
+def test_corridor(client):
+    """Demi-largeurs et hauteur de tranchée par portée"""
+    response = client.post("/api/calc/corridor", json={**CORRIDOR, "cable": ASTER, "wind_pressure_daPa": 36})
+    assert response.status_code == 200
+
+
+def test_corridor_wind_requires_cable(client):
+    """Déport au vent sans câble : 422"""
+    assert client.post("/api/calc/corridor", json={**CORRIDOR, "wind_pressure_daPa": 36}).status_code == 422
+
+
+def test_span_cache_stats_and_clear(client):
+    """Statistiques puis vidage du cache des portées"""
+    stats = client.get("/api/calc/cache/stats")
+    assert stats.status_code == 200
+    assert "hit_rate" in stats.json()["cache"]
+    cleared = client.delete("/api/calc/cache", params={"cable_name": "Aster 570"})
+    assert cleared.status_code == 200
+    assert cleared.json()["removed"] == 0
+
+
+def test_equivalent_span_by_canton(client):
+    """a_eq de la ligne et de chaque canton ; découpage incohérent : 422"""
+    response = client.post("/api/calc/equivalent-span", json={"spans_m": [300, 400, 500], "canton_sizes": [1, 2]})
+    assert response.status_code == 200
+    assert response.json()["result"]["cantons"][0]["a_eq_m"] == 300
+    response = client.post("/api/calc/equivalent-span", json={"spans_m": [300, 400, 500], "canton_sizes": [1, 1]})
+    assert response.status_code == 422
+
+
+def test_crr_catalog(client):
+    """Table CRR d'un câble du catalogue, CR pour la couche extérieure, CRR par couche"""
+    table = client.get("/api/calc/crr/catalog", params={"cable_name": "ASTER570"})
+    assert table.status_code == 200
+    layers = table.json()["result"]["layers"]
+
+    outer = client.get("/api/calc/crr/catalog/outer-layer", params={"broken": 1})
+    assert outer.status_code == 200
+    assert "ASTER570" in outer.json()["result"]
+
+    response = client.post("/api/calc/crr/catalog", json={
+        "cable_name": "ASTER570", "damage": [{"layer": layers[-1]["layer"], "broken": 1}]
+    })
+    assert response.status_code == 200
+    assert response.json()["result"]["CRR_dan"] < table.json()["result"]["CRA_dan"]
+
+
+def test_crr_catalog_invalid(client):
+    """Câble inconnu : 404 ; nombre de brins négatif : 422"""
+    assert client.get("/api/calc/crr/catalog", params={"cable_name": "inconnu"}).status_code == 404
+    assert client.get("/api/calc/crr/catalog/outer-layer", params={"broken": -1}).status_code == 422
+    response = client.post("/api/calc/crr/catalog", json={"cable_name": "ASTER570", "damage": [{"layer": 1, "broken": -1}]})
+    assert response.status_code == 422
+
+
+VHL = {**LINE, "angles_grade": [0, 10, 0, 5, 0, 0]}
+
+
+def test_vhl_matrix(client):
+    """Une ligne par support, une colonne par cas de charge"""
+    response = client.post("/api/calc/vhl/matrix", json={
+        **VHL, "cases": [{"name": "ref", "temperature_C": 15}, {"name": "vent", "temperature_C": 15, "wind_pressure_daPa": 57}]
+    })
+    assert response.status_code == 200
+
+
+def test_vhl_matrix_invalid_angles(client):
+    """Nombre d'angles différent du nombre de supports : 422"""
+    response = client.post("/api/calc/vhl/matrix", json={
+        **VHL, "angles_grade": [0, 0], "cases": [{"name": "ref", "temperature_C": 15}]
+    })
+    assert response.status_code == 422
+
+
+def test_interventions(client):
+    """Un état par intervention"""
+    response = client.post("/api/calc/interventions", json={
+        **VHL, "case": {"name": "pose", "temperature_C": 15},
+        "interventions": [{"kind": "lower", "support": 1, "delta_z_m": -2}, {"kind": "pulley", "support": 3}]
+    })
+    assert response.status_code == 200
+
+
+def test_interventions_unknown_support(client):
+    """Support hors de la ligne : 422"""
+    response = client.post("/api/calc/interventions", json={
+        **VHL, "case": {"name": "pose", "temperature_C": 15},
+        "interventions": [{"kind": "lower", "support": 40, "delta_z_m": -2}]
+    })
+    assert response.status_code == 422
+
+
+THERMAL = {"cable_name": "ASTER570", "ambient_C": [20, 30], "wind_speed_m_s": [0.6, 1.0], "irradiance_W_m2": [900, 500]}
+
+
+def test_thermal(client):
+    """Température du conducteur au-dessus de l'ambiante"""
+    response = client.post("/api/calc/thermal", json={**THERMAL, "current_A": 800})
+    assert response.status_code == 200
+    assert response.json()["result"]["min"] > 20
+
+
+def test_thermal_invalid(client):
+    """Ni intensité ni température maximale : 422 ; câble inconnu : 404"""
+    assert client.post("/api/calc/thermal", json=THERMAL).status_code == 422
+    assert client.post("/api/calc/thermal", json={**THERMAL, "current_A": 800, "cable_name": "x"}).status_code == 404
+
+
+TRANSIENT = {
+    "step_s": 60,
+    "scenarios": [{
+        "name": "échelon", "cable_name": "ASTER570", "current_A": [400] * 5 + [1200] * 30,
+        "ambient_C": [25], "wind_speed_m_s": [0.6], "irradiance_W_m2": [0]
+    }]
+}
+
+
+def test_thermal_transient(client):
+    """La température monte après l'échelon d'intensité"""
+    response = client.post("/api/calc/thermal/transient", json=TRANSIENT)
+    assert response.status_code == 200
+
+
+def test_thermal_transient_invalid(client):
+    """Série de longueur incohérente ou pas trop long : 422"""
+    scenario = {**TRANSIENT["scenarios"][0], "ambient_C": [25, 26]}
+    assert client.post("/api/calc/thermal/transient", json={**TRANSIENT, "scenarios": [scenario]}).status_code == 422
+    assert client.post("/api/calc/thermal/transient", json={**TRANSIENT, "step_s": 10**6}).status_code == 422
+
+
+POINT_LOAD = {"cable": ASTER, "a_m": 400, "reference": {"temperature_C": 15, "tension_dan": 2500}, "temperature_C": 15}
+
+
+def test_point_load(client):
+    """Charge ponctuelle et courbe de danger"""
+    response = client.post("/api/calc/point-load", json={
+        **POINT_LOAD, "loads": [{"position_m": 150, "load_dan": 500}],
+        "danger_curve": {"loads_dan": [100, 500], "n_positions": 11}
+    })
+    assert response.status_code == 200
+
+
+def test_point_load_invalid(client):
+    """Sans charge ni courbe, ou charge hors de la portée : 422"""
+    assert client.post("/api/calc/point-load", json=POINT_LOAD).status_code == 422
+    response = client.post("/api/calc/point-load", json={**POINT_LOAD, "loads": [{"position_m": 450, "load_dan": 500}]})
+    assert response.status_code == 422
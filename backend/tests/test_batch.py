@@ -0,0 +1,134 @@
+"""
+Tests unitaires pour le moteur de calcul vectorisé des portées
+"""
+import numpy as np
+import pytest
+from backend.domain.batch import (
+    BatchSpanCalculator,
+    CableTable,
+    round_half_even
+)
+from backend.domain.mechanical import (
+    MechanicalCalculator,
+    SpanGeometry,
+    SpanWarning,
+    SpanError,
+    render_span_messages
+)
+
+
+# ===== FIXTURES =====
+
+@pytest.fixture
+def cables(cable_aster570, cable_phlox228):
+    """Câbles Aster 570 et Phlox 228 pour les tests"""
+    return [cable_aster570, cable_phlox228]
+
+
+# ===== TESTS ARRONDI =====
+
+def test_round_half_even_matches_python_round():
+    """L'arrondi vectorisé reproduit round(x, 2) de Python"""
+    values = np.round(np.random.default_rng(1).uniform(0, 100, 20000), 3)
+
+    rounded = round_half_even(values, 2)
+
+    assert rounded.tolist() == [round(float(v), 2) for v in values]
+
+
+# ===== TESTS CALCUL EN LOT =====
+
+def test_calculate_spans_bit_compatible_with_scalar(cables):
+    """Les résultats en lot sont identiques au calcul scalaire"""
+    rng = np.random.default_rng(42)
+    n = 2000
+    a = np.round(rng.uniform(50, 1200, n), 1)
+    h = np.round(rng.uniform(-100, 100, n), 1)
+    rho = np.round(rng.uniform(50, 15000, n))
+    cable_index = rng.integers(0, len(cables), n)
+    wind = rng.uniform(0, 60, n)
+    angle = rng.uniform(-30, 30, n)
+
+    batch = BatchSpanCalculator.calculate_spans(a, h, rho, cable_index, cables, wind, angle)
+
+    for i in range(n):
+        result = MechanicalCalculator.calculate_span(
+            geometry=SpanGeometry(a=float(a[i]), h=float(h[i])),
+            cable=cables[cable_index[i]],
+            rho=float(rho[i]),
+            wind_pressure_daPa=float(wind[i]),
+            angle_grade=float(angle[i])
+        )
+        assert (batch.b[i], batch.F1[i], batch.F2[i], batch.H[i]) == (
+            result.b, result.F1, result.F2, result.H
+        )
+        assert (batch.T0[i], batch.TA[i], batch.TB[i]) == (result.T0, result.TA, result.TB)
+        assert bin(int(batch.warnings[i])).count("1") == len(result.warnings)
+        assert bin(int(batch.errors[i])).count("1") == len(result.errors)
+
+
+def test_calculate_spans_warning_codes(cables):
+    """Les codes d'avertissement reflètent les seuils CELESTE"""
+    batch = BatchSpanCalculator.calculate_spans(
+        a=[500, 100, 100],
+        h=[10, 0, 0],
+        rho=[2000, 50, 15000],
+        cable_index=0,
+        cables=cables,
+        wind_pressure_daPa=[50, np.nan, 10],
+        angle_grade=[20, 0, np.nan]
+    )
+
+    assert batch.warnings[0] == SpanWarning.WIND_ABOVE_LIMIT | SpanWarning.ANGLE_ABOVE_LIMIT
+    assert batch.warnings[1] == SpanWarning.RHO_LOW
+    assert batch.warnings[2] == SpanWarning.RHO_HIGH
+
+
+def test_render_span_messages_matches_scalar(cables):
+    """Les messages rendus depuis les codes sont ceux du calcul scalaire"""
+    cable = cables[0]
+    batch = BatchSpanCalculator.calculate_spans(
+        a=[500.0], h=[10.0], rho=[50.0], cable_index=[0], cables=cables,
+        wind_pressure_daPa=[50.0], angle_grade=[20.0]
+    )
+    result = MechanicalCalculator.calculate_span(
+        geometry=SpanGeometry(a=500.0, h=10.0),
+        cable=cable,
+        rho=50.0,
+        wind_pressure_daPa=50.0,
+        angle_grade=20.0
+    )
+
+    warnings, errors = render_span_messages(
+        batch.warnings[0],
+        batch.errors[0],
+        rho=50.0,
+        max_tension=int(max(batch.T0[0], batch.TA[0], batch.TB[0])),
+        rupture_dan=cable.rupture_dan,
+        wind_pressure_daPa=50.0,
+        angle_grade=20.0
+    )
+
+    assert warnings == result.warnings
+    assert errors == result.errors
+
+
+def test_calculate_spans_tension_exceeds_rupture(cables):
+    """Erreur de rupture pour un rho très faible sur une grande portée"""
+    batch = BatchSpanCalculator.calculate_spans(
+        a=[5000], h=[100], rho=[50], cable_index=[0], cables=CableTable.from_cables(cables)
+    )
+
+    assert batch.errors[0] == SpanError.TENSION_ABOVE_RUPTURE
+
+
+def test_calculate_spans_rejects_invalid_rho(cables):
+    """Un rho nul ou négatif est refusé"""
+    with pytest.raises(ValueError):
+        BatchSpanCalculator.calculate_spans(a=[100], h=[0], rho=[0], cable_index=[0], cables=cables)
+
+
+def test_calculate_spans_rejects_unknown_cable(cables):
+    """Un indice de câble hors table est refusé"""
+    with pytest.raises(ValueError):
+        BatchSpanCalculator.calculate_spans(a=[100], h=[0], rho=[2000], cable_index=[5], cables=cables)
@@ -0,0 +1,96 @@
+"""
+Tests unitaires pour le cache des calculs de portée
+"""
+from dataclasses import replace
+
+from backend.domain.cache import SpanCache
+from backend.domain.mechanical import (
+    MechanicalCalculator,
+    SpanGeometry
+)
+
+
+# ===== TESTS =====
+
+def test_cache_matches_direct_calculation(cable_aster570):
+    """Un résultat en cache est identique au calcul direct"""
+    cache = SpanCache(maxsize=8)
+    geometry = SpanGeometry(a=400, h=25)
+
+    direct = MechanicalCalculator.calculate_span(geometry, cable_aster570, 1500.0, 40.0, 18.0)
+    first = cache.calculate_span(geometry, cable_aster570, 1500.0, 40.0, 18.0)
+    second = cache.calculate_span(geometry, cable_aster570, 1500.0, 40.0, 18.0)
+
+    assert first == direct
+    assert second == direct
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_returns_independent_messages(cable_aster570):
+    """Modifier un résultat renvoyé n'altère pas le cache"""
+    cache = SpanCache(maxsize=8)
+    geometry = SpanGeometry(a=400, h=0)
+
+    first = cache.calculate_span(geometry, cable_aster570, 1500.0, 40.0)
+    first.warnings.append("modifié")
+    second = cache.calculate_span(geometry, cable_aster570, 1500.0, 40.0)
+
+    assert "modifié" not in second.warnings
+
+
+def test_cache_distinguishes_inputs(cable_aster570):
+    """Des entrées différentes (même de peu, ou None vs 0) ne partagent pas d'entrée"""
+    cache = SpanCache(maxsize=8)
+    geometry = SpanGeometry(a=400, h=0)
+
+    cache.calculate_span(geometry, cable_aster570, 1500.0)
+    cache.calculate_span(geometry, cable_aster570, 1500.0 + 1e-9)
+    cache.calculate_span(geometry, cable_aster570, 1500.0, 0.0)
+
+    assert cache.stats()["hits"] == 0
+    assert len(cache) == 3
+
+
+def test_cache_lru_eviction(cable_aster570):
+    """L'entrée la moins récemment utilisée est évincée"""
+    cache = SpanCache(maxsize=2)
+    geometry = SpanGeometry(a=300, h=0)
+
+    cache.calculate_span(geometry, cable_aster570, 1000.0)
+    cache.calculate_span(geometry, cable_aster570, 1100.0)
+    cache.calculate_span(geometry, cable_aster570, 1000.0)  # 1000 redevient récent
+    cache.calculate_span(geometry, cable_aster570, 1200.0)  # évince 1100
+    cache.calculate_span(geometry, cable_aster570, 1000.0)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert len(cache) == 2
+
+
+def test_cache_invalidated_when_cable_changes(cable_aster570):
+    """Modifier les propriétés d'un câble purge ses anciennes entrées"""
+    cache = SpanCache(maxsize=8)
+    geometry = SpanGeometry(a=400, h=0)
+    cache.calculate_span(geometry, cable_aster570, 1500.0)
+    cache.calculate_span(geometry, cable_aster570, 1600.0)
+
+    heavier = replace(cable_aster570, mass_lin_kg_per_m=2.0)
+    result = cache.calculate_span(geometry, heavier, 1500.0)
+
+    assert result == MechanicalCalculator.calculate_span(geometry, heavier, 1500.0)
+    assert cache.stats()["invalidations"] == 2
+    assert len(cache) == 1
+    assert cache.invalidate_cable("Aster 570") == 1
+    assert len(cache) == 0
+
+
+def test_disabled_cache_does_not_store(cable_aster570):
+    """Une taille nulle désactive le cache"""
+    cache = SpanCache(maxsize=0)
+    cache.calculate_span(SpanGeometry(a=400, h=0), cable_aster570, 1500.0)
+
+    assert not cache.enabled
+    assert len(cache) == 0
+    assert cache.stats()["misses"] == 0
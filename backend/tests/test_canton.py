@@ -0,0 +1,88 @@
+"""
+Tests unitaires pour le calcul des cantons
+"""
+import numpy as np
+import pytest
+from backend.domain.canton import CantonSolver, canton_starts, equivalent_spans
+from backend.domain.mechanical import (
+    MechanicalCalculator,
+    SpanGeometry
+)
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+
+
+# ===== TESTS PORTÉE ÉQUIVALENTE =====
+
+def test_canton_starts():
+    """Indices de début de canton"""
+    assert canton_starts([3, 1, 2]).tolist() == [0, 3, 4]
+
+
+def test_canton_starts_rejects_empty_canton():
+    """Un canton sans portée est refusé"""
+    with pytest.raises(ValueError):
+        canton_starts([3, 0, 2])
+
+
+def test_equivalent_spans_matches_scalar():
+    """La portée équivalente par canton est celle de calculate_equivalent_span"""
+    cantons = [[400, 500, 450, 380], [300], [250, 600]]
+    a = [span for canton in cantons for span in canton]
+
+    a_eq, K = equivalent_spans(a, canton_starts([len(c) for c in cantons]))
+
+    for i, canton in enumerate(cantons):
+        expected_a_eq, expected_K = MechanicalCalculator.calculate_equivalent_span(canton)
+        assert a_eq[i] == pytest.approx(expected_a_eq, rel=1e-12)
+        assert K[i] == pytest.approx(expected_K, rel=1e-12)
+
+
+# ===== TESTS SOLVEUR DE CANTONS =====
+
+def test_solve_spans_match_calculate_span(cable_aster570):
+    """Les portées d'un canton sont calculées avec le ρ du canton"""
+    a = np.array([400.0, 500.0, 450.0, 300.0])
+    h = np.array([0.0, 10.0, -5.0, 2.0])
+    reference = ReferenceState(temperature_C=15, tension_dan=3000)
+
+    result = CantonSolver.solve(a, h, [3, 1], cable_aster570, reference, temperature_C=40)
+
+    assert result.canton_index.tolist() == [0, 0, 0, 1]
+    for i in range(4):
+        expected = MechanicalCalculator.calculate_span(
+            geometry=SpanGeometry(a=a[i], h=h[i]),
+            cable=cable_aster570,
+            rho=float(result.rho_m[result.canton_index[i]])
+        )
+        assert (result.spans.F1[i], result.spans.TB[i]) == (expected.F1, expected.TB)
+
+
+def test_solve_canton_state_from_ruling_span(cable_aster570):
+    """L'état du canton est celui de sa portée équivalente"""
+    a = np.array([400.0, 500.0, 450.0])
+    reference = ReferenceState(temperature_C=15, tension_dan=3000)
+
+    result = CantonSolver.solve(a, np.zeros(3), [3], cable_aster570, reference, temperature_C=-5)
+
+    expected = StateChangeSolver.solve(
+        CableConstants.from_cable(cable_aster570), result.ruling_span_m[0], reference, -5
+    )
+    assert result.tension_dan[0] == pytest.approx(float(expected.tension_dan))
+
+
+def test_solve_wind_uses_apparent_weight(cable_aster570):
+    """Sous vent, T0 des portées suit la tension du canton"""
+    a = np.array([400.0, 500.0])
+    reference = ReferenceState(temperature_C=15, tension_dan=3000)
+
+    result = CantonSolver.solve(
+        a, np.zeros(2), [2], cable_aster570, reference, temperature_C=-5, wind_pressure_daPa=36
+    )
+
+    assert result.spans.T0 == pytest.approx(np.rint(result.tension_dan[[0, 0]]))
+
+
+def test_solve_rejects_size_mismatch(cable_aster570):
+    """Les tailles de cantons doivent couvrir toutes les portées"""
+    with pytest.raises(ValueError):
+        CantonSolver.solve([400, 500], [0, 0], [3], cable_aster570, ReferenceState(15, 3000), 15)
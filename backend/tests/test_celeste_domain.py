@@ -0,0 +1,50 @@
+"""
+Tests unitaires pour la validation en masse du domaine CELESTE
+"""
+import numpy as np
+import pytest
+from backend.domain.celeste_domain import canton_extremes, validate_domains
+from backend.domain.mechanical import MechanicalCalculator
+
+
+def test_matches_scalar_validation():
+    """Même verdict que validate_celeste_domain, limites comprises"""
+    rng = np.random.default_rng(7)
+    a2 = rng.uniform(50, 400, 2000)
+    a1 = a2 * rng.uniform(1, 5, 2000)
+    h_max = a2 * rng.uniform(0, 1, 2000)
+    # Cas limites : a1/a2 = 3 exactement, h_max/a2 = 0.4 et 0.8 exactement, a2 nul
+    a1 = np.r_[a1, 300, 200, 300, 100]
+    a2 = np.r_[a2, 100, 100, 100, 0]
+    h_max = np.r_[h_max, 40, 80, 41, 10]
+
+    validation = validate_domains(a1, a2, h_max)
+    expected = [
+        len(MechanicalCalculator.validate_celeste_domain(x, y, z)) == 0
+        for x, y, z in zip(a1, a2, h_max)
+    ]
+    assert validation.valid.tolist() == expected
+    assert validation.valid[-4:].tolist() == [True, True, False, True]
+
+
+def test_utilisation_histogram():
+    """Le taux d'utilisation rapporte h_max/a2 à la limite applicable"""
+    validation = validate_domains([200, 400], [100, 100], [40, 30])
+    assert validation.limit.tolist() == [0.8, 0.4]
+    assert validation.utilisation == pytest.approx([0.5, 0.75])
+
+    edges, counts = validation.histogram()
+    assert counts.sum() == 2
+    assert counts[5] == 1 and counts[7] == 1
+    assert edges[-1] == np.inf
+
+
+def test_extremes_from_spans():
+    """a1, a2 et h_max par canton, dénivelés en valeur absolue"""
+    a1, a2, h_max = canton_extremes([300, 100, 400, 200, 250], [10, -90, 5, 0, 30], [2, 3])
+    assert a1.tolist() == [300, 400]
+    assert a2.tolist() == [100, 200]
+    assert h_max.tolist() == [90, 30]
+
+    with pytest.raises(ValueError):
+        canton_extremes([300, 100], [0, 0], [3])
@@ -0,0 +1,104 @@
+"""
+Tests unitaires pour le contrôle des distances aux nuages de points LiDAR
+"""
+import numpy as np
+import pytest
+from backend.domain.clearance import (
+    ClearanceChecker,
+    ConductorEnvelope,
+    PointGridIndex,
+    load_point_cloud
+)
+from backend.domain.profile import sag_at
+
+
+@pytest.fixture
+def envelope():
+    """Ligne de 4 portées, trois conducteurs, balancement de 30°"""
+    return ConductorEnvelope.from_spans(
+        a=[300.0, 400.0, 350.0, 420.0],
+        h=[10.0, -15.0, 5.0, 0.0],
+        rho_max_sag_m=1200.0,
+        start_altitude_m=100.0,
+        rho_wind_m=1500.0,
+        swing_angle_rad=np.radians(30),
+        phase_offsets_m=(-4.0, 0.0, 4.0)
+    )
+
+
+@pytest.fixture
+def cloud():
+    """Végétation aléatoire sous la ligne"""
+    rng = np.random.default_rng(8)
+    n = 50_000
+    x = rng.uniform(-20, 1490, n)
+    return np.column_stack((x, rng.uniform(-30, 30, n), rng.uniform(60, 105, n)))
+
+
+def test_point_below_conductor(envelope):
+    """Point à la verticale du conducteur central : distance à la flèche maximale"""
+    x = 150.0
+    sag = sag_at(x, 300.0, 10.0, 1200.0)
+    chord = 100.0 + 10.0 * x / 300.0
+    distance = envelope.distances(0, np.array([[x, 0.0, chord - sag - 7.0]]))
+    assert distance[0] == pytest.approx(7.0)
+
+
+def test_point_beside_swinging_conductor(envelope):
+    """Point dans le plan du balancement : distance radiale à l'arc de vent"""
+    x = 150.0
+    sag_wind = sag_at(x, 300.0, 10.0, 1500.0)
+    chord = 100.0 + 10.0 * x / 300.0
+    angle = np.radians(20)
+    radius = sag_wind + 3.0
+    point = [x, 4.0 + radius * np.sin(angle), chord - radius * np.cos(angle)]
+    assert envelope.distances(0, np.array([point]))[0] == pytest.approx(3.0)
+
+
+def test_grid_query_covers_span(cloud):
+    """Les cellules interrogées contiennent tous les points de l'intervalle"""
+    index = PointGridIndex.build(cloud, cell_size_m=25.0)
+    start, stop = index.query(300.0, 700.0)
+    x = index.points[start:stop, 0]
+    expected = np.flatnonzero((cloud[:, 0] >= 300.0) & (cloud[:, 0] <= 700.0))
+    assert set(expected) <= set(index.point_index[start:stop].tolist())
+    assert x.min() >= 300.0 - 25.0 and x.max() <= 700.0 + 25.0
+
+
+def test_check_matches_brute_force(envelope, cloud):
+    """Distances minimales et points en défaut identiques à un calcul sans index"""
+    result = ClearanceChecker.check(PointGridIndex.build(cloud, cell_size_m=10.0), envelope, clearance_m=6.0)
+
+    supports = envelope.supports_m
+    for span in range(4):
+        inside = (cloud[:, 0] >= supports[span]) & (
+            cloud[:, 0] < supports[span + 1] if span < 3 else cloud[:, 0] <= supports[-1]
+        )
+        distance = envelope.distances(span, cloud[inside])
+        assert result.min_distance_m[span] == pytest.approx(distance.min())
+        assert result.min_point_index[span] == np.flatnonzero(inside)[np.argmin(distance)]
+        assert result.violations_count[span] == np.count_nonzero(distance < 6.0)
+
+    assert np.all(result.violation_distance_m < 6.0)
+    assert result.points_checked.sum() == np.count_nonzero((cloud[:, 0] >= 0) & (cloud[:, 0] <= supports[-1]))
+
+
+def test_process_pool_matches_serial(envelope, cloud):
+    """Répartition des portées sur plusieurs processus : mêmes résultats"""
+    index = PointGridIndex.build(cloud, max_lateral_m=20.0)
+    serial = ClearanceChecker.check(index, envelope, clearance_m=6.0)
+    pooled = ClearanceChecker.check(index, envelope, clearance_m=6.0, workers=2)
+    assert np.array_equal(serial.min_distance_m, pooled.min_distance_m)
+    assert np.array_equal(serial.violation_point_index, pooled.violation_point_index)
+
+
+def test_load_point_cloud_formats(cloud, tmp_path):
+    """Fichiers .npy et binaires projetés en mémoire, CSV avec en-tête"""
+    points = cloud[:100].astype(np.float32)
+    np.save(tmp_path / "cloud.npy", points)
+    points.tofile(tmp_path / "cloud.bin")
+    np.savetxt(tmp_path / "cloud.csv", points, delimiter=",", header="x,y,z", comments="")
+
+    assert isinstance(load_point_cloud(tmp_path / "cloud.npy"), np.memmap)
+    assert np.array_equal(load_point_cloud(tmp_path / "cloud.bin"), points)
+    assert load_point_cloud(tmp_path / "cloud.csv") == pytest.approx(points)
@@ -0,0 +1,60 @@
+"""
+Tests unitaires pour la tranchée forestière
+"""
+import numpy as np
+import pytest
+from backend.domain.corridor import CorridorCalculator, CorridorParameters, swing_angle
+from backend.domain.profile import ProfileSampler
+
+
+@pytest.fixture
+def parameters():
+    """Distances de tranchée sans vent"""
+    return CorridorParameters(
+        conductor_offset_m=3.0,
+        safety_at_m=5.0,
+        safety_dt_m=2.0,
+        safety_vertical_m=4.0
+    )
+
+
+def test_corridor_without_wind(parameters):
+    """Demi-largeurs constantes et hauteur de tranchée minimale au point bas"""
+    profile = ProfileSampler.sample([400], [0], 1500, start_altitude_m=30, resolution_m=1.0)
+    corridor = CorridorCalculator.compute(profile, parameters, [0, 400], [0, 0])
+    summary = CorridorCalculator.summarize(corridor, profile.span_starts)
+
+    assert np.allclose(corridor.half_width_at_m, 8.0)
+    assert np.allclose(corridor.half_width_dt_m, 5.0)
+    F1 = 400 * 400 / (8 * 1500)
+    assert summary.min_trench_height_m[0] == pytest.approx(30 - F1 - 4)
+    assert summary.min_trench_station_m[0] == pytest.approx(200)
+    assert summary.area_at_m2[0] == pytest.approx(2 * 8 * 400)
+
+
+def test_corridor_wind_widens_at_midspan(parameters, cable_aster570):
+    """Sous vent, le déport élargit la tranchée au milieu de portée"""
+    parameters.swing_angle_rad = swing_angle(cable_aster570, 36)
+    profile = ProfileSampler.sample([300, 400], [0, 0], 1500, start_altitude_m=30)
+    corridor = CorridorCalculator.compute(profile, parameters, [0, 700], [0, 0])
+    summary = CorridorCalculator.summarize(corridor, profile.span_starts)
+
+    assert corridor.half_width_at_m[0] == pytest.approx(8.0)
+    assert summary.max_half_width_at_m[1] > summary.max_half_width_at_m[0] > 8.0
+    # Le conducteur incliné remonte : la tranchée est plus haute qu'à vent nul
+    assert summary.min_trench_height_m[1] > 30 - 400 * 400 / (8 * 1500) - 4
+
+
+def test_corridor_follows_ground(parameters):
+    """La hauteur de tranchée suit le terrain interpolé"""
+    profile = ProfileSampler.sample([200], [0], 2000, start_altitude_m=50, resolution_m=10)
+    corridor = CorridorCalculator.compute(profile, parameters, [0, 200], [0, 20])
+    expected = corridor.conductor_altitude_m - profile.station_m * 0.1 - 4
+    assert np.allclose(corridor.trench_height_m, expected)
+
+
+def test_corridor_rejects_unsorted_ground(parameters):
+    """Abscisses de terrain non croissantes refusées"""
+    profile = ProfileSampler.sample([200], [0], 2000)
+    with pytest.raises(ValueError):
+        CorridorCalculator.compute(profile, parameters, [0, 100, 50], [0, 0, 0])
@@ -0,0 +1,89 @@
+"""
+Tests unitaires pour la CRR calculée à partir du catalogue des couches
+"""
+import math
+
+import numpy as np
+import pytest
+from backend.domain.catalog import decode_xml_name
+from backend.domain.crr import CRR_CATALOG, CRRCatalog
+from backend.domain.mechanical import MechanicalCalculator
+
+
+# ===== FIXTURES =====
+
+@pytest.fixture
+def catalog():
+    """Catalogue réduit : un câble alu-acier, un câble sans données de couche"""
+    cables = [
+        {
+            "Désignation": "TEST/A+C",
+            "Indice": "A",
+            "Charge de Rupture Nominale": "10000",
+            "Rupture de l'acier": "120",
+            "Rupture de l'aluminium": "18"
+        },
+        {"Désignation": "NU", "Indice": "A", "Charge de Rupture Assignée": "5000"},
+    ]
+    layers = [
+        {"Désignation câble": "TEST/A+C", "Indice câble": "A", "N° de la couche": "2",
+         "Nature de la couche": "Aluminium", "Diamètre des brins": "3", "CRA brin": "0", "Nombre de brins": "6"},
+        {"Désignation câble": "TEST/A+C", "Indice câble": "A", "N° de la couche": "1",
+         "Nature de la couche": "Acier", "Diamètre des brins": "2", "CRA brin": "400", "Nombre de brins": "1"},
+    ]
+    return CRRCatalog.from_records(cables, layers)
+
+
+# ===== TESTS =====
+
+def test_decode_xml_name():
+    """Les noms de champs exportés depuis XML sont décodés"""
+    assert decode_xml_name("N_x00B0__x0020_de_x0020_la_x0020_couche") == "N° de la couche"
+
+
+def test_strand_strength_from_catalog(catalog):
+    """CRA brin si renseignée, sinon contrainte × section du brin"""
+    layers = catalog.cable_layers("TEST/A+C")
+
+    assert [layer["layer"] for layer in layers] == [1, 2]
+    assert layers[0]["strand_strength_dan"] == 400
+    assert layers[1]["strand_strength_dan"] == pytest.approx(18 * math.pi * 9 / 4)
+
+
+def test_lookup_matches_calculate_crr(catalog):
+    """La table précalculée reprend la formule de calculate_crr"""
+    strength = 18 * math.pi * 9 / 4
+    for k in range(7):
+        assert catalog.lookup("TEST/A+C", 2, k) == pytest.approx(
+            MechanicalCalculator.calculate_crr(10000, [(k, strength)])
+        )
+
+
+def test_evaluate_several_layers(catalog):
+    """Brins cassés dans plusieurs couches"""
+    CRR, CR = catalog.evaluate("TEST/A+C", {1: 1, 2: 2})
+    assert CRR == pytest.approx(10000 - 400 - 2 * 18 * math.pi * 9 / 4)
+    assert CR == pytest.approx(min(9500, CRR))
+
+
+def test_invalid_scenarios(catalog):
+    """Câble, couche ou nombre de brins invalides"""
+    with pytest.raises(KeyError):
+        catalog.lookup("INCONNU", 1, 0)
+    with pytest.raises(KeyError):
+        catalog.lookup("NU", 1, 0)
+    with pytest.raises(ValueError):
+        catalog.lookup("TEST/A+C", 2, 7)
+
+
+def test_outer_layer_scenario(catalog):
+    """Scénario sur la couche extérieure de tous les câbles à la fois"""
+    cr = catalog.outer_layer_scenario(1)
+    assert cr[0] == pytest.approx(min(9500, 10000 - 18 * math.pi * 9 / 4))
+    assert np.isnan(cr[1])
+
+
+def test_default_catalog_loaded():
+    """Le catalogue du dépôt est chargé et précalculé à l'import"""
+    assert len(CRR_CATALOG) > 0
+    assert CRR_CATALOG.cr_table.size == int((CRR_CATALOG.strands + 1).sum())
@@ -0,0 +1,69 @@
+"""
+Tests unitaires pour les tampons de géométrie 3D
+"""
+import struct
+
+import numpy as np
+import pytest
+from backend.domain.geometry import LineGeometryBuilder, pack_buffers, unpack_buffers
+from backend.domain.profile import ProfileSampler
+
+
+def test_build_matches_profile():
+    """Les sommets reprennent le profil échantillonné, un bloc par conducteur"""
+    geometry = LineGeometryBuilder.build([300, 400], [10, -20], 1500, phase_offsets_m=[-4, 4], resolution_m=5)
+    profile = ProfileSampler.sample([300, 400], [10, -20], 1500, resolution_m=5)
+    n = len(profile)
+
+    assert geometry.catenary_positions.dtype == np.float32
+    assert geometry.catenary_positions.shape == (2 * n, 3)
+    assert np.allclose(geometry.catenary_positions[:n, 2], profile.altitude_m, atol=1e-4)
+    assert np.all(geometry.catenary_positions[n:, 1] == 4)
+    assert geometry.span_offsets.tolist() == [0, 61, n, n + 61, 2 * n]
+    # Pas de segment entre la fin d'une portée et le début de la suivante
+    pairs = geometry.catenary_indices.reshape(-1, 2)
+    assert len(pairs) == 2 * (n - 2)
+    assert not np.any((pairs[:, 0] == 60) & (pairs[:, 1] == 61))
+
+
+def test_low_points_are_curve_minimum():
+    """Le point bas est le minimum de la courbe, ou le support bas si hors portée"""
+    geometry = LineGeometryBuilder.build([400, 200], [10, -60], 1500, resolution_m=0.1)
+    profile = ProfileSampler.sample([400, 200], [10, -60], 1500, resolution_m=0.1)
+
+    first = profile.span_index == 0
+    assert geometry.low_points[0, 2] == pytest.approx(profile.altitude_m[first].min(), abs=1e-3)
+    assert geometry.low_points[1, 0] == pytest.approx(600)
+    assert geometry.low_points[1, 2] == pytest.approx(-50)
+
+
+def test_support_positions():
+    """Pied et sommet de chaque support"""
+    geometry = LineGeometryBuilder.build([300, 400], [10, -20], 1500, support_heights_m=[30, 35, 30])
+    supports = geometry.support_positions
+
+    assert supports.shape == (3, 2, 3)
+    assert supports[1, :, 0].tolist() == [300, 300]
+    assert supports[1, 0, 2] == pytest.approx(-25)
+    assert supports[1, 1, 2] == pytest.approx(10)
+
+
+def test_pack_round_trip_and_alignment():
+    """Les tampons sont alignés sur 4 octets et relus à l'identique"""
+    geometry = LineGeometryBuilder.build([300, 400], [10, -20], 1500, resolution_m=7)
+    data = pack_buffers(geometry.buffers(), {"origin": [0, 0, 100]})
+
+    (header_length,) = struct.unpack_from("<I", data, 0)
+    assert header_length % 4 == 0
+    header, buffers = unpack_buffers(data)
+    assert header["origin"] == [0, 0, 100]
+    for descriptor in header["buffers"]:
+        assert descriptor["offset"] % 4 == 0
+    for name, array in geometry.buffers().items():
+        assert np.array_equal(buffers[name], array)
+
+
+def test_pack_rejects_unsupported_dtype():
+    """Seuls float32 et uint32 sont acceptés"""
+    with pytest.raises(ValueError):
+        pack_buffers({"values": np.zeros(3)})
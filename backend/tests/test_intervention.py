@@ -0,0 +1,123 @@
+"""
+Tests unitaires pour le simulateur d'interventions sur câbles
+"""
+import copy
+
+import numpy as np
+import pytest
+from backend.domain.intervention import Intervention, InterventionKind, InterventionSimulator
+from backend.domain.mechanical import ConductorLengthCalculator
+from backend.domain.state_change import ReferenceState
+from backend.domain.vhl import LoadCase, VHLCalculator
+
+
+@pytest.fixture
+def line():
+    """Ligne de 40 portées en 8 cantons"""
+    rng = np.random.default_rng(11)
+    return {
+        "a": rng.uniform(200, 500, 40),
+        "h": rng.uniform(-20, 20, 40),
+        "canton_sizes": [5] * 8,
+        "angle_grade": rng.uniform(0, 15, 41),
+        "reference": ReferenceState(temperature_C=15, tension_dan=2500),
+        "case": LoadCase("pose", 25, wind_pressure_daPa=10),
+    }
+
+
+def _unstressed_canton_lengths(simulator, cable):
+    """Longueurs à vide des cantons dans l'état courant du simulateur"""
+    s = simulator.state
+    return ConductorLengthCalculator.compute(
+        s.a, s.h, s.tension_dan / simulator.apparent, cable,
+        np.diff(np.flatnonzero(s.anchored)),
+        temperature_C=simulator.case.temperature_C,
+        load_factor=simulator.apparent / simulator.constants.weight_dan_per_m
+    ).canton_unstressed_m
+
+
+def test_initial_state_matches_vhl_matrix(line, cable_aster570):
+    """Avant intervention, les efforts sont ceux de la matrice VHL"""
+    simulator = InterventionSimulator(cable=cable_aster570, **line)
+    full = VHLCalculator.compute(
+        line["a"], line["h"], line["canton_sizes"], line["angle_grade"],
+        cable_aster570, line["reference"], [line["case"]]
+    )
+    assert simulator.state.V == pytest.approx(full.V[:, 0])
+    assert simulator.state.L == pytest.approx(full.L[:, 0])
+
+
+def test_incremental_sequence_matches_full_recompute(line, cable_aster570):
+    """Suite d'interventions appliquées en variations : même état qu'un recalcul complet"""
+    simulator = InterventionSimulator(cable=cable_aster570, **line)
+    steps = simulator.run([
+        Intervention(InterventionKind.LOWER, 7, delta_z_m=-3.0),
+        Intervention(InterventionKind.PULLEY, 10),
+        Intervention(InterventionKind.ANCHOR, 12),
+        Intervention(InterventionKind.LOWER, 10, delta_z_m=-8.0),
+    ])
+    full = copy.deepcopy(simulator)
+    full.recompute()
+
+    assert simulator.state.tension_dan == pytest.approx(full.state.tension_dan)
+    assert simulator.state.V == pytest.approx(full.state.V)
+    assert simulator.state.H == pytest.approx(full.state.H)
+    assert simulator.state.L == pytest.approx(full.state.L, abs=1e-9)
+
+    # Seuls les cantons touchés sont recalculés
+    assert steps[0].cantons == [(5, 10)]
+    assert steps[1].cantons == [(5, 15)]
+    assert steps[2].cantons == [(5, 12), (12, 15)]
+    assert steps[1].supports.tolist() == list(range(5, 16))
+
+
+def test_pulley_equalizes_tension(line, cable_aster570):
+    """Sur poulie, les tensions de part et d'autre de l'ancien ancrage s'égalisent"""
+    simulator = InterventionSimulator(cable=cable_aster570, **line)
+    step = simulator.apply(Intervention(InterventionKind.PULLEY, 5))
+    i = step.supports.tolist().index(5)
+    assert step.tension_before_dan[i, 0] != pytest.approx(step.tension_before_dan[i, 1])
+    assert step.tension_after_dan[i, 0] == pytest.approx(step.tension_after_dan[i, 1])
+
+
+def test_lowering_shifts_vertical_load(line, cable_aster570):
+    """Abaisser un accrochage décharge verticalement le support"""
+    simulator = InterventionSimulator(cable=cable_aster570, **line)
+    step = simulator.apply(Intervention(InterventionKind.LOWER, 3, delta_z_m=-5.0))
+    i = step.supports.tolist().index(3)
+    assert step.V_after[i] < step.V_before[i]
+
+
+def test_lowering_changes_canton_tension(line, cable_aster570):
+    """Abaisser un accrochage modifie la tension du canton, à longueur de câble constante"""
+    simulator = InterventionSimulator(cable=cable_aster570, **line)
+    before = _unstressed_canton_lengths(simulator, cable_aster570)
+    step = simulator.apply(Intervention(InterventionKind.LOWER, 7, delta_z_m=-5.0))
+    after = _unstressed_canton_lengths(simulator, cable_aster570)
+
+    i = step.supports.tolist().index(7)
+    assert abs(step.tension_after_dan[i, 0] - step.tension_before_dan[i, 0]) > 10
+    assert step.tension_after_dan[i, 0] == pytest.approx(step.tension_after_dan[i, 1])
+    # Le câble n'a pas été recoupé : même longueur à vide, au millimètre près
+    assert after == pytest.approx(before, abs=1e-3)
+    # Les autres cantons sont inchangés
+    untouched = [k for k in range(40) if not 5 <= k < 10]
+    assert simulator.state.tension_dan[untouched] == pytest.approx(
+        InterventionSimulator(cable=cable_aster570, **line).state.tension_dan[untouched]
+    )
+
+
+def test_stay_balances_longitudinal_load(line, cable_aster570):
+    """Un hauban sans effort imposé compense L et charge verticalement le support"""
+    simulator = InterventionSimulator(cable=cable_aster570, **line)
+    step = simulator.apply(Intervention(InterventionKind.STAY, 5, stay_angle_deg=45))
+    assert step.supports.tolist() == [5]
+    assert step.L_after[0] == pytest.approx(0, abs=1e-9)
+    assert step.V_after[0] == pytest.approx(step.V_before[0] + abs(step.L_before[0]))
+
+
+def test_line_ends_stay_anchored(line, cable_aster570):
+    """Les supports d'extrémité ne peuvent pas être mis sur poulie"""
+    simulator = InterventionSimulator(cable=cable_aster570, **line)
+    with pytest.raises(ValueError):
+        simulator.apply(Intervention(InterventionKind.PULLEY, 0))
@@ -0,0 +1,104 @@
+"""
+Tests unitaires pour le solveur inverse de ρ
+"""
+import time
+
+import numpy as np
+import pytest
+from backend.domain.inverse import RhoSolver, RhoTarget, SolveStatus
+from backend.domain.mechanical import (
+    MechanicalCalculator,
+    SpanGeometry
+)
+
+
+# ===== TESTS SOLVEUR =====
+
+@pytest.mark.parametrize("target", [t for t in RhoTarget if t is not RhoTarget.CLEARANCE])
+def test_solve_recovers_rho(cable_aster570, target):
+    """Le solveur retrouve le ρ ayant produit la valeur cible"""
+    a = np.array([100.0, 350.0, 500.0, 800.0])
+    h = np.array([0.0, -20.0, 10.0, 60.0])
+    rho_true = np.array([1500.0, 2000.0, 2500.0, 3000.0])
+    omega = np.full(4, cable_aster570.mass_lin_kg_per_m)
+    values, _ = RhoSolver.evaluate(target, a, h, rho_true, omega)
+
+    solution = RhoSolver.solve(target, values, a, h, 0, [cable_aster570])
+
+    assert np.all(solution.status == SolveStatus.CONVERGED)
+    assert solution.rho == pytest.approx(rho_true, rel=1e-8)
+
+
+def test_solve_clearance(cable_aster570):
+    """Recherche de ρ pour une hauteur cible du point bas"""
+    solution = RhoSolver.solve(
+        RhoTarget.CLEARANCE, values=[20.0], a=[500.0], h=[10.0],
+        cable_index=[0], cables=[cable_aster570], low_attachment_m=[30.0]
+    )
+
+    _, F2, _ = MechanicalCalculator.calculate_sag(SpanGeometry(a=500, h=10), solution.rho[0])
+    assert solution.status[0] == SolveStatus.CONVERGED
+    assert 30.0 - F2 == pytest.approx(20.0, abs=1e-6)
+
+
+def test_solve_tension_matches_calculate_span(cable_aster570):
+    """Le ρ trouvé redonne la tension TB visée via calculate_span"""
+    solution = RhoSolver.solve("TB", [3300.0], [500.0], [10.0], [0], [cable_aster570])
+
+    result = MechanicalCalculator.calculate_span(
+        geometry=SpanGeometry(a=500, h=10),
+        cable=cable_aster570,
+        rho=float(solution.rho[0])
+    )
+    assert result.TB == 3300
+
+
+def test_solve_tension_under_wind_and_ice(cable_aster570):
+    """Sous vent et givre, le ρ trouvé redonne la tension visée sous poids apparent"""
+    solution = RhoSolver.solve(
+        "TB", [5000.0], [500.0], [10.0], [0], [cable_aster570],
+        wind_pressure_daPa=36, ice_thickness_mm=5
+    )
+    calm = RhoSolver.solve("TB", [5000.0], [500.0], [10.0], [0], [cable_aster570])
+
+    result = MechanicalCalculator.calculate_span(
+        geometry=SpanGeometry(a=500, h=10),
+        cable=cable_aster570,
+        rho=float(solution.rho[0]),
+        wind_pressure_daPa=36,
+        ice_thickness_mm=5
+    )
+    assert result.TB == 5000
+    assert solution.rho[0] < calm.rho[0]
+
+
+def test_solve_unreachable_target(cable_aster570):
+    """Une cible hors de l'encadrement est signalée sans lever d'exception"""
+    solution = RhoSolver.solve("T0", [1e9, 3000.0], [100.0, 100.0], [0.0, 0.0], 0, [cable_aster570])
+
+    assert solution.status.tolist() == [SolveStatus.NOT_BRACKETED, SolveStatus.CONVERGED]
+    assert np.isnan(solution.rho[0])
+    assert solution.iterations[0] == 0
+
+
+def test_solve_clearance_requires_attachment_height(cable_aster570):
+    """La cible clearance exige la hauteur de l'accrochage bas"""
+    with pytest.raises(ValueError):
+        RhoSolver.solve("clearance", [20.0], [500.0], [10.0], [0], [cable_aster570])
+
+
+@pytest.mark.slow
+def test_solve_10k_spans_under_a_second(cable_aster570):
+    """10 000 portées sont résolues en moins d'une seconde"""
+    rng = np.random.default_rng(0)
+    n = 10_000
+    a = rng.uniform(50, 1000, n)
+    h = rng.uniform(-80, 80, n)
+    values, _ = RhoSolver.evaluate("H", a, h, rng.uniform(500, 5000, n), np.full(n, 1.631))
+
+    start = time.perf_counter()
+    solution = RhoSolver.solve("H", values, a, h, 0, [cable_aster570])
+    elapsed = time.perf_counter() - start
+
+    assert np.all(solution.status == SolveStatus.CONVERGED)
+    assert elapsed < 1.0
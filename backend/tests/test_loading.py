@@ -0,0 +1,105 @@
+"""
+Tests unitaires pour les charges apparentes (vent, givre)
+"""
+import numpy as np
+import pytest
+from backend.domain.batch import BatchSpanCalculator
+from backend.domain.loading import GRAVITY, apparent_load, load_factor, load_factor_table
+from backend.domain.mechanical import MechanicalCalculator, SpanGeometry
+from backend.domain.state_change import CableConstants
+from backend.domain.vhl import LoadCase, VHLCalculator
+
+
+@pytest.fixture
+def cables(cable_aster570, cable_phlox228):
+    """Câbles Aster 570 et Phlox 228"""
+    return [cable_aster570, cable_phlox228]
+
+
+def test_no_wind_no_ice_is_unit_factor(cables):
+    """Sans vent ni givre : m = 1 exactement, tensions inchangées"""
+    assert load_factor(1.631, 31.5) == 1.0
+    geometry = SpanGeometry(a=400, h=10)
+    bare = MechanicalCalculator.calculate_tensions(geometry, cables[0], 1500)
+    calm = MechanicalCalculator.calculate_span(geometry, cables[0], 1500, wind_pressure_daPa=0.0)
+    assert (calm.T0, calm.TA, calm.TB) == tuple(round(t) for t in bare)
+
+
+def test_wind_on_projected_diameter():
+    """p = √((ω·g)² + (q·d)²) et inclinaison tan φ = q·d / (ω·g)"""
+    weight = 1.631 * GRAVITY / 10
+    load = apparent_load(weight, 0.0315, 36.0)
+    assert load.transverse_dan_per_m == pytest.approx(36 * 0.0315)
+    assert load.apparent_dan_per_m == pytest.approx(np.sqrt(weight**2 + (36 * 0.0315)**2))
+    assert load.swing_angle_rad == pytest.approx(np.arctan(36 * 0.0315 / weight))
+
+
+def test_ice_adds_weight_and_exposed_width():
+    """Le givre alourdit le câble et élargit la surface au vent"""
+    load = apparent_load(1.6, 0.03, 20.0, ice_thickness_mm=10)
+    ice_area = np.pi * (0.05**2 - 0.03**2) / 4
+    assert load.vertical_dan_per_m == pytest.approx(1.6 + 900 * ice_area * GRAVITY / 10)
+    assert load.transverse_dan_per_m == pytest.approx(20 * 0.05)
+
+
+def test_wind_raises_span_tensions(cables):
+    """Sous vent, T0 = ρ·p : les tensions suivent le poids apparent"""
+    geometry = SpanGeometry(a=400, h=0)
+    windy = MechanicalCalculator.calculate_span(geometry, cables[0], 1500, wind_pressure_daPa=36)
+    iced = MechanicalCalculator.calculate_span(geometry, cables[0], 1500, wind_pressure_daPa=36, ice_thickness_mm=5)
+    constants = CableConstants.from_cable(cables[0])
+    assert windy.T0 == round(1500 * float(constants.apparent_weight(36)))
+    assert iced.T0 > windy.T0
+
+
+def test_batch_with_ice_matches_scalar(cables):
+    """Vent et givre en lot : identiques au calcul scalaire"""
+    rng = np.random.default_rng(3)
+    n = 500
+    a = np.round(rng.uniform(50, 800, n), 1)
+    h = np.round(rng.uniform(-50, 50, n), 1)
+    rho = np.round(rng.uniform(500, 3000, n))
+    cable_index = rng.integers(0, 2, n)
+    wind = rng.uniform(0, 50, n)
+    ice = rng.uniform(0, 15, n)
+
+    batch = BatchSpanCalculator.calculate_spans(
+        a, h, rho, cable_index, cables, wind, ice_thickness_mm=ice
+    )
+    for i in range(n):
+        result = MechanicalCalculator.calculate_span(
+            SpanGeometry(a=float(a[i]), h=float(h[i])), cables[cable_index[i]], float(rho[i]),
+            wind_pressure_daPa=float(wind[i]), ice_thickness_mm=float(ice[i])
+        )
+        assert (batch.T0[i], batch.TA[i], batch.TB[i]) == (result.T0, result.TA, result.TB)
+
+
+def test_load_factor_table_reused_across_spans(cables):
+    """Coefficients câbles × cas calculés une fois, puis indexés par portée"""
+    mass = [c.mass_lin_kg_per_m for c in cables]
+    diameter = [c.diameter_mm for c in cables]
+    table = load_factor_table(mass, diameter, [0.0, 36.0, 18.0], [0.0, 0.0, 10.0])
+    assert table.shape == (2, 3)
+    assert table[:, 0] == pytest.approx([1.0, 1.0])
+
+    a = np.full(4, 400.0)
+    cable_index = np.array([0, 1, 1, 0])
+    from_table = BatchSpanCalculator.calculate_spans(
+        a, 0.0, 1500.0, cable_index, cables, load_factor=table[cable_index, 2]
+    )
+    direct = BatchSpanCalculator.calculate_spans(
+        a, 0.0, 1500.0, cable_index, cables, 18.0, ice_thickness_mm=10.0
+    )
+    assert np.array_equal(from_table.T0, direct.T0)
+
+
+def test_vhl_loading_uses_apparent_load(cables):
+    """Les charges des cas VHL sont celles du modèle de charge apparente"""
+    constants = CableConstants.from_cable(cables[0])
+    vertical, transverse, apparent = VHLCalculator.loading(
+        constants, [LoadCase("givre", -5, wind_pressure_daPa=18, ice_thickness_mm=10)]
+    )
+    load = apparent_load(constants.weight_dan_per_m, constants.diameter_m, 18, 10)
+    assert (vertical[0], transverse[0], apparent[0]) == (
+        load.vertical_dan_per_m, load.transverse_dan_per_m, load.apparent_dan_per_m
+    )
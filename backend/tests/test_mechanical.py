@@ -3,11 +3,20 @@ Tests unitaires pour les calculs mécaniques
 """
 import pytest
 import math
+import random
+import numpy as np
 from backend.domain.mechanical import (
+    ConductorLengthCalculator,
+    EquivalentSpanAccumulator,
     MechanicalCalculator,
     CableProperties,
+    CompactSpanResult,
     SpanGeometry,
-    SpanResult
+    SpanResult,
+    SpanWarning,
+    SpanError,
+    compact_result_to_dict,
+    span_result_to_dict
 )
 
 
@@ -147,6 +156,87 @@ def test_calculate_equivalent_span_empty():
     assert K == 0.0
 
 
+def test_calculate_equivalent_span_generator():
+    """Les portées peuvent provenir d'un générateur"""
+    spans = [400, 500, 450, 380]
+    assert MechanicalCalculator.calculate_equivalent_span(a for a in spans) == \
+        MechanicalCalculator.calculate_equivalent_span(spans)
+
+
+def test_accumulator_add_replace_remove():
+    """Les sommes courantes suivent les modifications d'une portée"""
+    accumulator = EquivalentSpanAccumulator([400, 500, 450])
+    accumulator.add(380)
+    assert accumulator.result() == pytest.approx(
+        MechanicalCalculator.calculate_equivalent_span([400, 500, 450, 380]), rel=1e-12
+    )
+
+    assert accumulator.replace(1, 520) == 500
+    assert accumulator.remove(0) == 400
+    assert len(accumulator) == 3
+    assert accumulator.result() == pytest.approx(
+        MechanicalCalculator.calculate_equivalent_span([520, 450, 380]), rel=1e-12
+    )
+
+
+def test_accumulator_ranges_and_segments():
+    """Sous-plages et découpage en cantons par sommes préfixes"""
+    spans = [300, 400, 350, 500, 420]
+    accumulator = EquivalentSpanAccumulator(spans)
+
+    assert accumulator.range(1, 4) == pytest.approx(
+        MechanicalCalculator.calculate_equivalent_span(spans[1:4]), rel=1e-12
+    )
+    accumulator.replace(2, 360)
+    spans[2] = 360
+    segments = accumulator.segments([2, 3])
+    assert segments[0] == pytest.approx(MechanicalCalculator.calculate_equivalent_span(spans[:2]), rel=1e-12)
+    assert segments[1] == pytest.approx(MechanicalCalculator.calculate_equivalent_span(spans[2:]), rel=1e-12)
+
+    with pytest.raises(ValueError):
+        accumulator.segments([2, 2])
+    with pytest.raises(ValueError):
+        accumulator.range(3, 6)
+
+
+def test_accumulator_streaming_mode():
+    """Sans conservation des portées, seules les sommes sont disponibles"""
+    accumulator = EquivalentSpanAccumulator((a for a in [400, 500]), keep_spans=False)
+    assert accumulator.result()[0] == pytest.approx(math.sqrt((400**3 + 500**3) / 900))
+    with pytest.raises(ValueError):
+        accumulator.replace(0, 300)
+
+
+def test_accumulator_random_edits_match_recompute():
+    """Suite aléatoire d'ajouts, retraits et remplacements : sous-plages identiques à un recalcul"""
+    rng = random.Random(3)
+    spans = [rng.uniform(200, 500) for _ in range(50)]
+    accumulator = EquivalentSpanAccumulator(spans)
+
+    for _ in range(500):
+        operation = rng.random()
+        if operation < 0.3:
+            spans.append(rng.uniform(200, 500))
+            accumulator.add(spans[-1])
+        elif operation < 0.6 and len(spans) > 2:
+            index = rng.randrange(len(spans))
+            assert accumulator.remove(index) == spans.pop(index)
+        else:
+            index = rng.randrange(len(spans))
+            a = rng.uniform(200, 500)
+            assert accumulator.replace(index, a) == spans[index]
+            spans[index] = a
+
+        start = rng.randrange(len(spans))
+        stop = rng.randrange(start + 1, len(spans) + 1)
+        assert accumulator.range(start, stop) == pytest.approx(
+            MechanicalCalculator.calculate_equivalent_span(spans[start:stop]), rel=1e-9
+        )
+
+    assert list(accumulator.spans) == spans
+    assert accumulator.result() == pytest.approx(MechanicalCalculator.calculate_equivalent_span(spans), rel=1e-9)
+
+
 # ===== TESTS CRR =====
 
 def test_calculate_crr_no_broken_wires():
@@ -330,3 +420,94 @@ def test_calculate_span_rho_warning_high(cable_aster570):
     )
 
     assert any("ρ très élevé" in w for w in result.warnings)
+
+
+# ===== TESTS RÉSULTAT COMPACT =====
+
+def test_calculate_span_compact_matches_span_result(cable_aster570):
+    """Le résultat compact porte les mêmes valeurs et messages que SpanResult"""
+    geometry = SpanGeometry(a=500, h=10)
+
+    compact = MechanicalCalculator.calculate_span_compact(
+        geometry, cable_aster570, 50, wind_pressure_daPa=50, angle_grade=20
+    )
+    result = MechanicalCalculator.calculate_span(
+        geometry, cable_aster570, 50, wind_pressure_daPa=50, angle_grade=20
+    )
+
+    assert isinstance(compact, CompactSpanResult)
+    assert compact.to_span_result() == result
+    assert compact_result_to_dict(compact) == span_result_to_dict(result)
+
+
+def test_compact_span_result_uses_codes(cable_aster570):
+    """Les avertissements sont stockés en masque de bits, sans chaînes"""
+    compact = MechanicalCalculator.calculate_span_compact(
+        SpanGeometry(a=100, h=0), cable_aster570, 15000, wind_pressure_daPa=50
+    )
+
+    assert compact.warning_codes == SpanWarning.WIND_ABOVE_LIMIT | SpanWarning.RHO_HIGH
+    assert compact.error_codes == SpanError.TENSION_ABOVE_RUPTURE
+    assert not hasattr(compact, "__dict__")
+
+
+
+# ===== TESTS LONGUEURS DE CONDUCTEUR =====
+
+def test_arc_length_matches_numerical_integration():
+    """Longueur de la chaînette inclinée égale à l'intégration numérique"""
+    a, h, rho = 400.0, 35.0, 1200.0
+    xm = ConductorLengthCalculator.low_point_offset(a, h, rho)
+    x = np.linspace(xm - a / 2, xm + a / 2, 200_001)
+    y = rho * np.cosh(x / rho)
+
+    assert y[-1] - y[0] == pytest.approx(h)
+    assert ConductorLengthCalculator.arc_lengths(a, h, rho) == pytest.approx(
+        np.sum(np.hypot(np.diff(x), np.diff(y))), rel=1e-10
+    )
+
+
+def test_slack_close_to_parabolic_approximation(cable_aster570):
+    """Portée de niveau : mou ≈ a³/(24·ρ²)"""
+    lengths = ConductorLengthCalculator.compute([300.0], [0.0], 2000.0, cable_aster570)
+    assert lengths.slack_m[0] == pytest.approx(300**3 / (24 * 2000**2), rel=1e-3)
+    assert lengths.thermal_m[0] == 0
+
+
+def test_elastic_stretch_matches_integrated_tension(cable_aster570):
+    """Allongement élastique = ∫ T ds / (E·S) avec T = T0·cosh(x/ρ)"""
+    a, h, rho = 500.0, -40.0, 1500.0
+    lengths = ConductorLengthCalculator.compute([a], [h], rho, cable_aster570, load_factor=1.2)
+    xm = ConductorLengthCalculator.low_point_offset(a, h, rho)
+    x = np.linspace(xm - a / 2, xm + a / 2, 200_001)
+    ds = np.hypot(np.diff(x), np.diff(rho * np.cosh(x / rho)))
+    T0 = rho * 1.2 * cable_aster570.mass_lin_kg_per_m * MechanicalCalculator.G / 10
+    T = T0 * np.cosh((x[1:] + x[:-1]) / (2 * rho))
+    ES = cable_aster570.E_MPa * cable_aster570.section_mm2 / 10
+
+    assert lengths.elastic_m[0] == pytest.approx(np.sum(T * ds) / ES, rel=1e-8)
+
+
+def test_canton_totals_and_drums(cable_aster570):
+    """Totaux par canton en un appel, puis nombre de tourets"""
+    rng = np.random.default_rng(5)
+    a = rng.uniform(200, 500, 1000)
+    h = rng.uniform(-30, 30, 1000)
+    sizes = [10] * 100
+    lengths = ConductorLengthCalculator.compute(
+        a, h, 1500.0, cable_aster570, sizes, temperature_C=40, unstressed_temperature_C=15
+    )
+
+    assert lengths.canton_length_m.shape == (100,)
+    assert lengths.canton_length_m[3] == pytest.approx(lengths.arc_length_m[30:40].sum())
+    assert np.all(lengths.thermal_m > 0)
+    assert np.all(lengths.unstressed_length_m < lengths.arc_length_m)
+    assert lengths.drums(2000.0, allowance_m=50).tolist() == np.ceil(
+        (lengths.canton_unstressed_m + 50) / 2000
+    ).astype(int).tolist()
+
+
+def test_conductor_lengths_invalid_cantons(cable_aster570):
+    """Découpage incohérent refusé"""
+    with pytest.raises(ValueError):
+        ConductorLengthCalculator.compute([300.0, 300.0], [0.0, 0.0], 1500.0, cable_aster570, [3])
@@ -0,0 +1,89 @@
+"""
+Tests unitaires pour la propagation d'incertitudes Monte Carlo
+"""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from backend.domain.canton import CantonSolver
+from backend.domain.montecarlo import InputTolerances, MonteCarloJob, MonteCarloSimulator
+from backend.domain.state_change import ReferenceState
+
+
+# ===== FIXTURES =====
+
+@pytest.fixture
+def job(cable_aster570):
+    """Canton de trois portées avec incertitudes"""
+    return MonteCarloJob(
+        cable=cable_aster570,
+        spans_m=[300, 420, 380],
+        delta_h_m=[5, -10, 20],
+        reference=ReferenceState(temperature_C=15, tension_dan=2500),
+        temperature_C=40,
+        tolerances=InputTolerances(span_m=0.5, delta_h_m=0.3, mass_rel=0.02, E_rel=0.03, alpha_rel=0.05),
+        n_samples=30_000,
+        seed=7
+    )
+
+
+# ===== TESTS =====
+
+def test_zero_tolerance_matches_canton_solver(job):
+    """Sans incertitude, toutes les valeurs égalent le calcul déterministe"""
+    job = replace(job, tolerances=InputTolerances(), n_samples=100)
+    result = MonteCarloSimulator.run(job)
+    canton = CantonSolver.solve(
+        job.spans_m, job.delta_h_m, [3], job.cable, job.reference, job.temperature_C
+    )
+
+    assert result.distributions["T0_dan"].mean[0] == pytest.approx(canton.tension_dan[0], rel=1e-12)
+    assert np.allclose(result.percentiles("TB_dan", [95])[95], canton.spans.TB, atol=0.5)
+    assert np.allclose(result.percentiles("F2_m", [5])[5], canton.spans.F2, atol=0.005)
+
+
+def test_percentiles_close_to_exact(job):
+    """Les percentiles de l'histogramme approchent ceux des échantillons"""
+    result = MonteCarloSimulator.run(job)
+    samples = MonteCarloSimulator.evaluate(job, np.random.default_rng(1), job.n_samples)["TB_dan"]
+
+    estimated = result.percentiles("TB_dan", [5, 50, 95])
+    for q in (5, 50, 95):
+        exact = np.percentile(samples, q, axis=0)
+        assert np.allclose(estimated[q], exact, atol=1.0)
+
+
+def test_histograms_count_every_sample(job):
+    """Chaque échantillon est compté une fois par portée"""
+    result = MonteCarloSimulator.run(job)
+    counts = result.distributions["F2_m"].counts
+
+    assert counts.shape == (3, MonteCarloSimulator.BINS)
+    assert np.all(counts.sum(axis=1) == job.n_samples)
+
+
+def test_deterministic_for_seed(job):
+    """Même graine, mêmes résultats ; graine différente, résultats différents"""
+    first = MonteCarloSimulator.run(job)
+    second = MonteCarloSimulator.run(job)
+    other = MonteCarloSimulator.run(replace(job, seed=8))
+
+    assert np.array_equal(first.distributions["TB_dan"].counts, second.distributions["TB_dan"].counts)
+    assert np.array_equal(first.distributions["TB_dan"].mean, second.distributions["TB_dan"].mean)
+    assert not np.array_equal(first.distributions["TB_dan"].mean, other.distributions["TB_dan"].mean)
+
+
+def test_process_pool_matches_single_process(job):
+    """Le résultat ne dépend pas du nombre de processus"""
+    single = MonteCarloSimulator.run(job)
+    pooled = MonteCarloSimulator.run(job, workers=2)
+
+    for name, distribution in single.distributions.items():
+        assert np.array_equal(distribution.counts, pooled.distributions[name].counts)
+        assert np.array_equal(distribution.mean, pooled.distributions[name].mean)
+
+
+def test_rejects_mismatched_spans(job):
+    """Portées et dénivelés de longueurs différentes refusés"""
+    with pytest.raises(ValueError):
+        MonteCarloSimulator.run(replace(job, delta_h_m=[0, 0]))
@@ -0,0 +1,77 @@
+"""
+Tests unitaires pour les surcharges ponctuelles
+"""
+import numpy as np
+import pytest
+from backend.domain.point_load import PointLoadSolver
+from backend.domain.state_change import CableConstants, ReferenceState
+
+
+@pytest.fixture
+def constants(cable_aster570):
+    """Constantes du câble Aster 570"""
+    return CableConstants.from_cable(cable_aster570)
+
+
+@pytest.fixture
+def reference():
+    """État de référence à 15 °C"""
+    return ReferenceState(temperature_C=15, tension_dan=2500)
+
+
+def test_zero_load_is_unloaded_span(constants, reference):
+    """Sans charge : tension de référence et flèche parabolique F1"""
+    result = PointLoadSolver.solve(400, 0, constants, reference, 15, [200.0], [0.0])
+    w = constants.weight_dan_per_m
+    assert result.tension_dan == pytest.approx(2500)
+    assert result.max_sag_m == pytest.approx(400**2 * w / (8 * 2500))
+    assert result.max_sag_x_m == pytest.approx(200)
+    assert result.drop_m == pytest.approx([0.0])
+
+
+def test_equivalent_weight_matches_numerical_integral(constants):
+    """D = ∫ V(x)² dx calculé en forme fermée"""
+    a, w = 400.0, constants.weight_dan_per_m
+    positions, loads = np.array([120.0, 300.0]), np.array([300.0, 150.0])
+    x = np.linspace(0, a, 400_001)
+    reaction = w * a / 2 + np.sum(loads * (a - positions)) / a
+    shear = reaction - w * x - np.sum(loads[None, :] * (x[:, None] > positions[None, :]), axis=1)
+    D = np.sum((shear[1:]**2 + shear[:-1]**2) / 2 * np.diff(x))
+
+    p = PointLoadSolver.equivalent_weight(a, w, positions, loads)
+    assert p**2 * a**3 / 12 == pytest.approx(D, rel=1e-5)
+
+
+def test_load_increases_tension_and_sag(constants, reference):
+    """Une charge tend le câble et l'abaisse à son droit ; flèche max sous la charge"""
+    result = PointLoadSolver.solve(400, 0, constants, reference, 15, [150.0], [500.0])
+    assert result.tension_dan > 2500
+    assert result.drop_m[0] > 0
+    assert result.max_sag_x_m == pytest.approx(150)
+    assert result.max_sag_m == pytest.approx(result.sag_at_load_m[0])
+
+
+def test_danger_curve_grid(constants, reference):
+    """Grille intensités × positions, symétrique en portée de niveau"""
+    positions = np.linspace(0, 400, 41)
+    result = PointLoadSolver.solve(
+        400, 0, constants, reference, 15, positions[:, None], np.array([100.0, 500.0])[:, None, None]
+    )
+    assert result.tension_dan.shape == (2, 41)
+    assert result.drop_m.shape == (2, 41, 1)
+    assert result.tension_dan[0] == pytest.approx(result.tension_dan[0, ::-1])
+    assert np.all(result.tension_dan[1] >= result.tension_dan[0])
+    assert result.drop_m[:, 0, 0] == pytest.approx([0, 0])
+
+    # Chaque point de la grille vaut le calcul isolé
+    single = PointLoadSolver.solve(400, 0, constants, reference, 15, [positions[13]], [500.0])
+    assert result.tension_dan[1, 13] == pytest.approx(single.tension_dan)
+    assert result.max_sag_m[1, 13] == pytest.approx(single.max_sag_m)
+
+
+def test_invalid_loads(constants, reference):
+    """Charge hors portée ou négative refusée"""
+    with pytest.raises(ValueError):
+        PointLoadSolver.solve(400, 0, constants, reference, 15, [450.0], [100.0])
+    with pytest.raises(ValueError):
+        PointLoadSolver.solve(400, 0, constants, reference, 15, [100.0], [-1.0])
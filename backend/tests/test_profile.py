@@ -0,0 +1,87 @@
+"""
+Tests unitaires pour l'échantillonnage des profils de conducteurs
+"""
+import numpy as np
+import pytest
+from backend.domain.mechanical import MechanicalCalculator, SpanGeometry
+from backend.domain.profile import ProfileSampler, decimate_min_max, sag_at
+
+
+def test_sag_at_midspan_equals_F1():
+    """F(a/2) = F1 du calcul scalaire"""
+    F1, _, _ = MechanicalCalculator.calculate_sag(SpanGeometry(a=400, h=30), 1500)
+    assert sag_at(200, 400, 30, 1500) == pytest.approx(F1, abs=0.005)
+
+
+def test_sample_counts_and_supports():
+    """Points réguliers, supports inclus, altitudes d'accrochage chaînées"""
+    profile = ProfileSampler.sample([300, 450], [10, -20], 1500, start_altitude_m=100, resolution_m=1.0)
+
+    assert profile.span_starts.tolist() == [0, 301]
+    assert len(profile) == 301 + 451
+    assert np.all(profile.sag_m >= 0)
+    # Accrochages : 100 → 110 → 90
+    assert profile.altitude_m[0] == pytest.approx(100)
+    assert profile.altitude_m[300] == pytest.approx(110)
+    assert profile.altitude_m[301] == pytest.approx(110)
+    assert profile.altitude_m[-1] == pytest.approx(90)
+    assert profile.station_m[-1] == pytest.approx(750)
+
+
+def test_sample_resolution_upper_bound():
+    """Le pas effectif ne dépasse pas la résolution demandée"""
+    profile = ProfileSampler.sample([333.3], [0], 1200, resolution_m=2.0)
+    assert np.max(np.diff(profile.x_m)) <= 2.0
+
+
+def test_sample_rejects_invalid_inputs():
+    """Portées, ρ et résolution doivent être positifs"""
+    with pytest.raises(ValueError):
+        ProfileSampler.sample([300], [0], 0)
+    with pytest.raises(ValueError):
+        ProfileSampler.sample([300], [0], 1500, resolution_m=0)
+    with pytest.raises(ValueError):
+        ProfileSampler.sample([300, 200], [0], 1500)
+
+
+# ===== TESTS NIVEAU DE DÉTAIL =====
+
+def test_decimate_keeps_extremes_per_bucket():
+    """Au plus deux points par colonne, extrêmes conservés"""
+    profile = ProfileSampler.sample([300, 400], [10, -20], 1500, start_altitude_m=100, resolution_m=0.5)
+    decimated = decimate_min_max(profile, 0, 700, 50)
+
+    assert len(decimated) <= 100
+    assert np.all(np.diff(decimated.station_m) >= 0)
+    assert decimated.altitude_m.min() == profile.altitude_m.min()
+    assert decimated.altitude_m.max() == profile.altitude_m.max()
+
+
+def test_sample_window_point_count_depends_on_pixels():
+    """Le nombre de points dépend de la largeur d'affichage, pas de la ligne"""
+    a = [350.0] * 300
+    h = [4.0, -4.0] * 150
+    decimated = ProfileSampler.sample_window(a, h, 1500, 0, pixel_width=800)
+
+    assert len(decimated) <= 1600
+    assert decimated.station_m[-1] == pytest.approx(sum(a))
+
+
+def test_sample_window_zoom_only_overlapping_spans():
+    """Une fenêtre zoomée n'échantillonne que les portées recoupées"""
+    a = [300.0, 400.0, 500.0]
+    h = [10.0, -20.0, 5.0]
+    decimated = ProfileSampler.sample_window(a, h, 1500, 100, pixel_width=200,
+                                             window_start_m=650, window_end_m=750)
+    full = ProfileSampler.sample(a, h, 1500, start_altitude_m=100, resolution_m=0.01)
+    in_window = (full.station_m >= 650) & (full.station_m <= 750)
+
+    assert set(decimated.span_index.tolist()) == {1, 2}
+    assert decimated.station_m.min() >= 650 and decimated.station_m.max() <= 750
+    assert decimated.altitude_m.min() == pytest.approx(full.altitude_m[in_window].min(), abs=1e-3)
+
+
+def test_sample_window_outside_line():
+    """Une fenêtre hors de la ligne est refusée"""
+    with pytest.raises(ValueError):
+        ProfileSampler.sample_window([300], [0], 1500, 0, 100, window_start_m=400)
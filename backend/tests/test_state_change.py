@@ -0,0 +1,95 @@
+"""
+Tests unitaires pour l'équation de changement d'état
+"""
+import numpy as np
+import pytest
+from backend.domain.state_change import (
+    CableConstants,
+    ReferenceState,
+    StateChangeSolver,
+    reference_from_rho
+)
+
+
+# ===== FIXTURES =====
+
+@pytest.fixture
+def constants_aster570(cable_aster570):
+    """Constantes du câble Aster 570"""
+    return CableConstants.from_cable(cable_aster570)
+
+
+# ===== TESTS CONSTANTES =====
+
+def test_cable_constants(constants_aster570):
+    """Constantes E·S, α et poids linéique"""
+    assert constants_aster570.ES_dan == pytest.approx(78000 * 564.6 / 10)
+    assert constants_aster570.alpha_per_C == pytest.approx(19.1e-6)
+    assert constants_aster570.weight_dan_per_m == pytest.approx(1.631 * 0.981)
+
+
+def test_apparent_weight_with_wind(constants_aster570):
+    """Poids apparent p = √((ω·g)² + (q·d)²)"""
+    p = constants_aster570.apparent_weight([0.0, 36.0])
+
+    assert p[0] == pytest.approx(constants_aster570.weight_dan_per_m)
+    assert p[1] == pytest.approx(np.hypot(1.631 * 0.981, 36 * 0.0315))
+
+
+# ===== TESTS CUBIQUE =====
+
+def test_solve_cubic_positive_root():
+    """Racine positive de T³ + A·T² - B = 0"""
+    A = np.array([-3000.0, 0.0, 500.0])
+    B = np.array([1e10, 8.0, 1e9])
+
+    T, _ = StateChangeSolver.solve_cubic(A, B)
+
+    assert np.all(T > 0)
+    assert T**2 * (T + A) == pytest.approx(B, rel=1e-12)
+
+
+# ===== TESTS CHANGEMENT D'ÉTAT =====
+
+def test_same_state_returns_reference_tension(constants_aster570):
+    """L'état de référence redonne la tension de référence"""
+    reference = ReferenceState(temperature_C=15, tension_dan=3000)
+
+    result = StateChangeSolver.solve(constants_aster570, 400, reference, 15)
+
+    assert result.tension_dan == pytest.approx(3000, rel=1e-10)
+
+
+def test_solve_grid_satisfies_equation(constants_aster570):
+    """Chaque point de la grille vérifie l'équation de changement d'état"""
+    reference = ReferenceState(temperature_C=15, tension_dan=3000)
+    temperatures = np.array([-20.0, 15.0, 40.0, 75.0])
+    winds = np.array([0.0, 18.0, 36.0])
+
+    result = StateChangeSolver.solve_grid(constants_aster570, 400, reference, temperatures, winds)
+
+    c = constants_aster570
+    T2 = result.tension_dan
+    p1 = c.weight_dan_per_m
+    p2 = result.apparent_weight_dan_per_m
+    lhs = (T2 - 3000) / c.ES_dan + c.alpha_per_C * (temperatures[:, None] - 15)
+    rhs = 400**2 / 24 * (p2**2 / T2**2 - p1**2 / 3000**2)
+
+    assert T2.shape == (4, 3)
+    assert lhs == pytest.approx(rhs, abs=1e-12)
+    # La tension baisse avec la température et augmente avec le vent
+    assert np.all(np.diff(T2, axis=0) < 0)
+    assert np.all(np.diff(T2, axis=1) > 0)
+
+
+def test_reference_from_rho(constants_aster570):
+    """Un état défini par ρ a une tension T0 = ρ × p"""
+    reference = reference_from_rho(constants_aster570, 2000, 15)
+
+    assert reference.tension_dan == pytest.approx(2000 * constants_aster570.weight_dan_per_m)
+
+
+def test_solve_rejects_invalid_ruling_span(constants_aster570):
+    """Une portée équivalente nulle est refusée"""
+    with pytest.raises(ValueError):
+        StateChangeSolver.solve(constants_aster570, 0, ReferenceState(15, 3000), 15)
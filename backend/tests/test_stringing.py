@@ -0,0 +1,113 @@
+"""
+Tests unitaires pour les tables de pose et leur cache disque
+"""
+import csv
+import io
+import json
+import os
+
+import numpy as np
+import pytest
+from backend.domain.canton import CantonSolver
+from backend.domain.state_change import ReferenceState
+from backend.domain.stringing import StringingTableCache, StringingTableGenerator
+
+
+@pytest.fixture
+def line():
+    """Ligne de 30 portées en 6 cantons"""
+    rng = np.random.default_rng(4)
+    return {
+        "a": rng.uniform(200, 500, 30),
+        "h": rng.uniform(-20, 20, 30),
+        "canton_sizes": [5] * 6,
+        "reference": ReferenceState(temperature_C=15, tension_dan=2500),
+        "temperatures_C": np.arange(-10, 41, 5.0),
+    }
+
+
+def test_tables_match_canton_solver(line, cable_aster570):
+    """Chaque température de la table vaut le calcul des cantons à cette température"""
+    table = StringingTableGenerator.generate(cable=cable_aster570, **line)
+    assert table.tension_dan.shape == (6, 11)
+    assert table.sag_m.shape == (30, 11)
+
+    j = 8
+    result = CantonSolver.solve(
+        line["a"], line["h"], line["canton_sizes"], cable_aster570, line["reference"], line["temperatures_C"][j]
+    )
+    assert table.tension_dan[:, j] == pytest.approx(result.tension_dan)
+    assert np.round(table.sag_m[:, j], 2) == pytest.approx(result.spans.F1)
+
+
+def test_sag_increases_with_temperature(line, cable_aster570):
+    """La tension baisse et la flèche augmente avec la température"""
+    table = StringingTableGenerator.generate(cable=cable_aster570, **line)
+    assert np.all(np.diff(table.tension_dan, axis=1) < 0)
+    assert np.all(np.diff(table.sag_m, axis=1) > 0)
+
+
+def test_content_key_depends_on_every_input(line, cable_aster570):
+    """Même entrées : même empreinte ; une portée modifiée change l'empreinte"""
+    first = StringingTableGenerator.generate(cable=cable_aster570, **line)
+    again = StringingTableGenerator.generate(cable=cable_aster570, **line)
+    line["a"] = line["a"].copy()
+    line["a"][7] += 1e-9
+    changed = StringingTableGenerator.generate(cable=cable_aster570, **line)
+    assert first.key == again.key
+    assert changed.key != first.key
+
+
+def test_cache_reuses_tables_from_disk(line, cable_aster570, tmp_path):
+    """Rouvrir le chantier relit la table depuis le disque, dans un nouveau cache"""
+    table = StringingTableCache(tmp_path).get_or_generate(cable=cable_aster570, **line)
+    reopened = StringingTableCache(tmp_path)
+    cached = reopened.get_or_generate(cable=cable_aster570, **line)
+
+    assert reopened.hits == 1 and reopened.misses == 0
+    assert np.array_equal(cached.sag_m, table.sag_m)
+    assert cached.to_dict() == table.to_dict()
+
+
+def test_exports_without_recomputation(line, cable_aster570, tmp_path):
+    """Export CSV et JSON d'une table relue par son empreinte"""
+    cache = StringingTableCache(tmp_path)
+    key = cache.get_or_generate(cable=cable_aster570, **line).key
+    table = cache.get(key)
+
+    rows = list(csv.DictReader(io.StringIO(table.to_csv())))
+    assert len(rows) == 30 * 11
+    assert int(rows[12]["span"]) == 1 and float(rows[12]["temperature_C"]) == -5.0
+    assert float(rows[12]["F1_m"]) == round(float(table.sag_m[1, 1]), 2)
+
+    data = json.loads(table.to_json())
+    assert len(data["cantons"]) == 6
+    assert data["cantons"][0]["spans"][1]["F1_m"][1] == round(float(table.sag_m[1, 1]), 2)
+
+
+def test_cache_size_eviction(line, cable_aster570, tmp_path):
+    """Au-delà de la taille maximale, la table la moins récemment utilisée est supprimée"""
+    cache = StringingTableCache(tmp_path)
+    old = cache.get_or_generate(cable=cable_aster570, **line)
+    size = cache.size_bytes()
+    os.utime(tmp_path / f"{old.key}.npz", ns=(0, 0))
+
+    cache.max_bytes = int(size * 1.5)
+    line["temperatures_C"] = line["temperatures_C"] + 1
+    recent = cache.get_or_generate(cable=cable_aster570, **line)
+
+    assert cache.evictions == 1
+    assert cache.get(old.key) is None
+    assert cache.get(recent.key) is not None
+
+
+def test_unwritable_cache_returns_table(line, cable_aster570, tmp_path):
+    """Écriture du cache impossible : la table est renvoyée sans être mise en cache"""
+    blocked = tmp_path / "fichier"
+    blocked.write_text("", encoding="utf-8")
+    cache = StringingTableCache(blocked / "tables")
+    table = cache.get_or_generate(cable=cable_aster570, **line)
+
+    assert table.sag_m.shape == (30, 11)
+    assert cache.write_errors == 1
+    assert cache.stats()["tables"] == 0
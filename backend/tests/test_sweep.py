@@ -0,0 +1,96 @@
+"""
+Tests unitaires pour les balayages paramétriques
+"""
+import json
+
+import numpy as np
+import pytest
+from backend.domain.state_change import CableConstants, StateChangeSolver, reference_from_rho
+from backend.domain.sweep import (
+    SweepAxis,
+    SweepJob,
+    SweepRunner,
+    load_sweep_column
+)
+
+
+# ===== FIXTURES =====
+
+@pytest.fixture
+def job(cable_aster570):
+    """Balayage 3 ρ × 4 températures × 2 vents sur 2 portées"""
+    return SweepJob(
+        cable=cable_aster570,
+        spans_m=[400.0, 500.0],
+        delta_h_m=[0.0, 10.0],
+        rho_m=SweepAxis.linspace(1500, 2500, 3),
+        temperature_C=SweepAxis(values=[-20.0, 15.0, 40.0, 75.0]),
+        wind_pressure_daPa=SweepAxis(values=[0.0, 36.0])
+    )
+
+
+# ===== TESTS =====
+
+def test_sweep_axis_linspace():
+    """Axe régulier bornes incluses"""
+    assert SweepAxis.linspace(0, 10, 3).values == [0.0, 5.0, 10.0]
+
+
+def test_run_writes_columns_and_manifest(job, tmp_path):
+    """Chaque colonne couvre la grille complète et le manifeste la décrit"""
+    manifest = SweepRunner.run(job, tmp_path, chunk_size=7)
+
+    assert manifest["shape"] == [3, 4, 2, 2]
+    assert json.loads((tmp_path / "manifest.json").read_text())["shape"] == [3, 4, 2, 2]
+    for name in manifest["columns"]:
+        column = load_sweep_column(tmp_path, name)
+        assert column.shape == (3, 4, 2, 2)
+        assert column.dtype == np.float32
+        assert np.all(np.isfinite(column))
+
+
+def test_run_matches_state_change(job, tmp_path):
+    """Les tensions écrites sont celles de l'équation de changement d'état"""
+    manifest = SweepRunner.run(job, tmp_path, chunk_size=5)
+    T0 = load_sweep_column(tmp_path, "T0_dan")
+
+    constants = CableConstants.from_cable(job.cable)
+    reference = reference_from_rho(constants, 2000.0, 15.0)
+    expected = StateChangeSolver.solve(constants, manifest["ruling_span_m"], reference, 40.0, 36.0)
+
+    assert T0[1, 2, 1, 0] == pytest.approx(float(expected.tension_dan), rel=1e-6)
+    # T0 est commun à toutes les portées du canton
+    assert T0[1, 2, 1, 0] == T0[1, 2, 1, 1]
+
+
+def test_chunk_size_does_not_change_results(job, tmp_path):
+    """Le découpage en blocs n'influe pas sur les résultats"""
+    SweepRunner.run(job, tmp_path / "small", chunk_size=3)
+    SweepRunner.run(job, tmp_path / "large", chunk_size=1000)
+
+    assert np.array_equal(
+        load_sweep_column(tmp_path / "small", "TB_dan"),
+        load_sweep_column(tmp_path / "large", "TB_dan")
+    )
+
+
+def test_state_change_solved_once_per_state(job, tmp_path, monkeypatch):
+    """L'équation de changement d'état n'est pas résolue pour chaque portée"""
+    solved = []
+    solve = StateChangeSolver.solve
+
+    def counting_solve(*args, **kwargs):
+        result = solve(*args, **kwargs)
+        solved.append(result.tension_dan.size)
+        return result
+
+    monkeypatch.setattr(StateChangeSolver, "solve", counting_solve)
+    SweepRunner.run(job, tmp_path, chunk_size=1000)
+    assert solved == [3 * 4 * 2]
+
+
+def test_run_rejects_unknown_column(job, tmp_path):
+    """Une colonne inconnue est refusée"""
+    job.columns = ["T0_dan", "inconnue"]
+    with pytest.raises(ValueError):
+        SweepRunner.run(job, tmp_path)
@@ -0,0 +1,119 @@
+"""
+Tests unitaires pour les profils de terrain et la garde au sol
+"""
+import numpy as np
+import pytest
+from backend.domain.profile import sag_at
+from backend.domain.terrain import TerrainProfile, convert_profile_csv
+
+
+@pytest.fixture
+def line():
+    """Ligne de 12 portées"""
+    rng = np.random.default_rng(6)
+    return {"a": rng.uniform(250, 450, 12), "h": rng.uniform(-15, 15, 12), "rho": 1100.0, "start_altitude_m": 100.0}
+
+
+@pytest.fixture
+def terrain(line, tmp_path):
+    """Sol bruité 20 m sous les accrochages, débordant la ligne de 10 m"""
+    rng = np.random.default_rng(7)
+    supports = np.concatenate(([0.0], np.cumsum(line["a"])))
+    attachments = line["start_altitude_m"] + np.concatenate(([0.0], np.cumsum(line["h"])))
+    x = np.unique(rng.uniform(-10, supports[-1] + 10, 5000))
+    ground = np.interp(x, supports, attachments) - 20 + rng.normal(0, 1.5, x.size)
+    np.save(tmp_path / "terrain.npy", np.vstack((x, ground)))
+    return TerrainProfile.open(tmp_path / "terrain.npy")
+
+
+def test_csv_conversion_round_trip(tmp_path):
+    """Conversion par blocs d'un CSV avec en-tête et séparateur « ; »"""
+    data = np.column_stack((np.arange(1000) * 2.5, np.linspace(50, 80, 1000)))
+    csv_path = tmp_path / "profil.csv"
+    np.savetxt(csv_path, data, delimiter=";", header="abscisse;altitude", comments="", fmt="%.6f")
+
+    convert_profile_csv(csv_path, tmp_path / "profil.npy", chunk_rows=64)
+    profile = TerrainProfile.open(tmp_path / "profil.npy")
+
+    assert isinstance(profile.chainage_m, np.memmap)
+    assert profile.chainage_m.dtype == np.float64
+    assert np.asarray(profile.chainage_m) == pytest.approx(data[:, 0])
+    assert np.asarray(profile.elevation_m) == pytest.approx(data[:, 1])
+
+
+def test_non_increasing_chainage_rejected(tmp_path):
+    """Abscisses non croissantes (même entre deux blocs) : erreur, aucun fichier laissé"""
+    csv_path = tmp_path / "profil.csv"
+    csv_path.write_text("0,10\n5,11\n10,12\n9,12\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        convert_profile_csv(csv_path, tmp_path / "profil.npy", chunk_rows=3)
+    assert not (tmp_path / "profil.npy").exists()
+
+
+def test_blank_and_comment_lines_ignored(tmp_path):
+    """Lignes vides (en fin de fichier comprises) et commentaires : ignorés à la conversion"""
+    csv_path = tmp_path / "profil.csv"
+    csv_path.write_text("abscisse,altitude\n0,10\n\n# relevé complémentaire\n5,11\n10,12\n\n  \n", encoding="utf-8")
+    convert_profile_csv(csv_path, tmp_path / "profil.npy", chunk_rows=2)
+    profile = TerrainProfile.open(tmp_path / "profil.npy")
+
+    assert np.asarray(profile.chainage_m).tolist() == [0, 5, 10]
+    assert np.asarray(profile.elevation_m).tolist() == [10, 11, 12]
+
+
+def test_flat_ground_level_span(tmp_path):
+    """Portée de niveau sur sol plat : garde minimale à mi-portée = hauteur − F1"""
+    np.save(tmp_path / "plat.npy", np.array([[-100.0, 600.0], [70.0, 70.0]]))
+    profile = TerrainProfile.open(tmp_path / "plat.npy")
+    result = profile.clearance([400.0], [0.0], 1000.0, start_altitude_m=100.0)
+
+    assert result.min_clearance_m[0] == pytest.approx(30 - 400**2 / (8 * 1000))
+    assert result.station_m[0] == pytest.approx(200)
+    assert result.ground_elevation_m[0] == pytest.approx(70)
+
+
+def test_exact_minimum_matches_dense_sampling(line, terrain):
+    """Minimum exact par portée : jamais au-dessus d'un échantillonnage fin, et très proche"""
+    result = terrain.clearance(**line)
+    supports = np.concatenate(([0.0], np.cumsum(line["a"])))
+    attachments = 100.0 + np.concatenate(([0.0], np.cumsum(line["h"])))
+    x_terrain = np.asarray(terrain.chainage_m)
+
+    for span in range(12):
+        a, h = line["a"][span], line["h"][span]
+        inside = x_terrain[(x_terrain >= supports[span]) & (x_terrain <= supports[span + 1])]
+        x = np.concatenate((np.linspace(supports[span], supports[span + 1], 200_001), inside))
+        local = x - supports[span]
+        conductor = attachments[span] + h * local / a - sag_at(local, a, h, 1100.0)
+        gap = conductor - np.interp(x, x_terrain, np.asarray(terrain.elevation_m))
+        assert result.min_clearance_m[span] == pytest.approx(gap.min(), abs=1e-6)
+        assert result.min_clearance_m[span] <= gap.min() + 1e-12
+
+
+def test_chunk_size_does_not_change_result(line, terrain):
+    """Le découpage en blocs de portées ne modifie pas les minima"""
+    whole = terrain.clearance(**line)
+    chunked = terrain.clearance(**line, chunk_points=300)
+    assert np.array_equal(whole.min_clearance_m, chunked.min_clearance_m)
+    assert np.array_equal(whole.station_m, chunked.station_m)
+
+
+def test_span_outside_profile_is_nan(tmp_path):
+    """Portée hors du profil : NaN"""
+    np.save(tmp_path / "court.npy", np.array([[0.0, 300.0], [70.0, 70.0]]))
+    profile = TerrainProfile.open(tmp_path / "court.npy")
+    result = profile.clearance([300.0, 300.0, 300.0], [0.0, 0.0, 0.0], 1000.0, 100.0, start_station_m=-500.0)
+    assert np.isnan(result.min_clearance_m[0])
+    assert np.isfinite(result.min_clearance_m[1:]).all()
+
+
+def test_from_csv_reuses_binary(tmp_path):
+    """Le profil binaire est réutilisé tant que le CSV n'a pas changé"""
+    csv_path = tmp_path / "profil.csv"
+    csv_path.write_text("0,10\n5,11\n10,12\n", encoding="utf-8")
+    first = TerrainProfile.from_csv(csv_path)
+    mtime = (tmp_path / "profil.npy").stat().st_mtime_ns
+    second = TerrainProfile.from_csv(csv_path)
+
+    assert (tmp_path / "profil.npy").stat().st_mtime_ns == mtime
+    assert np.array_equal(first.elevation_m, second.elevation_m)
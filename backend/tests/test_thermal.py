@@ -0,0 +1,82 @@
+"""
+Tests unitaires pour le bilan thermique CIGRE
+"""
+import numpy as np
+import pytest
+from backend.domain.thermal import (
+    MIN_WIND_SPEED_M_S,
+    CIGREThermalSolver,
+    ThermalConductor,
+    load_thermal_conductors,
+)
+
+
+@pytest.fixture
+def conductor():
+    """Conducteur de type Aster 570"""
+    return ThermalConductor(
+        name="Aster 570",
+        diameter_m=0.0315,
+        resistance_20C_ohm_per_m=0.0583e-3,
+        temperature_coefficient_per_C=0.0036,
+        emissivity=0.8,
+        absorptivity=0.8
+    )
+
+
+def test_no_current_no_sun_stays_at_ambient(conductor):
+    """Sans apport, le conducteur est à la température ambiante"""
+    T = CIGREThermalSolver.temperature(conductor, 0, 20, 2, 0)
+    assert T == pytest.approx(20, abs=1e-2)
+
+
+def test_temperature_and_ampacity_are_consistent(conductor):
+    """La température obtenue à l'intensité admissible vaut la température maximale"""
+    rng = np.random.default_rng(1)
+    ambient = rng.uniform(-10, 35, 500)
+    wind = rng.uniform(0, 10, 500)
+    sun = rng.uniform(0, 1000, 500)
+
+    I = CIGREThermalSolver.ampacity(conductor, 80, ambient, wind, sun)
+    T = CIGREThermalSolver.temperature(conductor, I, ambient, wind, sun)
+
+    assert I.shape == (500,)
+    assert np.all(I > 0)
+    assert np.allclose(T, 80, atol=1e-2)
+
+
+def test_heat_balance_terms(conductor):
+    """Termes Joule, solaire et rayonnement selon leurs formules"""
+    balance = CIGREThermalSolver.heat_balance(conductor, 1000, 70, 20, 1, 900)
+    assert balance.joule == pytest.approx(1000**2 * 0.0583e-3 * (1 + 0.0036 * 50))
+    assert balance.solar == pytest.approx(0.8 * 900 * 0.0315)
+    sigma = 5.6697e-8
+    assert balance.radiative == pytest.approx(
+        np.pi * 0.0315 * sigma * 0.8 * ((70 + 273.15)**4 - (20 + 273.15)**4)
+    )
+    assert balance.convective > 0
+
+
+def test_minimum_wind_speed(conductor):
+    """Le vent est borné à v_min : vent nul et v_min refroidissent autant"""
+    calm = CIGREThermalSolver.ampacity(conductor, 75, 30, 0.0, 800)
+    v_min = CIGREThermalSolver.ampacity(conductor, 75, 30, MIN_WIND_SPEED_M_S, 800)
+    windy = CIGREThermalSolver.ampacity(conductor, 75, 30, 3.0, 800)
+    assert calm == pytest.approx(v_min)
+    assert windy > calm
+
+
+def test_parallel_wind_cools_less(conductor):
+    """Un vent parallèle au conducteur refroidit moins qu'un vent perpendiculaire"""
+    perpendicular = CIGREThermalSolver.ampacity(conductor, 75, 25, 4, 0, wind_angle_deg=90)
+    parallel = CIGREThermalSolver.ampacity(conductor, 75, 25, 4, 0, wind_angle_deg=0)
+    assert parallel < perpendicular
+
+
+def test_catalog_conductors():
+    """Résistances du catalogue converties en Ω/m"""
+    conductors = load_thermal_conductors()
+    aster = conductors["ASTER570"]
+    assert aster.diameter_m == pytest.approx(0.0315, rel=0.05)
+    assert 1e-5 < aster.resistance_20C_ohm_per_m < 1e-3
+    assert aster.temperature_coefficient_per_C > 0
@@ -0,0 +1,95 @@
+"""
+Tests unitaires pour le régime thermique transitoire
+"""
+import numpy as np
+import pytest
+from backend.domain.thermal import CIGREThermalSolver, ThermalConductor
+from backend.domain.transient import TransientScenario, TransientThermalModel
+
+
+@pytest.fixture
+def conductor():
+    """Conducteur de type Aster 570"""
+    return ThermalConductor(
+        name="Aster 570",
+        diameter_m=0.0315,
+        resistance_20C_ohm_per_m=0.0583e-3,
+        temperature_coefficient_per_C=0.0036,
+        emissivity=0.8,
+        absorptivity=0.8,
+        heat_capacity_J_per_m_C=1400
+    )
+
+
+def test_load_step_reaches_steady_state(conductor):
+    """Après un échelon de charge, la température tend vers le régime permanent"""
+    current = np.r_[np.full(10, 400.0), np.full(500, 1200.0)]
+    initial = CIGREThermalSolver.temperature(conductor, 400, 25, 1, 500)
+    T = TransientThermalModel.integrate(conductor, initial, 60, current, 25, 1, 500)[0]
+
+    assert T[:10] == pytest.approx(np.full(10, initial), abs=1e-3)
+    assert np.all(np.diff(T[10:]) >= 0)
+    assert T[-1] == pytest.approx(CIGREThermalSolver.temperature(conductor, 1200, 25, 1, 500), abs=0.01)
+
+
+def test_long_steps_match_fine_integration(conductor):
+    """Pas longs franchis sans sous-pas : proches d'une intégration explicite à 1 s"""
+    current = [1500.0, 200.0, 900.0]
+    T = TransientThermalModel.integrate(conductor, 25, 1200, current, 20, 0.8, 600)[0]
+
+    reference = []
+    temperature = 25.0
+    for intensity in current:
+        for _ in range(1200):
+            balance = (
+                intensity**2 * conductor.resistance(temperature)
+                + CIGREThermalSolver.solar_heating(conductor, 600)
+                - CIGREThermalSolver.convective_cooling(conductor, temperature, 20, 0.8)
+                - CIGREThermalSolver.radiative_cooling(conductor, temperature, 20)
+            )
+            temperature = temperature + balance / conductor.heat_capacity_J_per_m_C
+        reference.append(float(temperature))
+
+    assert T == pytest.approx(reference, abs=0.1)
+
+
+def test_chunking_does_not_change_result(conductor):
+    """La température reportée entre tranches rend le découpage transparent"""
+    rng = np.random.default_rng(3)
+    current = rng.uniform(0, 1500, 300)
+    ambient = rng.uniform(0, 30, 300)
+    whole = TransientThermalModel.integrate(conductor, 30, 120, current, ambient, 2, 300)
+    chunked = TransientThermalModel.integrate(conductor, 30, 120, current, ambient, 2, 300, chunk_steps=17)
+    assert np.array_equal(whole, chunked)
+
+
+def test_stacked_conductors_match_individual_runs(conductor):
+    """Plusieurs conducteurs intégrés ensemble donnent les trajectoires individuelles"""
+    copper = ThermalConductor("100/CU/19", 0.013, 0.178e-3, 0.00393, 0.8, 0.8, heat_capacity_J_per_m_C=354)
+    current = np.vstack((np.full(50, 1000.0), np.full(50, 300.0)))
+    together = TransientThermalModel.integrate(
+        ThermalConductor.stack([conductor, copper]), [20, 20], 60, current, 20, 1, 0
+    )
+    for i, single in enumerate((conductor, copper)):
+        alone = TransientThermalModel.integrate(single, 20, 60, current[i], 20, 1, 0)[0]
+        assert together[i] == pytest.approx(alone)
+
+
+def test_scenarios_in_processes(conductor):
+    """Le résultat ne dépend pas du nombre de processus"""
+    scenarios = [
+        TransientScenario(f"s{k}", conductor, 300, np.full(20, 400.0 * k), 25, 1, 0)
+        for k in range(1, 4)
+    ]
+    serial = TransientThermalModel.run_scenarios(scenarios)
+    parallel = TransientThermalModel.run_scenarios(scenarios, workers=2)
+    for a, b in zip(serial, parallel):
+        assert np.array_equal(a, b)
+    assert serial[0][0] == pytest.approx(CIGREThermalSolver.temperature(conductor, 400, 25, 1, 0), abs=1e-2)
+
+
+def test_heat_capacity_required(conductor):
+    """Sans capacité thermique, le régime transitoire n'est pas calculable"""
+    conductor.heat_capacity_J_per_m_C = float("nan")
+    with pytest.raises(ValueError):
+        TransientThermalModel.integrate(conductor, 20, 60, [100.0], 20, 1, 0)
@@ -0,0 +1,87 @@
+"""
+Tests unitaires pour la matrice VHL des supports
+"""
+import numpy as np
+import pytest
+from backend.domain.state_change import CableConstants, ReferenceState, StateChangeSolver
+from backend.domain.vhl import LoadCase, VHLCalculator
+
+
+@pytest.fixture
+def reference():
+    """État de référence à 15 °C sans vent"""
+    return ReferenceState(temperature_C=15, tension_dan=2500)
+
+
+def test_flat_spans_reference_case(cable_aster570, reference):
+    """Dans l'état de référence : V = w·a au support central, L = ±T aux extrémités"""
+    matrix = VHLCalculator.compute(
+        [400, 400], [0, 0], [2], [0, 0, 0], cable_aster570, reference, [LoadCase("ref", 15)]
+    )
+    w = CableConstants.from_cable(cable_aster570).weight_dan_per_m
+
+    assert matrix.V[:, 0] == pytest.approx([w * 200, w * 400, w * 200])
+    assert matrix.H[:, 0] == pytest.approx([0, 0, 0])
+    assert matrix.L[:, 0] == pytest.approx([2500, 0, -2500])
+    assert matrix.span_tension_dan[:, 0] == pytest.approx([2500, 2500])
+
+
+def test_line_angle_creates_transverse_load(cable_aster570, reference):
+    """H = 2·T·sin(θ/2) sur un support d'angle"""
+    matrix = VHLCalculator.compute(
+        [400, 400], [0, 0], [2], [0, 20, 0], cable_aster570, reference, [LoadCase("ref", 15)]
+    )
+    assert matrix.H[1, 0] == pytest.approx(2 * 2500 * np.sin(np.radians(18) / 2))
+    assert matrix.L[1, 0] == pytest.approx(0, abs=1e-9)
+
+
+def test_uneven_supports_shift_vertical_load(cable_aster570, reference):
+    """Le support haut d'une portée dénivelée reprend plus de poids"""
+    matrix = VHLCalculator.compute(
+        [400], [40], [1], [0, 0], cable_aster570, reference, [LoadCase("ref", 15)]
+    )
+    w = CableConstants.from_cable(cable_aster570).weight_dan_per_m
+    assert matrix.V[:, 0] == pytest.approx([w * 200 - 2500 * 0.1, w * 200 + 2500 * 0.1])
+    assert matrix.V[:, 0].sum() == pytest.approx(w * 400)
+
+
+def test_broken_span_unbalances_support(cable_aster570, reference):
+    """Conducteur rompu : le support voisin reprend la tension non compensée"""
+    matrix = VHLCalculator.compute(
+        [400, 400], [0, 0], [2], [0, 0, 0], cable_aster570, reference,
+        [LoadCase("ref", 15), LoadCase("rupture", 15, broken_span=1)]
+    )
+    assert matrix.L[1, 1] == pytest.approx(-2500)
+    assert matrix.V[2, 1] == 0
+    assert matrix.span_tension_dan[1, 1] == 0
+    assert matrix.case_names[matrix.governing_case[1]] == "rupture"
+
+
+def test_ice_and_wind_increase_loads(cable_aster570, reference):
+    """Le givre augmente V et la tension ; le vent crée un effort H"""
+    cases = [LoadCase("ref", 15), LoadCase("givre", -5, ice_thickness_mm=10), LoadCase("vent", 15, 57)]
+    matrix = VHLCalculator.compute([300, 400], [0, 0], [1, 1], [0, 0, 0], cable_aster570, reference, cases)
+
+    assert np.all(matrix.V[:, 1] > matrix.V[:, 0])
+    assert np.all(matrix.span_tension_dan[:, 1] > 2500)
+    # Vent : demi-portées de chaque côté, sans angle de ligne
+    assert matrix.H[1, 2] == pytest.approx(57 * 0.0315 * 350)
+    # Cantons distincts : tensions différentes de part et d'autre du support central
+    assert matrix.L[1, 1] != pytest.approx(0)
+
+
+def test_apparent_weight_override_matches_wind(cable_aster570, reference):
+    """Le poids apparent imposé reproduit le calcul sous vent du solveur"""
+    constants = CableConstants.from_cable(cable_aster570)
+    wind = StateChangeSolver.solve(constants, 400, reference, 15, 57)
+    apparent = np.hypot(constants.weight_dan_per_m, 57 * constants.diameter_m)
+    override = StateChangeSolver.solve(constants, 400, reference, 15, apparent_weight_dan_per_m=apparent)
+    assert override.tension_dan == pytest.approx(wind.tension_dan)
+
+
+def test_invalid_inputs(cable_aster570, reference):
+    """Tailles incohérentes et portée rompue hors ligne refusées"""
+    with pytest.raises(ValueError):
+        VHLCalculator.compute([400], [0], [1], [0], cable_aster570, reference, [LoadCase("ref", 15)])
+    with pytest.raises(ValueError):
+        VHLCalculator.compute([400], [0], [1], [0, 0], cable_aster570, reference, [LoadCase("r", 15, broken_span=3)])
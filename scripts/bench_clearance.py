@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark du contrôle des distances LiDAR
+Génère un nuage de points synthétique le long d'une ligne, l'écrit en .npy,
+puis mesure le chargement projeté en mémoire, l'indexation et le contrôle
+Usage: python bench_clearance.py [--points 10000000] [--length-km 30] [--workers 1]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from backend.domain.clearance import (
+    ClearanceChecker,
+    ConductorEnvelope,
+    PointGridIndex,
+    load_point_cloud
+)
+
+
+def make_cloud(path: Path, n: int, a: np.ndarray, h: np.ndarray) -> None:
+    """Végétation aléatoire de 15 à 40 m sous les accrochages, sur ±40 m"""
+    rng = np.random.default_rng(0)
+    length = float(a.sum())
+    points = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(n, 3))
+    supports_x = np.concatenate(([0.0], np.cumsum(a)))
+    supports_z = np.concatenate(([0.0], np.cumsum(h)))
+    for start in range(0, n, 1_000_000):
+        stop = min(start + 1_000_000, n)
+        x = rng.uniform(0, length, stop - start)
+        points[start:stop, 0] = x
+        points[start:stop, 1] = rng.uniform(-40, 40, stop - start)
+        points[start:stop, 2] = np.interp(x, supports_x, supports_z) - rng.uniform(15, 40, stop - start)
+    points.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du contrôle des distances LiDAR")
+    parser.add_argument("--points", type=int, default=10_000_000, help="Nombre de points")
+    parser.add_argument("--length-km", type=float, default=30.0, help="Longueur de ligne (km)")
+    parser.add_argument("--workers", type=int, default=1, help="Nombre de processus")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    n_spans = max(int(args.length_km * 1000 / 400), 1)
+    a = rng.uniform(300, 500, n_spans)
+    a *= args.length_km * 1000 / a.sum()
+    h = rng.uniform(-20, 20, n_spans)
+    envelope = ConductorEnvelope.from_spans(
+        a, h, rho_max_sag_m=1200, rho_wind_m=1500, swing_angle_rad=0.6, phase_offsets_m=(-5.0, 0.0, 5.0)
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "cloud.npy"
+        make_cloud(path, args.points, a, h)
+
+        start = time.perf_counter()
+        points = load_point_cloud(path)
+        index = PointGridIndex.build(points, cell_size_m=25.0, max_lateral_m=30.0)
+        indexed = time.perf_counter()
+        result = ClearanceChecker.check(index, envelope, clearance_m=5.0, workers=args.workers)
+        checked = time.perf_counter()
+        del points, index
+
+    print(f"\n📊 {args.points} points, {n_spans} portées ({args.length_km} km), {args.workers} processus\n")
+    print(f"Indexation : {indexed - start:.2f} s")
+    print(f"Contrôle   : {checked - indexed:.2f} s")
+    print(f"Points comparés : {int(result.points_checked.sum())}")
+    print(f"Points en défaut : {int(result.violations_count.sum())}")
+    print(f"Distance minimale : {float(result.min_distance_m.min()):.2f} m")
+
+
+if __name__ == "__main__":
+    main()
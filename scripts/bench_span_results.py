@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire / temps des représentations de résultats de portées
+Compare SpanResult (messages rédigés), CompactSpanResult (codes, slots) et
+BatchSpanResult (colonnes NumPy) pour un grand nombre de portées
+Usage: python bench_span_results.py [--spans 100000]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour importer les modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from backend.domain.batch import BatchSpanCalculator
+from backend.domain.mechanical import (
+    MechanicalCalculator,
+    CableProperties,
+    SpanGeometry
+)
+
+CABLE = CableProperties(
+    name="Aster 570",
+    mass_lin_kg_per_m=1.631,
+    E_MPa=78000,
+    section_mm2=564.6,
+    alpha_1e6_per_C=19.1,
+    rupture_dan=17200,
+    diameter_mm=31.5
+)
+
+
+def make_inputs(n: int):
+    """Portées aléatoires, dont une partie déclenche des avertissements"""
+    rng = np.random.default_rng(0)
+    a = np.round(rng.uniform(50, 1200, n), 1)
+    h = np.round(rng.uniform(-100, 100, n), 1)
+    rho = np.round(rng.uniform(50, 12000, n))
+    wind = np.round(rng.uniform(0, 50, n), 1)
+    angle = np.round(rng.uniform(-25, 25, n), 1)
+    return a, h, rho, wind, angle
+
+
+def measure(label: str, build):
+    """Mesure le temps, la mémoire conservée et le pic d'allocation"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = build()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return label, elapsed, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des résultats de portées")
+    parser.add_argument("--spans", type=int, default=100_000, help="Nombre de portées")
+    args = parser.parse_args()
+
+    a, h, rho, wind, angle = make_inputs(args.spans)
+    rows = list(zip(a.tolist(), h.tolist(), rho.tolist(), wind.tolist(), angle.tolist()))
+
+    def span_results():
+        return [
+            MechanicalCalculator.calculate_span(SpanGeometry(ai, hi), CABLE, ri, wi, gi)
+            for ai, hi, ri, wi, gi in rows
+        ]
+
+    def compact_results():
+        return [
+            MechanicalCalculator.calculate_span_compact(SpanGeometry(ai, hi), CABLE, ri, wi, gi)
+            for ai, hi, ri, wi, gi in rows
+        ]
+
+    def batch_results():
+        return BatchSpanCalculator.calculate_spans(a, h, rho, 0, [CABLE], wind, angle)
+
+    measurements = [
+        measure("SpanResult (messages)", span_results),
+        measure("CompactSpanResult (codes)", compact_results),
+        measure("BatchSpanResult (colonnes)", batch_results),
+    ]
+
+    print(f"\n📊 {args.spans} portées\n")
+    print(f"{'Représentation':<28} {'Temps (s)':>10} {'Conservé (Mo)':>14} {'Pic (Mo)':>10}")
+    print("-" * 66)
+    reference = measurements[0][2]
+    for label, elapsed, current, peak in measurements:
+        print(
+            f"{label:<28} {elapsed:>10.3f} {current / 1e6:>14.1f} {peak / 1e6:>10.1f}"
+            f"   ({current / reference:.0%} de SpanResult)"
+        )
+
+
+if __name__ == "__main__":
+    main()